@@ -1,3 +1,6 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
 
@@ -7,7 +10,9 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from backend.api.config import settings
+from backend.api.token_cache import TokenValidationCache
 from backend.data.database import get_user_repository
+from backend.logger import logger
 
 # Secret key for JWT token signing (in production, this should be stored securely)
 # Fixed JWT error handling
@@ -18,15 +23,36 @@ ACCESS_TOKEN_EXPIRE_MINUTES = settings.ACCESS_TOKEN_EXPIRE_MINUTES
 # Security scheme for Swagger UI
 security = HTTPBearer()
 
+# Recently validated tokens, see validate_token
+token_cache = TokenValidationCache(
+    max_size=settings.TOKEN_CACHE_SIZE,
+    revalidate_seconds=settings.TOKEN_CACHE_REVALIDATE_SECONDS,
+)
 
-def get_password_hash(password: str) -> str:
+# bcrypt work runs on its own pool so a login burst cannot take over the
+# event loop or the database executor. bcrypt releases the GIL while hashing.
+_password_executor = None
+_pending_password_jobs = 0
+
+
+def get_password_hash(password: str, rounds: Optional[int] = None) -> str:
     """Hash a password using bcrypt"""
     # Generate a salt and hash the password
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds or settings.BCRYPT_ROUNDS)
     hashed_password = bcrypt.hashpw(password.encode("utf-8"), salt)
     return hashed_password.decode("utf-8")
 
 
+def password_needs_rehash(hashed_password: str, rounds: Optional[int] = None) -> bool:
+    """Whether a bcrypt hash was made with a cost other than the configured one"""
+    try:
+        # Format: $2b$<cost>$<salt and hash>
+        cost = int(hashed_password.split("$")[2])
+    except (AttributeError, IndexError, ValueError):
+        return False
+    return cost != (rounds or settings.BCRYPT_ROUNDS)
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a plain password against a hashed password using bcrypt"""
     try:
@@ -38,6 +64,48 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         return False
 
 
+def _get_password_executor() -> ThreadPoolExecutor:
+    global _password_executor
+    if _password_executor is None:
+        workers = settings.PASSWORD_HASH_WORKERS or min(4, os.cpu_count() or 1)
+        _password_executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="bcrypt"
+        )
+    return _password_executor
+
+
+async def _run_password_job(fn, *args):
+    """
+    Run a bcrypt call on the password pool.
+
+    At most PASSWORD_HASH_MAX_PENDING jobs may be queued or running; beyond
+    that requests are shed with 503 rather than queueing for seconds.
+    """
+    global _pending_password_jobs
+    if _pending_password_jobs >= settings.PASSWORD_HASH_MAX_PENDING:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many authentication requests, please retry",
+            headers={"Retry-After": "1"},
+        )
+    _pending_password_jobs += 1
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_password_executor(), fn, *args)
+    finally:
+        _pending_password_jobs -= 1
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password on the password pool"""
+    return await _run_password_job(get_password_hash, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password on the password pool"""
+    return await _run_password_job(verify_password, plain_password, hashed_password)
+
+
 def get_user_by_email(email: str):
     """Get user by email from the database"""
     user_repo = get_user_repository()
@@ -60,54 +128,69 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return encoded_jwt
 
 
+def _credentials_error(detail: str = "Could not validate credentials"):
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+def _check_token_version(user_id: str, token_version: int) -> bool:
+    """
+    Reject tokens of deactivated users and tokens issued before the user's
+    token version was bumped. Returns whether the result may be cached.
+    """
+    try:
+        state = get_user_repository().get_token_state(user_id)
+    except Exception as e:
+        # Fail open on database errors, but re-check on the next request
+        logger.error(f"Error checking token state for user {user_id}: {e}")
+        return False
+    if state is None:
+        return True
+    current_version, is_active = state
+    if not is_active or token_version != current_version:
+        raise _credentials_error("Token has been revoked")
+    return True
+
+
 def validate_token(token: str) -> str:
     """Validate a JWT token and return the user ID"""
     if not token:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Not authenticated",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise _credentials_error("Not authenticated")
+
+    # Tokens validated recently skip signature and revocation checks
+    user_id = token_cache.get(token)
+    if user_id is not None:
+        return user_id
 
     try:
-        # Decode the JWT token
+        # Decode the JWT token; PyJWT rejects expired tokens
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-
-        # Check if token has expired (PyJWT does this automatically, but we'll keep the check)
-        exp = payload.get("exp")
-        if exp and datetime.utcnow().timestamp() > exp:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Token has expired",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-
-        user_id = payload.get("sub")
-        if not user_id:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Could not validate credentials",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-        return user_id
     except jwt.ExpiredSignatureError:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Token has expired",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    except jwt.PyJWTError:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise _credentials_error("Token has expired")
     except Exception:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise _credentials_error()
+
+    user_id = payload.get("sub")
+    if not user_id:
+        raise _credentials_error()
+
+    try:
+        token_version = int(payload.get("ver", 0))
+    except (TypeError, ValueError):
+        raise _credentials_error()
+
+    if _check_token_version(user_id, token_version):
+        token_cache.put(token, user_id, payload.get("exp"))
+    return user_id
+
+
+def revoke_user_tokens(user_id: str) -> None:
+    """Invalidate every token issued to a user so far"""
+    get_user_repository().revoke_tokens(user_id)
+    token_cache.revoke_user(user_id)
 
 
 def get_current_user(
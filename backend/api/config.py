@@ -22,10 +22,43 @@ class APISettings(BaseSettings):
     # Database settings
     DATABASE_URL: str = "sqlite:///../data/jobpilot.db"
 
+    # Database engine profile
+    DB_POOL_SIZE: int = 5  # Pooled connections kept open
+    DB_MAX_OVERFLOW: int = 10  # Extra connections allowed under load
+    DB_POOL_TIMEOUT: float = 30.0  # Seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800  # Reconnect server connections older than this
+    DB_POOL_PRE_PING: bool = True  # Test server connections on checkout
+    DB_SQLITE_JOURNAL_MODE: str = "WAL"  # Empty keeps SQLite's default
+    DB_SQLITE_SYNCHRONOUS: str = "NORMAL"  # Empty keeps SQLite's default
+    DB_SQLITE_BUSY_TIMEOUT_MS: int = 5000  # Wait for locks instead of failing
+    DB_SQLITE_MMAP_SIZE: int = 268435456  # Bytes memory-mapped for reads; 0 = off
+    DB_WRITE_BATCH_SIZE: int = 256  # SQLite writes per group commit; 0 = inline
+    DB_WRITE_MAX_DELAY_MS: float = 2.0  # Wait this long for more queued writes
+
+    # Search totals
+    SEARCH_COUNT_STRATEGY: str = "exact"  # "exact", "capped" or "cached"
+    SEARCH_COUNT_CAP: int = 1000  # Capped counts stop here and report "1000+"
+    SEARCH_COUNT_CACHE_TTL_SECONDS: float = 30.0  # Cached counts live this long
+    SEARCH_COUNT_CACHE_SIZE: int = 1000  # Filter signatures kept; 0 disables
+
+    # Job view counter buffer
+    VIEW_BUFFER_DURABILITY: str = "buffered"  # "buffered", "sync" or "off"
+    VIEW_BUFFER_FLUSH_INTERVAL_MS: int = 1000  # Flush pending view counts this often
+    VIEW_BUFFER_MAX_PENDING: int = 10000  # Flush early at this many (user, job) pairs
+
     # Security settings
     SECRET_KEY: str = "your-secret-key-here"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
 
+    # Password hashing settings
+    BCRYPT_ROUNDS: int = 12  # Hashes with another cost are upgraded on login
+    PASSWORD_HASH_WORKERS: int = 0  # Threads for bcrypt; 0 = min(4, CPU count)
+    PASSWORD_HASH_MAX_PENDING: int = 64  # Queued hash jobs before shedding load
+
+    # Token validation cache
+    TOKEN_CACHE_SIZE: int = 10000  # Validated tokens kept; 0 disables the cache
+    TOKEN_CACHE_REVALIDATE_SECONDS: float = 60.0  # Re-check revocation this often
+
     # Authentication settings (always True now)
     REQUIRE_AUTHENTICATION: bool = True
 
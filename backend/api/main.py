@@ -23,6 +23,8 @@ from backend.api.routers import (
     timeline,
     users,
 )
+from backend.data.database import get_database_manager, get_interaction_repository
+from backend.utils.retry import retry_budget, retry_metrics
 
 # Setup logging with both file and console handlers
 # Create logs directory if it doesn't exist
@@ -100,7 +102,24 @@ async def root():
 # Health check endpoint
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy"}
+    # Pool, write queue and retry counters only; no query is made
+    db_manager = get_database_manager()
+    database = {"pool": db_manager.pool_stats()}
+    if db_manager.write_queue is not None:
+        database["write_queue"] = db_manager.write_queue.stats()
+    retries = {
+        "budget_remaining": retry_budget.remaining(),
+        "call_sites": retry_metrics.snapshot(),
+    }
+    return {"status": "healthy", "database": database, "retries": retries}
+
+
+@app.on_event("shutdown")
+def flush_view_buffer():
+    # Write job views still held in memory before the process exits
+    view_buffer = get_interaction_repository().view_buffer
+    if view_buffer is not None:
+        view_buffer.close()
 
 
 # Test endpoint to validate a token
@@ -77,6 +77,11 @@ class JobApplicationListResponse(BaseModel):
     applications: List[JobApplicationResponse] = Field(
         ..., description="List of job applications"
     )
-    total: int = Field(..., description="Total number of applications")
+    total: Optional[int] = Field(
+        None, description="Total number of applications, if counted"
+    )
     page: int = Field(..., description="Current page number")
     page_size: int = Field(..., description="Number of items per page")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page, if there may be one"
+    )
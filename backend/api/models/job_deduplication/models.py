@@ -37,8 +37,10 @@ class JobDeduplicationResponse(BaseModel):
 class BatchDeduplicationRequest(BaseModel):
     """Request model for finding duplicates in a batch of jobs"""
 
-    job_ids: List[str] = Field(
-        ..., description="List of job IDs to check for duplicates", min_items=2
+    job_ids: Optional[List[str]] = Field(
+        None,
+        description="List of job IDs to check for duplicates (all active jobs if omitted)",
+        min_items=2,
     )
     confidence_threshold: float = Field(
         0.8,
@@ -46,6 +48,9 @@ class BatchDeduplicationRequest(BaseModel):
         ge=0.0,
         le=1.0,
     )
+    persist: bool = Field(
+        True, description="Record new duplicate pairs in the job duplications table"
+    )
 
 
 class BatchDeduplicationResult(BaseModel):
@@ -77,6 +82,16 @@ class BatchDeduplicationResponse(BaseModel):
         ..., description="Total number of duplicates found"
     )
     confidence_threshold: float = Field(..., description="Confidence threshold used")
+    jobs_processed: int = Field(0, description="Number of job listings examined")
+    blocks: int = Field(0, description="Number of company blocks compared within")
+    candidate_pairs: int = Field(
+        0, description="Candidate pairs generated by blocking and LSH"
+    )
+    duplicates_recorded: int = Field(
+        0, description="New duplicate pairs written to the database"
+    )
+    elapsed_ms: float = Field(0.0, description="Processing time in milliseconds")
+    jobs_per_second: float = Field(0.0, description="Deduplication throughput")
     processed_at: str = Field(
         ..., description="Timestamp when the deduplication was processed"
     )
@@ -128,6 +128,11 @@ class ResumeListResponse(BaseModel):
     """Model for returning a list of resumes"""
 
     resumes: List[ResumeResponse] = Field(..., description="List of resumes")
-    total: int = Field(..., description="Total number of resumes")
+    total: Optional[int] = Field(
+        None, description="Total number of resumes, if counted"
+    )
     page: int = Field(..., description="Current page number")
     page_size: int = Field(..., description="Number of items per page")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page, if there may be one"
+    )
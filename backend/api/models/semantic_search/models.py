@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -77,6 +77,10 @@ class HybridSearchRequest(BaseModel):
     semantic_weight: float = Field(
         0.5, description="Weight for semantic matching (0.0 to 1.0)", ge=0.0, le=1.0
     )
+    fusion: str = Field(
+        "minmax",
+        description="Score fusion: 'minmax' (normalized scores) or 'rrf' (reciprocal rank)",
+    )
 
 
 class HybridSearchResult(BaseModel):
@@ -106,6 +110,10 @@ class HybridSearchResponse(BaseModel):
     limit: int = Field(..., description="Limit used for this search")
     keyword_weight: float = Field(..., description="Weight used for keyword matching")
     semantic_weight: float = Field(..., description="Weight used for semantic matching")
+    fusion: str = Field("minmax", description="Score fusion method used")
+    timings_ms: Dict[str, float] = Field(
+        default_factory=dict, description="Time spent in each search stage (ms)"
+    )
     processed_at: str = Field(
         ..., description="Timestamp when the search was processed"
     )
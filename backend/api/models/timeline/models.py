@@ -90,3 +90,6 @@ class TimelineEventListResponse(BaseModel):
     total: int = Field(..., description="Total number of timeline events")
     page: int = Field(..., description="Current page number")
     page_size: int = Field(..., description="Number of items per page")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page, if there may be one"
+    )
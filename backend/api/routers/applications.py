@@ -13,6 +13,7 @@ from backend.api.models.applications.models import (
 )
 from backend.data.database import get_interaction_repository
 from backend.data.models import ApplicationStatus
+from backend.data.pagination import InvalidCursorError, next_cursor
 from backend.logger import logger
 
 router = APIRouter(prefix="/applications", tags=["applications"])
@@ -25,17 +26,28 @@ async def list_applications(
     ),
     limit: int = Query(50, description="Number of applications to return", le=100),
     offset: int = Query(0, description="Number of applications to skip"),
+    after: Optional[str] = Query(
+        None, description="Cursor of the previous page (next_cursor)"
+    ),
+    include_total: Optional[bool] = Query(
+        None, description="Count all applications (default: without a cursor only)"
+    ),
     current_user=Depends(get_current_user),
     db=Depends(get_db),
 ):
     """List all job applications for the current user (requires authentication)"""
+    if include_total is None:
+        include_total = after is None
     try:
         interaction_repo = get_interaction_repository()
-        applications, total = interaction_repo.get_applications(
+        applications, total = await db.run_sync(
+            interaction_repo.get_applications,
             user_profile_id=current_user,
             status=status,
             limit=limit,
             offset=offset,
+            after=after,
+            include_total=include_total,
         )
 
         # Convert to response models
@@ -64,7 +76,11 @@ async def list_applications(
             total=total,
             page=offset // limit + 1 if limit > 0 else 1,
             page_size=limit,
+            next_cursor=next_cursor(applications, limit, "updated_at"),
         )
+    except InvalidCursorError as e:
+        # "status" is the query parameter here, not fastapi.status
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error listing applications for user {current_user}: {e}")
         raise HTTPException(
@@ -82,7 +98,9 @@ async def get_application(
     """Get a specific job application by ID (requires authentication)"""
     try:
         interaction_repo = get_interaction_repository()
-        application = interaction_repo.get_application(application_id)
+        application = await db.run_sync(
+            interaction_repo.get_application, application_id
+        )
 
         if not application:
             raise HTTPException(
@@ -140,7 +158,8 @@ async def create_application(
             )
 
         interaction_repo = get_interaction_repository()
-        interaction = interaction_repo.apply_to_job(
+        interaction = await db.run_sync(
+            interaction_repo.apply_to_job,
             user_id=str(application_data.user_profile_id),
             job_id=str(application_data.job_id),
             resume_version=application_data.resume_version,
@@ -154,8 +173,8 @@ async def create_application(
         if application_data.notes:
             # Update the interaction to store notes in the proper field
             update_dict = {"notes": application_data.notes}
-            updated_interaction = interaction_repo.update_application(
-                interaction.id, update_dict
+            updated_interaction = await db.run_sync(
+                interaction_repo.update_application, interaction.id, update_dict
             )
             if updated_interaction:
                 interaction = updated_interaction
@@ -208,7 +227,9 @@ async def update_application(
     """Update a job application (requires authentication)"""
     try:
         interaction_repo = get_interaction_repository()
-        application = interaction_repo.get_application(application_id)
+        application = await db.run_sync(
+            interaction_repo.get_application, application_id
+        )
 
         if not application:
             raise HTTPException(
@@ -225,8 +246,8 @@ async def update_application(
 
         # Update the application
         update_dict = update_data.dict(exclude_unset=True)
-        updated_application = interaction_repo.update_application(
-            application_id, update_dict
+        updated_application = await db.run_sync(
+            interaction_repo.update_application, application_id, update_dict
         )
 
         if not updated_application:
@@ -237,7 +258,9 @@ async def update_application(
 
         # Refresh the application data to ensure we have the latest values
         # This is a workaround for potential caching issues
-        refreshed_application = interaction_repo.get_application(application_id)
+        refreshed_application = await db.run_sync(
+            interaction_repo.get_application, application_id
+        )
         if refreshed_application:
             updated_application = refreshed_application
 
@@ -277,7 +300,9 @@ async def delete_application(
     """Delete a job application (requires authentication)"""
     try:
         interaction_repo = get_interaction_repository()
-        application = interaction_repo.get_application(application_id)
+        application = await db.run_sync(
+            interaction_repo.get_application, application_id
+        )
 
         if not application:
             raise HTTPException(
@@ -292,7 +317,7 @@ async def delete_application(
                 detail="Not authorized to delete this application",
             )
 
-        success = interaction_repo.delete_application(application_id)
+        success = await db.run_sync(interaction_repo.delete_application, application_id)
 
         if not success:
             raise HTTPException(
@@ -2,20 +2,27 @@ from datetime import datetime
 from typing import Optional
 from uuid import uuid4
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from pydantic import BaseModel, EmailStr, validator
 
 from backend.api.auth import (
     create_access_token,
-    get_password_hash,
     get_user_by_email,
-    verify_password,
+    hash_password_async,
+    password_needs_rehash,
+    revoke_user_tokens,
+    validate_token,
+    verify_password_async,
 )
 from backend.data.database import get_user_repository
 from backend.data.models import UserProfile, UserProfileDB
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
 
+# Logout also succeeds without a token, it just has nothing to revoke
+optional_security = HTTPBearer(auto_error=False)
+
 
 class LoginRequest(BaseModel):
     email: str
@@ -50,53 +57,89 @@ class UserResponse(BaseModel):
     is_verified: bool
 
 
+def _load_login_user(user_repo, email: str):
+    """
+    Return (user_id, is_active, hashed_password, token_version) for an email,
+    or None.
+    """
+    with user_repo.db_manager.get_session() as session:
+        return (
+            session.query(
+                UserProfileDB.id,
+                UserProfileDB.is_active,
+                UserProfileDB.hashed_password,
+                UserProfileDB.token_version,
+            )
+            .filter(UserProfileDB.email == email)
+            .first()
+        )
+
+
+def _record_login(user_repo, user_id: str, new_hash: Optional[str] = None) -> None:
+    values = {"last_login": datetime.utcnow()}
+    if new_hash:
+        values["hashed_password"] = new_hash
+    with user_repo.db_manager.get_session() as session:
+        session.query(UserProfileDB).filter(UserProfileDB.id == user_id).update(
+            values, synchronize_session=False
+        )
+
+
+def _store_user(user_repo, user_db: UserProfileDB) -> None:
+    with user_repo.db_manager.get_session() as session:
+        session.add(user_db)
+        session.flush()
+
+
 @router.post("/login", response_model=LoginResponse)
 async def login(login_request: LoginRequest):
     """Authenticate user and return access token"""
-    # Look up user by email in database
+    # Database calls run on the database executor, off the event loop
     user_repo = get_user_repository()
+    run_sync = user_repo.db_manager.run_sync
 
     # Get user from database
-    with user_repo.db_manager.get_session() as session:
-        db_user = (
-            session.query(UserProfileDB)
-            .filter(UserProfileDB.email == login_request.email)
-            .first()
-        )
+    db_user = await run_sync(_load_login_user, user_repo, login_request.email)
 
-        # Check if user exists
-        if not db_user:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Incorrect email or password",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+    # Check if user exists
+    if not db_user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Incorrect email or password",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    user_id, is_active, hashed_password, token_version = db_user
 
-        # Check if user is active
-        if not db_user.is_active:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="User account is inactive",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+    # Check if user is active
+    if not is_active:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User account is inactive",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
 
-        # Verify password against hashed password in database
-        if not verify_password(login_request.password, db_user.hashed_password):
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Incorrect email or password",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+    # Verify password against hashed password in database
+    if not await verify_password_async(login_request.password, hashed_password):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Incorrect email or password",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
 
-        # Update last login time
-        db_user.last_login = datetime.utcnow()
-        session.flush()
+    # Upgrade hashes made with a different bcrypt cost while we have the
+    # plain password
+    new_hash = None
+    if password_needs_rehash(hashed_password):
+        new_hash = await hash_password_async(login_request.password)
 
-        # Get user ID while still in session
-        user_id = str(db_user.id)
+    # Update last login time
+    user_id = str(user_id)
+    await run_sync(_record_login, user_repo, user_id, new_hash)
 
     # Create access token
-    access_token = create_access_token(data={"sub": user_id})
+    # "ver" ties the token to the user's token version; bumping it revokes
+    # the token
+    access_token = create_access_token(data={"sub": user_id, "ver": token_version or 0})
 
     return LoginResponse(access_token=access_token, token_type="bearer")
 
@@ -104,8 +147,12 @@ async def login(login_request: LoginRequest):
 @router.post("/register", response_model=UserResponse)
 async def register(user_data: UserCreate):
     """Register a new user"""
+    user_repo = get_user_repository()
+
     # Check if user with this email already exists
-    existing_user = get_user_by_email(user_data.email)
+    existing_user = await user_repo.db_manager.run_sync(
+        get_user_by_email, user_data.email
+    )
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -113,7 +160,7 @@ async def register(user_data: UserCreate):
         )
 
     # Hash the password
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = await hash_password_async(user_data.password)
 
     # Create user profile data
     user_profile = UserProfile(
@@ -128,7 +175,6 @@ async def register(user_data: UserCreate):
     )
 
     # Store user in database
-    user_repo = get_user_repository()
     # Use pydantic_to_sqlalchemy to convert the user_profile to UserProfileDB
     from datetime import datetime
 
@@ -140,9 +186,7 @@ async def register(user_data: UserCreate):
     user_db.created_at = datetime.utcnow()
     user_db.updated_at = datetime.utcnow()
 
-    with user_repo.db_manager.get_session() as session:
-        session.add(user_db)
-        session.flush()
+    await user_repo.db_manager.run_sync(_store_user, user_repo, user_db)
 
     # Return user data
     return UserResponse(
@@ -156,11 +200,17 @@ async def register(user_data: UserCreate):
 
 
 @router.post("/logout")
-async def logout():
-    """Logout user (typically handled client-side by deleting token)"""
-    # In a stateless JWT system, logout is typically handled client-side
-    # by deleting the token. In a stateful system, you might invalidate
-    # the token on the server.
+async def logout(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security),
+):
+    """Logout user, revoking every token issued to them so far"""
+    # The client still deletes its token. When it sends one, the user's
+    # token version is bumped so copies of it stop working too.
+    if credentials is not None:
+        user_repo = get_user_repository()
+        run_sync = user_repo.db_manager.run_sync
+        user_id = await run_sync(validate_token, credentials.credentials)
+        await run_sync(revoke_user_tokens, user_id)
     return {"message": "Logged out successfully"}
 
 
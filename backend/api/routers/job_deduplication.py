@@ -1,4 +1,6 @@
+import asyncio
 from datetime import datetime
+from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException
 
@@ -10,10 +12,21 @@ from backend.api.models.job_deduplication.models import (
     JobDeduplicationRequest,
     JobDeduplicationResponse,
 )
+from backend.data.database import get_database_manager
+from backend.data.job_deduplication import DeduplicationReport, JobDeduplicator
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
 
+def _run_deduplication(
+    job_ids: Optional[List[str]], confidence_threshold: float, persist: bool
+) -> DeduplicationReport:
+    with get_database_manager().get_session() as session:
+        return JobDeduplicator().run(
+            session, job_ids, confidence_threshold, persist=persist
+        )
+
+
 @router.post("/deduplicate", response_model=JobDeduplicationResponse)
 async def check_job_duplicates(
     request: JobDeduplicationRequest,
@@ -64,61 +77,39 @@ async def batch_job_deduplication(
 ):
     """Find duplicates in a batch of jobs (requires authentication)"""
     try:
-        # In a real implementation, this would:
-        # 1. Retrieve all jobs from the database
-        # 2. Compare each job with every other job
-        # 3. Calculate similarity scores for each pair
-        # 4. Identify duplicates based on the confidence threshold
-        # 5. Return a list of duplicate pairs
-
-        # Mock implementation for now
-        job_ids = request.job_ids
-        confidence_threshold = request.confidence_threshold
-
-        # Simple mock logic - in reality this would involve complex text comparison
-        mock_duplicates = []
-        total_checked = 0
-
-        # Compare each job with every other job (simplified)
-        for i in range(len(job_ids)):
-            for j in range(i + 1, len(job_ids)):
-                total_checked += 1
-                job1_id = job_ids[i]
-                job2_id = job_ids[j]
-
-                # Simple mock logic for determining duplicates
-                is_duplicate = (
-                    job1_id.startswith("job-")
-                    and job2_id.startswith("job-")
-                    and job1_id != job2_id
-                    and
-                    # Mock condition for higher confidence
-                    abs(hash(job1_id) - hash(job2_id)) % 10 < 3
-                )
-
-                if is_duplicate:
-                    confidence_score = 0.95
-                    matching_fields = ["title", "company", "description"]
-                    canonical_job_id = job1_id
-                    duplicate_job_id = job2_id
+        # Candidates come from company blocks and MinHash/LSH buckets, so only
+        # a small fraction of all pairs is ever scored
+        report = await asyncio.to_thread(
+            _run_deduplication,
+            request.job_ids,
+            request.confidence_threshold,
+            request.persist,
+        )
 
-                    mock_duplicates.append(
-                        BatchDeduplicationResult(
-                            job_id_1=job1_id,
-                            job_id_2=job2_id,
-                            confidence_score=confidence_score,
-                            matching_fields=matching_fields,
-                            canonical_job_id=canonical_job_id,
-                            duplicate_job_id=duplicate_job_id,
-                            merge_strategy="keep_canonical",
-                        )
-                    )
+        duplicates = [
+            BatchDeduplicationResult(
+                job_id_1=pair.canonical_job_id,
+                job_id_2=pair.duplicate_job_id,
+                confidence_score=pair.confidence_score,
+                matching_fields=pair.matching_fields,
+                canonical_job_id=pair.canonical_job_id,
+                duplicate_job_id=pair.duplicate_job_id,
+                merge_strategy="keep_canonical",
+            )
+            for pair in report.duplicates
+        ]
 
         return BatchDeduplicationResponse(
-            duplicates=mock_duplicates,
-            total_checked=total_checked,
-            total_duplicates_found=len(mock_duplicates),
-            confidence_threshold=confidence_threshold,
+            duplicates=duplicates,
+            total_checked=report.candidate_pairs,
+            total_duplicates_found=len(duplicates),
+            confidence_threshold=request.confidence_threshold,
+            jobs_processed=report.jobs_processed,
+            blocks=report.blocks,
+            candidate_pairs=report.candidate_pairs,
+            duplicates_recorded=report.records_written,
+            elapsed_ms=round(report.elapsed_seconds * 1000, 2),
+            jobs_per_second=round(report.jobs_per_second, 1),
             processed_at=datetime.utcnow().isoformat(),
         )
     except Exception as e:
@@ -3,7 +3,6 @@ from typing import Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
 
 from backend.api.auth import get_current_user
 from backend.api.dependencies import get_db
@@ -13,13 +12,22 @@ from backend.api.models.resumes.models import (
     ResumeResponse,
     ResumeUpdate,
 )
-from backend.data.database import get_resume_repository
+from backend.data.database import DatabaseManager, get_resume_repository
+from backend.data.pagination import InvalidCursorError, next_cursor
 from backend.data.resume_models import ResumeStatus, ResumeType
 from backend.logger import logger
 
 router = APIRouter(prefix="/resumes", tags=["resumes"])
 
 
+async def _get_owned_resume(db, resume_id: str, user_id: str):
+    """Fetch a resume on the database executor; None unless the user owns it."""
+    resume = await db.run_sync(get_resume_repository().get_resume, resume_id)
+    if resume is None or str(resume.user_id) != str(user_id):
+        return None
+    return resume
+
+
 @router.get("/", response_model=ResumeListResponse)
 async def list_resumes(
     status: Optional[ResumeStatus] = Query(None, description="Filter by resume status"),
@@ -28,34 +36,53 @@ async def list_resumes(
     ),
     limit: int = Query(50, description="Number of resumes to return", le=100),
     offset: int = Query(0, description="Number of resumes to skip"),
+    after: Optional[str] = Query(
+        None, description="Cursor of the previous page (next_cursor)"
+    ),
+    include_total: Optional[bool] = Query(
+        None, description="Count all resumes (default: without a cursor only)"
+    ),
     current_user=Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: DatabaseManager = Depends(get_db),
 ):
     """List all resumes for the current user with optional filtering and pagination"""
+    if include_total is None:
+        include_total = after is None
     try:
         resume_repo = get_resume_repository()
 
-        # Get user's resumes with filtering
-        resumes = await resume_repo.get_user_resumes(
-            user_id=current_user, status=status
+        # Get a page of the user's resumes with filtering
+        resumes, total_resumes = await db.run_sync(
+            resume_repo.get_user_resumes,
+            user_id=current_user,
+            status=status,
+            resume_type=resume_type,
+            limit=limit,
+            offset=offset,
+            after=after,
+            include_total=include_total,
         )
 
-        # Apply pagination
-        total_resumes = len(resumes)
-        paginated_resumes = resumes[offset : offset + limit]
+        # Load the target jobs of tailored resumes in one query
+        target_jobs = {}
+        job_ids = list(
+            {str(resume.target_job_id) for resume in resumes if resume.target_job_id}
+        )
+        if job_ids:
+            from backend.data.database import get_job_repository
+
+            job_repo = get_job_repository()
+            jobs = await db.run_sync(job_repo.get_jobs, job_ids)
+            target_jobs = {str(job.id): job for job in jobs}
 
         # Convert to response models
         resume_responses = []
-        for resume in paginated_resumes:
-            # Get target job details if resume is tailored
-            target_job = None
-            if resume.job_id:
-                from backend.data.database import get_job_repository
-
-                job_repo = get_job_repository()
-                job = job_repo.get_job(str(resume.job_id))
-                if job:
-                    target_job = job
+        for resume in resumes:
+            target_job = (
+                target_jobs.get(str(resume.target_job_id))
+                if resume.target_job_id
+                else None
+            )
 
             resume_response = ResumeResponse(
                 id=UUID(resume.id) if not isinstance(resume.id, UUID) else resume.id,
@@ -80,10 +107,10 @@ async def list_resumes(
                     else resume.template_id
                 ),
                 parent_resume_id=(
-                    UUID(resume.based_on_resume_id)
-                    if resume.based_on_resume_id
-                    and not isinstance(resume.based_on_resume_id, UUID)
-                    else resume.based_on_resume_id
+                    UUID(resume.parent_resume_id)
+                    if resume.parent_resume_id
+                    and not isinstance(resume.parent_resume_id, UUID)
+                    else resume.parent_resume_id
                 ),
                 target_job=target_job,
                 version=resume.version,
@@ -98,11 +125,15 @@ async def list_resumes(
             total=total_resumes,
             page=offset // limit + 1 if limit > 0 else 1,
             page_size=limit,
+            next_cursor=next_cursor(resumes, limit, "updated_at"),
         )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error listing resumes for user {current_user}: {e}")
+        # "status" is the query parameter here, not fastapi.status
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            status_code=500,
             detail="Failed to list resumes",
         )
 
@@ -111,12 +142,11 @@ async def list_resumes(
 async def get_resume(
     resume_id: str,
     current_user=Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: DatabaseManager = Depends(get_db),
 ):
     """Get a specific resume by ID"""
     try:
-        resume_repo = get_resume_repository()
-        resume = await resume_repo.get_resume(resume_id, current_user)
+        resume = await _get_owned_resume(db, resume_id, current_user)
 
         if not resume:
             raise HTTPException(
@@ -126,11 +156,11 @@ async def get_resume(
 
         # Get target job details if resume is tailored
         target_job = None
-        if resume.job_id:
+        if resume.target_job_id:
             from backend.data.database import get_job_repository
 
             job_repo = get_job_repository()
-            job = job_repo.get_job(str(resume.job_id))
+            job = await db.run_sync(job_repo.get_job, str(resume.target_job_id))
             if job:
                 target_job = job
 
@@ -157,10 +187,10 @@ async def get_resume(
                 else resume.template_id
             ),
             parent_resume_id=(
-                UUID(resume.based_on_resume_id)
-                if resume.based_on_resume_id
-                and not isinstance(resume.based_on_resume_id, UUID)
-                else resume.based_on_resume_id
+                UUID(resume.parent_resume_id)
+                if resume.parent_resume_id
+                and not isinstance(resume.parent_resume_id, UUID)
+                else resume.parent_resume_id
             ),
             target_job=target_job,
             version=resume.version,
@@ -182,7 +212,7 @@ async def get_resume(
 async def create_resume(
     resume_data: ResumeCreate,
     current_user=Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: DatabaseManager = Depends(get_db),
 ):
     """Create a new resume"""
     try:
@@ -194,24 +224,21 @@ async def create_resume(
             )
 
         resume_repo = get_resume_repository()
-        resume_db = await resume_repo.create_resume(resume_data)
+        resume = await db.run_sync(resume_repo.create_resume, resume_data)
 
-        if not resume_db:
+        if not resume:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to create resume",
             )
 
-        # Convert back to Pydantic model
-        resume = resume_repo._db_to_pydantic(resume_db)
-
         # Get target job details if resume is tailored
         target_job = None
-        if resume.job_id:
+        if resume.target_job_id:
             from backend.data.database import get_job_repository
 
             job_repo = get_job_repository()
-            job = job_repo.get_job(str(resume.job_id))
+            job = await db.run_sync(job_repo.get_job, str(resume.target_job_id))
             if job:
                 target_job = job
 
@@ -238,10 +265,10 @@ async def create_resume(
                 else resume.template_id
             ),
             parent_resume_id=(
-                UUID(resume.based_on_resume_id)
-                if resume.based_on_resume_id
-                and not isinstance(resume.based_on_resume_id, UUID)
-                else resume.based_on_resume_id
+                UUID(resume.parent_resume_id)
+                if resume.parent_resume_id
+                and not isinstance(resume.parent_resume_id, UUID)
+                else resume.parent_resume_id
             ),
             target_job=target_job,
             version=resume.version,
@@ -264,14 +291,14 @@ async def update_resume(
     resume_id: str,
     update_data: ResumeUpdate,
     current_user=Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: DatabaseManager = Depends(get_db),
 ):
     """Update an existing resume"""
     try:
         resume_repo = get_resume_repository()
 
         # Check if resume exists and belongs to user
-        existing_resume = await resume_repo.get_resume(resume_id, current_user)
+        existing_resume = await _get_owned_resume(db, resume_id, current_user)
         if not existing_resume:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -282,8 +309,8 @@ async def update_resume(
         update_dict = update_data.dict(exclude_unset=True)
 
         # Update the resume
-        updated_resume = await resume_repo.update_resume(
-            resume_id, current_user, update_dict
+        updated_resume = await db.run_sync(
+            resume_repo.update_resume, resume_id, update_dict
         )
 
         if not updated_resume:
@@ -294,11 +321,11 @@ async def update_resume(
 
         # Get target job details if resume is tailored
         target_job = None
-        if updated_resume.job_id:
+        if updated_resume.target_job_id:
             from backend.data.database import get_job_repository
 
             job_repo = get_job_repository()
-            job = job_repo.get_job(str(updated_resume.job_id))
+            job = await db.run_sync(job_repo.get_job, str(updated_resume.target_job_id))
             if job:
                 target_job = job
 
@@ -330,10 +357,10 @@ async def update_resume(
                 else updated_resume.template_id
             ),
             parent_resume_id=(
-                UUID(updated_resume.based_on_resume_id)
-                if updated_resume.based_on_resume_id
-                and not isinstance(updated_resume.based_on_resume_id, UUID)
-                else updated_resume.based_on_resume_id
+                UUID(updated_resume.parent_resume_id)
+                if updated_resume.parent_resume_id
+                and not isinstance(updated_resume.parent_resume_id, UUID)
+                else updated_resume.parent_resume_id
             ),
             target_job=target_job,
             version=updated_resume.version,
@@ -355,14 +382,14 @@ async def update_resume(
 async def delete_resume(
     resume_id: str,
     current_user=Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: DatabaseManager = Depends(get_db),
 ):
     """Delete a resume"""
     try:
         resume_repo = get_resume_repository()
 
         # Check if resume exists and belongs to user
-        existing_resume = await resume_repo.get_resume(resume_id, current_user)
+        existing_resume = await _get_owned_resume(db, resume_id, current_user)
         if not existing_resume:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -370,7 +397,7 @@ async def delete_resume(
             )
 
         # Delete the resume
-        success = await resume_repo.delete_resume(resume_id, current_user)
+        success = await db.run_sync(resume_repo.delete_resume, resume_id)
 
         if not success:
             raise HTTPException(
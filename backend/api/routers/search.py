@@ -10,10 +10,31 @@ from backend.api.models.semantic_search.models import (
     SemanticSearchResponse,
     SemanticSearchResult,
 )
+from backend.data.database import get_database_manager, get_job_repository
+from backend.data.models import JobListing
+from backend.services.hybrid_search_service import MINMAX, HybridSearchService
 
 router = APIRouter(prefix="/search", tags=["search"])
 
 
+def _job_result_fields(job: JobListing) -> dict:
+    """Fields shared by semantic and hybrid search results."""
+    return {
+        "job_id": str(job.id),
+        "title": job.title,
+        "company": job.company_name or "",
+        "location": job.location,
+        "job_type": job.job_type.value if job.job_type else None,
+        "remote_type": job.remote_type.value if job.remote_type else None,
+        "experience_level": (
+            job.experience_level.value if job.experience_level else None
+        ),
+        "salary_min": int(job.salary_min) if job.salary_min is not None else None,
+        "salary_max": int(job.salary_max) if job.salary_max is not None else None,
+        "description": job.description,
+    }
+
+
 @router.get("/semantic", response_model=SemanticSearchResponse)
 async def semantic_search(
     query: str = Query(..., description="Semantic search query"),
@@ -35,50 +56,44 @@ async def semantic_search(
 ):
     """Perform semantic search on job listings (requires authentication)"""
     try:
-        # In a real implementation, this would:
-        # 1. Convert the query to embeddings using a sentence transformer model
-        # 2. Search the job embeddings in the database
-        # 3. Calculate semantic similarity scores
-        # 4. Apply filters if provided
-        # 5. Return results sorted by semantic similarity
+        # Location and company are free-text filters resolved in SQL; the
+        # remaining filters are applied by the vector index before scoring.
+        # Queries and scoring run on the database executor, off the event loop
+        db_manager = get_database_manager()
+        job_repo = get_job_repository()
+        allowed_job_ids = None
+        if location or company:
+            allowed_job_ids = await db_manager.run_sync(
+                job_repo.find_job_ids, location=location, company=company
+            )
 
-        # Mock implementation for now
-        mock_results = [
-            SemanticSearchResult(
-                job_id="job-123",
-                title="Senior Python Developer",
-                company="Tech Corp",
-                location="San Francisco, CA",
-                job_type="Full-time",
-                remote_type="Hybrid",
-                experience_level="Senior-level",
-                salary_min=120000,
-                salary_max=160000,
-                description="Looking for an experienced Python developer with Django and FastAPI experience",
-                score=0.95,
-            ),
+        hits = await db_manager.run_sync(
+            db_manager.vector_index.search,
+            query,
+            limit=limit,
+            job_types=job_types,
+            remote_types=remote_types,
+            experience_levels=experience_levels,
+            min_salary=min_salary,
+            max_salary=max_salary,
+            job_ids=allowed_job_ids,
+        )
+        scores = dict(hits)
+        jobs = await db_manager.run_sync(
+            job_repo.get_jobs, [job_id for job_id, _ in hits]
+        )
+
+        results = [
             SemanticSearchResult(
-                job_id="job-456",
-                title="Backend Engineer",
-                company="Innovate Inc",
-                location="Remote",
-                job_type="Full-time",
-                remote_type="Remote",
-                experience_level="Mid-level",
-                salary_min=100000,
-                salary_max=140000,
-                description="Build scalable backend services using Python and cloud technologies",
-                score=0.87,
-            ),
+                **_job_result_fields(job), score=round(scores[str(job.id)], 4)
+            )
+            for job in jobs
         ]
 
-        # Apply limit to mock results
-        limited_results = mock_results[:limit]
-
         return SemanticSearchResponse(
             query=query,
-            results=limited_results,
-            total=len(mock_results),
+            results=results,
+            total=len(results),
             limit=limit,
             processed_at=datetime.utcnow().isoformat(),
         )
@@ -109,61 +124,52 @@ async def hybrid_search(
     semantic_weight: float = Query(
         0.5, description="Weight for semantic matching (0.0 to 1.0)", ge=0.0, le=1.0
     ),
+    fusion: str = Query(
+        MINMAX,
+        description="Score fusion: 'minmax' (normalized scores) or 'rrf' (reciprocal rank)",
+        pattern="^(minmax|rrf)$",
+    ),
     current_user=Depends(get_current_user),
 ):
     """Perform hybrid search on job listings (semantic + keyword) (requires authentication)"""
     try:
-        # In a real implementation, this would:
-        # 1. Perform keyword search on job listings
-        # 2. Convert the query to embeddings and perform semantic search
-        # 3. Combine the scores using the provided weights
-        # 4. Apply filters if provided
-        # 5. Return results sorted by combined score
+        service = HybridSearchService(
+            get_job_repository(), get_database_manager().vector_index
+        )
+        outcome = await service.search(
+            query,
+            limit=limit,
+            job_types=job_types,
+            remote_types=remote_types,
+            experience_levels=experience_levels,
+            min_salary=min_salary,
+            max_salary=max_salary,
+            location=location,
+            company=company,
+            keyword_weight=keyword_weight,
+            semantic_weight=semantic_weight,
+            fusion=fusion,
+        )
 
-        # Mock implementation for now
-        mock_results = [
+        results = [
             HybridSearchResult(
-                job_id="job-123",
-                title="Senior Python Developer",
-                company="Tech Corp",
-                location="San Francisco, CA",
-                job_type="Full-time",
-                remote_type="Hybrid",
-                experience_level="Senior-level",
-                salary_min=120000,
-                salary_max=160000,
-                description="Looking for an experienced Python developer with Django and FastAPI experience",
-                keyword_score=0.85,
-                semantic_score=0.95,
-                combined_score=0.90,
-            ),
-            HybridSearchResult(
-                job_id="job-456",
-                title="Backend Engineer",
-                company="Innovate Inc",
-                location="Remote",
-                job_type="Full-time",
-                remote_type="Remote",
-                experience_level="Mid-level",
-                salary_min=100000,
-                salary_max=140000,
-                description="Build scalable backend services using Python and cloud technologies",
-                keyword_score=0.75,
-                semantic_score=0.87,
-                combined_score=0.81,
-            ),
+                **_job_result_fields(hit.job),
+                keyword_score=round(hit.keyword_score, 4),
+                semantic_score=round(hit.semantic_score, 4),
+                combined_score=round(hit.combined_score, 4),
+            )
+            for hit in outcome.hits
         ]
 
-        # Apply limit to mock results
-        limited_results = mock_results[:limit]
-
         return HybridSearchResponse(
             query=query,
-            results=limited_results,
-            total=len(mock_results),
+            results=results,
+            total=outcome.total,
             limit=limit,
             keyword_weight=keyword_weight,
             semantic_weight=semantic_weight,
+            fusion=fusion,
+            timings_ms=outcome.timings,
             processed_at=datetime.utcnow().isoformat(),
         )
     except Exception as e:
@@ -17,6 +17,7 @@ from backend.api.models.analytics.models import (
     TopSkillResume,
     UserStatsResponse,
 )
+from backend.data.database import get_interaction_repository
 
 router = APIRouter(prefix="/stats", tags=["statistics"])
 
@@ -286,3 +287,12 @@ async def get_job_source_statistics(current_user=Depends(get_current_user)):
         )
     except Exception as e:
         raise Exception(f"Error fetching job source statistics: {str(e)}")
+
+
+@router.get("/view-buffer")
+async def get_view_buffer_statistics(current_user=Depends(get_current_user)):
+    """Get job view buffer depth and flush counters (requires authentication)"""
+    view_buffer = get_interaction_repository().view_buffer
+    if view_buffer is None:
+        return {"enabled": False}
+    return {"enabled": True, **view_buffer.stats()}
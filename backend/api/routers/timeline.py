@@ -12,12 +12,18 @@ from backend.api.models.timeline.models import (
 )
 from backend.data.database import get_database_manager
 from backend.data.models import TimelineEventType
+from backend.data.pagination import InvalidCursorError, next_cursor
 from backend.logger import logger
 from backend.services.timeline_service import TimelineService
 
 router = APIRouter(prefix="/timeline", tags=["timeline"])
 
 
+def _create_event(session: Session, **fields):
+    """Write intent for creating a timeline event."""
+    return TimelineService(session, autocommit=False).create_event(**fields)
+
+
 # Database session dependency
 def get_database_session():
     """Get database session for timeline operations."""
@@ -38,6 +44,9 @@ async def list_timeline_events(
     ),
     limit: int = Query(50, description="Number of timeline events to return", le=100),
     offset: int = Query(0, description="Number of timeline events to skip"),
+    after: Optional[str] = Query(
+        None, description="Cursor of the previous page (next_cursor)"
+    ),
     current_user=Depends(get_current_user),
     db: Session = Depends(get_database_session),
 ):
@@ -50,12 +59,14 @@ async def list_timeline_events(
             user_profile_id = current_user
 
         # Get timeline events with filtering
-        events = timeline_service.get_user_timeline(
+        events = await get_database_manager().run_sync(
+            timeline_service.get_user_timeline,
             user_profile_id=user_profile_id,
             limit=limit,
             offset=offset,
             job_id=job_id,
             event_types=event_types,
+            after=after,
         )
 
         # Convert to response models
@@ -85,7 +96,10 @@ async def list_timeline_events(
             total=total_events,
             page=offset // limit + 1 if limit > 0 else 1,
             page_size=limit,
+            next_cursor=next_cursor(events, limit, "event_date"),
         )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         logger.error(f"Error listing timeline events: {e}")
         raise HTTPException(
@@ -106,7 +120,9 @@ async def get_timeline_event(
 
         # Get all events for the user and find the specific one
         # This is a simplified approach - in a real implementation, we would query directly by ID
-        events = timeline_service.get_user_timeline(user_profile_id=current_user)
+        events = await get_database_manager().run_sync(
+            timeline_service.get_user_timeline, user_profile_id=current_user
+        )
         event = next((e for e in events if e.id == event_id), None)
 
         if not event:
@@ -145,7 +161,6 @@ async def get_timeline_event(
 async def create_timeline_event(
     event_data: TimelineEventCreate,
     current_user=Depends(get_current_user),
-    db: Session = Depends(get_database_session),
 ):
     """Create a new timeline event"""
     try:
@@ -156,8 +171,9 @@ async def create_timeline_event(
                 detail="Not authorized to create timeline event for another user",
             )
 
-        timeline_service = TimelineService(db)
-        event = timeline_service.create_event(
+        # Queued on the database writer; shares a commit with other writes
+        event = await get_database_manager().write_async(
+            _create_event,
             user_profile_id=event_data.user_profile_id,
             event_type=event_data.event_type,
             title=event_data.title,
@@ -205,7 +221,9 @@ async def update_timeline_event(
         timeline_service = TimelineService(db)
 
         # Check if event exists and belongs to user (simplified check)
-        events = timeline_service.get_user_timeline(user_profile_id=current_user)
+        events = await get_database_manager().run_sync(
+            timeline_service.get_user_timeline, user_profile_id=current_user
+        )
         existing_event = next((e for e in events if e.id == event_id), None)
 
         if not existing_event:
@@ -216,7 +234,9 @@ async def update_timeline_event(
 
         # Update the event
         update_dict = update_data.dict(exclude_unset=True)
-        updated_event = timeline_service.update_event(event_id, **update_dict)
+        updated_event = await get_database_manager().run_sync(
+            timeline_service.update_event, event_id, **update_dict
+        )
 
         if not updated_event:
             raise HTTPException(
@@ -259,7 +279,9 @@ async def delete_timeline_event(
         timeline_service = TimelineService(db)
 
         # Check if event exists and belongs to user (simplified check)
-        events = timeline_service.get_user_timeline(user_profile_id=current_user)
+        events = await get_database_manager().run_sync(
+            timeline_service.get_user_timeline, user_profile_id=current_user
+        )
         existing_event = next((e for e in events if e.id == event_id), None)
 
         if not existing_event:
@@ -269,7 +291,9 @@ async def delete_timeline_event(
             )
 
         # Delete the event
-        success = timeline_service.delete_event(event_id)
+        success = await get_database_manager().run_sync(
+            timeline_service.delete_event, event_id
+        )
 
         if not success:
             raise HTTPException(
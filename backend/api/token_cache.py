@@ -0,0 +1,124 @@
+"""
+JobPilot Token Validation Cache
+Bounded LRU cache of validated access tokens.
+
+Every authenticated request goes through ``validate_token``. Decoding and
+verifying the JWT signature, then checking the user's token version, is
+repeated for the same token on every request a client makes, so validated
+tokens are cached by a SHA-256 digest of the token (the raw token is never
+kept):
+
+- An entry holds the token's user ID and expires at the token's own ``exp``,
+  or after ``revalidate_seconds`` if that comes first, so revocations made by
+  another process are picked up within that window.
+- ``revoke_user`` drops every cached token of a user immediately, e.g. on
+  logout or when the account is deactivated.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Set, Tuple
+
+DEFAULT_MAX_SIZE = 10000
+DEFAULT_REVALIDATE_SECONDS = 60.0
+
+
+def token_digest(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+class TokenValidationCache:
+    """Thread-safe LRU cache from token digest to (user_id, expires_at)."""
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_MAX_SIZE,
+        revalidate_seconds: float = DEFAULT_REVALIDATE_SECONDS,
+        clock=time.time,
+    ):
+        self.max_size = max_size
+        self.revalidate_seconds = revalidate_seconds
+        # Wall-clock time: expiry is compared against the token's exp claim
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._keys_by_user: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.revocations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, token: str) -> Optional[str]:
+        """User ID of a cached, unexpired token, or None."""
+        key = token_digest(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            user_id, expires_at = entry
+            if expires_at <= self._clock():
+                self._discard(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return user_id
+
+    def put(self, token: str, user_id: str, exp: Optional[float] = None) -> None:
+        """Cache a validated token until its exp or the revalidation window."""
+        if self.max_size <= 0 or self.revalidate_seconds <= 0:
+            return
+        now = self._clock()
+        expires_at = now + self.revalidate_seconds
+        if exp is not None:
+            expires_at = min(expires_at, float(exp))
+        if expires_at <= now:
+            return
+        key = token_digest(token)
+        user_id = str(user_id)
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = (user_id, expires_at)
+            self._keys_by_user.setdefault(user_id, set()).add(key)
+            while len(self._entries) > self.max_size:
+                self._discard(next(iter(self._entries)))
+                self.evictions += 1
+
+    def revoke_user(self, user_id: str) -> None:
+        """Forget every cached token of a user."""
+        with self._lock:
+            keys = list(self._keys_by_user.get(str(user_id), ()))
+            for key in keys:
+                self._discard(key)
+            self.revocations += len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_user.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "revocations": self.revocations,
+        }
+
+    def _discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        keys = self._keys_by_user.get(entry[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_user[entry[0]]
@@ -0,0 +1,157 @@
+"""
+JobPilot Company Resolution Cache
+Bounded LRU/TTL cache of company resolutions for job ingestion.
+
+Resolving a company means validating its name and domain, then running
+exact, domain and fuzzy matching against the companies table. Feeds repeat
+the same employers across many postings, so resolutions are cached by
+``(normalized_name, domain)``:
+
+- Positive entries hold a snapshot of the company's columns. Callers get a
+  fresh detached ``CompanyInfoDB`` built from it, never a shared instance.
+- Negative entries record that no company matched, with a shorter TTL.
+
+Entries are invalidated when a company is updated or deleted, and negative
+entries are dropped whenever a company is created, since a new company may
+match a name that previously resolved to nothing.
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Set, Tuple
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached
+
+from backend.data.models import CompanyInfoDB
+
+CacheKey = Tuple[str, Optional[str]]
+
+DEFAULT_MAX_SIZE = 10000
+DEFAULT_TTL_SECONDS = 600.0
+DEFAULT_NEGATIVE_TTL_SECONDS = 60.0
+
+# Returned by CompanyResolutionCache.get when the key is not cached
+MISSING = object()
+
+
+def company_snapshot(company: CompanyInfoDB) -> Dict[str, Any]:
+    """Column values of a loaded company."""
+    return {
+        attribute.key: copy.deepcopy(getattr(company, attribute.key))
+        for attribute in inspect(CompanyInfoDB).column_attrs
+    }
+
+
+def detached_company(snapshot: Dict[str, Any]) -> CompanyInfoDB:
+    """A new detached ``CompanyInfoDB`` for a cached snapshot."""
+    company = CompanyInfoDB(**copy.deepcopy(snapshot))
+    make_transient_to_detached(company)
+    return company
+
+
+class CompanyResolutionCache:
+    """Thread-safe LRU cache with per-entry expiry."""
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_MAX_SIZE,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        negative_ttl_seconds: float = DEFAULT_NEGATIVE_TTL_SECONDS,
+        clock=time.monotonic,
+    ):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[CacheKey, Tuple[float, Optional[dict]]]" = (
+            OrderedDict()
+        )
+        self._keys_by_company: Dict[str, Set[CacheKey]] = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: CacheKey):
+        """
+        Cached snapshot for the key, None for a negative entry, or MISSING.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return MISSING
+            expires_at, snapshot = entry
+            if expires_at <= self._clock():
+                self._discard(key)
+                self.misses += 1
+                return MISSING
+            self._entries.move_to_end(key)
+            if snapshot is None:
+                self.negative_hits += 1
+            else:
+                self.hits += 1
+            return snapshot
+
+    def put(self, key: CacheKey, snapshot: Optional[Dict[str, Any]]) -> None:
+        """Cache a resolved company snapshot, or None for "no match"."""
+        ttl = self.ttl_seconds if snapshot is not None else self.negative_ttl_seconds
+        if ttl <= 0 or self.max_size <= 0:
+            return
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = (self._clock() + ttl, snapshot)
+            if snapshot is not None:
+                self._keys_by_company.setdefault(str(snapshot["id"]), set()).add(key)
+            while len(self._entries) > self.max_size:
+                self._discard(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate_company(self, company_id: str) -> None:
+        """Forget a company that was updated or deleted."""
+        with self._lock:
+            for key in list(self._keys_by_company.get(str(company_id), ())):
+                self._discard(key)
+            self._drop_negative()
+
+    def forget_negative(self) -> None:
+        """Drop "no match" entries, e.g. after companies were created."""
+        with self._lock:
+            self._drop_negative()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_company.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def _drop_negative(self) -> None:
+        for key in [key for key, (_, value) in self._entries.items() if value is None]:
+            del self._entries[key]
+
+    def _discard(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None or entry[1] is None:
+            return
+        company_id = str(entry[1]["id"])
+        keys = self._keys_by_company.get(company_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_company[company_id]
@@ -6,10 +6,20 @@ companies across different data sources to prevent duplicates.
 """
 
 import re
+import threading
+import weakref
+from collections import Counter, defaultdict
 from difflib import SequenceMatcher
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 from urllib.parse import urlparse
 
+# Companies scored with SequenceMatcher per fuzzy lookup, taken best-first by
+# trigram overlap from the name index
+MAX_FUZZY_CANDIDATES = 64
+
+# Minimum similarity for suggest_company_matches
+SUGGESTION_THRESHOLD = 0.3
+
 
 def normalize_company_name(name: str) -> str:
     """
@@ -98,6 +108,203 @@ def extract_domain_from_url(url: str) -> Optional[str]:
         return None
 
 
+def name_trigrams(name: str) -> Set[str]:
+    """
+    Character trigrams of a normalized name, padded like pg_trgm.
+
+    Examples:
+        >>> sorted(name_trigrams("ibm"))
+        ["  i", " ib", "bm ", "ibm"]
+    """
+    if not name:
+        return set()
+    padded = f"  {name} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class CompanyNameIndex:
+    """
+    In-memory character trigram index over ``companies.normalized_name``.
+
+    Fuzzy lookups only score the companies sharing the most trigrams with the
+    query, instead of running SequenceMatcher against every company. The
+    index is loaded lazily on first use and updated incrementally by the
+    repositories when companies are created, renamed or deleted.
+    """
+
+    def __init__(self):
+        self._names: Dict[str, str] = {}
+        self._trigram_counts: Dict[str, int] = {}
+        self._postings: Dict[str, Set[str]] = defaultdict(set)
+        self._loaded = False
+        self._lock = threading.RLock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def ensure_loaded(self, session) -> None:
+        """Load every company's normalized name the first time it is needed."""
+        if self._loaded:
+            return
+        from .models import CompanyInfoDB
+
+        with self._lock:
+            if self._loaded:
+                return
+            for company_id, normalized_name in session.query(
+                CompanyInfoDB.id, CompanyInfoDB.normalized_name
+            ):
+                self._add(company_id, normalized_name)
+            self._loaded = True
+
+    def invalidate(self) -> None:
+        """Drop the index; it is reloaded on the next lookup."""
+        with self._lock:
+            self._names.clear()
+            self._trigram_counts.clear()
+            self._postings.clear()
+            self._loaded = False
+
+    def add(self, company_id: str, normalized_name: Optional[str]) -> None:
+        """Index a new company, or re-index a renamed one."""
+        if not self._loaded:
+            return  # Picked up by the initial load
+        with self._lock:
+            self._remove(company_id)
+            self._add(company_id, normalized_name)
+
+    def remove(self, company_id: str) -> None:
+        """Remove a deleted company."""
+        if not self._loaded:
+            return
+        with self._lock:
+            self._remove(company_id)
+
+    def search(
+        self,
+        normalized_name: str,
+        threshold: float = 0.0,
+        limit: int = 1,
+        max_candidates: int = MAX_FUZZY_CANDIDATES,
+    ) -> List[Tuple[str, float]]:
+        """
+        Best (company_id, similarity_score) pairs at or above the threshold.
+
+        Candidates are ranked by trigram Dice coefficient and the top
+        ``max_candidates`` are scored exactly with ``similarity_score``.
+        """
+        query_trigrams = name_trigrams(normalized_name)
+        if not query_trigrams:
+            return []
+
+        with self._lock:
+            shared = Counter()
+            for trigram in query_trigrams:
+                postings = self._postings.get(trigram)
+                if postings:
+                    shared.update(postings)
+
+            # SequenceMatcher's ratio is at most 2 * min(len) / (sum of lens)
+            query_length = len(normalized_name)
+            ranked = []
+            for company_id, count in shared.items():
+                name = self._names[company_id]
+                lengths = query_length + len(name)
+                if 2 * min(query_length, len(name)) < threshold * lengths:
+                    continue
+                dice = (
+                    2 * count / (len(query_trigrams) + self._trigram_counts[company_id])
+                )
+                ranked.append((dice, company_id, name))
+
+        ranked.sort(reverse=True)
+        matches = []
+        for _, company_id, name in ranked[:max_candidates]:
+            score = similarity_score(normalized_name, name)
+            if score >= threshold:
+                matches.append((company_id, score))
+        matches.sort(key=lambda match: match[1], reverse=True)
+        return matches[:limit]
+
+    def _add(self, company_id: str, normalized_name: Optional[str]) -> None:
+        if not normalized_name:
+            return
+        trigrams = name_trigrams(normalized_name)
+        self._names[company_id] = normalized_name
+        self._trigram_counts[company_id] = len(trigrams)
+        for trigram in trigrams:
+            self._postings[trigram].add(company_id)
+
+    def _remove(self, company_id: str) -> None:
+        name = self._names.pop(company_id, None)
+        if name is None:
+            return
+        self._trigram_counts.pop(company_id, None)
+        for trigram in name_trigrams(name):
+            postings = self._postings.get(trigram)
+            if postings is not None:
+                postings.discard(company_id)
+                if not postings:
+                    del self._postings[trigram]
+
+
+_name_indexes = weakref.WeakKeyDictionary()
+_name_indexes_lock = threading.Lock()
+
+
+def company_name_index(bind) -> CompanyNameIndex:
+    """
+    The shared name index for a database.
+
+    Accepts an engine, connection or session; one index is kept per engine.
+    """
+    if hasattr(bind, "get_bind"):
+        bind = bind.get_bind()
+    engine = getattr(bind, "engine", bind)
+    with _name_indexes_lock:
+        index = _name_indexes.get(engine)
+        if index is None:
+            index = _name_indexes[engine] = CompanyNameIndex()
+        return index
+
+
+def _fuzzy_matches(
+    session, normalized_name: str, threshold: float, limit: int
+) -> List[Tuple[str, str, float]]:
+    """
+    Indexed fuzzy matches as (company_id, company_name, score), best first.
+
+    Hits are checked against the companies table in one query, so companies
+    deleted behind the index's back are dropped from it rather than returned.
+    """
+    from .models import CompanyInfoDB
+
+    index = company_name_index(session)
+    index.ensure_loaded(session)
+    matches = index.search(
+        normalized_name, threshold=threshold, limit=MAX_FUZZY_CANDIDATES
+    )
+    if not matches:
+        return []
+
+    names = dict(
+        session.query(CompanyInfoDB.id, CompanyInfoDB.name).filter(
+            CompanyInfoDB.id.in_([company_id for company_id, _ in matches])
+        )
+    )
+    results = []
+    for company_id, score in matches:
+        if company_id not in names:
+            index.remove(company_id)
+        elif len(results) < limit:
+            results.append((company_id, names[company_id], score))
+    return results
+
+
 def find_existing_company_by_name(
     session, name: str, similarity_threshold: float = 0.85
 ) -> Optional[str]:
@@ -118,7 +325,7 @@ def find_existing_company_by_name(
 
     # First try exact normalized match (fastest)
     exact_match = (
-        session.query(CompanyInfoDB)
+        session.query(CompanyInfoDB.id)
         .filter(CompanyInfoDB.normalized_name == normalized_search)
         .first()
     )
@@ -126,23 +333,10 @@ def find_existing_company_by_name(
     if exact_match:
         return exact_match.id
 
-    # If no exact match, try fuzzy matching
-    all_companies = session.query(CompanyInfoDB.id, CompanyInfoDB.normalized_name).all()
-
-    best_match = None
-    best_score = 0.0
-
-    for company_id, company_normalized_name in all_companies:
-        if not company_normalized_name:
-            continue
+    # If no exact match, score the nearest names from the trigram index
+    matches = _fuzzy_matches(session, normalized_search, similarity_threshold, 1)
 
-        score = similarity_score(normalized_search, company_normalized_name)
-
-        if score > best_score and score >= similarity_threshold:
-            best_score = score
-            best_match = company_id
-
-    return best_match
+    return matches[0][0] if matches else None
 
 
 def find_existing_company_by_domain(session, domain: str) -> Optional[str]:
@@ -251,27 +445,9 @@ def suggest_company_matches(
     Returns:
         List of tuples (company_id, company_name, similarity_score) ordered by score
     """
-    from .models import CompanyInfoDB
-
-    normalized_search = normalize_company_name(name)
-    all_companies = session.query(
-        CompanyInfoDB.id, CompanyInfoDB.name, CompanyInfoDB.normalized_name
-    ).all()
-
-    matches = []
-
-    for company_id, company_name, normalized_name in all_companies:
-        if not normalized_name:
-            continue
-
-        score = similarity_score(normalized_search, normalized_name)
-
-        if score > 0.3:  # Only include reasonable matches
-            matches.append((company_id, company_name, score))
-
-    # Sort by similarity score (descending) and limit results
-    matches.sort(key=lambda x: x[2], reverse=True)
-    return matches[:limit]
+    return _fuzzy_matches(
+        session, normalize_company_name(name), SUGGESTION_THRESHOLD, limit
+    )
 
 
 def validate_company_data(
@@ -4,12 +4,27 @@ Repository pattern implementation for company data management.
 """
 
 import re
+import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from sqlalchemy import and_, desc, func, or_
+from sqlalchemy import and_, desc, func, insert, or_
 from sqlalchemy.exc import IntegrityError
 
+from backend.data.bulk_insert import (
+    DEFAULT_CHUNK_SIZE,
+    BulkWriteReport,
+    chunked,
+    execute_grouped,
+    row_values,
+)
+from backend.data.conversion import conversion_plan
+from backend.data.count_cache import (
+    COUNT_STRATEGIES,
+    TotalCount,
+    count_total,
+    filter_signature,
+)
 from backend.data.models import (
     CompanyInfo,
     CompanyInfoDB,
@@ -17,9 +32,12 @@ from backend.data.models import (
     pydantic_to_sqlalchemy,
     sqlalchemy_to_pydantic,
 )
+from backend.data.pagination import InvalidCursorError, keyset_order
 from backend.logger import logger
 from backend.utils.retry import retry_db_write
 
+COMPANY_COLUMNS = frozenset(CompanyInfoDB.__table__.columns.keys())
+
 
 class CompanyRepository:
     """Repository for company information operations."""
@@ -52,10 +70,15 @@ class CompanyRepository:
 
                 session.add(company_db)
                 session.flush()  # Get the ID
+                self.db_manager.company_index.add(
+                    company_db.id, company_db.normalized_name
+                )
 
                 result = sqlalchemy_to_pydantic(company_db, CompanyInfo)
-                logger.info(f"Created company: {result.name} (ID: {result.id})")
-                return result
+
+            self.db_manager.company_cache.forget_negative()
+            logger.info(f"Created company: {result.name} (ID: {result.id})")
+            return result
 
         except IntegrityError as e:
             if "unique_company_identity" in str(e):
@@ -124,10 +147,17 @@ class CompanyRepository:
 
                 company_db.updated_at = datetime.utcnow()
                 session.flush()
+                if "name" in update_data:
+                    self.db_manager.search_index.refresh_company(session, company_id)
+                    self.db_manager.company_index.add(
+                        company_id, company_db.normalized_name
+                    )
 
                 result = sqlalchemy_to_pydantic(company_db, CompanyInfo)
-                logger.info(f"Updated company: {company_id}")
-                return result
+
+            self.db_manager.company_cache.invalidate_company(company_id)
+            logger.info(f"Updated company: {company_id}")
+            return result
 
         except Exception as e:
             logger.error(f"Error updating company {company_id}: {e}")
@@ -142,11 +172,14 @@ class CompanyRepository:
                     .filter(CompanyInfoDB.id == company_id)
                     .first()
                 )
-                if company_db:
-                    session.delete(company_db)
-                    logger.info(f"Deleted company: {company_id}")
-                    return True
-                return False
+                if not company_db:
+                    return False
+                session.delete(company_db)
+                self.db_manager.company_index.remove(company_id)
+
+            self.db_manager.company_cache.invalidate_company(company_id)
+            logger.info(f"Deleted company: {company_id}")
+            return True
         except Exception as e:
             logger.error(f"Error deleting company {company_id}: {e}")
             return False
@@ -159,8 +192,27 @@ class CompanyRepository:
         size_categories: Optional[List[CompanySizeCategory]] = None,
         limit: int = 50,
         offset: int = 0,
-    ) -> Tuple[List[CompanyInfo], int]:
-        """Search companies with filters."""
+        after: Optional[str] = None,
+        include_total: bool = True,
+        count_strategy: Optional[str] = None,
+    ) -> Tuple[List[CompanyInfo], Optional[TotalCount]]:
+        """Search companies with filters, newest first.
+
+        Pages by offset, or by keyset when ``after`` is the cursor of the
+        previous page. The total is None unless ``include_total``;
+        ``count_strategy`` (exact, capped or cached) picks how it is counted.
+        """
+        if count_strategy not in (None, *COUNT_STRATEGIES):
+            raise ValueError(f"Unknown count strategy: {count_strategy}")
+        count_key = (
+            "companies",
+            filter_signature(
+                query=query,
+                industries=industries,
+                locations=locations,
+                size_categories=size_categories,
+            ),
+        )
         try:
             with self.db_manager.get_session() as session:
                 query_obj = session.query(CompanyInfoDB)
@@ -193,27 +245,41 @@ class CompanyRepository:
                     )
 
                 # Get total count
-                total_count = query_obj.count()
+                total_count = None
+                if include_total:
+                    total_count = count_total(
+                        query_obj,
+                        CompanyInfoDB.id,
+                        count_strategy,
+                        cache=self.db_manager.count_cache,
+                        key=count_key,
+                        tables=(CompanyInfoDB.__tablename__,),
+                    )
 
                 # Apply pagination and ordering
-                companies_db = (
-                    query_obj.order_by(desc(CompanyInfoDB.created_at))
+                plan = conversion_plan(CompanyInfoDB, CompanyInfo)
+                rows = (
+                    keyset_order(
+                        query_obj.with_entities(*plan.columns),
+                        CompanyInfoDB.created_at,
+                        CompanyInfoDB.id,
+                        after,
+                    )
                     .offset(offset)
                     .limit(limit)
                     .all()
                 )
 
                 # Convert to Pydantic models
-                companies = [
-                    sqlalchemy_to_pydantic(company_db, CompanyInfo)
-                    for company_db in companies_db
-                ]
+                companies = plan.from_rows(rows, validate=False)
 
                 logger.info(
                     f"Search returned {len(companies)} companies out of {total_count} total"
                 )
                 return companies, total_count
 
+        except InvalidCursorError:
+            raise
         except Exception as e:
             logger.error(f"Error searching companies: {e}")
             return [], 0
@@ -396,38 +462,60 @@ class CompanyRepository:
             return []
 
     @retry_db_write(max_retries=2, base_delay=1.5)
-    def bulk_create_companies(self, companies_data: List[CompanyInfo]) -> int:
-        """Create multiple companies efficiently."""
+    def bulk_create_companies(
+        self,
+        companies_data: Iterable[CompanyInfo],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> int:
+        """Create multiple companies efficiently with chunked Core inserts."""
         try:
+            report = BulkWriteReport()
+            start = time.perf_counter()
+            normalized_names = {}
             with self.db_manager.get_session() as session:
-                companies_db = []
-                for company_data in companies_data:
-                    # Validate company name
-                    if not company_data.name or len(company_data.name.strip()) == 0:
-                        logger.warning("Skipping company with empty name")
-                        continue
-
-                    company_db = pydantic_to_sqlalchemy(company_data, CompanyInfoDB)
-
-                    # Add normalized name for matching
-                    company_db.normalized_name = self._normalize_company_name(
-                        company_data.name
-                    )
-
-                    # Extract domain from website if provided
-                    if company_data.website:
-                        company_db.domain = self._extract_domain_from_url(
-                            company_data.website
-                        )
+                for chunk in chunked(companies_data, chunk_size):
+                    rows = []
+                    for company_data in chunk:
+                        # Validate company name
+                        if not company_data.name or not company_data.name.strip():
+                            logger.warning("Skipping company with empty name")
+                            report.skipped += 1
+                            continue
+
+                        row = row_values(company_data, COMPANY_COLUMNS)
+                        row.setdefault("id", str(company_data.id))
+
+                        # Add normalized name for matching
+                        if company_data.name not in normalized_names:
+                            normalized_names[company_data.name] = (
+                                self._normalize_company_name(company_data.name)
+                            )
+                        row["normalized_name"] = normalized_names[company_data.name]
 
-                    companies_db.append(company_db)
+                        # Extract domain from website if provided
+                        if company_data.website:
+                            row["domain"] = self._extract_domain_from_url(
+                                company_data.website
+                            )
 
-                session.add_all(companies_db)
-                session.flush()
+                        rows.append(row)
 
-                count = len(companies_db)
-                logger.info(f"Bulk created {count} companies")
-                return count
+                    if rows:
+                        execute_grouped(session, insert(CompanyInfoDB.__table__), rows)
+                        for row in rows:
+                            self.db_manager.company_index.add(
+                                row["id"], row["normalized_name"]
+                            )
+                        report.inserted += len(rows)
+                    report.chunks += 1
+
+            report.elapsed_seconds = time.perf_counter() - start
+            self.db_manager.company_cache.forget_negative()
+            logger.info(
+                f"Bulk created {report.inserted} companies "
+                f"at {report.rows_per_second:,.0f} rows/s"
+            )
+            return report.inserted
 
         except Exception as e:
             logger.error(f"Error bulk creating companies: {e}")
@@ -0,0 +1,204 @@
+"""
+JobPilot Model Conversion
+Compiled conversion plans from database rows to Pydantic models.
+
+Converting a row used to walk every table column with getattr and test each
+column name against hard-coded lists, once per row. A ConversionPlan does
+that work once per (ORM class, model class): it picks the columns the model
+needs, decides which NULLs become empty lists or dicts, and prepares
+converters from stored values to field types. Plans convert ORM objects or
+plain Core rows, so read paths can select only ``plan.columns`` and never
+build ORM objects.
+
+Rows are validated in bulk through a TypeAdapter by default. Rows read back
+from our own tables are already well typed, so hot read paths pass
+``validate=False``: the plan's converters fix up ids and enums and the models
+are built with ``model_construct``, skipping validation.
+"""
+
+from enum import Enum
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Union,
+    get_args,
+    get_origin,
+)
+from uuid import UUID
+
+from pydantic import BaseModel, TypeAdapter
+
+# Columns whose NULLs are returned as empty lists
+EMPTY_LIST_COLUMNS = frozenset(
+    [
+        "skills",
+        "preferred_locations",
+        "preferred_job_types",
+        "preferred_remote_types",
+        "skills_required",
+        "skills_preferred",
+        "benefits",
+        "values",
+        "tags",
+        "tech_stack",
+        "matching_fields",
+    ]
+)
+
+# Columns whose NULLs are returned as empty dicts
+EMPTY_DICT_COLUMNS = frozenset(
+    [
+        "event_data",
+        "scraping_rules",
+        "rate_limit_config",
+        "source_metadata",
+        "benefits_parsed",
+    ]
+)
+
+# Required fields left out when NULL so the model's default applies
+DEFAULTED_COLUMNS = frozenset(["id", "created_at", "updated_at"])
+
+
+def _converter(annotation) -> Optional[Callable[[Any], Any]]:
+    """Converter from a stored value to a field type, or None if it already fits."""
+    origin = get_origin(annotation)
+    if origin is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        return _converter(args[0]) if len(args) == 1 else None
+    if origin in (list, List):
+        args = get_args(annotation)
+        convert_item = _converter(args[0]) if args else None
+        if convert_item is None:
+            return None
+        return lambda value: [convert_item(item) for item in value]
+    if annotation is UUID:
+        return lambda value: value if isinstance(value, UUID) else UUID(str(value))
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        return lambda value: (
+            value if isinstance(value, annotation) else annotation(value)
+        )
+    return None
+
+
+class ConversionPlan:
+    """Precomputed conversion of one ORM class into one model class.
+
+    The target is normally a Pydantic model; any other class (such as a
+    detached copy of the ORM class itself) is called with the column values
+    as keyword arguments.
+    """
+
+    def __init__(self, orm_class, model_class):
+        self.orm_class = orm_class
+        self.model_class = model_class
+        self.is_pydantic = isinstance(model_class, type) and issubclass(
+            model_class, BaseModel
+        )
+        fields = model_class.model_fields if self.is_pydantic else None
+
+        self.names = tuple(
+            column.key
+            for column in orm_class.__table__.columns
+            if fields is None or column.key in fields
+        )
+        # Select these to fetch exactly what the model needs as Core rows
+        self.columns = tuple(getattr(orm_class, name) for name in self.names)
+
+        self._empty: Dict[str, Callable[[], Any]] = {}
+        for name in self.names:
+            if name in EMPTY_LIST_COLUMNS:
+                self._empty[name] = list
+            elif name in EMPTY_DICT_COLUMNS:
+                self._empty[name] = dict
+
+        self._fields = frozenset(fields) if fields is not None else None
+        self._converters = []
+        self._adapter = None
+        if self.is_pydantic:
+            for name, field in fields.items():
+                convert = _converter(field.annotation)
+                if convert is not None:
+                    self._converters.append((name, convert))
+            self._adapter = TypeAdapter(List[model_class])
+
+    def row_data(self, names: Sequence[str], values: Iterable[Any]) -> Dict[str, Any]:
+        """Model keyword arguments for column values in ``names`` order."""
+        data = {}
+        empty = self._empty
+        for name, value in zip(names, values, strict=True):
+            if value is None:
+                if name in DEFAULTED_COLUMNS:
+                    continue
+                make_empty = empty.get(name)
+                if make_empty is not None:
+                    value = make_empty()
+            data[name] = value
+        return data
+
+    def from_object(self, obj, validate: bool = True):
+        """Model for one ORM object."""
+        data = self.row_data(self.names, (getattr(obj, name) for name in self.names))
+        if validate or not self.is_pydantic:
+            return self.model_class(**data)
+        return self._construct([data])[0]
+
+    def from_objects(self, objs: Iterable[Any], validate: bool = True) -> List[Any]:
+        """Models for several ORM objects."""
+        names = self.names
+        return self._build(
+            [
+                self.row_data(names, [getattr(obj, name) for name in names])
+                for obj in objs
+            ],
+            validate,
+        )
+
+    def from_rows(self, rows: Sequence[Any], validate: bool = True) -> List[Any]:
+        """Models for Core rows, e.g. from ``select(*plan.columns, ...)``.
+
+        Labelled extra columns that match model fields (such as a joined
+        ``company_name``) are passed through; other extra columns are ignored.
+        """
+        if not rows:
+            return []
+        keys = rows[0]._fields
+        if self._fields is not None:
+            positions = [i for i, key in enumerate(keys) if key in self._fields]
+            names = [keys[i] for i in positions]
+            if len(positions) != len(keys):
+                rows = [[row[i] for i in positions] for row in rows]
+        else:
+            names = keys
+        return self._build([self.row_data(names, row) for row in rows], validate)
+
+    def _build(self, rows: List[Dict[str, Any]], validate: bool) -> List[Any]:
+        if not self.is_pydantic:
+            return [self.model_class(**data) for data in rows]
+        if validate:
+            return self._adapter.validate_python(rows)
+        return self._construct(rows)
+
+    def _construct(self, rows: List[Dict[str, Any]]) -> List[Any]:
+        converters = self._converters
+        construct = self.model_class.model_construct
+        models = []
+        for data in rows:
+            for name, convert in converters:
+                value = data.get(name)
+                if value is not None:
+                    data[name] = convert(value)
+            models.append(construct(**data))
+        return models
+
+
+@lru_cache(maxsize=None)
+def conversion_plan(orm_class, model_class) -> ConversionPlan:
+    """The shared conversion plan for an (ORM class, model class) pair."""
+    return ConversionPlan(orm_class, model_class)
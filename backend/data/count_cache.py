@@ -0,0 +1,276 @@
+"""
+JobPilot Search Count Cache
+Count strategies for the totals of paginated searches.
+
+Counting a search wraps the whole filtered join in a count, which with text
+predicates costs about as much as the search itself. Searches therefore pick
+how their total is produced:
+
+- ``exact``: count every matching row, as before.
+- ``capped``: count at most ``cap + 1`` rows; past the cap the total is a
+  lower bound, shown as e.g. "1000+".
+- ``cached``: exact counts cached per normalized filter signature for a
+  short TTL.
+
+Cached counts are invalidated by writes: every INSERT, UPDATE or DELETE
+executed on a watched engine drops the counts that depend on its table,
+once when it runs and again when its transaction commits (a count taken in
+between may still have seen the old rows).
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from enum import Enum
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+from sqlalchemy import event, func
+from sqlalchemy.sql.dml import UpdateBase
+
+COUNT_EXACT = "exact"
+COUNT_CAPPED = "capped"
+COUNT_CACHED = "cached"
+COUNT_STRATEGIES = (COUNT_EXACT, COUNT_CAPPED, COUNT_CACHED)
+
+DEFAULT_COUNT_CAP = 1000
+DEFAULT_MAX_SIZE = 1000
+DEFAULT_TTL_SECONDS = 30.0
+
+CacheKey = Tuple[str, str]
+
+
+class TotalCount(int):
+    """A search total that knows which strategy produced it.
+
+    Behaves as a plain int; ``exact`` is False when the count stopped at the
+    cap and the real total is larger.
+    """
+
+    def __new__(cls, value: int, strategy: str = COUNT_EXACT, exact: bool = True):
+        total = super().__new__(cls, value)
+        total.strategy = strategy
+        total.exact = exact
+        return total
+
+    @property
+    def display(self) -> str:
+        return str(int(self)) if self.exact else f"{int(self)}+"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "value": int(self),
+            "strategy": self.strategy,
+            "exact": self.exact,
+            "display": self.display,
+        }
+
+
+def filter_signature(**filters) -> str:
+    """Normalized key for a set of search filters.
+
+    Unset filters are dropped, strings are case-folded (searches match
+    case-insensitively) and lists are sorted, so equivalent searches share a
+    cached count.
+    """
+
+    def normalize(value):
+        if isinstance(value, Enum):
+            value = value.value
+        if isinstance(value, str):
+            return value.lower()
+        if isinstance(value, (list, tuple, set, frozenset)):
+            return sorted({normalize(item) for item in value}, key=str)
+        return value
+
+    normalized = {
+        name: normalize(value)
+        for name, value in filters.items()
+        if value not in (None, "", [], (), set())
+    }
+    return json.dumps(normalized, sort_keys=True, default=str)
+
+
+class CountCache:
+    """Thread-safe LRU cache of search totals with per-table invalidation.
+
+    Also carries the count strategy and cap that searches use by default.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_MAX_SIZE,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        default_strategy: str = COUNT_EXACT,
+        cap: int = DEFAULT_COUNT_CAP,
+        clock=time.monotonic,
+    ):
+        if default_strategy not in COUNT_STRATEGIES:
+            raise ValueError(f"Unknown count strategy: {default_strategy}")
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.default_strategy = default_strategy
+        self.cap = cap
+        self._clock = clock
+        self._entries: "OrderedDict[CacheKey, Tuple[float, int]]" = OrderedDict()
+        self._keys_by_table: Dict[str, Set[CacheKey]] = {}
+        self._tables_by_key: Dict[CacheKey, Tuple[str, ...]] = {}
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @classmethod
+    def from_settings(cls, settings=None) -> "CountCache":
+        """Cache configured by the SEARCH_COUNT_* API settings."""
+        if settings is None:
+            # Import here to avoid circular imports
+            from backend.api.config import settings
+        return cls(
+            max_size=settings.SEARCH_COUNT_CACHE_SIZE,
+            ttl_seconds=settings.SEARCH_COUNT_CACHE_TTL_SECONDS,
+            default_strategy=settings.SEARCH_COUNT_STRATEGY,
+            cap=settings.SEARCH_COUNT_CAP,
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: CacheKey) -> Optional[int]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= self._clock():
+                if entry is not None:
+                    self._discard(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def generation(self, tables: Iterable[str]) -> Tuple[int, ...]:
+        """Write generation of the tables; take it before counting."""
+        with self._lock:
+            return tuple(self._generations.get(table, 0) for table in tables)
+
+    def put(
+        self,
+        key: CacheKey,
+        value: int,
+        tables: Tuple[str, ...],
+        generation: Tuple[int, ...],
+    ) -> bool:
+        """Cache a count unless one of its tables was written since ``generation``."""
+        if self.ttl_seconds <= 0 or self.max_size <= 0:
+            return False
+        with self._lock:
+            current = tuple(self._generations.get(table, 0) for table in tables)
+            if current != generation:
+                return False
+            self._discard(key)
+            self._entries[key] = (self._clock() + self.ttl_seconds, value)
+            self._tables_by_key[key] = tables
+            for table in tables:
+                self._keys_by_table.setdefault(table, set()).add(key)
+            while len(self._entries) > self.max_size:
+                self._discard(next(iter(self._entries)))
+            return True
+
+    def invalidate_table(self, table: str) -> None:
+        """Forget every count that depends on a written table."""
+        with self._lock:
+            self._generations[table] = self._generations.get(table, 0) + 1
+            keys = self._keys_by_table.pop(table, ())
+            for key in list(keys):
+                self._discard(key)
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_table.clear()
+            self._tables_by_key.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+        }
+
+    def _discard(self, key: CacheKey) -> None:
+        self._entries.pop(key, None)
+        for table in self._tables_by_key.pop(key, ()):
+            keys = self._keys_by_table.get(table)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_table[table]
+
+
+def invalidate_on_write(engine, cache: CountCache) -> None:
+    """Drop cached counts of every table written through the engine."""
+
+    @event.listens_for(engine, "after_execute")
+    def _after_execute(conn, clauseelement, multiparams, params, options, result):
+        if isinstance(clauseelement, UpdateBase):
+            table = clauseelement.table.name
+            conn.info.setdefault("count_cache_tables", set()).add(table)
+            cache.invalidate_table(table)
+
+    @event.listens_for(engine, "commit")
+    def _commit(conn):
+        for table in conn.info.pop("count_cache_tables", ()):
+            cache.invalidate_table(table)
+
+    @event.listens_for(engine, "rollback")
+    def _rollback(conn):
+        conn.info.pop("count_cache_tables", None)
+
+
+def count_total(
+    query_obj,
+    id_column,
+    strategy: Optional[str] = None,
+    cache: Optional[CountCache] = None,
+    key: Optional[CacheKey] = None,
+    tables: Tuple[str, ...] = (),
+) -> TotalCount:
+    """Total rows of a query, produced by the given strategy.
+
+    Args:
+        query_obj: Filtered ORM query to count
+        id_column: Column identifying one result row
+        strategy: One of COUNT_STRATEGIES (default: the cache's default)
+        cache: Cache holding cached counts, default strategy and cap
+        key: Cache key, e.g. ``(namespace, filter_signature(...))``
+        tables: Tables whose writes invalidate the cached count
+    """
+    if strategy is None:
+        strategy = cache.default_strategy if cache is not None else COUNT_EXACT
+    cap = cache.cap if cache is not None else DEFAULT_COUNT_CAP
+    if strategy not in COUNT_STRATEGIES:
+        raise ValueError(f"Unknown count strategy: {strategy}")
+    counted = query_obj.order_by(None)
+
+    if strategy == COUNT_CAPPED:
+        limited = counted.with_entities(id_column).limit(cap + 1).subquery()
+        value = query_obj.session.query(func.count()).select_from(limited).scalar()
+        if value > cap:
+            return TotalCount(cap, COUNT_CAPPED, exact=False)
+        return TotalCount(value, COUNT_CAPPED)
+
+    if strategy == COUNT_CACHED and cache is not None and key is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            return TotalCount(cached, COUNT_CACHED)
+        generation = cache.generation(tables)
+        value = counted.with_entities(func.count(id_column)).scalar()
+        cache.put(key, value, tables, generation)
+        return TotalCount(value, COUNT_CACHED)
+
+    value = counted.with_entities(func.count(id_column)).scalar()
+    return TotalCount(value, COUNT_EXACT)
@@ -3,19 +3,65 @@ JobPilot Database Management
 Database operations and repository pattern for job hunting data.
 """
 
+import asyncio
+import contextvars
+import functools
 import os
-from contextlib import contextmanager
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
-
-from sqlalchemy import and_, create_engine, desc, or_, text
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+from uuid import uuid4
+
+from sqlalchemy import (
+    and_,
+    bindparam,
+    desc,
+    func,
+    insert,
+    or_,
+    text,
+    tuple_,
+    update,
+)
 from sqlalchemy.orm import sessionmaker
 
+from backend.data.bulk_insert import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_TRANSACTION_SIZE,
+    BulkWriteReport,
+    chunked,
+    execute_grouped,
+    row_values,
+)
+from backend.data.company_cache import (
+    MISSING,
+    CompanyResolutionCache,
+    company_snapshot,
+    detached_company,
+)
 from backend.data.company_matcher import (
+    company_name_index,
     extract_domain_from_url,
     find_existing_company,
     validate_company_data,
 )
+from backend.data.conversion import conversion_plan
+from backend.data.count_cache import (
+    COUNT_STRATEGIES,
+    CountCache,
+    TotalCount,
+    count_total,
+    filter_signature,
+    invalidate_on_write,
+)
+from backend.data.engine import (
+    EngineProfile,
+    create_profiled_engine,
+    is_file_sqlite,
+    pool_stats,
+)
 from backend.data.models import (
     Base,
     CompanyInfoDB,
@@ -23,6 +69,7 @@ from backend.data.models import (
     ExperienceLevel,
     JobListing,
     JobListingDB,
+    JobListingSummary,
     JobStatus,
     JobType,
     RemoteType,
@@ -31,15 +78,56 @@ from backend.data.models import (
     pydantic_to_sqlalchemy,
     sqlalchemy_to_pydantic,
 )
+from backend.data.pagination import InvalidCursorError, keyset_order
 from backend.data.resume_models import Resume, ResumeDB
+from backend.data.search_index import JOB_ROWID, JobSearchIndex
+from backend.data.vector_index import JobVectorIndex
+from backend.data.write_queue import WriteQueue
 from backend.logger import logger
 from backend.utils.retry import retry_db_critical, retry_db_write
 
+# Largest in-memory search hit list pushed into SQL as an IN (...) filter; larger
+# hit lists are intersected with the filtered rows in Python instead
+MAX_SEARCH_ID_FILTER = 5000
+
+JOB_COLUMNS = frozenset(JobListingDB.__table__.columns.keys())
+
+# Job reads select these columns plus the company name as Core rows and build
+# JobListing models from them without validation
+JOB_PLAN = conversion_plan(JobListingDB, JobListing)
+JOB_ROW_COLUMNS = (*JOB_PLAN.columns, CompanyInfoDB.name.label("company_name"))
+
+# Lists and search results read only the summary columns, leaving out the long
+# text and JSON columns
+JOB_SUMMARY_PLAN = conversion_plan(JobListingDB, JobListingSummary)
+JOB_SUMMARY_COLUMNS = (
+    *JOB_SUMMARY_PLAN.columns,
+    CompanyInfoDB.name.label("company_name"),
+)
+
+
+def job_projection(summary: bool):
+    """Conversion plan and selected columns for summary or full job reads."""
+    if summary:
+        return JOB_SUMMARY_PLAN, JOB_SUMMARY_COLUMNS
+    return JOB_PLAN, JOB_ROW_COLUMNS
+
+
+# Threads that run blocking database calls for async callers default to the
+# pool capacity (pool_size + max_overflow), so a worker never waits on a
+# connection checkout while holding a thread.
+DEFAULT_EXECUTOR_WORKERS = 15
+
 
 class DatabaseManager:
     """Manages database connections and provides basic operations."""
 
-    def __init__(self, database_url: str = None):
+    def __init__(
+        self,
+        database_url: str = None,
+        executor_workers: int = None,
+        engine_profile: EngineProfile = None,
+    ):
         """Initialize database manager."""
         if database_url is None:
             # Default to SQLite in the data directory
@@ -48,8 +136,31 @@ class DatabaseManager:
             database_url = f"sqlite:///{data_dir}/jobpilot.db"
 
         self.database_url = database_url
-        self.engine = create_engine(database_url, echo=False)
+        self.engine_profile = engine_profile or EngineProfile.from_settings()
+        self.engine = create_profiled_engine(database_url, self.engine_profile)
         self.SessionFactory = sessionmaker(bind=self.engine)
+        self.search_index = JobSearchIndex(self.engine)
+        self.vector_index = JobVectorIndex(self.engine)
+        self.company_index = company_name_index(self.engine)
+        self.company_cache = CompanyResolutionCache()
+        self.count_cache = CountCache.from_settings()
+        invalidate_on_write(self.engine, self.count_cache)
+        self.executor_workers = (
+            executor_workers
+            or self.engine_profile.pool_capacity
+            or DEFAULT_EXECUTOR_WORKERS
+        )
+        self._executor = None
+
+        # SQLite has one writer at a time; queue writes for group commit
+        self.write_queue = None
+        profile = self.engine_profile
+        if profile.write_batch_size > 0 and is_file_sqlite(database_url):
+            self.write_queue = WriteQueue(
+                self.SessionFactory,
+                max_batch=profile.write_batch_size,
+                max_delay_seconds=profile.write_max_delay_ms / 1000,
+            )
 
         # Create tables if they don't exist
         self.create_tables()
@@ -60,6 +171,7 @@ class DatabaseManager:
         """Create all database tables."""
         try:
             Base.metadata.create_all(self.engine)
+            self.search_index.ensure_schema()
             logger.info("Database tables created successfully")
         except Exception as e:
             logger.error(f"Error creating database tables: {e}")
@@ -72,6 +184,7 @@ class DatabaseManager:
     def drop_all_tables(self):
         """Drop all database tables (DANGEROUS - for development only)."""
         try:
+            self.search_index.drop()
             Base.metadata.drop_all(self.engine)
             logger.info("All database tables dropped successfully")
         except Exception as e:
@@ -93,6 +206,58 @@ class DatabaseManager:
         finally:
             session.close()
 
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Bounded pool that runs blocking database work for async callers."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.executor_workers, thread_name_prefix="db"
+            )
+        return self._executor
+
+    async def run_sync(self, fn, *args, **kwargs):
+        """
+        Run a blocking call on the database executor and await its result.
+
+        Async route handlers and repositories use this for every SQLAlchemy
+        call, so a slow query occupies one executor thread instead of the
+        event loop. Context variables (e.g. request-scoped logging context)
+        are carried over to the worker thread.
+        """
+        loop = asyncio.get_running_loop()
+        call = functools.partial(contextvars.copy_context().run, fn, *args, **kwargs)
+        return await loop.run_in_executor(self.executor, call)
+
+    def write(self, fn, *args, **kwargs):
+        """
+        Run fn(session, *args, **kwargs) as a write and return its result
+        once committed.
+
+        On SQLite the write goes through the write queue and shares a
+        transaction with other queued writes, so fn must return plain values
+        rather than instances bound to the session. Elsewhere it gets a
+        session of its own.
+        """
+        if self.write_queue is None:
+            with self.get_session() as session:
+                return fn(session, *args, **kwargs)
+        return self.write_queue.write(fn, *args, **kwargs)
+
+    async def write_async(self, fn, *args, **kwargs):
+        """Async form of write(); awaits the commit off the event loop."""
+        if self.write_queue is None:
+            return await self.run_sync(self.write, fn, *args, **kwargs)
+        return await self.write_queue.write_async(fn, *args, **kwargs)
+
+    def close(self):
+        """Shut down the executor and writer, release pooled connections."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self.write_queue is not None:
+            self.write_queue.close()
+        self.engine.dispose()
+
     def health_check(self) -> bool:
         """Check database connectivity."""
         try:
@@ -103,6 +268,10 @@ class DatabaseManager:
             logger.error(f"Database health check failed: {e}")
             return False
 
+    def pool_stats(self) -> Dict[str, Any]:
+        """Connection pool usage."""
+        return pool_stats(self.engine)
+
     def get_table_stats(self) -> Dict[str, int]:
         """Get statistics about table row counts."""
         stats = {}
@@ -134,6 +303,7 @@ class JobRepository:
                 job_db = pydantic_to_sqlalchemy(job_data, JobListingDB)
                 session.add(job_db)
                 session.flush()  # Get the ID
+                self.db_manager.search_index.refresh_jobs(session, [job_db.id])
 
                 # Convert back to Pydantic model
                 result = sqlalchemy_to_pydantic(job_db, JobListing)
@@ -147,21 +317,68 @@ class JobRepository:
             raise
 
     def get_job(self, job_id: str) -> Optional[JobListing]:
-        """Get job by ID."""
+        """Get the full job listing by ID, with its company name."""
         try:
             with self.db_manager.get_session() as session:
-                job_db = (
-                    session.query(JobListingDB)
+                row = (
+                    session.query(*JOB_ROW_COLUMNS)
+                    .outerjoin(CompanyInfoDB)
                     .filter(JobListingDB.id == job_id)
                     .first()
                 )
-                if job_db:
-                    return sqlalchemy_to_pydantic(job_db, JobListing)
+                if row:
+                    return JOB_PLAN.from_rows([row], validate=False)[0]
                 return None
         except Exception as e:
             logger.error(f"Error getting job {job_id}: {e}")
             return None
 
+    def get_jobs(self, job_ids: List[str]) -> List[JobListing]:
+        """Get several jobs by ID in one query, in the order given."""
+        if not job_ids:
+            return []
+        try:
+            with self.db_manager.get_session() as session:
+                rows = (
+                    session.query(*JOB_ROW_COLUMNS)
+                    .outerjoin(CompanyInfoDB)
+                    .filter(JobListingDB.id.in_(job_ids))
+                    .all()
+                )
+
+                jobs = JOB_PLAN.from_rows(rows, validate=False)
+                jobs_by_id = {row.id: job for row, job in zip(rows, jobs, strict=True)}
+                return [
+                    jobs_by_id[job_id] for job_id in job_ids if job_id in jobs_by_id
+                ]
+        except Exception as e:
+            logger.error(f"Error getting jobs {job_ids}: {e}")
+            return []
+
+    def find_job_ids(
+        self, location: Optional[str] = None, company: Optional[str] = None
+    ) -> List[str]:
+        """IDs of active jobs whose location and company name contain the given text."""
+        try:
+            with self.db_manager.get_session() as session:
+                query_obj = (
+                    session.query(JobListingDB.id)
+                    .join(CompanyInfoDB)
+                    .filter(JobListingDB.status == JobStatus.ACTIVE)
+                )
+                if location:
+                    query_obj = query_obj.filter(
+                        JobListingDB.location.ilike(f"%{location}%")
+                    )
+                if company:
+                    query_obj = query_obj.filter(
+                        CompanyInfoDB.name.ilike(f"%{company}%")
+                    )
+                return [job_id for (job_id,) in query_obj]
+        except Exception as e:
+            logger.error(f"Error finding job IDs: {e}")
+            return []
+
     @retry_db_write()
     def update_job(self, job_id: str, job_data: Dict[str, Any]) -> Optional[JobListing]:
         """Update job listing."""
@@ -182,6 +399,7 @@ class JobRepository:
 
                 job_db.updated_at = datetime.utcnow()
                 session.flush()
+                self.db_manager.search_index.refresh_jobs(session, [job_id])
 
                 result = sqlalchemy_to_pydantic(job_db, JobListing)
                 logger.info(f"Updated job: {job_id}")
@@ -202,6 +420,7 @@ class JobRepository:
                 )
                 if job_db:
                     session.delete(job_db)
+                    self.db_manager.search_index.remove_jobs([job_id])
                     logger.info(f"Deleted job: {job_id}")
                     return True
                 return False
@@ -222,9 +441,38 @@ class JobRepository:
         max_age_days: Optional[int] = None,
         limit: int = 50,
         offset: int = 0,
-    ) -> Tuple[List[JobListing], int]:
-        """Search jobs with filters using company relationship."""
+        after: Optional[str] = None,
+        include_total: bool = True,
+        count_strategy: Optional[str] = None,
+        summary: bool = True,
+    ) -> Tuple[List[Union[JobListingSummary, JobListing]], Optional[TotalCount]]:
+        """Search jobs with filters using company relationship.
+
+        Results are newest first; pass the cursor of the previous page as
+        ``after`` to page by keyset instead of offset. Ranked text searches
+        only support offsets. The total is None unless ``include_total``;
+        ``count_strategy`` (exact, capped or cached) picks how it is counted.
+        Results are JobListingSummary rows unless ``summary`` is False.
+        """
+        if count_strategy not in (None, *COUNT_STRATEGIES):
+            raise ValueError(f"Unknown count strategy: {count_strategy}")
+        count_key = (
+            "jobs",
+            filter_signature(
+                query=query,
+                job_types=job_types,
+                remote_types=remote_types,
+                experience_levels=experience_levels,
+                locations=locations,
+                companies=companies,
+                min_salary=min_salary,
+                max_salary=max_salary,
+                max_age_days=max_age_days,
+            ),
+        )
         try:
+            if query and after:
+                raise InvalidCursorError("Ranked text search pages by offset only")
             with self.db_manager.get_session() as session:
                 # Join with CompanyInfoDB to get company information
                 query_obj = (
@@ -233,110 +481,288 @@ class JobRepository:
                     .filter(JobListingDB.status == JobStatus.ACTIVE)
                 )
 
-                # Text search across title, company name, and description
+                # Full-text search across title, company name, description and
+                # requirements, ranked by BM25
+                text_scores = None
+                text_rank = None
                 if query:
-                    search_filter = or_(
-                        JobListingDB.title.ilike(f"%{query}%"),
-                        CompanyInfoDB.name.ilike(
-                            f"%{query}%"
-                        ),  # Search company name from relationship
-                        JobListingDB.description.ilike(f"%{query}%"),
-                        JobListingDB.requirements.ilike(f"%{query}%"),
-                    )
-                    query_obj = query_obj.filter(search_filter)
-
-                # Filter by job types
-                if job_types:
-                    query_obj = query_obj.filter(JobListingDB.job_type.in_(job_types))
+                    search_index = self.db_manager.search_index
+                    if search_index.uses_fts5:
+                        ranked = search_index.ranked_subquery(query)
+                        if ranked is not None:
+                            query_obj = query_obj.join(
+                                ranked, ranked.c.job_rowid == JOB_ROWID
+                            )
+                            text_rank = ranked.c.rank
+                    else:
+                        text_scores = dict(search_index.search(query, session=session))
+                        if len(text_scores) <= MAX_SEARCH_ID_FILTER:
+                            query_obj = query_obj.filter(
+                                JobListingDB.id.in_(list(text_scores))
+                            )
+
+                    if text_rank is None and text_scores is None:
+                        # No searchable tokens (e.g. punctuation only)
+                        query_obj = query_obj.filter(
+                            or_(
+                                JobListingDB.title.ilike(f"%{query}%"),
+                                CompanyInfoDB.name.ilike(f"%{query}%"),
+                                JobListingDB.description.ilike(f"%{query}%"),
+                                JobListingDB.requirements.ilike(f"%{query}%"),
+                            )
+                        )
 
-                # Filter by remote types
-                if remote_types:
-                    query_obj = query_obj.filter(
-                        JobListingDB.remote_type.in_(remote_types)
-                    )
+                query_obj = self._apply_filters(
+                    query_obj,
+                    job_types=job_types,
+                    remote_types=remote_types,
+                    experience_levels=experience_levels,
+                    locations=locations,
+                    companies=companies,
+                    min_salary=min_salary,
+                    max_salary=max_salary,
+                    max_age_days=max_age_days,
+                )
 
-                # Filter by experience levels
-                if experience_levels:
-                    query_obj = query_obj.filter(
-                        JobListingDB.experience_level.in_(experience_levels)
+                if text_scores is not None:
+                    # In-memory index: rank the filtered candidates in Python
+                    candidates = [
+                        row
+                        for row in query_obj.with_entities(
+                            JobListingDB.id, JobListingDB.created_at
+                        )
+                        if row.id in text_scores
+                    ]
+                    candidates.sort(
+                        key=lambda row: (
+                            text_scores[row.id],
+                            row.created_at or datetime.min,
+                        ),
+                        reverse=True,
                     )
-
-                # Filter by locations
-                if locations:
-                    location_filters = [
-                        JobListingDB.location.ilike(f"%{loc}%") for loc in locations
+                    total_count = TotalCount(len(candidates))
+                    page_ids = [row.id for row in candidates[offset : offset + limit]]
+                elif text_rank is not None:
+                    # Rank and page on ids only, then load the page's rows
+                    total_count = None
+                    if include_total:
+                        total_count = self._count_jobs(
+                            query_obj, count_strategy, count_key
+                        )
+                    page_ids = [
+                        job_id
+                        for (job_id,) in query_obj.with_entities(JobListingDB.id)
+                        .order_by(text_rank, desc(JobListingDB.created_at))
+                        .offset(offset)
+                        .limit(limit)
                     ]
-                    query_obj = query_obj.filter(or_(*location_filters))
-
-                # Filter by companies using company name from relationship
-                if companies:
-                    query_obj = query_obj.filter(CompanyInfoDB.name.in_(companies))
-
-                # Salary filters
-                if min_salary is not None:
-                    query_obj = query_obj.filter(
-                        or_(
-                            JobListingDB.salary_min >= min_salary,
-                            JobListingDB.salary_max >= min_salary,
+                else:
+                    page_ids = None
+
+                plan, columns = job_projection(summary)
+                if page_ids is not None:
+                    rows_by_id = {
+                        row.id: row
+                        for row in session.query(*columns)
+                        .join(CompanyInfoDB)
+                        .filter(JobListingDB.id.in_(page_ids))
+                    }
+                    rows = [rows_by_id[job_id] for job_id in page_ids]
+                else:
+                    # Get total count
+                    total_count = None
+                    if include_total:
+                        total_count = self._count_jobs(
+                            query_obj, count_strategy, count_key
                         )
-                    )
 
-                if max_salary is not None:
-                    query_obj = query_obj.filter(
-                        or_(
-                            JobListingDB.salary_max <= max_salary,
-                            JobListingDB.salary_min <= max_salary,
+                    # Apply pagination and ordering
+                    rows = (
+                        keyset_order(
+                            query_obj.with_entities(*columns),
+                            JobListingDB.created_at,
+                            JobListingDB.id,
+                            after,
                         )
+                        .offset(offset)
+                        .limit(limit)
+                        .all()
                     )
 
-                # Age filter
-                if max_age_days is not None:
-                    cutoff_date = datetime.utcnow() - timedelta(days=max_age_days)
-                    query_obj = query_obj.filter(JobListingDB.created_at >= cutoff_date)
-
-                # Get total count
-                total_count = query_obj.count()
-
-                # Apply pagination and ordering
-                jobs_db = (
-                    query_obj.order_by(desc(JobListingDB.created_at))
-                    .offset(offset)
-                    .limit(limit)
-                    .all()
-                )
-
                 # Convert to Pydantic models with company name populated
-                jobs = []
-                for job_db in jobs_db:
-                    job_dict = sqlalchemy_to_pydantic(job_db, JobListing).dict()
-                    # Populate company name from relationship
-                    job_dict["company_name"] = job_db.company.name
-                    jobs.append(JobListing(**job_dict))
+                jobs = plan.from_rows(rows, validate=False)
 
                 logger.info(
                     f"Search returned {len(jobs)} jobs out of {total_count} total"
                 )
                 return jobs, total_count
 
+        except InvalidCursorError:
+            raise
         except Exception as e:
             logger.error(f"Error searching jobs: {e}")
             return [], 0
 
-    def get_recent_jobs(self, limit: int = 20) -> List[JobListing]:
-        """Get most recent job listings."""
+    def _count_jobs(self, query_obj, count_strategy, count_key) -> TotalCount:
+        """Total of a job search; cached totals depend on jobs and companies."""
+        return count_total(
+            query_obj,
+            JobListingDB.id,
+            count_strategy,
+            cache=self.db_manager.count_cache,
+            key=count_key,
+            tables=(JobListingDB.__tablename__, CompanyInfoDB.__tablename__),
+        )
+
+    @staticmethod
+    def _apply_filters(
+        query_obj,
+        job_types: Optional[List[JobType]] = None,
+        remote_types: Optional[List[RemoteType]] = None,
+        experience_levels: Optional[List[ExperienceLevel]] = None,
+        locations: Optional[List[str]] = None,
+        companies: Optional[List[str]] = None,
+        min_salary: Optional[float] = None,
+        max_salary: Optional[float] = None,
+        max_age_days: Optional[int] = None,
+    ):
+        """Apply the structured job search filters to a job/company query."""
+        # Filter by job types
+        if job_types:
+            query_obj = query_obj.filter(JobListingDB.job_type.in_(job_types))
+
+        # Filter by remote types
+        if remote_types:
+            query_obj = query_obj.filter(JobListingDB.remote_type.in_(remote_types))
+
+        # Filter by experience levels
+        if experience_levels:
+            query_obj = query_obj.filter(
+                JobListingDB.experience_level.in_(experience_levels)
+            )
+
+        # Filter by locations
+        if locations:
+            location_filters = [
+                JobListingDB.location.ilike(f"%{loc}%") for loc in locations
+            ]
+            query_obj = query_obj.filter(or_(*location_filters))
+
+        # Filter by companies using company name from relationship
+        if companies:
+            query_obj = query_obj.filter(CompanyInfoDB.name.in_(companies))
+
+        # Salary filters
+        if min_salary is not None:
+            query_obj = query_obj.filter(
+                or_(
+                    JobListingDB.salary_min >= min_salary,
+                    JobListingDB.salary_max >= min_salary,
+                )
+            )
+
+        if max_salary is not None:
+            query_obj = query_obj.filter(
+                or_(
+                    JobListingDB.salary_max <= max_salary,
+                    JobListingDB.salary_min <= max_salary,
+                )
+            )
+
+        # Age filter
+        if max_age_days is not None:
+            cutoff_date = datetime.utcnow() - timedelta(days=max_age_days)
+            query_obj = query_obj.filter(JobListingDB.created_at >= cutoff_date)
+
+        return query_obj
+
+    def rank_jobs_by_text(
+        self,
+        query: str,
+        limit: int = 100,
+        job_types: Optional[List[JobType]] = None,
+        remote_types: Optional[List[RemoteType]] = None,
+        experience_levels: Optional[List[ExperienceLevel]] = None,
+        location: Optional[str] = None,
+        company: Optional[str] = None,
+        min_salary: Optional[float] = None,
+        max_salary: Optional[float] = None,
+    ) -> List[Tuple[str, float]]:
+        """
+        Top (job_id, BM25 score) pairs for active jobs matching the filters.
+
+        Higher scores are better. Only IDs are fetched, so callers can merge
+        rankings before loading any rows.
+        """
         try:
             with self.db_manager.get_session() as session:
-                jobs_db = (
-                    session.query(JobListingDB)
+                query_obj = self._apply_filters(
+                    session.query(JobListingDB.id)
+                    .join(CompanyInfoDB)
+                    .filter(JobListingDB.status == JobStatus.ACTIVE),
+                    job_types=job_types,
+                    remote_types=remote_types,
+                    experience_levels=experience_levels,
+                    locations=[location] if location else None,
+                    min_salary=min_salary,
+                    max_salary=max_salary,
+                )
+                if company:
+                    query_obj = query_obj.filter(
+                        CompanyInfoDB.name.ilike(f"%{company}%")
+                    )
+
+                search_index = self.db_manager.search_index
+                if search_index.uses_fts5:
+                    ranked = search_index.ranked_subquery(query)
+                    if ranked is None:
+                        return []
+                    rows = (
+                        query_obj.join(ranked, ranked.c.job_rowid == JOB_ROWID)
+                        .with_entities(JobListingDB.id, ranked.c.rank)
+                        .order_by(ranked.c.rank)
+                        .limit(limit)
+                    )
+                    return [(job_id, -rank) for job_id, rank in rows]
+
+                # In-memory index: walk hits best first, keeping those that
+                # pass the filters
+                hits = search_index.search(query, session=session)
+                results = []
+                for start in range(0, len(hits), MAX_SEARCH_ID_FILTER):
+                    chunk = hits[start : start + MAX_SEARCH_ID_FILTER]
+                    allowed = {
+                        job_id
+                        for (job_id,) in query_obj.filter(
+                            JobListingDB.id.in_([job_id for job_id, _ in chunk])
+                        )
+                    }
+                    results.extend(hit for hit in chunk if hit[0] in allowed)
+                    if len(results) >= limit:
+                        break
+                return results[:limit]
+
+        except Exception as e:
+            logger.error(f"Error ranking jobs for '{query}': {e}")
+            return []
+
+    def get_recent_jobs(
+        self, limit: int = 20, summary: bool = True
+    ) -> List[Union[JobListingSummary, JobListing]]:
+        """Get most recent job listings, as summaries unless ``summary`` is False."""
+        try:
+            with self.db_manager.get_session() as session:
+                plan, columns = job_projection(summary)
+                rows = (
+                    session.query(*columns)
+                    .outerjoin(CompanyInfoDB)
                     .filter(JobListingDB.status == JobStatus.ACTIVE)
                     .order_by(desc(JobListingDB.created_at))
                     .limit(limit)
                     .all()
                 )
 
-                jobs = [
-                    sqlalchemy_to_pydantic(job_db, JobListing) for job_db in jobs_db
-                ]
+                jobs = plan.from_rows(rows, validate=False)
                 logger.info(f"Retrieved {len(jobs)} recent jobs")
                 return jobs
 
@@ -344,12 +770,15 @@ class JobRepository:
             logger.error(f"Error getting recent jobs: {e}")
             return []
 
-    def get_jobs_by_company(self, company: str, limit: int = 20) -> List[JobListing]:
-        """Get jobs by company name using company relationship."""
+    def get_jobs_by_company(
+        self, company: str, limit: int = 20, summary: bool = True
+    ) -> List[Union[JobListingSummary, JobListing]]:
+        """Get jobs by company name, as summaries unless ``summary`` is False."""
         try:
             with self.db_manager.get_session() as session:
-                jobs_db = (
-                    session.query(JobListingDB)
+                plan, columns = job_projection(summary)
+                rows = (
+                    session.query(*columns)
                     .join(CompanyInfoDB)
                     .filter(
                         and_(
@@ -363,12 +792,7 @@ class JobRepository:
                 )
 
                 # Convert to Pydantic models with company name populated
-                jobs = []
-                for job_db in jobs_db:
-                    job_dict = sqlalchemy_to_pydantic(job_db, JobListing).dict()
-                    # Populate company name from relationship
-                    job_dict["company_name"] = job_db.company.name
-                    jobs.append(JobListing(**job_dict))
+                jobs = plan.from_rows(rows, validate=False)
 
                 logger.info(f"Retrieved {len(jobs)} jobs for company: {company}")
                 return jobs
@@ -379,93 +803,375 @@ class JobRepository:
 
     @retry_db_write(max_retries=2, base_delay=1.5)
     def bulk_create_jobs(self, jobs_data: List[JobListing]) -> int:
-        """Create multiple job listings efficiently."""
-        try:
-            with self.db_manager.get_session() as session:
-                jobs_db = [
-                    pydantic_to_sqlalchemy(job_data, JobListingDB)
-                    for job_data in jobs_data
-                ]
-                session.add_all(jobs_db)
-                session.flush()
+        """Create multiple job listings efficiently in one transaction."""
+        report = self.bulk_load_jobs(jobs_data, transaction_size=max(len(jobs_data), 1))
+        return report.inserted
 
-                count = len(jobs_db)
-                logger.info(f"Bulk created {count} jobs")
-                return count
+    def bulk_load_jobs(
+        self,
+        jobs: Iterable[Union[JobListing, Dict[str, Any]]],
+        upsert: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        transaction_size: int = DEFAULT_TRANSACTION_SIZE,
+    ) -> BulkWriteReport:
+        """
+        Stream job listings into the database with chunked Core inserts.
+
+        Jobs are consumed lazily, written ``chunk_size`` rows per executemany
+        and committed every ``transaction_size`` rows. Jobs with a
+        ``company_name`` but no ``company_id`` have their companies resolved
+        (or created) once per chunk. With ``upsert``, a job whose
+        ``(source, job_url)`` already exists updates that row instead.
+        """
+        report = BulkWriteReport()
+        start = time.perf_counter()
+        chunks = chunked(jobs, chunk_size)
+        try:
+            exhausted = False
+            while not exhausted:
+                exhausted = True
+                written = 0
+                resolutions = {}
+                with self.db_manager.get_session() as session:
+                    with self.db_manager.search_index.deferred_indexing(session):
+                        for chunk in chunks:
+                            written += self._write_job_chunk(
+                                session, chunk, upsert, resolutions, report
+                            )
+                            if written >= transaction_size:
+                                exhausted = False
+                                break
+                self._cache_resolutions(resolutions)
+                if written:
+                    report.transactions += 1
 
         except Exception as e:
-            logger.error(f"Error bulk creating jobs: {e}")
+            logger.error(f"Error bulk loading jobs: {e}")
             raise
 
+        report.elapsed_seconds = time.perf_counter() - start
+        logger.info(
+            f"Bulk loaded {report.rows_written} jobs ({report.inserted} inserted, "
+            f"{report.updated} updated) at {report.rows_per_second:,.0f} rows/s"
+        )
+        return report
+
+    def _write_job_chunk(
+        self,
+        session,
+        chunk: List[Union[JobListing, Dict[str, Any]]],
+        upsert: bool,
+        resolutions: Dict,
+        report: BulkWriteReport,
+    ) -> int:
+        """Insert (or upsert) one chunk of jobs; returns rows written."""
+        rows = []
+        company_names = {}
+        for item in chunk:
+            row = row_values(item, JOB_COLUMNS)
+            # Keep the model's ID so callers can find the rows they loaded
+            row.setdefault("id", str(getattr(item, "id", None) or uuid4()))
+            if row.get("company_id") is None:
+                company_name = (
+                    item.get("company_name")
+                    if isinstance(item, Mapping)
+                    else getattr(item, "company_name", None)
+                )
+                if company_name:
+                    company_names[len(rows)] = company_name
+            rows.append(row)
+
+        if company_names:
+            company_ids = self._resolve_companies(
+                {(name, None) for name in company_names.values()},
+                True,
+                resolutions,
+                session,
+            )
+            for position, name in company_names.items():
+                company_id = company_ids.get((name, None))
+                if company_id is None:
+                    raise ValueError(f"Could not resolve company {name}")
+                rows[position]["company_id"] = company_id
+
+        updates = []
+        if upsert:
+            rows, updates = self._split_job_upserts(session, rows, report)
+            self.update_job_rows(session, updates)
+            report.updated += len(updates)
+
+        self.insert_job_rows(session, rows)
+        report.inserted += len(rows)
+        report.chunks += 1
+        return len(rows) + len(updates)
+
+    def insert_job_rows(self, session, rows: List[Dict[str, Any]]) -> None:
+        """
+        Insert job column dicts (each with an ``id``) with one executemany.
+
+        Must run inside ``search_index.deferred_indexing(session)``.
+        """
+        if rows:
+            execute_grouped(session, insert(JobListingDB.__table__), rows)
+            self.db_manager.search_index.index_inserted_jobs(
+                session, [row["id"] for row in rows]
+            )
+
+    def update_job_rows(self, session, updates: List[Dict[str, Any]]) -> None:
+        """Update jobs from column dicts keyed by ``existing_id``."""
+        if updates:
+            execute_grouped(
+                session,
+                update(JobListingDB.__table__).where(
+                    JobListingDB.__table__.c.id == bindparam("existing_id")
+                ),
+                updates,
+            )
+            self.db_manager.search_index.refresh_jobs(
+                session, [row["existing_id"] for row in updates]
+            )
+
+    @staticmethod
+    def _split_job_upserts(session, rows, report):
+        """
+        Split rows into inserts and updates of jobs with the same
+        ``(source, job_url)``. Within a chunk the last row for a key wins.
+        """
+        latest = {}
+        for position, row in enumerate(rows):
+            if row.get("source") and row.get("job_url"):
+                latest[(row["source"], row["job_url"])] = position
+        if not latest:
+            return rows, []
+
+        existing = dict(
+            ((source, job_url), job_id)
+            for job_id, source, job_url in session.query(
+                JobListingDB.id, JobListingDB.source, JobListingDB.job_url
+            ).filter(
+                tuple_(JobListingDB.source, JobListingDB.job_url).in_(list(latest))
+            )
+        )
+
+        inserts, updates = [], []
+        now = datetime.utcnow()
+        for position, row in enumerate(rows):
+            key = (row.get("source"), row.get("job_url"))
+            if key in latest and latest[key] != position:
+                report.skipped += 1
+            elif key in existing:
+                values = {
+                    column: value
+                    for column, value in row.items()
+                    if column not in ("id", "created_at")
+                }
+                values["updated_at"] = now
+                values["existing_id"] = existing[key]
+                updates.append(values)
+            else:
+                inserts.append(row)
+        return inserts, updates
+
     def get_or_create_company(
         self, name: str, domain: str = None, **kwargs
     ) -> CompanyInfoDB:
-        """Get existing company or create new one with matching."""
+        """
+        Get existing company or create new one with matching.
+
+        Resolutions are cached in ``db_manager.company_cache``; a cache hit
+        returns a detached company without opening a session.
+        """
         try:
-            with self.db_manager.get_session() as session:
-                # Extract domain from website if provided in kwargs
-                website = kwargs.get("website")
-                if website and not domain:
-                    domain = extract_domain_from_url(website)
-
-                # Validate company data
-                normalized_name, validated_domain, errors = validate_company_data(
-                    name=name, domain=domain, website=website
-                )
-
-                if errors:
-                    raise ValueError(f"Invalid company data: {', '.join(errors)}")
-
-                # Try to find existing company
-                existing_id = find_existing_company(session, name, validated_domain)
-                if existing_id:
-                    existing = (
-                        session.query(CompanyInfoDB)
-                        .filter(CompanyInfoDB.id == existing_id)
-                        .first()
-                    )
-                    if existing:
-                        logger.info(f"Found existing company: {existing.name}")
-                        # Create detached copy with all attributes loaded
-                        session.expunge(existing)
-                        return existing
-
-                # Create new company
-                company_data = {
-                    "name": name.strip(),
-                    "normalized_name": normalized_name,
-                    "domain": validated_domain,
-                    **kwargs,
-                }
+            # Extract domain from website if provided in kwargs
+            website = kwargs.get("website")
+            if website and not domain:
+                domain = extract_domain_from_url(website)
 
-                # Handle size_category conversion if size is provided
-                if "size" in kwargs and "size_category" not in kwargs:
-                    from backend.data.company_matcher import (
-                        get_company_size_category_from_string,
-                    )
+            # Validate company data
+            normalized_name, validated_domain, errors = validate_company_data(
+                name=name, domain=domain, website=website
+            )
 
-                    size_category = get_company_size_category_from_string(
-                        kwargs["size"]
-                    )
-                    if size_category:
-                        company_data["size_category"] = CompanySizeCategory(
-                            size_category
-                        )
+            if errors:
+                raise ValueError(f"Invalid company data: {', '.join(errors)}")
 
-                company = CompanyInfoDB(**company_data)
-                session.add(company)
-                session.flush()
-                session.refresh(company)
+            cache = self.db_manager.company_cache
+            key = (normalized_name, validated_domain)
+            cached = cache.get(key)
+            if cached is not None and cached is not MISSING:
+                return detached_company(cached)
 
-                logger.info(f"Created new company: {company.name} (ID: {company.id})")
+            with self.db_manager.get_session() as session:
+                company, created = self._resolve_company(
+                    session,
+                    name,
+                    normalized_name,
+                    validated_domain,
+                    kwargs,
+                    lookup=cached is MISSING,
+                )
+                snapshot = company_snapshot(company)
                 # Create detached copy with all attributes loaded
                 session.expunge(company)
-                return company
+
+            # Only cache once the session has committed
+            if created:
+                cache.forget_negative()
+            cache.put(key, snapshot)
+            return company
 
         except Exception as e:
             logger.error(f"Error getting/creating company {name}: {e}")
             raise
 
+    def resolve_companies(
+        self, companies, create: bool = True
+    ) -> Dict[Tuple[str, Optional[str]], Optional[str]]:
+        """
+        Resolve many ``(name, domain)`` pairs to company IDs in one session.
+
+        Pairs that normalize to the same name and domain are resolved once.
+        Unmatched companies are created unless ``create`` is False, in which
+        case they map to None and the miss is cached. Invalid names map to
+        None.
+        """
+        resolutions = {}
+        try:
+            resolved = self._resolve_companies(companies, create, resolutions)
+        except Exception as e:
+            logger.error(f"Error resolving companies: {e}")
+            raise
+
+        self._cache_resolutions(resolutions)
+        return resolved
+
+    def _resolve_companies(
+        self, companies, create: bool, resolutions: Dict, session=None
+    ) -> Dict[Tuple[str, Optional[str]], Optional[str]]:
+        """
+        Resolve pairs from ``resolutions``, the cache, then the database.
+
+        Database resolutions are recorded in ``resolutions`` as
+        ``key -> (snapshot, created)`` for the caller to cache once committed.
+        Lookups run in ``session`` when given, otherwise in a new session.
+        """
+        cache = self.db_manager.company_cache
+        resolved = {}
+        pending = {}
+        # Keys with a cached "no match" skip the lookup when creating
+        skip_lookup = set()
+        for name, domain in dict.fromkeys(companies):
+            normalized_name, validated_domain, errors = validate_company_data(
+                name=name, domain=domain
+            )
+            if errors:
+                logger.warning(f"Skipping invalid company {name}: {', '.join(errors)}")
+                resolved[(name, domain)] = None
+                continue
+
+            key = (normalized_name, validated_domain)
+            if key in resolutions:
+                cached = resolutions[key][0]
+            else:
+                cached = cache.get(key)
+            if cached is MISSING or (cached is None and create):
+                pending.setdefault(key, []).append((name, domain))
+                if cached is None:
+                    skip_lookup.add(key)
+            else:
+                resolved[(name, domain)] = cached["id"] if cached else None
+
+        if not pending:
+            return resolved
+
+        session_scope = (
+            nullcontext(session) if session else self.db_manager.get_session()
+        )
+        with session_scope as session:
+            for key, names in pending.items():
+                company, created = self._resolve_company(
+                    session,
+                    names[0][0],
+                    key[0],
+                    key[1],
+                    {},
+                    lookup=key not in skip_lookup,
+                    create=create,
+                )
+                snapshot = company_snapshot(company) if company else None
+                resolutions[key] = (snapshot, created)
+                for name_domain in names:
+                    resolved[name_domain] = snapshot["id"] if snapshot else None
+
+        logger.info(
+            f"Resolved {len(resolved)} companies "
+            f"({len(pending)} looked up in the database)"
+        )
+        return resolved
+
+    def _cache_resolutions(self, resolutions: Dict) -> None:
+        """Cache committed company resolutions."""
+        cache = self.db_manager.company_cache
+        if any(created for _, created in resolutions.values()):
+            cache.forget_negative()
+        for key, (snapshot, _) in resolutions.items():
+            cache.put(key, snapshot)
+
+    def _resolve_company(
+        self,
+        session,
+        name: str,
+        normalized_name: str,
+        validated_domain: Optional[str],
+        kwargs: Dict[str, Any],
+        lookup: bool = True,
+        create: bool = True,
+    ) -> Tuple[Optional[CompanyInfoDB], bool]:
+        """Find or create a validated company; returns (company, created)."""
+        # Try to find existing company
+        existing_id = (
+            find_existing_company(session, name, validated_domain) if lookup else None
+        )
+        if existing_id:
+            existing = (
+                session.query(CompanyInfoDB)
+                .filter(CompanyInfoDB.id == existing_id)
+                .first()
+            )
+            if existing:
+                logger.info(f"Found existing company: {existing.name}")
+                return existing, False
+
+        if not create:
+            return None, False
+
+        # Create new company
+        company_data = {
+            "name": name.strip(),
+            "normalized_name": normalized_name,
+            "domain": validated_domain,
+            **kwargs,
+        }
+
+        # Handle size_category conversion if size is provided
+        if "size" in kwargs and "size_category" not in kwargs:
+            from backend.data.company_matcher import (
+                get_company_size_category_from_string,
+            )
+
+            size_category = get_company_size_category_from_string(kwargs["size"])
+            if size_category:
+                company_data["size_category"] = CompanySizeCategory(size_category)
+
+        company = CompanyInfoDB(**company_data)
+        session.add(company)
+        session.flush()
+        session.refresh(company)
+        self.db_manager.company_index.add(company.id, company.normalized_name)
+
+        logger.info(f"Created new company: {company.name} (ID: {company.id})")
+        return company, True
+
     def update_job_status(self, job_id: str, status: JobStatus) -> bool:
         """Update job status."""
         try:
@@ -555,11 +1261,17 @@ class UserRepository:
                 if not user_db:
                     return None
 
+                was_active = user_db.is_active
+
                 # Update fields
                 for field, value in user_data.items():
                     if hasattr(user_db, field):
                         setattr(user_db, field, value)
 
+                # Deactivation revokes every token issued so far
+                if was_active and not user_db.is_active:
+                    user_db.token_version = (user_db.token_version or 0) + 1
+
                 user_db.updated_at = datetime.utcnow()
                 session.flush()
 
@@ -571,6 +1283,40 @@ class UserRepository:
             logger.error(f"Error updating user {user_id}: {e}")
             raise
 
+    def get_token_state(self, user_id: str) -> Optional[Tuple[int, bool]]:
+        """Return (token_version, is_active) for a user, or None."""
+        with self.db_manager.get_session() as session:
+            row = (
+                session.query(UserProfileDB.token_version, UserProfileDB.is_active)
+                .filter(UserProfileDB.id == user_id)
+                .first()
+            )
+            if row is None:
+                return None
+            return row.token_version or 0, bool(row.is_active)
+
+    def revoke_tokens(self, user_id: str) -> bool:
+        """Invalidate every token issued to a user so far."""
+        try:
+            with self.db_manager.get_session() as session:
+                updated = (
+                    session.query(UserProfileDB)
+                    .filter(UserProfileDB.id == user_id)
+                    .update(
+                        {
+                            UserProfileDB.token_version: func.coalesce(
+                                UserProfileDB.token_version, 0
+                            )
+                            + 1
+                        },
+                        synchronize_session=False,
+                    )
+                )
+                return updated > 0
+        except Exception as e:
+            logger.error(f"Error revoking tokens for user {user_id}: {e}")
+            raise
+
     def delete_user(self, user_id: str) -> bool:
         """Delete user profile."""
         try:
@@ -590,19 +1336,25 @@ class UserRepository:
             return False
 
     def list_users(
-        self, limit: int = 50, offset: int = 0
-    ) -> Tuple[List[UserProfile], int]:
-        """List all user profiles with pagination."""
+        self,
+        limit: int = 50,
+        offset: int = 0,
+        after: Optional[str] = None,
+        include_total: bool = True,
+    ) -> Tuple[List[UserProfile], Optional[int]]:
+        """List all user profiles with offset or keyset (``after``) pagination."""
         try:
             with self.db_manager.get_session() as session:
                 query_obj = session.query(UserProfileDB)
 
                 # Get total count
-                total_count = query_obj.count()
+                total_count = query_obj.count() if include_total else None
 
                 # Apply pagination and ordering
                 users_db = (
-                    query_obj.order_by(desc(UserProfileDB.created_at))
+                    keyset_order(
+                        query_obj, UserProfileDB.created_at, UserProfileDB.id, after
+                    )
                     .offset(offset)
                     .limit(limit)
                     .all()
@@ -616,6 +1368,8 @@ class UserRepository:
                 logger.info(f"Listed {len(users)} users out of {total_count} total")
                 return users, total_count
 
+        except InvalidCursorError:
+            raise
         except Exception as e:
             logger.error(f"Error listing users: {e}")
             return [], 0
@@ -663,40 +1417,58 @@ class ResumeRepository:
         self,
         user_id: str,
         status: Optional[str] = None,
+        resume_type: Optional[str] = None,
         limit: int = 50,
         offset: int = 0,
-    ) -> Tuple[List[Resume], int]:
-        """Get resumes for a user with filtering and pagination."""
+        after: Optional[str] = None,
+        include_total: bool = True,
+    ) -> Tuple[List[Resume], Optional[int]]:
+        """Get a page of a user's resumes, most recently updated first.
+
+        Filtering, paging and the total (None unless ``include_total``) all
+        run in SQL; pass the cursor of the previous page as ``after`` to page
+        by keyset instead of offset. Only the rows of the page are validated,
+        so the content sections come back as ContactInfo, WorkExperience and
+        the other section models. Response models share those classes and
+        reuse the instances, so each section is parsed once per request.
+        """
         try:
             with self.db_manager.get_session() as session:
-                query_obj = session.query(ResumeDB).filter(ResumeDB.user_id == user_id)
+                plan = conversion_plan(ResumeDB, Resume)
+                query_obj = session.query(*plan.columns).filter(
+                    ResumeDB.user_id == user_id
+                )
 
-                # Filter by status if provided
+                # Filter by status and type if provided
                 if status:
                     query_obj = query_obj.filter(ResumeDB.status == status)
+                if resume_type:
+                    query_obj = query_obj.filter(ResumeDB.resume_type == resume_type)
 
                 # Get total count
-                total_count = query_obj.count()
+                total_count = (
+                    query_obj.with_entities(func.count(ResumeDB.id)).scalar()
+                    if include_total
+                    else None
+                )
 
                 # Apply pagination and ordering
-                resumes_db = (
-                    query_obj.order_by(desc(ResumeDB.updated_at))
+                rows = (
+                    keyset_order(query_obj, ResumeDB.updated_at, ResumeDB.id, after)
                     .offset(offset)
                     .limit(limit)
                     .all()
                 )
 
-                # Convert to Pydantic models
-                resumes = [
-                    sqlalchemy_to_pydantic(resume_db, Resume)
-                    for resume_db in resumes_db
-                ]
+                resumes = plan.from_rows(rows)
 
                 logger.info(
                     f"Retrieved {len(resumes)} resumes out of {total_count} total for user {user_id}"
                 )
                 return resumes, total_count
 
+        except InvalidCursorError:
+            raise
         except Exception as e:
             logger.error(f"Error getting resumes for user {user_id}: {e}")
             return [], 0
@@ -808,12 +1580,15 @@ def initialize_database(database_url: str = None):
     from backend.data.company_repository import CompanyRepository
     from backend.data.interaction_repository import JobUserInteractionRepository
     from backend.data.skill_bank_repository import SkillBankRepository
+    from backend.data.view_buffer import ViewCounterBuffer
 
     db_manager = DatabaseManager(database_url)
     job_repo = JobRepository(db_manager)
     user_repo = UserRepository(db_manager)
     resume_repo = ResumeRepository(db_manager)
-    interaction_repo = JobUserInteractionRepository(db_manager)
+    interaction_repo = JobUserInteractionRepository(
+        db_manager, view_buffer=ViewCounterBuffer.from_settings(db_manager)
+    )
     company_repo = CompanyRepository(db_manager)
     skill_bank_repo = SkillBankRepository(db_manager)
 
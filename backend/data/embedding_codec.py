@@ -0,0 +1,124 @@
+"""
+JobPilot Embedding Codec
+Packed binary storage format for embedding vectors.
+
+Vectors are stored as little-endian float32, float16 or int8 bytes. int8
+vectors use symmetric scalar quantization with one scale per vector
+(``value = code * scale``). Decoding returns zero-copy ``np.frombuffer`` views
+of the stored bytes.
+"""
+
+import struct
+import sys
+from array import array
+from typing import List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+FLOAT32 = "float32"
+FLOAT16 = "float16"
+INT8 = "int8"
+
+EMBEDDING_DTYPES = (FLOAT32, FLOAT16, INT8)
+
+# Explicit little-endian layouts so files are portable across platforms
+_NUMPY_DTYPES = {FLOAT32: "<f4", FLOAT16: "<f2", INT8: "i1"}
+_ITEM_SIZES = {FLOAT32: 4, FLOAT16: 2, INT8: 1}
+
+
+def _check_dtype(dtype: str) -> None:
+    if dtype not in EMBEDDING_DTYPES:
+        raise ValueError(
+            f"Unsupported embedding dtype {dtype!r}; expected one of {EMBEDDING_DTYPES}"
+        )
+
+
+def encode_embedding(
+    vector: Sequence[float], dtype: str = FLOAT32
+) -> Tuple[bytes, Optional[float]]:
+    """
+    Pack a vector into bytes.
+
+    Returns (data, scale); scale is only set for int8.
+    """
+    _check_dtype(dtype)
+
+    if NUMPY_AVAILABLE:
+        values = np.asarray(vector, dtype=np.float32)
+        if dtype != INT8:
+            return values.astype(_NUMPY_DTYPES[dtype]).tobytes(), None
+        peak = float(np.abs(values).max()) if values.size else 0.0
+        scale = peak / 127.0 if peak > 0 else 1.0
+        codes = np.clip(np.rint(values / scale), -127, 127).astype(np.int8)
+        return codes.tobytes(), scale
+
+    # Pure-Python fallback, e.g. for migrations on hosts without NumPy
+    values = [float(value) for value in vector]
+    if dtype == FLOAT16:
+        return struct.pack(f"<{len(values)}e", *values), None
+    if dtype == FLOAT32:
+        packed = array("f", values)
+        if sys.byteorder != "little":
+            packed.byteswap()
+        return packed.tobytes(), None
+
+    peak = max((abs(value) for value in values), default=0.0)
+    scale = peak / 127.0 if peak > 0 else 1.0
+    codes = array("b", [max(-127, min(127, round(value / scale))) for value in values])
+    return codes.tobytes(), scale
+
+
+def decode_embedding(data: bytes, dtype: str = FLOAT32):
+    """
+    Zero-copy NumPy view of a packed vector, in its stored dtype.
+
+    int8 views hold the raw codes; multiply by the scale (or use
+    ``embedding_to_array``) to recover the values. Cosine similarity is
+    unaffected by the per-vector scale.
+    """
+    _check_dtype(dtype)
+    if not NUMPY_AVAILABLE:
+        raise ImportError("NumPy is required to decode embeddings: pip install numpy")
+    return np.frombuffer(data, dtype=_NUMPY_DTYPES[dtype])
+
+
+def embedding_to_array(
+    data: bytes, dtype: str = FLOAT32, scale: Optional[float] = None
+):
+    """float32 array of the stored values (a view when stored as float32)."""
+    view = decode_embedding(data, dtype)
+    if dtype == FLOAT32:
+        return view
+    values = view.astype(np.float32)
+    if dtype == INT8 and scale is not None:
+        values *= scale
+    return values
+
+
+def embedding_to_list(
+    data: bytes, dtype: str = FLOAT32, scale: Optional[float] = None
+) -> List[float]:
+    """Decode a packed vector to a list of floats without requiring NumPy."""
+    _check_dtype(dtype)
+    if NUMPY_AVAILABLE:
+        return embedding_to_array(data, dtype, scale).tolist()
+
+    count = len(data) // _ITEM_SIZES[dtype]
+    if dtype == FLOAT16:
+        return list(struct.unpack(f"<{count}e", data))
+    if dtype == FLOAT32:
+        values = array("f")
+        values.frombytes(data)
+        if sys.byteorder != "little":
+            values.byteswap()
+        return values.tolist()
+
+    values = array("b")
+    values.frombytes(data)
+    return [code * (scale or 1.0) for code in values]
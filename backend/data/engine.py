@@ -0,0 +1,188 @@
+"""
+JobPilot Database Engine
+Engine profile: connection pool sizing and SQLite pragmas.
+
+SQLite defaults to a rollback journal with ``synchronous=FULL``, so a writer
+blocks every reader and concurrent writers fail fast with "database is
+locked". Each new SQLite connection therefore gets:
+
+- ``journal_mode=WAL``: readers no longer block on a writer.
+- ``synchronous=NORMAL``: safe under WAL, one fsync per checkpoint instead
+  of per commit.
+- ``busy_timeout``: a locked database is waited on inside SQLite rather than
+  surfacing as an error that the retry decorators sleep on.
+- ``mmap_size``: reads go through a memory map instead of read() calls.
+
+Server dialects instead get an explicitly sized pool with pre-ping and
+connection recycling.
+
+The profile also sizes the SQLite write queue (``write_batch_size``, 0 to
+write inline instead).
+
+``upsert_insert`` gives the dialect's ``insert`` construct with
+``ON CONFLICT`` support, for the dialects that have one.
+"""
+
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import QueuePool
+
+# Dialects supporting INSERT ... ON CONFLICT DO UPDATE
+UPSERT_DIALECTS = {"sqlite": sqlite_insert, "postgresql": postgresql_insert}
+
+
+class EngineProfile:
+    """Engine settings for DatabaseManager."""
+
+    __slots__ = (
+        "pool_size",
+        "max_overflow",
+        "pool_timeout",
+        "pool_recycle",
+        "pool_pre_ping",
+        "sqlite_journal_mode",
+        "sqlite_synchronous",
+        "sqlite_busy_timeout_ms",
+        "sqlite_mmap_size",
+        "write_batch_size",
+        "write_max_delay_ms",
+    )
+
+    def __init__(
+        self,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        pool_timeout: float = 30.0,
+        pool_recycle: int = 1800,
+        pool_pre_ping: bool = True,
+        sqlite_journal_mode: Optional[str] = "WAL",
+        sqlite_synchronous: Optional[str] = "NORMAL",
+        sqlite_busy_timeout_ms: int = 5000,
+        sqlite_mmap_size: int = 256 * 1024 * 1024,
+        write_batch_size: int = 256,
+        write_max_delay_ms: float = 2.0,
+    ):
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.pool_timeout = pool_timeout
+        self.pool_recycle = pool_recycle
+        self.pool_pre_ping = pool_pre_ping
+        self.sqlite_journal_mode = sqlite_journal_mode
+        self.sqlite_synchronous = sqlite_synchronous
+        self.sqlite_busy_timeout_ms = sqlite_busy_timeout_ms
+        self.sqlite_mmap_size = sqlite_mmap_size
+        # Group commit for SQLite writes, see backend.data.write_queue
+        self.write_batch_size = write_batch_size
+        self.write_max_delay_ms = write_max_delay_ms
+
+    @classmethod
+    def from_settings(cls, settings=None) -> "EngineProfile":
+        """Profile from the DB_* API settings."""
+        if settings is None:
+            # Import here to avoid circular imports
+            from backend.api.config import settings
+        return cls(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+            pool_pre_ping=settings.DB_POOL_PRE_PING,
+            sqlite_journal_mode=settings.DB_SQLITE_JOURNAL_MODE or None,
+            sqlite_synchronous=settings.DB_SQLITE_SYNCHRONOUS or None,
+            sqlite_busy_timeout_ms=settings.DB_SQLITE_BUSY_TIMEOUT_MS,
+            sqlite_mmap_size=settings.DB_SQLITE_MMAP_SIZE,
+            write_batch_size=settings.DB_WRITE_BATCH_SIZE,
+            write_max_delay_ms=settings.DB_WRITE_MAX_DELAY_MS,
+        )
+
+    @property
+    def pool_capacity(self) -> int:
+        """Most connections the pool hands out at once."""
+        return self.pool_size + self.max_overflow
+
+    def sqlite_pragmas(self) -> Dict[str, Any]:
+        pragmas = {
+            "journal_mode": self.sqlite_journal_mode,
+            "synchronous": self.sqlite_synchronous,
+            "busy_timeout": self.sqlite_busy_timeout_ms,
+            "mmap_size": self.sqlite_mmap_size,
+        }
+        return {name: value for name, value in pragmas.items() if value is not None}
+
+
+def is_memory_sqlite(database_url: str) -> bool:
+    url = make_url(database_url)
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+
+def is_file_sqlite(database_url: str) -> bool:
+    url = make_url(database_url)
+    return url.get_backend_name() == "sqlite" and not is_memory_sqlite(database_url)
+
+
+def upsert_insert(bind) -> Optional[Callable]:
+    """The ``insert`` of the bind's dialect with ON CONFLICT, or None."""
+    return UPSERT_DIALECTS.get(bind.dialect.name)
+
+
+def create_profiled_engine(database_url: str, profile: EngineProfile) -> Engine:
+    """Create an engine with the profile's pool and connection settings."""
+    url = make_url(database_url)
+    options: Dict[str, Any] = {"echo": False}
+
+    if url.get_backend_name() != "sqlite":
+        options.update(
+            pool_size=profile.pool_size,
+            max_overflow=profile.max_overflow,
+            pool_timeout=profile.pool_timeout,
+            pool_recycle=profile.pool_recycle,
+            pool_pre_ping=profile.pool_pre_ping,
+        )
+        return create_engine(url, **options)
+
+    pragmas = profile.sqlite_pragmas()
+    if is_memory_sqlite(database_url):
+        # WAL and mmap do not apply to in-memory databases
+        pragmas.pop("journal_mode", None)
+        pragmas.pop("mmap_size", None)
+    else:
+        # File databases use a QueuePool; size it like a server pool
+        options.update(
+            pool_size=profile.pool_size,
+            max_overflow=profile.max_overflow,
+            pool_timeout=profile.pool_timeout,
+        )
+    engine = create_engine(url, **options)
+
+    if pragmas:
+
+        @event.listens_for(engine, "connect")
+        def _set_sqlite_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            try:
+                for name, value in pragmas.items():
+                    cursor.execute(f"PRAGMA {name}={value}")
+            finally:
+                cursor.close()
+
+    return engine
+
+
+def pool_stats(engine: Engine) -> Dict[str, Any]:
+    """Connection pool usage, for health checks."""
+    pool = engine.pool
+    stats: Dict[str, Any] = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+        )
+    else:
+        stats["status"] = pool.status()
+    return stats
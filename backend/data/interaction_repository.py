@@ -8,25 +8,35 @@ of user interactions with jobs.
 """
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import uuid4
 
+from sqlalchemy import func
+
+from backend.data.engine import upsert_insert
 from backend.data.models import (
     ApplicationStatus,
     InteractionType,
     JobUserInteractionDB,
     sqlalchemy_to_pydantic,
 )
+from backend.data.pagination import InvalidCursorError, keyset_order
 from backend.logger import logger
 from backend.utils.retry import retry_db_write
 
 
 class JobUserInteractionRepository:
-    """Repository for managing all user-job interactions."""
+    """Repository for managing all user-job interactions.
+
+    Writes go through ``DatabaseManager.write``, so on SQLite they share a
+    group commit with other queued writes. Job views go through the view
+    counter buffer when one is given.
+    """
 
-    def __init__(self, db_manager):
+    def __init__(self, db_manager, view_buffer=None):
         """Initialize interaction repository."""
         self.db_manager = db_manager
+        self.view_buffer = view_buffer
 
     @retry_db_write()
     def save_job(
@@ -50,54 +60,40 @@ class JobUserInteractionRepository:
             JobUserInteractionDB: The saved job interaction record
         """
         try:
-            with self.db_manager.get_session() as session:
-                # Check if user has already saved this job
-                existing = self._get_existing_interaction(
-                    session, user_id, job_id, InteractionType.SAVED
-                )
-
-                current_time = datetime.utcnow()
-
-                if existing:
-                    # Update existing saved job
-                    existing.notes = notes
-                    existing.tags = tags or []
-                    existing.interaction_data = interaction_data or {}
-                    existing.last_interaction = current_time
-                    existing.interaction_count = existing.interaction_count + 1
-                    session.flush()
-                    session.refresh(existing)
-
-                    result = sqlalchemy_to_pydantic(existing, JobUserInteractionDB)
-                    logger.info(f"Updated saved job: {job_id} for user: {user_id}")
-                    return result
-                else:
-                    # Create new saved job interaction
-                    interaction = JobUserInteractionDB(
-                        id=str(uuid4()),
-                        user_id=user_id,
-                        job_id=job_id,
-                        interaction_type=InteractionType.SAVED,
-                        notes=notes,
-                        tags=tags or [],
-                        saved_date=current_time,
-                        first_interaction=current_time,
-                        last_interaction=current_time,
-                        interaction_count=1,
-                        interaction_data=interaction_data or {},
-                    )
-                    session.add(interaction)
-                    session.flush()
-                    session.refresh(interaction)
-
-                    result = sqlalchemy_to_pydantic(interaction, JobUserInteractionDB)
-                    logger.info(f"Saved job: {job_id} for user: {user_id}")
-                    return result
-
+            return self.db_manager.write(
+                self._save_job, user_id, job_id, notes, tags, interaction_data
+            )
         except Exception as e:
             logger.error(f"Error saving job {job_id} for user {user_id}: {e}")
             raise
 
+    def _save_job(
+        self,
+        session,
+        user_id: str,
+        job_id: str,
+        notes: Optional[str],
+        tags: Optional[List[str]],
+        interaction_data: Optional[Dict[str, Any]],
+    ) -> JobUserInteractionDB:
+        interaction = self._upsert_interaction(
+            session,
+            user_id,
+            job_id,
+            InteractionType.SAVED,
+            {
+                "notes": notes,
+                "tags": tags or [],
+                "interaction_data": interaction_data or {},
+                "saved_date": datetime.utcnow(),
+            },
+            update=("notes", "tags", "interaction_data"),
+        )
+
+        result = sqlalchemy_to_pydantic(interaction, JobUserInteractionDB)
+        logger.info(f"Saved job: {job_id} for user: {user_id}")
+        return result
+
     @retry_db_write()
     def apply_to_job(
         self,
@@ -120,55 +116,46 @@ class JobUserInteractionRepository:
             JobUserInteractionDB: The job application interaction record
         """
         try:
-            with self.db_manager.get_session() as session:
-                # Check if user has already applied to this job
-                existing = self._get_existing_interaction(
-                    session, user_id, job_id, InteractionType.APPLIED
-                )
-
-                current_time = datetime.utcnow()
-
-                if existing:
-                    # Update existing application
-                    existing.resume_version = resume_version
-                    existing.cover_letter = cover_letter
-                    existing.interaction_data = interaction_data or {}
-                    existing.last_interaction = current_time
-                    existing.interaction_count = existing.interaction_count + 1
-                    session.flush()
-                    session.refresh(existing)
-
-                    result = sqlalchemy_to_pydantic(existing, JobUserInteractionDB)
-                    logger.info(f"Updated application: {job_id} for user: {user_id}")
-                    return result
-                else:
-                    # Create new job application interaction
-                    interaction = JobUserInteractionDB(
-                        id=str(uuid4()),
-                        user_id=user_id,
-                        job_id=job_id,
-                        interaction_type=InteractionType.APPLIED,
-                        application_status=ApplicationStatus.APPLIED,
-                        applied_date=current_time,
-                        resume_version=resume_version,
-                        cover_letter=cover_letter,
-                        first_interaction=current_time,
-                        last_interaction=current_time,
-                        interaction_count=1,
-                        interaction_data=interaction_data or {},
-                    )
-                    session.add(interaction)
-                    session.flush()
-                    session.refresh(interaction)
-
-                    result = sqlalchemy_to_pydantic(interaction, JobUserInteractionDB)
-                    logger.info(f"Applied to job: {job_id} for user: {user_id}")
-                    return result
-
+            return self.db_manager.write(
+                self._apply_to_job,
+                user_id,
+                job_id,
+                resume_version,
+                cover_letter,
+                interaction_data,
+            )
         except Exception as e:
             logger.error(f"Error applying to job {job_id} for user {user_id}: {e}")
             raise
 
+    def _apply_to_job(
+        self,
+        session,
+        user_id: str,
+        job_id: str,
+        resume_version: Optional[str],
+        cover_letter: Optional[str],
+        interaction_data: Optional[Dict[str, Any]],
+    ) -> JobUserInteractionDB:
+        interaction = self._upsert_interaction(
+            session,
+            user_id,
+            job_id,
+            InteractionType.APPLIED,
+            {
+                "application_status": ApplicationStatus.APPLIED,
+                "applied_date": datetime.utcnow(),
+                "resume_version": resume_version,
+                "cover_letter": cover_letter,
+                "interaction_data": interaction_data or {},
+            },
+            update=("resume_version", "cover_letter", "interaction_data"),
+        )
+
+        result = sqlalchemy_to_pydantic(interaction, JobUserInteractionDB)
+        logger.info(f"Applied to job: {job_id} for user: {user_id}")
+        return result
+
     def get_user_interactions(
         self,
         user_id: str,
@@ -242,64 +229,59 @@ class JobUserInteractionRepository:
         user_id: str,
         job_id: str,
         interaction_data: Optional[Dict[str, Any]] = None,
-    ) -> JobUserInteractionDB:
+    ) -> Optional[JobUserInteractionDB]:
         """Record that a user viewed a job.
 
+        With a view buffer, plain views are only counted and written by the
+        buffer's next flush; None is returned then.
+
         Args:
             user_id: ID of the user viewing the job
             job_id: ID of the job being viewed
             interaction_data: Optional flexible data storage
 
         Returns:
-            JobUserInteractionDB: The job view interaction record
+            JobUserInteractionDB: The job view interaction record, or None if
+            the view was buffered
         """
         try:
-            with self.db_manager.get_session() as session:
-                # Check if user has already viewed this job
-                existing = self._get_existing_interaction(
-                    session, user_id, job_id, InteractionType.VIEWED
-                )
-
-                current_time = datetime.utcnow()
-
-                if existing:
-                    # Update existing view record
-                    existing.last_interaction = current_time
-                    existing.interaction_count = existing.interaction_count + 1
-                    if interaction_data:
-                        existing.interaction_data.update(interaction_data)
-                    session.flush()
-                    session.refresh(existing)
-
-                    result = sqlalchemy_to_pydantic(existing, JobUserInteractionDB)
-                    logger.debug(
-                        f"Updated job view: {job_id} for user: {user_id} (count: {existing.interaction_count})"
-                    )
-                    return result
-                else:
-                    # Create new job view interaction
-                    interaction = JobUserInteractionDB(
-                        id=str(uuid4()),
-                        user_id=user_id,
-                        job_id=job_id,
-                        interaction_type=InteractionType.VIEWED,
-                        first_interaction=current_time,
-                        last_interaction=current_time,
-                        interaction_count=1,
-                        interaction_data=interaction_data or {},
-                    )
-                    session.add(interaction)
-                    session.flush()
-                    session.refresh(interaction)
-
-                    result = sqlalchemy_to_pydantic(interaction, JobUserInteractionDB)
-                    logger.debug(f"Recorded job view: {job_id} for user: {user_id}")
-                    return result
-
+            if self.view_buffer is not None and not interaction_data:
+                self.view_buffer.record(user_id, job_id)
+                return None
+            return self.db_manager.write(
+                self._record_job_view, user_id, job_id, interaction_data
+            )
         except Exception as e:
             logger.error(f"Error recording job view {job_id} for user {user_id}: {e}")
             raise
 
+    def _record_job_view(
+        self,
+        session,
+        user_id: str,
+        job_id: str,
+        interaction_data: Optional[Dict[str, Any]],
+    ) -> JobUserInteractionDB:
+        interaction = self._upsert_interaction(
+            session,
+            user_id,
+            job_id,
+            InteractionType.VIEWED,
+            {"interaction_data": interaction_data or {}},
+        )
+        if interaction_data:
+            # Merge into the data of earlier views; a new row already has it
+            merged = {**(interaction.interaction_data or {}), **interaction_data}
+            if merged != interaction.interaction_data:
+                interaction.interaction_data = merged
+                session.flush()
+
+        result = sqlalchemy_to_pydantic(interaction, JobUserInteractionDB)
+        logger.debug(
+            f"Recorded job view: {job_id} for user: {user_id} (count: {interaction.interaction_count})"
+        )
+        return result
+
     @retry_db_write()
     def hide_job(
         self,
@@ -320,50 +302,35 @@ class JobUserInteractionRepository:
             JobUserInteractionDB: The job hide interaction record
         """
         try:
-            with self.db_manager.get_session() as session:
-                # Check if user has already hidden this job
-                existing = self._get_existing_interaction(
-                    session, user_id, job_id, InteractionType.HIDDEN
-                )
-
-                current_time = datetime.utcnow()
-
-                if existing:
-                    # Update existing hide record
-                    existing.notes = reason
-                    existing.interaction_data = interaction_data or {}
-                    existing.last_interaction = current_time
-                    session.flush()
-                    session.refresh(existing)
-
-                    result = sqlalchemy_to_pydantic(existing, JobUserInteractionDB)
-                    logger.info(f"Updated hidden job: {job_id} for user: {user_id}")
-                    return result
-                else:
-                    # Create new job hide interaction
-                    interaction = JobUserInteractionDB(
-                        id=str(uuid4()),
-                        user_id=user_id,
-                        job_id=job_id,
-                        interaction_type=InteractionType.HIDDEN,
-                        notes=reason,
-                        first_interaction=current_time,
-                        last_interaction=current_time,
-                        interaction_count=1,
-                        interaction_data=interaction_data or {},
-                    )
-                    session.add(interaction)
-                    session.flush()
-                    session.refresh(interaction)
-
-                    result = sqlalchemy_to_pydantic(interaction, JobUserInteractionDB)
-                    logger.info(f"Hid job: {job_id} for user: {user_id}")
-                    return result
-
+            return self.db_manager.write(
+                self._hide_job, user_id, job_id, reason, interaction_data
+            )
         except Exception as e:
             logger.error(f"Error hiding job {job_id} for user {user_id}: {e}")
             raise
 
+    def _hide_job(
+        self,
+        session,
+        user_id: str,
+        job_id: str,
+        reason: Optional[str],
+        interaction_data: Optional[Dict[str, Any]],
+    ) -> JobUserInteractionDB:
+        interaction = self._upsert_interaction(
+            session,
+            user_id,
+            job_id,
+            InteractionType.HIDDEN,
+            {"notes": reason, "interaction_data": interaction_data or {}},
+            update=("notes", "interaction_data"),
+            count=False,
+        )
+
+        result = sqlalchemy_to_pydantic(interaction, JobUserInteractionDB)
+        logger.info(f"Hid job: {job_id} for user: {user_id}")
+        return result
+
     @retry_db_write()
     def update_application_status(
         self, interaction_id: str, status: ApplicationStatus
@@ -378,46 +345,133 @@ class JobUserInteractionRepository:
             bool: True if update was successful, False otherwise
         """
         try:
-            with self.db_manager.get_session() as session:
-                interaction_db = (
-                    session.query(JobUserInteractionDB)
-                    .filter(
-                        JobUserInteractionDB.id == interaction_id,
-                        JobUserInteractionDB.interaction_type
-                        == InteractionType.APPLIED,
-                    )
-                    .first()
-                )
+            return self.db_manager.write(
+                self._update_application_status, interaction_id, status
+            )
+        except Exception as e:
+            logger.error(f"Error updating application status {interaction_id}: {e}")
+            return False
 
-                if not interaction_db:
-                    logger.warning(
-                        f"Application interaction not found: {interaction_id}"
-                    )
-                    return False
+    def _update_application_status(
+        self, session, interaction_id: str, status: ApplicationStatus
+    ) -> bool:
+        interaction_db = (
+            session.query(JobUserInteractionDB)
+            .filter(
+                JobUserInteractionDB.id == interaction_id,
+                JobUserInteractionDB.interaction_type == InteractionType.APPLIED,
+            )
+            .first()
+        )
 
-                old_status = interaction_db.application_status
-                interaction_db.application_status = status
-                interaction_db.last_interaction = datetime.utcnow()
+        if not interaction_db:
+            logger.warning(f"Application interaction not found: {interaction_id}")
+            return False
 
-                # Set response date if status indicates a response from employer
-                if status in [
-                    ApplicationStatus.INTERVIEWING,
-                    ApplicationStatus.REJECTED,
-                    ApplicationStatus.ACCEPTED,
-                ]:
-                    if not interaction_db.response_date:
-                        interaction_db.response_date = datetime.utcnow()
+        old_status = interaction_db.application_status
+        interaction_db.application_status = status
+        interaction_db.last_interaction = datetime.utcnow()
 
-                session.flush()
+        # Set response date if status indicates a response from employer
+        if status in [
+            ApplicationStatus.INTERVIEWING,
+            ApplicationStatus.REJECTED,
+            ApplicationStatus.ACCEPTED,
+        ]:
+            if not interaction_db.response_date:
+                interaction_db.response_date = datetime.utcnow()
 
-                logger.info(
-                    f"Updated application status: {interaction_id} from {old_status} to {status}"
-                )
-                return True
+        session.flush()
 
-        except Exception as e:
-            logger.error(f"Error updating application status {interaction_id}: {e}")
-            return False
+        logger.info(
+            f"Updated application status: {interaction_id} from {old_status} to {status}"
+        )
+        return True
+
+    def _upsert_interaction(
+        self,
+        session,
+        user_id: str,
+        job_id: str,
+        interaction_type: InteractionType,
+        values: Dict[str, Any],
+        update: Tuple[str, ...] = (),
+        count: bool = True,
+    ) -> JobUserInteractionDB:
+        """Insert an interaction, or update the existing one, in one statement.
+
+        Uses ``INSERT ... ON CONFLICT (user_id, job_id, interaction_type) DO
+        UPDATE ... RETURNING`` so that concurrent writers cannot create
+        duplicate rows.
+
+        Args:
+            session: Database session
+            user_id: ID of the user
+            job_id: ID of the job
+            interaction_type: Type of interaction
+            values: Column values of a new interaction
+            update: Columns of ``values`` that overwrite an existing one
+            count: Whether to increment the interaction count of an existing one
+
+        Returns:
+            JobUserInteractionDB: The interaction as stored
+        """
+        current_time = datetime.utcnow()
+        row = {
+            "id": str(uuid4()),
+            "user_id": user_id,
+            "job_id": job_id,
+            "interaction_type": interaction_type,
+            "first_interaction": current_time,
+            "last_interaction": current_time,
+            "interaction_count": 1,
+            **values,
+        }
+
+        insert = upsert_insert(session.get_bind())
+        if insert is None:
+            return self._update_or_insert_interaction(session, row, update, count)
+
+        table = JobUserInteractionDB.__table__
+        statement = insert(JobUserInteractionDB).values(**row)
+        changes = {name: statement.excluded[name] for name in update}
+        changes["last_interaction"] = statement.excluded.last_interaction
+        if count:
+            changes["interaction_count"] = (
+                func.coalesce(table.c.interaction_count, 0) + 1
+            )
+        statement = statement.on_conflict_do_update(
+            index_elements=[table.c.user_id, table.c.job_id, table.c.interaction_type],
+            set_=changes,
+        ).returning(JobUserInteractionDB)
+        return session.scalars(
+            statement, execution_options={"populate_existing": True}
+        ).one()
+
+    def _update_or_insert_interaction(
+        self,
+        session,
+        row: Dict[str, Any],
+        update: Tuple[str, ...],
+        count: bool,
+    ) -> JobUserInteractionDB:
+        """Read-then-write fallback for dialects without ON CONFLICT."""
+        existing = self._get_existing_interaction(
+            session, row["user_id"], row["job_id"], row["interaction_type"]
+        )
+        if existing is None:
+            interaction = JobUserInteractionDB(**row)
+            session.add(interaction)
+            session.flush()
+            return interaction
+
+        for name in update:
+            setattr(existing, name, row[name])
+        existing.last_interaction = row["last_interaction"]
+        if count:
+            existing.interaction_count = (existing.interaction_count or 0) + 1
+        session.flush()
+        return existing
 
     def _get_existing_interaction(
         self, session, user_id: str, job_id: str, interaction_type: InteractionType
@@ -450,6 +504,8 @@ class JobUserInteractionRepository:
         status: Optional[ApplicationStatus] = None,
         limit: int = 50,
         offset: int = 0,
+        after: Optional[str] = None,
+        include_total: bool = True,
     ):
         """Get applications with pagination (legacy compatibility).
 
@@ -458,9 +514,12 @@ class JobUserInteractionRepository:
             status: Optional filter by application status
             limit: Number of results to return
             offset: Number of results to skip
+            after: Cursor of the previous page, for keyset pagination
+            include_total: Whether to count all matching applications
 
         Returns:
-            Tuple[List, int]: List of applications and total count
+            Tuple[List, Optional[int]]: List of applications, most recently
+            updated first, and total count (None unless include_total)
         """
         try:
             with self.db_manager.get_session() as session:
@@ -479,11 +538,16 @@ class JobUserInteractionRepository:
                     )
 
                 # Get total count
-                total_count = query.count()
+                total_count = query.count() if include_total else None
 
                 # Apply pagination and ordering
                 interactions_db = (
-                    query.order_by(JobUserInteractionDB.last_interaction.desc())
+                    keyset_order(
+                        query,
+                        JobUserInteractionDB.last_interaction,
+                        JobUserInteractionDB.id,
+                        after,
+                    )
                     .offset(offset)
                     .limit(limit)
                     .all()
@@ -518,6 +582,8 @@ class JobUserInteractionRepository:
                 )
                 return applications, total_count
 
+        except InvalidCursorError:
+            raise
         except Exception as e:
             logger.error(f"Error getting applications: {e}")
             return [], 0
@@ -0,0 +1,528 @@
+"""
+JobPilot Job Deduplication
+Blocking + MinHash/LSH duplicate detection for job listings.
+
+Comparing every listing with every other one is quadratic. Instead listings
+are blocked by normalized company name, and within a block candidate pairs
+come from locality-sensitive hashing: listings whose MinHash signatures over
+description shingles agree on at least one band, or whose normalized titles
+are identical. Only those candidates are scored.
+"""
+
+import random
+import time
+import zlib
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from backend.data.company_matcher import normalize_company_name
+from backend.data.models import (
+    CompanyInfoDB,
+    JobDeduplicationDB,
+    JobListingDB,
+    JobStatus,
+)
+from backend.data.search_index import tokenize
+from backend.logger import logger
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# 32 bands of 4 rows: pairs with description Jaccard ~0.5 collide in some
+# band with probability ~0.87, pairs below ~0.2 almost never do
+NUM_PERM = 128
+NUM_BANDS = 32
+
+SHINGLE_SIZE = 3
+MAX_SHINGLES = 2000
+
+# Buckets larger than this are paired star-wise (each member with the first)
+# rather than all-pairs, so template boilerplate cannot blow up the work
+MAX_BUCKET_SIZE = 100
+
+# Per-field similarity from which a field is reported as matching
+FIELD_MATCH_THRESHOLD = 0.8
+
+FIELD_WEIGHTS = {"title": 0.4, "description": 0.45, "location": 0.15}
+
+# Shingle hashes per vectorised MinHash step (x NUM_PERM x 8 bytes)
+_CHUNK_SHINGLES = 8192
+_BAND_MULTIPLIER = 0x9E3779B97F4A7C15
+_MASK64 = (1 << 64) - 1
+_ID_FILTER_CHUNK = 5000
+
+
+class DedupRecord:
+    """The fields of a job listing that deduplication looks at."""
+
+    __slots__ = ("job_id", "company", "title", "description", "location", "posted")
+
+    def __init__(
+        self,
+        job_id: str,
+        company: Optional[str],
+        title: Optional[str],
+        description: Optional[str] = None,
+        location: Optional[str] = None,
+        posted: Optional[datetime] = None,
+    ):
+        self.job_id = job_id
+        self.company = company
+        self.title = title
+        self.description = description
+        self.location = location
+        self.posted = posted
+
+
+class DuplicatePair:
+    """A scored duplicate; the canonical job is the one posted first."""
+
+    def __init__(
+        self,
+        canonical_job_id: str,
+        duplicate_job_id: str,
+        confidence_score: float,
+        matching_fields: List[str],
+    ):
+        self.canonical_job_id = canonical_job_id
+        self.duplicate_job_id = duplicate_job_id
+        self.confidence_score = confidence_score
+        self.matching_fields = matching_fields
+
+
+class DeduplicationReport:
+    """Duplicates found in a run together with work and throughput counters."""
+
+    def __init__(self):
+        self.duplicates: List[DuplicatePair] = []
+        self.jobs_processed = 0
+        self.blocks = 0
+        self.candidate_pairs = 0
+        self.records_written = 0
+        self.timings: Dict[str, float] = {}
+
+    @property
+    def elapsed_seconds(self) -> float:
+        return self.timings.get("total", 0.0)
+
+    @property
+    def jobs_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.jobs_processed / self.elapsed_seconds
+
+
+def _shingle_hashes(text: Optional[str], size: int = SHINGLE_SIZE) -> List[int]:
+    """Stable 32-bit hashes of the word n-grams of a text.
+
+    Long texts keep the MAX_SHINGLES smallest hashes (a bottom-k sample), so
+    the kept shingles do not depend on set order or PYTHONHASHSEED and two
+    near-duplicate texts keep mostly the same ones.
+    """
+    tokens = tokenize(text or "")
+    if not tokens:
+        return []
+    if len(tokens) < size:
+        grams = {" ".join(tokens)}
+    else:
+        grams = {
+            " ".join(tokens[start : start + size])
+            for start in range(len(tokens) - size + 1)
+        }
+    return sorted({zlib.crc32(gram.encode("utf-8")) for gram in grams})[:MAX_SHINGLES]
+
+
+def _jaccard(left: Set[str], right: Set[str]) -> float:
+    if not left and not right:
+        return 1.0
+    return len(left & right) / len(left | right)
+
+
+def _signature_agreement(signatures, pairs: List[Tuple[int, int]]) -> List[float]:
+    """Share of equal MinHash slots per pair, i.e. the estimated Jaccard."""
+    if not pairs:
+        return []
+    if not NUMPY_AVAILABLE:
+        return [
+            sum(
+                1
+                for a, b in zip(signatures[left], signatures[right], strict=True)
+                if a == b
+            )
+            / len(signatures[left])
+            for left, right in pairs
+        ]
+
+    index = np.array(pairs, dtype=np.int64)
+    agreement = np.empty(len(pairs))
+    for start in range(0, len(pairs), _CHUNK_SHINGLES):
+        chunk = index[start : start + _CHUNK_SHINGLES]
+        agreement[start : start + len(chunk)] = (
+            signatures[chunk[:, 0]] == signatures[chunk[:, 1]]
+        ).mean(axis=1)
+    return agreement.tolist()
+
+
+class MinHasher:
+    """
+    MinHash signatures using multiply-shift hashing.
+
+    Each permutation maps a 32-bit shingle hash ``x`` to
+    ``((a * x + b) mod 2**64) >> 32`` for a random odd ``a``.
+    """
+
+    def __init__(self, num_perm: int = NUM_PERM, seed: int = 1):
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self.a = [rng.getrandbits(64) | 1 for _ in range(num_perm)]
+        self.b = [rng.getrandbits(64) for _ in range(num_perm)]
+
+    def signatures(self, shingle_sets: Sequence[List[int]]):
+        """
+        Signature matrix with one row per shingle set.
+
+        A uint32 array of shape (len(shingle_sets), num_perm) when NumPy is
+        available, else a list of lists. Rows of empty sets are all zeros.
+        """
+        if NUMPY_AVAILABLE:
+            return self._signatures_numpy(shingle_sets)
+        return [self._signature_python(hashes) for hashes in shingle_sets]
+
+    def _signature_python(self, hashes: List[int]) -> List[int]:
+        if not hashes:
+            return [0] * self.num_perm
+        return [
+            min(((a * x + b) & _MASK64) for x in hashes) >> 32
+            for a, b in zip(self.a, self.b, strict=True)
+        ]
+
+    def _signatures_numpy(self, shingle_sets: Sequence[List[int]]):
+        a = np.array(self.a, dtype=np.uint64)[:, None]
+        b = np.array(self.b, dtype=np.uint64)[:, None]
+        matrix = np.zeros((len(shingle_sets), self.num_perm), dtype=np.uint32)
+        # Small chunks keep the (num_perm x chunk) buffer in cache
+        buffer = np.empty((self.num_perm, _CHUNK_SHINGLES), dtype=np.uint64)
+
+        def flush(rows: List[int], values: List[int], offsets: List[int]) -> None:
+            hashed = buffer[:, : len(values)]
+            # uint64 array arithmetic wraps, which is the mod 2**64 we want
+            np.multiply(a, np.array(values, dtype=np.uint64), out=hashed)
+            hashed += b
+            # The minimum commutes with the shift, so only minima are shifted
+            minimums = np.minimum.reduceat(hashed, offsets, axis=1) >> np.uint64(32)
+            matrix[rows] = minimums.T
+
+        rows, values, offsets = [], [], []
+        for row, hashes in enumerate(shingle_sets):
+            if not hashes:
+                continue
+            if len(values) + len(hashes) > _CHUNK_SHINGLES:
+                flush(rows, values, offsets)
+                rows, values, offsets = [], [], []
+            rows.append(row)
+            offsets.append(len(values))
+            values.extend(hashes)
+        if values:
+            flush(rows, values, offsets)
+        return matrix
+
+
+class JobDeduplicator:
+    """Finds, scores and records duplicate job listings."""
+
+    def __init__(
+        self,
+        num_perm: int = NUM_PERM,
+        num_bands: int = NUM_BANDS,
+        max_bucket_size: int = MAX_BUCKET_SIZE,
+        seed: int = 1,
+    ):
+        if num_perm % num_bands:
+            raise ValueError("num_perm must be a multiple of num_bands")
+        self.hasher = MinHasher(num_perm, seed)
+        self.num_bands = num_bands
+        self.rows_per_band = num_perm // num_bands
+        self.max_bucket_size = max_bucket_size
+
+    def run(
+        self,
+        session,
+        job_ids: Optional[Iterable[str]] = None,
+        confidence_threshold: float = 0.8,
+        persist: bool = True,
+    ) -> DeduplicationReport:
+        """
+        Deduplicate the given jobs (all active jobs if None).
+
+        New pairs at or above the threshold are written to
+        ``job_duplications`` unless ``persist`` is False; pairs already
+        recorded in either direction are not written again.
+        """
+        started = time.perf_counter()
+        records = self.load_records(session, job_ids)
+        load_seconds = time.perf_counter() - started
+
+        report = self.find_duplicates(records, confidence_threshold)
+        report.timings["load"] = round(load_seconds, 4)
+
+        if persist and report.duplicates:
+            write_start = time.perf_counter()
+            report.records_written = self._persist(session, report.duplicates)
+            report.timings["persist"] = round(time.perf_counter() - write_start, 4)
+
+        report.timings["total"] = round(time.perf_counter() - started, 4)
+        logger.info(
+            f"Deduplicated {report.jobs_processed} jobs in "
+            f"{report.elapsed_seconds:.2f}s ({report.jobs_per_second:.0f} jobs/s): "
+            f"{report.blocks} blocks, {report.candidate_pairs} candidate pairs, "
+            f"{len(report.duplicates)} duplicates, {report.records_written} recorded"
+        )
+        return report
+
+    @staticmethod
+    def load_records(
+        session, job_ids: Optional[Iterable[str]] = None
+    ) -> List[DedupRecord]:
+        """Load only the columns deduplication needs."""
+        query_obj = session.query(
+            JobListingDB.id,
+            CompanyInfoDB.name,
+            JobListingDB.title,
+            JobListingDB.description,
+            JobListingDB.location,
+            JobListingDB.posted_date,
+            JobListingDB.created_at,
+        ).join(CompanyInfoDB)
+
+        if job_ids is None:
+            batches = [query_obj.filter(JobListingDB.status == JobStatus.ACTIVE)]
+        else:
+            job_ids = list(dict.fromkeys(str(job_id) for job_id in job_ids))
+            batches = [
+                query_obj.filter(
+                    JobListingDB.id.in_(job_ids[start : start + _ID_FILTER_CHUNK])
+                )
+                for start in range(0, len(job_ids), _ID_FILTER_CHUNK)
+            ]
+
+        return [
+            DedupRecord(
+                job_id,
+                company,
+                title,
+                description,
+                location,
+                posted_date or created_at,
+            )
+            for batch in batches
+            for job_id, company, title, description, location, posted_date, created_at in batch
+        ]
+
+    def find_duplicates(
+        self, records: Sequence[DedupRecord], confidence_threshold: float = 0.8
+    ) -> DeduplicationReport:
+        """Block, generate LSH candidates and score them; touches no database."""
+        report = DeduplicationReport()
+        report.jobs_processed = len(records)
+        started = time.perf_counter()
+
+        description_shingles = [
+            _shingle_hashes(record.description) for record in records
+        ]
+        has_description = [bool(hashes) for hashes in description_shingles]
+        # Listings without a description are signed by their title instead
+        shingles = [
+            hashes or _shingle_hashes(record.title)
+            for hashes, record in zip(description_shingles, records, strict=True)
+        ]
+        signed = [bool(hashes) for hashes in shingles]
+        signatures = self.hasher.signatures(shingles)
+        report.timings["signatures"] = round(time.perf_counter() - started, 4)
+
+        candidate_start = time.perf_counter()
+        block_ids: Dict[str, int] = {}
+        normalized: Dict[str, str] = {}
+        blocks = []
+        for record in records:
+            company = record.company or ""
+            if company not in normalized:
+                normalized[company] = normalize_company_name(company)
+            key = normalized[company]
+            blocks.append(block_ids.setdefault(key, len(block_ids)) if key else -1)
+        report.blocks = len(block_ids)
+
+        title_tokens = [frozenset(tokenize(record.title)) for record in records]
+        candidates: Set[Tuple[int, int]] = set()
+        for members in self._lsh_groups(blocks, signatures, signed):
+            self._add_pairs(members, candidates)
+        title_buckets: Dict[tuple, List[int]] = defaultdict(list)
+        for row, (block, tokens) in enumerate(zip(blocks, title_tokens, strict=True)):
+            if block >= 0 and tokens:
+                title_buckets[(block, tokens)].append(row)
+        for members in title_buckets.values():
+            if len(members) > 1:
+                self._add_pairs(members, candidates)
+        report.candidate_pairs = len(candidates)
+        report.timings["candidates"] = round(time.perf_counter() - candidate_start, 4)
+
+        scoring_start = time.perf_counter()
+        pairs = sorted(candidates)
+        agreements = _signature_agreement(signatures, pairs)
+        locations = [" ".join(tokenize(record.location)) for record in records]
+        for (left, right), agreement in zip(pairs, agreements, strict=True):
+            description = (
+                agreement if has_description[left] and has_description[right] else None
+            )
+            confidence, fields = self._score(
+                _jaccard(title_tokens[left], title_tokens[right]),
+                description,
+                locations[left],
+                locations[right],
+            )
+            if confidence < confidence_threshold:
+                continue
+            canonical, duplicate = records[left], records[right]
+            if (duplicate.posted or datetime.max, duplicate.job_id) < (
+                canonical.posted or datetime.max,
+                canonical.job_id,
+            ):
+                canonical, duplicate = duplicate, canonical
+            report.duplicates.append(
+                DuplicatePair(
+                    canonical.job_id, duplicate.job_id, round(confidence, 4), fields
+                )
+            )
+        report.duplicates.sort(key=lambda pair: pair.confidence_score, reverse=True)
+        report.timings["scoring"] = round(time.perf_counter() - scoring_start, 4)
+        report.timings["total"] = round(time.perf_counter() - started, 4)
+        return report
+
+    def _lsh_groups(self, blocks: List[int], signatures, signed: List[bool]):
+        """
+        Yield groups of 2+ rows that share a company block and a band.
+
+        Each band's rows are reduced to one 64-bit key; with NumPy the rows are
+        then grouped by sorting (block, key) instead of building a dict.
+        """
+        width = self.rows_per_band
+        if not NUMPY_AVAILABLE:
+            buckets: Dict[tuple, List[int]] = defaultdict(list)
+            for row, signature in enumerate(signatures):
+                if blocks[row] < 0 or not signed[row]:
+                    continue
+                for band in range(self.num_bands):
+                    band_rows = tuple(signature[band * width : (band + 1) * width])
+                    buckets[(blocks[row], band, band_rows)].append(row)
+            yield from (members for members in buckets.values() if len(members) > 1)
+            return
+
+        rows = np.flatnonzero(
+            np.asarray(signed, dtype=bool) & (np.asarray(blocks) >= 0)
+        )
+        block_ids = np.asarray(blocks, dtype=np.int64)[rows]
+        bands = signatures[rows].reshape(len(rows), self.num_bands, width)
+        keys = np.zeros((len(rows), self.num_bands), dtype=np.uint64)
+        for column in range(width):
+            keys = keys * np.uint64(_BAND_MULTIPLIER) + bands[:, :, column]
+
+        for band in range(self.num_bands):
+            band_keys = keys[:, band]
+            order = np.lexsort((band_keys, block_ids))
+            sorted_keys, sorted_blocks = band_keys[order], block_ids[order]
+            boundaries = (
+                np.flatnonzero(
+                    (sorted_keys[1:] != sorted_keys[:-1])
+                    | (sorted_blocks[1:] != sorted_blocks[:-1])
+                )
+                + 1
+            )
+            starts = np.concatenate(([0], boundaries))
+            stops = np.concatenate((boundaries, [len(order)]))
+            members = rows[order]
+            for group in np.flatnonzero(stops - starts > 1):
+                yield members[starts[group] : stops[group]].tolist()
+
+    def _add_pairs(self, members: List[int], candidates: Set[Tuple[int, int]]) -> None:
+        """All pairs of a bucket, or star pairs for an oversized one."""
+        members = sorted(members)
+        if len(members) > self.max_bucket_size:
+            candidates.update((members[0], other) for other in members[1:])
+            return
+        for position, left in enumerate(members):
+            for right in members[position + 1 :]:
+                candidates.add((left, right))
+
+    @staticmethod
+    def _score(
+        title: float,
+        description: Optional[float],
+        left_location: str,
+        right_location: str,
+    ) -> Tuple[float, List[str]]:
+        """
+        Weighted similarity over the fields both listings have.
+
+        Description similarity is the MinHash estimate of shingle Jaccard.
+        Company always matches, since candidates never leave their block.
+        """
+        similarities = {"title": title}
+        if description is not None:
+            similarities["description"] = description
+        if left_location and right_location:
+            similarities["location"] = float(left_location == right_location)
+
+        total_weight = sum(FIELD_WEIGHTS[field] for field in similarities)
+        confidence = (
+            sum(FIELD_WEIGHTS[field] * value for field, value in similarities.items())
+            / total_weight
+        )
+        matching_fields = ["company"] + [
+            field
+            for field in ("title", "description", "location")
+            if similarities.get(field, 0.0) >= FIELD_MATCH_THRESHOLD
+        ]
+        return confidence, matching_fields
+
+    @staticmethod
+    def _persist(session, duplicates: List[DuplicatePair]) -> int:
+        """Insert pairs not yet recorded; returns the number written."""
+        job_ids = list(
+            {pair.canonical_job_id for pair in duplicates}
+            | {pair.duplicate_job_id for pair in duplicates}
+        )
+        existing = set()
+        for start in range(0, len(job_ids), _ID_FILTER_CHUNK):
+            chunk = job_ids[start : start + _ID_FILTER_CHUNK]
+            for canonical_id, duplicate_id in session.query(
+                JobDeduplicationDB.canonical_job_id,
+                JobDeduplicationDB.duplicate_job_id,
+            ).filter(JobDeduplicationDB.canonical_job_id.in_(chunk)):
+                existing.add(frozenset((canonical_id, duplicate_id)))
+
+        now = datetime.utcnow()
+        rows = []
+        for pair in duplicates:
+            key = frozenset((pair.canonical_job_id, pair.duplicate_job_id))
+            if key in existing:
+                continue
+            existing.add(key)
+            rows.append(
+                {
+                    "canonical_job_id": pair.canonical_job_id,
+                    "duplicate_job_id": pair.duplicate_job_id,
+                    "confidence_score": pair.confidence_score,
+                    "matching_fields": pair.matching_fields,
+                    "merge_strategy": "keep_canonical",
+                    "reviewed": False,
+                    "created_at": now,
+                }
+            )
+        if rows:
+            session.bulk_insert_mappings(JobDeduplicationDB, rows)
+        return len(rows)
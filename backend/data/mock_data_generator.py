@@ -8,7 +8,7 @@ from datetime import date, datetime, timedelta
 from typing import Any, Dict, List
 from uuid import uuid4
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, contains_eager
 
 from backend.data.database import DatabaseManager
 from backend.data.models import (
@@ -54,6 +54,7 @@ from backend.data.skill_bank_models import (
     SummaryVariation,
 )
 from backend.data.skill_bank_repository import SkillBankRepository
+from backend.data.vector_index import HashingEmbedder, job_embedding_text
 
 # Import lead management classes for enhanced functionality
 try:
@@ -1289,8 +1290,9 @@ class MockDataGenerator:
     def create_job_embeddings(self, job_ids: List[str]) -> List[str]:
         """Create mock embeddings for job listings."""
         embedding_ids = []
-        model_name = "sentence-transformers/all-MiniLM-L6-v2"
-        embedding_dimension = 384
+        # Use the same embedder the semantic search endpoint embeds queries with
+        embedder = HashingEmbedder()
+        model_name = embedder.model_name
 
         with self._get_session() as session:
             for job_id in job_ids:
@@ -1318,39 +1320,28 @@ class MockDataGenerator:
                 # Create content hash from job description and title
                 import hashlib
 
-                content_text = (
-                    f"{job.title} {job.description or ''} {job.requirements or ''}"
+                content_text = job_embedding_text(
+                    job.title, job.description, job.requirements
                 )
                 content_hash = hashlib.md5(content_text.encode()).hexdigest()
 
-                # Generate realistic embedding vector (384-dimensional)
-                # In a real implementation, this would use an actual embedding model
-                import random
-
-                random.seed(
-                    hash(content_hash) % (2**32)
-                )  # Deterministic based on content
-                embedding_vector = [
-                    round(random.uniform(-1.0, 1.0), 6)
-                    for _ in range(embedding_dimension)
-                ]
-
-                # Create embedding record
+                # Create embedding record with a deterministic 384-dimensional
+                # embedding of the job content, packed as float32
                 embedding = JobEmbeddingDB(
                     id=str(uuid4()),
                     job_id=job_id,
                     embedding_model=model_name,
                     content_hash=content_hash,
-                    embedding_vector=embedding_vector,
-                    embedding_dimension=embedding_dimension,
                     content_type="job_description",
                     created_at=datetime.utcnow(),
                 )
+                embedding.set_vector(embedder.embed(content_text))
                 session.add(embedding)
                 session.commit()
                 session.refresh(embedding)
                 embedding_ids.append(embedding.id)
 
+        self.db_manager.vector_index.invalidate()
         print(f"   >>> Created/found {len(embedding_ids)} job embeddings")
         return embedding_ids
 
@@ -3363,6 +3354,22 @@ class MockDataGenerator:
         ]
 
         with self._get_session() as session:
+            # Job details for the interaction snapshots, with their companies
+            # loaded by the same query
+            job_details = {
+                job.id: {
+                    "title": job.title,
+                    "company_name": job.company.name if job.company else None,
+                    "location": job.location,
+                    "salary_min": job.salary_min,
+                    "salary_max": job.salary_max,
+                }
+                for job in session.query(JobListingDB)
+                .outerjoin(JobListingDB.company)
+                .options(contains_eager(JobListingDB.company))
+                .filter(JobListingDB.id.in_(job_ids))
+            }
+
             # Create interactions for each user to some jobs
             for user_id in user_ids:
                 # Each user applies to 3-6 jobs for better coverage
@@ -3395,18 +3402,8 @@ class MockDataGenerator:
                             days=random.randint(1, 45)
                         )
 
-                        # Get job details for snapshot
-                        job = (
-                            session.query(JobListingDB)
-                            .filter(JobListingDB.id == job_id)
-                            .first()
-                        )
                         job_snapshot = {
-                            "title": job.title,
-                            "company_name": job.company.name if job.company else None,
-                            "location": job.location,
-                            "salary_min": job.salary_min,
-                            "salary_max": job.salary_max,
+                            **job_details[job_id],
                             "snapshot_date": applied_date.isoformat(),
                         }
 
@@ -3437,7 +3434,7 @@ class MockDataGenerator:
                             user_profile_id=user_id,
                             event_type=TimelineEventType.APPLICATION_SUBMITTED,
                             title="Application Submitted",
-                            description=f"Applied to {job.title}",
+                            description=f"Applied to {job_details[job_id]['title']}",
                             event_data={
                                 "application_method": "JobPilot",
                                 "interaction_id": interaction.id,
@@ -3482,18 +3479,8 @@ class MockDataGenerator:
                             days=random.randint(1, 14)
                         )
 
-                        # Get job details for snapshot
-                        job = (
-                            session.query(JobListingDB)
-                            .filter(JobListingDB.id == job_id)
-                            .first()
-                        )
                         job_snapshot = {
-                            "title": job.title,
-                            "company_name": job.company.name if job.company else None,
-                            "location": job.location,
-                            "salary_min": job.salary_min,
-                            "salary_max": job.salary_max,
+                            **job_details[job_id],
                             "snapshot_date": saved_date.isoformat(),
                         }
 
@@ -3523,7 +3510,7 @@ class MockDataGenerator:
                             user_profile_id=user_id,
                             event_type=TimelineEventType.JOB_SAVED,
                             title="Job Saved",
-                            description=f"Saved {job.title} for later review",
+                            description=f"Saved {job_details[job_id]['title']} for later review",
                             event_data={
                                 "tags": ["interesting", "remote-friendly"],
                                 "interaction_id": interaction.id,
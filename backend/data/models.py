@@ -19,6 +19,7 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Integer,
+    LargeBinary,
     String,
     Text,
     UniqueConstraint,
@@ -28,6 +29,13 @@ from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.orm import relationship, sessionmaker
 
 from .base import Base
+from .conversion import conversion_plan
+from .embedding_codec import (
+    FLOAT32,
+    embedding_to_array,
+    embedding_to_list,
+    encode_embedding,
+)
 
 # Import enhanced skill bank models
 try:
@@ -154,6 +162,27 @@ class SeniorityLevel(str, Enum):
     C_LEVEL = "c_level"
 
 
+def coerce_enum_values(enum_cls, values) -> List[Enum]:
+    """
+    Resolve loosely formatted filter strings to enum members.
+
+    Matches member values or names case-insensitively, treating spaces and
+    hyphens as underscores, so "Full-time", "full_time" and "FULL_TIME" all
+    resolve to JobType.FULL_TIME. Unknown values are dropped.
+    """
+
+    def key(value) -> str:
+        if isinstance(value, Enum):
+            value = value.value
+        return str(value).strip().lower().replace("-", "_").replace(" ", "_")
+
+    lookup = {}
+    for member in enum_cls:
+        lookup[key(member.name)] = member
+        lookup[key(member.value)] = member
+    return [lookup[key(value)] for value in values or [] if key(value) in lookup]
+
+
 # =====================================
 # Pydantic Models for API/Data Transfer
 # =====================================
@@ -316,6 +345,36 @@ class JobListing(JobListingBase):
         from_attributes = True
 
 
+class JobListingSummary(BaseModel):
+    """Job listing fields shown in lists and search results.
+
+    Leaves out the long text and JSON columns; fetch the full JobListing by
+    ID when a single job is opened.
+    """
+
+    id: UUID
+    title: str
+    company_id: Optional[UUID] = None
+    company_name: Optional[str] = None
+    location: Optional[str] = None
+
+    job_type: Optional[JobType] = None
+    remote_type: Optional[RemoteType] = None
+    experience_level: Optional[ExperienceLevel] = None
+
+    salary_min: Optional[float] = None
+    salary_max: Optional[float] = None
+    salary_currency: str = "USD"
+
+    posted_date: Optional[datetime] = None
+    status: JobStatus = JobStatus.ACTIVE
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+    class Config:
+        from_attributes = True
+
+
 class UserProfile(BaseModel):
     """User profile for job matching."""
 
@@ -532,6 +591,8 @@ class JobSourceListingDB(Base):
     source_job_id = Column(String, nullable=False)  # Original ID from source platform
     source_url = Column(String, nullable=False)
     source_metadata = Column(JSON)  # Platform-specific fields
+    # Hash of the raw posting, compared on re-ingestion to skip unchanged rows
+    content_hash = Column(String)
     scraped_at = Column(DateTime, default=datetime.utcnow)
     last_updated = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -539,6 +600,10 @@ class JobSourceListingDB(Base):
     job = relationship("JobListingDB", back_populates="source_listings")
     source = relationship("JobSourceDB", back_populates="source_listings")
 
+    __table_args__ = (
+        Index("idx_source_listing_source_job", "source_id", "source_job_id"),
+    )
+
 
 class JobEmbeddingDB(Base):
     """SQLAlchemy model for job embeddings."""
@@ -552,7 +617,10 @@ class JobEmbeddingDB(Base):
     )
     embedding_model = Column(String, nullable=False)
     content_hash = Column(String, nullable=False)
-    embedding_vector = Column(JSON, nullable=False)  # Store as JSON array
+    # Packed little-endian vector, see backend.data.embedding_codec
+    embedding_data = Column(LargeBinary, nullable=False)
+    embedding_dtype = Column(String, nullable=False, default=FLOAT32)
+    embedding_scale = Column(Float)  # int8 only: value = code * scale
     embedding_dimension = Column(Integer, nullable=False)
     content_type = Column(String, default="job_description")
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -560,6 +628,29 @@ class JobEmbeddingDB(Base):
     # Relationships
     job = relationship("JobListingDB", back_populates="embeddings")
 
+    def set_vector(self, vector: List[float], dtype: str = FLOAT32) -> None:
+        """Pack and store a vector in the given dtype."""
+        self.embedding_data, self.embedding_scale = encode_embedding(vector, dtype)
+        self.embedding_dtype = dtype
+        self.embedding_dimension = len(vector)
+
+    def as_array(self):
+        """Stored vector as a float32 NumPy array (zero-copy for float32)."""
+        return embedding_to_array(
+            self.embedding_data, self.embedding_dtype or FLOAT32, self.embedding_scale
+        )
+
+    @property
+    def embedding_vector(self) -> List[float]:
+        """Stored vector as a list of floats."""
+        return embedding_to_list(
+            self.embedding_data, self.embedding_dtype or FLOAT32, self.embedding_scale
+        )
+
+    @embedding_vector.setter
+    def embedding_vector(self, vector: List[float]) -> None:
+        self.set_vector(vector)
+
 
 class JobDeduplicationDB(Base):
     """SQLAlchemy model for job deduplication."""
@@ -677,6 +768,11 @@ class JobListingDB(Base):
         Index("idx_job_experience_level", "experience_level"),
         Index("idx_job_remote_type", "remote_type"),
         Index("idx_job_created_status", "created_at", "status"),
+        # Keyset pagination, newest first. Status is deliberately not the
+        # leading column: SQLite would then drive ranked text searches from
+        # the status index and run the FTS match once per active job.
+        Index("idx_job_created_id", "created_at", "id"),
+        Index("idx_job_source_url", "source", "job_url"),
         # ADD: Data validation constraints
         CheckConstraint("salary_min >= 0", name="salary_min_positive"),
         CheckConstraint("salary_max >= salary_min", name="salary_range_valid"),
@@ -710,6 +806,8 @@ class UserProfileDB(Base):
     is_active = Column(Boolean, default=True)
     is_verified = Column(Boolean, default=False)
     last_login = Column(DateTime)
+    # Bumped to revoke every token issued before (logout, deactivation)
+    token_version = Column(Integer, nullable=False, default=0)
 
     # Location information
     city = Column(String)
@@ -753,7 +851,7 @@ class UserProfileDB(Base):
     __table_args__ = (
         Index("idx_user_email", "email"),
         Index("idx_user_location", "city", "state"),
-        Index("idx_user_created", "created_at"),
+        Index("idx_user_created", "created_at", "id"),
         # ADD: Data validation constraints
         CheckConstraint("email LIKE '%@%.%' OR email IS NULL", name="email_format"),
         CheckConstraint(
@@ -841,6 +939,7 @@ class JobUserInteractionDB(Base):
             "user_id",
             "interaction_type",
             "last_interaction",
+            "id",
         ),
         Index("idx_job_interaction_type", "job_id", "interaction_type"),
         # Business logic constraints
@@ -898,6 +997,7 @@ class CompanyInfoDB(Base):
     __table_args__ = (
         UniqueConstraint("normalized_name", "domain", name="unique_company_identity"),
         Index("idx_company_name_domain", "name", "domain"),
+        Index("idx_company_created", "created_at", "id"),
         # ADD: Data validation constraints
         CheckConstraint("LENGTH(name) >= 1", name="company_name_not_empty"),
         CheckConstraint("LENGTH(name) <= 200", name="company_name_max_length"),
@@ -948,6 +1048,11 @@ class TimelineEventDB(Base):
     interaction = relationship("JobUserInteractionDB")
     user_profile = relationship("UserProfileDB")
 
+    __table_args__ = (
+        # Keyset pagination of a user's timeline, most recent first
+        Index("idx_timeline_user_date", "user_profile_id", "event_date", "id"),
+    )
+
 
 # =====================================
 # Utility Functions
@@ -989,44 +1094,11 @@ def pydantic_to_sqlalchemy(pydantic_obj: BaseModel, sqlalchemy_class):
 
 
 def sqlalchemy_to_pydantic(sqlalchemy_obj, pydantic_class):
-    """Convert SQLAlchemy model to Pydantic model."""
-    data = {}
-    for column in sqlalchemy_obj.__table__.columns:
-        value = getattr(sqlalchemy_obj, column.name)
-        column_name = column.name
-
-        # Handle field name mappings for renamed fields
-        # No special mappings needed after ETL removal
-
-        # Handle None values for list fields
-        if value is None and column_name in [
-            "skills",
-            "preferred_locations",
-            "preferred_job_types",
-            "preferred_remote_types",
-            "skills_required",
-            "skills_preferred",
-            "benefits",
-            "values",
-            "tags",
-            "tech_stack",
-            "matching_fields",
-        ]:
-            value = []
-        # Handle None values for event_data dict field
-        elif value is None and column_name == "event_data":
-            value = {}
-        # Handle None values for metadata dict fields
-        elif value is None and column_name in [
-            "scraping_rules",
-            "rate_limit_config",
-            "source_metadata",
-            "benefits_parsed",
-        ]:
-            value = {}
-        # Skip None values for required fields - let Pydantic handle defaults
-        elif value is None and column_name in ["id", "created_at", "updated_at"]:
-            continue
-
-        data[column_name] = value
-    return pydantic_class(**data)
+    """Convert SQLAlchemy model to Pydantic model.
+
+    Uses the shared conversion plan for the pair; see ``conversion.py`` for
+    how NULL list, dict and defaulted fields are handled.
+    """
+    return conversion_plan(type(sqlalchemy_obj), pydantic_class).from_object(
+        sqlalchemy_obj
+    )
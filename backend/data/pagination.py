@@ -0,0 +1,67 @@
+"""
+JobPilot Keyset Pagination
+Opaque cursors for list queries ordered newest first.
+
+OFFSET pagination reads and throws away every skipped row, so page 500
+costs 500 pages of work. A cursor instead carries the sort key and id of the
+last row returned, and the next page starts right after it:
+
+    WHERE (sort_key, id) < (:sort_key, :id)
+    ORDER BY sort_key DESC, id DESC
+    LIMIT :limit
+
+A composite ``(..., sort_key, id)`` index answers that with a single range
+scan, so every page costs the same. The id breaks ties between rows with
+equal sort keys. Sort keys are insert/update timestamps that always have a
+default; rows with a NULL sort key are not reachable by cursor.
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, Optional, Sequence, Tuple
+
+from sqlalchemy import desc, tuple_
+
+
+class InvalidCursorError(ValueError):
+    """A pagination cursor that was not produced by ``encode_cursor``."""
+
+
+def encode_cursor(sort_value: datetime, row_id: str) -> str:
+    """Cursor pointing just past the row with this sort key and id."""
+    payload = json.dumps([sort_value.isoformat(), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Sort key and id encoded in a cursor."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(sort_value), str(row_id)
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError(f"Invalid pagination cursor: {cursor!r}") from e
+
+
+def keyset_order(query, sort_column, id_column, after: Optional[str] = None):
+    """Order a query newest first, starting after ``after`` if given."""
+    if after:
+        sort_value, row_id = decode_cursor(after)
+        query = query.filter(
+            tuple_(sort_column, id_column) < tuple_(sort_value, row_id)
+        )
+    return query.order_by(desc(sort_column), desc(id_column))
+
+
+def next_cursor(
+    items: Sequence[Any], limit: int, sort_field: str, id_field: str = "id"
+) -> Optional[str]:
+    """Cursor for the page after ``items``, or None on the last page."""
+    if not items or len(items) < limit:
+        return None
+    last = items[-1]
+    sort_value = getattr(last, sort_field)
+    if sort_value is None:
+        return None
+    return encode_cursor(sort_value, str(getattr(last, id_field)))
@@ -0,0 +1,70 @@
+"""
+JobPilot Query Counter
+Counts the SQL statements an engine executes, to catch N+1 query patterns.
+
+A read that loads related rows one at a time (a lazy relationship or a
+repository call inside a loop) runs one more query per row returned. Tests
+catch that by running the same call at several page sizes and requiring the
+same statement count each time::
+
+    assert_constant_queries(
+        db_manager.engine, lambda size: repo.search_jobs(limit=size)
+    )
+"""
+
+from typing import Any, Callable, Dict, List, Sequence
+
+from sqlalchemy import event
+
+
+class QueryCountGrowthError(AssertionError):
+    """The number of statements grew with the number of rows returned."""
+
+
+class QueryCounter:
+    """Context manager recording every statement executed on an engine."""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.statements: List[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def __enter__(self) -> "QueryCounter":
+        event.listen(self.engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        event.remove(self.engine, "before_cursor_execute", self._record)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+
+def count_queries(engine, call: Callable[[], Any]) -> QueryCounter:
+    """Run ``call`` and return the counter holding the statements it executed."""
+    with QueryCounter(engine) as counter:
+        call()
+    return counter
+
+
+def assert_constant_queries(
+    engine, call: Callable[[int], Any], sizes: Sequence[int] = (1, 5, 20)
+) -> int:
+    """Fail when the statements run by ``call(size)`` grow with ``size``.
+
+    Returns the statement count, which is the same for every size.
+    """
+    counters: Dict[int, QueryCounter] = {
+        size: count_queries(engine, lambda size=size: call(size)) for size in sizes
+    }
+    counts = {size: counter.count for size, counter in counters.items()}
+    if len(set(counts.values())) > 1:
+        largest = counters[max(sizes)].statements
+        raise QueryCountGrowthError(
+            f"Query count grows with page size {counts}; statements at size "
+            f"{max(sizes)}:\n" + "\n".join(largest)
+        )
+    return counts[sizes[0]]
@@ -338,6 +338,8 @@ class ResumeDB(Base):
         ),
         # Index for common queries
         Index("idx_user_resume_type_status", "user_id", "resume_type", "status"),
+        # Keyset pagination of a user's resumes, most recently updated first
+        Index("idx_user_resume_updated", "user_id", "updated_at", "id"),
         Index("idx_parent_resume", "parent_resume_id"),
         Index("idx_target_job", "target_job_id"),
     )
@@ -446,9 +448,14 @@ class ResumeRepository:
         """Delete resume"""
 
     async def get_user_resumes(
-        self, user_id: str, status: Optional[ResumeStatus] = None
+        self,
+        user_id: str,
+        status: Optional[ResumeStatus] = None,
+        resume_type: Optional[ResumeType] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
     ) -> List[Resume]:
-        """Get all resumes for user"""
+        """Get a page of resumes for user"""
 
     async def create_tailored_resume(self, base_resume_id: str, job_id: str) -> Resume:
         """Create job-tailored resume version"""
@@ -31,6 +31,7 @@ from backend.data.resume_models import (
     generate_ats_score,
 )
 from backend.data.skill_bank_models import EnhancedSkillBankDB
+from backend.data.skill_bank_repository import load_skill_bank_sections
 from backend.logger import logger
 
 
@@ -176,16 +177,32 @@ class ResumeRepository:
             return False
 
     async def get_user_resumes(
-        self, user_id: str, status: Optional[ResumeStatus] = None
+        self,
+        user_id: str,
+        status: Optional[ResumeStatus] = None,
+        resume_type: Optional[ResumeType] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
     ) -> List[Resume]:
-        """Get all resumes for a user, optionally filtered by status."""
+        """Get a user's resumes, optionally filtered by status and type.
+
+        Only the requested page is loaded and converted; without a limit
+        every matching resume is returned.
+        """
         try:
             query = self.session.query(ResumeDB).filter(ResumeDB.user_id == user_id)
 
             if status:
                 query = query.filter(ResumeDB.status == status.value)
+            if resume_type:
+                query = query.filter(ResumeDB.resume_type == resume_type.value)
 
-            resume_dbs = query.order_by(desc(ResumeDB.updated_at)).all()
+            query = query.order_by(desc(ResumeDB.updated_at), desc(ResumeDB.id))
+            if offset:
+                query = query.offset(offset)
+            if limit is not None:
+                query = query.limit(limit)
+            resume_dbs = query.all()
 
             return [self._db_to_pydantic(resume_db) for resume_db in resume_dbs]
 
@@ -552,23 +569,14 @@ class ResumeRepository:
             if not skill_bank:
                 return None
 
-            # Extract enhanced skills from new format
-            all_skills = {}
-            if skill_bank.skills:
-                skills_data = skill_bank.skills
-                if isinstance(skills_data, str):
-                    import json
-
-                    skills_data = json.loads(skills_data)
-                all_skills = skills_data
-
+            sections = load_skill_bank_sections(self.session, skill_bank.id)
             return {
-                "skills": all_skills,
-                "work_experiences": skill_bank.work_experiences or [],
-                "education_entries": skill_bank.education_entries or [],
-                "projects": skill_bank.projects or [],
-                "certifications": skill_bank.certifications or [],
-                "summary_variations": skill_bank.summary_variations or [],
+                "skills": sections["skills"],
+                "work_experiences": sections["work_experiences"],
+                "education_entries": sections["education_entries"],
+                "projects": sections["projects"],
+                "certifications": sections["certifications"],
+                "summary_variations": sections["summary_variations"],
             }
 
         except Exception as e:
@@ -697,8 +705,8 @@ class ResumeRepository:
                 certifications=certifications,
                 custom_sections=resume_db.custom_sections or [],
                 template_id=resume_db.template_id,
-                based_on_resume_id=resume_db.based_on_resume_id,
-                job_id=resume_db.job_id,
+                parent_resume_id=resume_db.parent_resume_id,
+                target_job_id=resume_db.target_job_id,
                 version=resume_db.version,
                 created_at=resume_db.created_at,
                 updated_at=resume_db.updated_at,
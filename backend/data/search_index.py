@@ -0,0 +1,533 @@
+"""
+Job Full-Text Search Index
+BM25-ranked keyword search over job listings.
+
+On SQLite the index is an FTS5 virtual table kept in sync with
+``job_listings`` and ``companies`` by triggers. Other dialects (or SQLite
+builds compiled without FTS5) fall back to an in-process inverted index that
+is loaded lazily and updated incrementally by the repositories.
+"""
+
+import math
+import re
+import threading
+from bisect import bisect_left
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Float, Integer, bindparam, literal_column, text
+from sqlalchemy.exc import OperationalError
+
+from backend.logger import logger
+
+FTS_TABLE = "job_listings_fts"
+# While this table has a row, inserted jobs are indexed by the bulk loader
+# instead of the per-row trigger. The row only lives inside a transaction.
+FTS_DEFERRED_TABLE = "job_listings_fts_deferred"
+
+# Indexed fields and their relative BM25 weights
+SEARCH_FIELDS = ("title", "company_name", "description", "requirements")
+FIELD_WEIGHTS = (4.0, 3.0, 1.0, 1.0)
+
+# Mirrors the FTS5 unicode61 tokenizer: runs of letters and digits
+_TOKEN_PATTERN = re.compile(r"[^\W_]+", re.UNICODE)
+
+_FTS_SCHEMA = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        title, company_name, description, requirements,
+        tokenize = 'unicode61 remove_diacritics 2'
+    )
+    """,
+    f"CREATE TABLE IF NOT EXISTS {FTS_DEFERRED_TABLE} (active INTEGER)",
+    f"""
+    CREATE TRIGGER IF NOT EXISTS job_listings_fts_insert
+    AFTER INSERT ON job_listings
+    WHEN NOT EXISTS (SELECT 1 FROM {FTS_DEFERRED_TABLE}) BEGIN
+        INSERT INTO {FTS_TABLE} (rowid, title, company_name, description, requirements)
+        VALUES (
+            NEW.rowid,
+            NEW.title,
+            (SELECT name FROM companies WHERE id = NEW.company_id),
+            NEW.description,
+            NEW.requirements
+        );
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS job_listings_fts_update
+    AFTER UPDATE OF title, description, requirements, company_id ON job_listings BEGIN
+        DELETE FROM {FTS_TABLE} WHERE rowid = OLD.rowid;
+        INSERT INTO {FTS_TABLE} (rowid, title, company_name, description, requirements)
+        VALUES (
+            NEW.rowid,
+            NEW.title,
+            (SELECT name FROM companies WHERE id = NEW.company_id),
+            NEW.description,
+            NEW.requirements
+        );
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS job_listings_fts_delete
+    AFTER DELETE ON job_listings BEGIN
+        DELETE FROM {FTS_TABLE} WHERE rowid = OLD.rowid;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS companies_fts_rename
+    AFTER UPDATE OF name ON companies BEGIN
+        UPDATE {FTS_TABLE} SET company_name = NEW.name
+        WHERE rowid IN (SELECT rowid FROM job_listings WHERE company_id = NEW.id);
+    END
+    """,
+]
+
+_FTS_REBUILD = [
+    f"DELETE FROM {FTS_TABLE}",
+    f"""
+    INSERT INTO {FTS_TABLE} (rowid, title, company_name, description, requirements)
+    SELECT j.rowid, j.title, c.name, j.description, j.requirements
+    FROM job_listings j LEFT JOIN companies c ON c.id = j.company_id
+    """,
+]
+
+_FTS_INDEX_JOBS = text(
+    f"""
+    INSERT INTO {FTS_TABLE} (rowid, title, company_name, description, requirements)
+    SELECT j.rowid, j.title, c.name, j.description, j.requirements
+    FROM job_listings j LEFT JOIN companies c ON c.id = j.company_id
+    WHERE j.id IN :job_ids
+    """
+).bindparams(bindparam("job_ids", expanding=True))
+
+_BM25_WEIGHTS = ", ".join(str(weight) for weight in FIELD_WEIGHTS)
+
+# Matches are keyed by job_listings.rowid so joins stay on the integer primary
+# key instead of a second lookup through the UUID index
+_FTS_MATCH = f"""
+    SELECT rowid AS job_rowid, bm25({FTS_TABLE}, {_BM25_WEIGHTS}) AS rank
+    FROM {FTS_TABLE}
+    WHERE {FTS_TABLE} MATCH :match
+"""
+
+_FTS_SEARCH = f"""
+    SELECT job_listings.id AS job_id, job_search.rank AS rank
+    FROM ({_FTS_MATCH}) AS job_search
+    JOIN job_listings ON job_listings.rowid = job_search.job_rowid
+"""
+
+JOB_ROWID = literal_column("job_listings.rowid")
+
+
+def tokenize(value: Optional[str]) -> List[str]:
+    """
+    Split text into lowercase search tokens.
+
+    Examples:
+        >>> tokenize("Senior Python/Django Engineer")
+        ["senior", "python", "django", "engineer"]
+    """
+    if not value:
+        return []
+    return _TOKEN_PATTERN.findall(value.lower())
+
+
+def build_match_expression(query: str) -> Optional[str]:
+    """
+    Build an FTS5 MATCH expression requiring every query token as a prefix.
+
+    Returns None when the query contains no searchable tokens.
+    """
+    tokens = tokenize(query)
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+class InvertedIndex:
+    """In-memory BM25 inverted index with weighted fields and prefix matching."""
+
+    def __init__(
+        self,
+        field_weights: Sequence[float] = FIELD_WEIGHTS,
+        k1: float = 1.2,
+        b: float = 0.75,
+    ):
+        self.field_weights = tuple(field_weights)
+        self.k1 = k1
+        self.b = b
+        self._postings: Dict[str, Dict[str, float]] = defaultdict(dict)
+        self._doc_terms: Dict[str, Tuple[str, ...]] = {}
+        self._doc_lengths: Dict[str, float] = {}
+        self._total_length = 0.0
+        self._vocabulary: List[str] = []
+        self._vocabulary_dirty = False
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._doc_lengths)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._doc_lengths
+
+    def add(self, doc_id: str, fields: Sequence[Optional[str]]) -> None:
+        """Index (or re-index) a document given its field values."""
+        term_freqs: Dict[str, float] = defaultdict(float)
+        length = 0.0
+        for weight, value in zip(self.field_weights, fields, strict=True):
+            for token in tokenize(value):
+                term_freqs[token] += weight
+                length += weight
+
+        with self._lock:
+            self._remove(doc_id)
+            for term, freq in term_freqs.items():
+                if term not in self._postings:
+                    self._vocabulary_dirty = True
+                self._postings[term][doc_id] = freq
+            self._doc_terms[doc_id] = tuple(term_freqs)
+            self._doc_lengths[doc_id] = length
+            self._total_length += length
+
+    def remove(self, doc_id: str) -> None:
+        """Remove a document from the index if present."""
+        with self._lock:
+            self._remove(doc_id)
+
+    def clear(self) -> None:
+        """Drop every document from the index."""
+        with self._lock:
+            self._postings.clear()
+            self._doc_terms.clear()
+            self._doc_lengths.clear()
+            self._total_length = 0.0
+            self._vocabulary = []
+            self._vocabulary_dirty = False
+
+    def search(
+        self, query: str, limit: Optional[int] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        Return (doc_id, score) pairs matching every query token, best first.
+
+        Each token matches any indexed term it is a prefix of, mirroring the
+        ``"token"*`` syntax used for FTS5.
+        """
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+
+        with self._lock:
+            doc_count = len(self._doc_lengths)
+            if doc_count == 0:
+                return []
+            avg_length = self._total_length / doc_count or 1.0
+
+            scores: Optional[Dict[str, float]] = None
+            for token in dict.fromkeys(tokens):
+                token_scores: Dict[str, float] = {}
+                for term in self._expand(token):
+                    postings = self._postings[term]
+                    idf = math.log(
+                        1.0 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5)
+                    )
+                    for doc_id, freq in postings.items():
+                        if scores is not None and doc_id not in scores:
+                            continue
+                        norm = self.k1 * (
+                            1.0
+                            - self.b
+                            + self.b * self._doc_lengths[doc_id] / avg_length
+                        )
+                        token_scores[doc_id] = token_scores.get(doc_id, 0.0) + (
+                            idf * freq * (self.k1 + 1.0) / (freq + norm)
+                        )
+
+                if scores is None:
+                    scores = token_scores
+                else:
+                    scores = {
+                        doc_id: scores[doc_id] + score
+                        for doc_id, score in token_scores.items()
+                    }
+                if not scores:
+                    return []
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        return ranked[:limit] if limit else ranked
+
+    def _remove(self, doc_id: str) -> None:
+        terms = self._doc_terms.pop(doc_id, None)
+        if terms is None:
+            return
+        for term in terms:
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(doc_id, None)
+            if not postings:
+                del self._postings[term]
+                self._vocabulary_dirty = True
+        self._total_length -= self._doc_lengths.pop(doc_id, 0.0)
+
+    def _expand(self, token: str) -> List[str]:
+        if self._vocabulary_dirty:
+            self._vocabulary = sorted(self._postings)
+            self._vocabulary_dirty = False
+
+        terms = []
+        position = bisect_left(self._vocabulary, token)
+        while position < len(self._vocabulary) and self._vocabulary[
+            position
+        ].startswith(token):
+            terms.append(self._vocabulary[position])
+            position += 1
+        return terms
+
+
+class JobSearchIndex:
+    """Full-text index over job listings backed by FTS5 or an inverted index."""
+
+    def __init__(self, engine, use_fts5: Optional[bool] = None):
+        """
+        Initialize the search index.
+
+        Args:
+            engine: SQLAlchemy engine the job tables live in
+            use_fts5: Force (True) or disable (False) FTS5; autodetect when None
+        """
+        self.engine = engine
+        self.uses_fts5 = False
+        self._use_fts5 = use_fts5
+        self._memory_index = InvertedIndex()
+        self._memory_loaded = False
+        self._load_lock = threading.Lock()
+
+    def ensure_schema(self) -> None:
+        """Create the FTS5 table and triggers, backfilling existing listings."""
+        if self._use_fts5 is False or self.engine.dialect.name != "sqlite":
+            self.uses_fts5 = False
+            return
+
+        try:
+            with self.engine.begin() as conn:
+                # Triggers created before deferred indexing are replaced
+                insert_trigger = conn.exec_driver_sql(
+                    "SELECT sql FROM sqlite_master "
+                    "WHERE type = 'trigger' AND name = 'job_listings_fts_insert'"
+                ).scalar()
+                if insert_trigger and FTS_DEFERRED_TABLE not in insert_trigger:
+                    conn.exec_driver_sql("DROP TRIGGER job_listings_fts_insert")
+
+                for statement in _FTS_SCHEMA:
+                    conn.exec_driver_sql(statement)
+
+                indexed = conn.exec_driver_sql(
+                    f"SELECT count(*) FROM {FTS_TABLE}"
+                ).scalar()
+                total = conn.exec_driver_sql(
+                    "SELECT count(*) FROM job_listings"
+                ).scalar()
+                if indexed != total:
+                    logger.info(
+                        f"Backfilling job search index ({indexed} of {total} listings indexed)"
+                    )
+                    for statement in _FTS_REBUILD:
+                        conn.exec_driver_sql(statement)
+
+            self.uses_fts5 = True
+        except OperationalError as e:
+            if self._use_fts5:
+                raise
+            logger.warning(f"FTS5 unavailable, using in-memory job search index: {e}")
+            self.uses_fts5 = False
+
+    def drop(self) -> None:
+        """Drop the FTS5 table (its triggers are dropped with job_listings)."""
+        self._memory_index.clear()
+        self._memory_loaded = False
+        if not self.uses_fts5:
+            return
+        with self.engine.begin() as conn:
+            conn.exec_driver_sql(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+            conn.exec_driver_sql(f"DROP TABLE IF EXISTS {FTS_DEFERRED_TABLE}")
+
+    def rebuild(self) -> None:
+        """
+        Rebuild the index from the job tables.
+
+        Required after ``VACUUM`` on SQLite, which may renumber the rowids the
+        FTS5 table is keyed by.
+        """
+        if self.uses_fts5:
+            with self.engine.begin() as conn:
+                for statement in _FTS_REBUILD:
+                    conn.exec_driver_sql(statement)
+            return
+
+        with self._load_lock:
+            self._memory_index.clear()
+            self._memory_loaded = False
+
+    def ranked_subquery(self, query: str):
+        """
+        FTS5 subquery of (job_rowid, rank) rows matching the query.
+
+        Join it on ``JOB_ROWID``. Lower rank is better, matching FTS5's
+        ``bm25()`` convention. Returns None when the query has no searchable
+        tokens.
+        """
+        match = build_match_expression(query)
+        if match is None:
+            return None
+
+        statement = text(_FTS_MATCH).bindparams(match=match)
+        return statement.columns(job_rowid=Integer, rank=Float).subquery("job_search")
+
+    def search(
+        self, query: str, limit: Optional[int] = None, session=None
+    ) -> List[Tuple[str, float]]:
+        """
+        Return (job_id, score) pairs for the query, most relevant first.
+
+        Scores are positive BM25 values; higher is better.
+        """
+        if not self.uses_fts5:
+            self._ensure_memory_loaded(session)
+            return self._memory_index.search(query, limit)
+
+        match = build_match_expression(query)
+        if match is None:
+            return []
+
+        statement = text(
+            _FTS_SEARCH + " ORDER BY rank" + (" LIMIT :limit" if limit else "")
+        )
+        params = {"match": match}
+        if limit:
+            params["limit"] = limit
+
+        if session is not None:
+            rows = session.execute(statement, params).all()
+        else:
+            with self.engine.connect() as conn:
+                rows = conn.execute(statement, params).all()
+        return [(job_id, -rank) for job_id, rank in rows]
+
+    def refresh_jobs(self, session, job_ids: Iterable[str]) -> None:
+        """
+        Re-index the given jobs from the session's view of the database.
+
+        FTS5 is maintained by triggers, so this only affects the in-memory
+        fallback. Jobs that no longer exist are removed from the index.
+        """
+        if self.uses_fts5 or not self._memory_loaded:
+            return
+
+        job_ids = [str(job_id) for job_id in job_ids]
+        if not job_ids:
+            return
+
+        found = set()
+        for row in self._document_query(session).filter(
+            self._job_id_column().in_(job_ids)
+        ):
+            self._memory_index.add(row[0], row[1:])
+            found.add(row[0])
+        for job_id in job_ids:
+            if job_id not in found:
+                self._memory_index.remove(job_id)
+
+    def refresh_company(self, session, company_id: str) -> None:
+        """Re-index every job of a company after its name changed."""
+        if self.uses_fts5 or not self._memory_loaded:
+            return
+
+        from backend.data.models import JobListingDB
+
+        job_ids = [
+            job_id
+            for (job_id,) in session.query(JobListingDB.id).filter(
+                JobListingDB.company_id == company_id
+            )
+        ]
+        self.refresh_jobs(session, job_ids)
+
+    @contextmanager
+    def deferred_indexing(self, session):
+        """
+        Index jobs inserted inside the block in batches instead of per row.
+
+        While the block runs, the FTS5 insert trigger is disabled for the
+        session's transaction only, and callers must pass inserted IDs to
+        ``index_inserted_jobs``. A rollback also removes the marker.
+        """
+        if not self.uses_fts5:
+            yield
+            return
+
+        session.execute(text(f"INSERT INTO {FTS_DEFERRED_TABLE} (active) VALUES (1)"))
+        try:
+            yield
+        finally:
+            session.execute(text(f"DELETE FROM {FTS_DEFERRED_TABLE}"))
+
+    def index_inserted_jobs(self, session, job_ids: Iterable[str]) -> None:
+        """Index jobs inserted inside ``deferred_indexing`` with one statement."""
+        job_ids = [str(job_id) for job_id in job_ids]
+        if not self.uses_fts5:
+            self.refresh_jobs(session, job_ids)
+        elif job_ids:
+            session.execute(_FTS_INDEX_JOBS, {"job_ids": job_ids})
+
+    def remove_jobs(self, job_ids: Iterable[str]) -> None:
+        """Drop jobs from the in-memory fallback index."""
+        if self.uses_fts5:
+            return
+        for job_id in job_ids:
+            self._memory_index.remove(str(job_id))
+
+    def _ensure_memory_loaded(self, session=None) -> None:
+        if self._memory_loaded:
+            return
+
+        with self._load_lock:
+            if self._memory_loaded:
+                return
+
+            from sqlalchemy.orm import Session
+
+            owns_session = session is None
+            if owns_session:
+                session = Session(bind=self.engine)
+            try:
+                count = 0
+                for row in self._document_query(session).yield_per(1000):
+                    self._memory_index.add(row[0], row[1:])
+                    count += 1
+            finally:
+                if owns_session:
+                    session.close()
+
+            self._memory_loaded = True
+            logger.info(f"Loaded {count} job listings into in-memory search index")
+
+    @staticmethod
+    def _job_id_column():
+        from backend.data.models import JobListingDB
+
+        return JobListingDB.id
+
+    @staticmethod
+    def _document_query(session):
+        from backend.data.models import CompanyInfoDB, JobListingDB
+
+        return session.query(
+            JobListingDB.id,
+            JobListingDB.title,
+            CompanyInfoDB.name,
+            JobListingDB.description,
+            JobListingDB.requirements,
+        ).outerjoin(CompanyInfoDB, CompanyInfoDB.id == JobListingDB.company_id)
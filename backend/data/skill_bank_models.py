@@ -14,6 +14,8 @@ from sqlalchemy import (
     Column,
     DateTime,
     ForeignKey,
+    Index,
+    Integer,
     String,
     Text,
 )
@@ -453,41 +455,15 @@ class EnhancedSkillBankDB(Base):
     user_id = Column(String, ForeignKey("user_profiles.id"), nullable=False)
 
     # SKILLS MANAGEMENT (Enhanced)
-    skills = Column(JSON, default=dict)  # Dict[category, List[EnhancedSkill]]
     skill_categories = Column(
         JSON, default=list
     )  # ["Technical", "Soft Skills", "Transferable"]
 
-    # SUMMARY VARIATIONS
+    # SUMMARY
     default_summary = Column(Text)
-    summary_variations = Column(JSON, default=list)  # List[SummaryVariation]
-
-    # EXPERIENCE ENTRIES (Master Records)
-    work_experiences = Column(JSON, default=list)  # List[ExperienceEntry]
-
-    # EDUCATION ENTRIES (Master Records)
-    education_entries = Column(JSON, default=list)  # List[EducationEntry]
-
-    # PROJECT ENTRIES (Master Records)
-    projects = Column(JSON, default=list)  # List[ProjectEntry]
 
-    # CERTIFICATIONS (Simple - no variations needed)
-    certifications = Column(JSON, default=list)  # List[Certification]
-
-    # CONTENT VARIATIONS (Related to experiences/education/projects)
-    experience_content_variations = Column(
-        JSON, default=dict
-    )  # Dict[experience_id, List[ContentVariation]]
-    education_content_variations = Column(
-        JSON, default=dict
-    )  # Dict[education_id, List[ContentVariation]]
-    project_content_variations = Column(
-        JSON, default=dict
-    )  # Dict[project_id, List[ContentVariation]]
-
-    # Legacy fields removed - functionality migrated to enhanced skills system
-    # All legacy keyword and skill fields have been replaced by the EnhancedSkill system
-    # which provides more structured and flexible skill management
+    # Skills, entries and content variations live in skill_bank_items, one
+    # row each, so changing one of them never rewrites the whole skill bank
 
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -495,6 +471,79 @@ class EnhancedSkillBankDB(Base):
 
     # Relationships
     user = relationship("UserProfileDB", back_populates="skill_bank")
+    items = relationship(
+        "SkillBankItemDB", back_populates="skill_bank", cascade="all, delete-orphan"
+    )
+
+    __table_args__ = (Index("idx_skill_bank_user", "user_id"),)
+
+
+class SkillBankItemDB(Base):
+    """One skill, entry or content variation of a skill bank."""
+
+    __tablename__ = "skill_bank_items"
+
+    skill_bank_id = Column(
+        String, ForeignKey("skill_banks.id", ondelete="CASCADE"), primary_key=True
+    )
+    section = Column(String, primary_key=True)  # SkillBank field, e.g. "skills"
+    id = Column(String, primary_key=True)  # The item's own id
+
+    # Dict key within grouped sections: the skill category, or the id of the
+    # experience/education/project a content variation belongs to
+    group_key = Column(String, nullable=False, default="")
+    name_key = Column(String)  # Lowercased skill name, for duplicate checks
+    position = Column(Integer, nullable=False, default=0)  # Order within section
+    data = Column(JSON, nullable=False)  # The item's model_dump(mode="json")
+
+    skill_bank = relationship("EnhancedSkillBankDB", back_populates="items")
+
+    __table_args__ = (
+        Index("idx_skill_bank_item_position", "skill_bank_id", "section", "position"),
+        Index(
+            "idx_skill_bank_item_name",
+            "skill_bank_id",
+            "section",
+            "group_key",
+            "name_key",
+        ),
+    )
+
+
+# Item model of each SkillBank section stored in skill_bank_items. Grouped
+# sections are Dict[group_key, List[item]] on SkillBank, the others are lists.
+SKILL_BANK_SECTIONS: Dict[str, type] = {
+    "skills": EnhancedSkill,
+    "summary_variations": SummaryVariation,
+    "work_experiences": ExperienceEntry,
+    "education_entries": EducationEntry,
+    "projects": ProjectEntry,
+    "certifications": Certification,
+    "experience_content_variations": ExperienceContentVariation,
+    "education_content_variations": EducationContentVariation,
+    "project_content_variations": ProjectContentVariation,
+}
+GROUPED_SECTIONS = frozenset(
+    [
+        "skills",
+        "experience_content_variations",
+        "education_content_variations",
+        "project_content_variations",
+    ]
+)
+
+
+def item_group_key(section: str, item: BaseModel) -> str:
+    """Dict key an item is filed under within its section ("" for lists)."""
+    if section == "skills":
+        return item.category.value
+    if section == "experience_content_variations":
+        return item.experience_id
+    if section == "education_content_variations":
+        return item.education_id
+    if section == "project_content_variations":
+        return item.project_id
+    return ""
 
 
 # =============================================================================
@@ -520,6 +569,11 @@ class SkillBankRepository:
     async def add_skill(self, user_id: str, skill: EnhancedSkill) -> EnhancedSkill:
         """Add a new skill to the skill bank."""
 
+    async def add_skills(
+        self, user_id: str, skills: List[EnhancedSkill]
+    ) -> List[EnhancedSkill]:
+        """Add several skills to the skill bank in one write."""
+
     async def update_skill(
         self, user_id: str, skill_id: str, updates: Dict[str, Any]
     ) -> EnhancedSkill:
@@ -1,28 +1,25 @@
 """
 JobPilot Skill Bank Repository
 Repository implementation for skill bank operations with enhanced content variation management
-"""
-
-import json
-from datetime import date, datetime
-from typing import Any, Dict, List, Optional
-
 
-# Custom JSON encoder for handling date and datetime objects
-class DateTimeEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        elif isinstance(obj, date):
-            return obj.isoformat()
-        return super().default(obj)
+Skills, entries and content variations are stored one row each in
+skill_bank_items. Adding, updating or deleting one of them reads and writes
+that row only, instead of loading the whole skill bank and serializing every
+section again.
+"""
 
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
 
+from pydantic import BaseModel
+from sqlalchemy import delete, func, insert, select, update
 from sqlalchemy.orm import Session
 
 from backend.data.database import DatabaseManager
 from backend.data.models import UserProfileDB
 from backend.data.skill_bank_models import (
+    GROUPED_SECTIONS,
+    SKILL_BANK_SECTIONS,
     Certification,
     EducationEntry,
     EnhancedSkill,
@@ -31,14 +28,95 @@ from backend.data.skill_bank_models import (
     ExperienceEntry,
     ProjectEntry,
     SkillBank,
+    SkillBankItemDB,
     SummaryVariation,
     convert_skill_list_to_enhanced,
     create_default_skill_bank,
+    item_group_key,
 )
 
+# Category the skills of a user profile are migrated into
+PROFILE_SKILLS_CATEGORY = "Technical Skills"
+
+
+def item_row(
+    skill_bank_id: str,
+    section: str,
+    item: BaseModel,
+    position: int,
+    group_key: Optional[str] = None,
+) -> Dict[str, Any]:
+    """skill_bank_items values for one item of a section."""
+    return {
+        "skill_bank_id": skill_bank_id,
+        "section": section,
+        "id": item.id,
+        "group_key": item_group_key(section, item) if group_key is None else group_key,
+        "name_key": item.name.lower() if section == "skills" else None,
+        "position": position,
+        "data": item.model_dump(mode="json"),
+    }
+
+
+def section_rows(skill_bank_id: str, section: str, value: Any) -> List[Dict[str, Any]]:
+    """skill_bank_items values for a whole section, in order.
+
+    ``value`` has the shape of the SkillBank field: a dict of lists for
+    grouped sections, a list otherwise. Items may be models or plain dicts.
+    """
+    model = SKILL_BANK_SECTIONS[section]
+    if section in GROUPED_SECTIONS:
+        pairs = [
+            (group_key, item)
+            for group_key, items in (value or {}).items()
+            for item in items
+        ]
+    else:
+        pairs = [(None, item) for item in value or []]
+
+    return [
+        item_row(
+            skill_bank_id,
+            section,
+            item if isinstance(item, model) else model.model_validate(item),
+            position,
+            group_key,
+        )
+        for position, (group_key, item) in enumerate(pairs)
+    ]
+
+
+def load_skill_bank_sections(session: Session, skill_bank_id: str) -> Dict[str, Any]:
+    """Stored items of a skill bank as plain dicts, shaped like SkillBank fields."""
+    sections: Dict[str, Any] = {
+        section: {} if section in GROUPED_SECTIONS else []
+        for section in SKILL_BANK_SECTIONS
+    }
+    rows = session.execute(
+        select(SkillBankItemDB.section, SkillBankItemDB.group_key, SkillBankItemDB.data)
+        .where(SkillBankItemDB.skill_bank_id == skill_bank_id)
+        .order_by(SkillBankItemDB.section, SkillBankItemDB.position)
+    )
+    for section, group_key, data in rows:
+        if section not in sections:
+            continue
+        if section in GROUPED_SECTIONS:
+            sections[section].setdefault(group_key, []).append(data)
+        else:
+            sections[section].append(data)
+    return sections
+
 
 class SkillBankRepository:
-    """Repository for skill bank operations."""
+    """
+    Repository for skill bank operations.
+
+    The async methods never touch the database on the event loop: reads live
+    in the synchronous ``_fetch`` methods, dispatched to the database executor
+    with ``DatabaseManager.run_sync``, and writes are session functions run
+    through ``DatabaseManager.write_async``. Methods that change one skill,
+    entry or variation read and write that item's row only.
+    """
 
     def __init__(self, db_manager: DatabaseManager):
         self.db_manager = db_manager
@@ -53,42 +131,11 @@ class SkillBankRepository:
 
     async def get_skill_bank(self, user_id: str) -> Optional[SkillBank]:
         """Get user's skill bank."""
-        with self._get_session() as session:
-            skill_bank_db = (
-                session.query(EnhancedSkillBankDB)
-                .filter(EnhancedSkillBankDB.user_id == user_id)
-                .first()
-            )
-
-            if not skill_bank_db:
-                return None
-
-            return self._db_to_pydantic(skill_bank_db)
+        return await self.db_manager.run_sync(self._fetch_skill_bank, user_id)
 
     async def create_skill_bank(self, user_id: str) -> SkillBank:
         """Create a new skill bank for user."""
-        with self._get_session() as session:
-            # Check if skill bank already exists
-            existing = (
-                session.query(EnhancedSkillBankDB)
-                .filter(EnhancedSkillBankDB.user_id == user_id)
-                .first()
-            )
-
-            if existing:
-                return self._db_to_pydantic(existing)
-
-            # Create default skill bank
-            skill_bank = create_default_skill_bank(user_id)
-
-            # Convert to database model
-            skill_bank_db = self._pydantic_to_db(skill_bank)
-
-            session.add(skill_bank_db)
-            session.commit()
-            session.refresh(skill_bank_db)
-
-            return self._db_to_pydantic(skill_bank_db)
+        return await self.db_manager.write_async(self._create_skill_bank, user_id)
 
     async def get_or_create_skill_bank(self, user_id: str) -> SkillBank:
         """Get existing skill bank or create a new one."""
@@ -100,39 +147,79 @@ class SkillBankRepository:
     async def update_skill_bank(
         self, user_id: str, updates: Dict[str, Any]
     ) -> SkillBank:
-        """Update skill bank fields."""
+        """Update skill bank fields.
+
+        Section fields (``skills``, ``work_experiences``, ...) replace all
+        items of that section.
+        """
+        return await self.db_manager.write_async(
+            self._update_skill_bank, user_id, updates
+        )
+
+    def _fetch_skill_bank(self, user_id: str) -> Optional[SkillBank]:
         with self._get_session() as session:
-            skill_bank_db = (
-                session.query(EnhancedSkillBankDB)
-                .filter(EnhancedSkillBankDB.user_id == user_id)
-                .first()
+            skill_bank_db = self._query_skill_bank(session, user_id)
+            if not skill_bank_db:
+                return None
+
+            return self._db_to_pydantic(session, skill_bank_db)
+
+    def _create_skill_bank(self, session: Session, user_id: str) -> SkillBank:
+        # Check if skill bank already exists
+        existing = self._query_skill_bank(session, user_id)
+        if existing:
+            return self._db_to_pydantic(session, existing)
+
+        # Create default skill bank
+        skill_bank = create_default_skill_bank(user_id)
+        session.add(
+            EnhancedSkillBankDB(
+                id=skill_bank.id,
+                user_id=skill_bank.user_id,
+                skill_categories=skill_bank.skill_categories,
+                default_summary=skill_bank.default_summary,
+                created_at=skill_bank.created_at,
+                updated_at=skill_bank.updated_at,
             )
+        )
+        session.flush()
 
-            if not skill_bank_db:
-                # Create new skill bank if it doesn't exist
-                return await self.create_skill_bank(user_id)
-
-            # Update fields
-            for field, value in updates.items():
-                if hasattr(skill_bank_db, field):
-                    if isinstance(value, (dict, list)):
-                        setattr(
-                            skill_bank_db,
-                            field,
-                            (
-                                json.dumps(value, cls=DateTimeEncoder)
-                                if value
-                                else ([] if field.endswith("s") else {})
-                            ),
-                        )
-                    else:
-                        setattr(skill_bank_db, field, value)
-
-            skill_bank_db.updated_at = datetime.utcnow()
-            session.commit()
-            session.refresh(skill_bank_db)
-
-            return self._db_to_pydantic(skill_bank_db)
+        rows = []
+        for section in SKILL_BANK_SECTIONS:
+            rows.extend(
+                section_rows(skill_bank.id, section, getattr(skill_bank, section))
+            )
+        if rows:
+            session.execute(insert(SkillBankItemDB), rows)
+
+        return skill_bank
+
+    def _update_skill_bank(
+        self, session: Session, user_id: str, updates: Dict[str, Any]
+    ) -> SkillBank:
+        skill_bank_id = self._skill_bank_id(session, user_id)
+
+        fields = {}
+        for field, value in updates.items():
+            if field in SKILL_BANK_SECTIONS:
+                session.execute(
+                    delete(SkillBankItemDB).where(
+                        SkillBankItemDB.skill_bank_id == skill_bank_id,
+                        SkillBankItemDB.section == field,
+                    )
+                )
+                rows = section_rows(skill_bank_id, field, value)
+                if rows:
+                    session.execute(insert(SkillBankItemDB), rows)
+            elif field != "id" and field in EnhancedSkillBankDB.__table__.columns:
+                fields[field] = value
+
+        self._touch(session, skill_bank_id, **fields)
+
+        skill_bank_db = session.get(
+            EnhancedSkillBankDB, skill_bank_id, populate_existing=True
+        )
+        return self._db_to_pydantic(session, skill_bank_db)
 
     # ===========================================
     # SKILLS MANAGEMENT
@@ -140,84 +227,102 @@ class SkillBankRepository:
 
     async def add_skill(self, user_id: str, skill: EnhancedSkill) -> EnhancedSkill:
         """Add a new skill to the skill bank."""
-        skill_bank = await self.get_or_create_skill_bank(user_id)
-
-        # Add skill to appropriate category
-        if skill.category.value not in skill_bank.skills:
-            skill_bank.skills[skill.category.value] = []
-
-        # Check for duplicates by name
-        existing_skills = skill_bank.skills[skill.category.value]
-        if any(
-            existing.name.lower() == skill.name.lower() for existing in existing_skills
-        ):
-            raise ValueError(
-                f"Skill '{skill.name}' already exists in category '{skill.category.value}'"
-            )
-
-        skill_bank.skills[skill.category.value].append(skill)
+        skills = await self.add_skills(user_id, [skill])
+        return skills[0]
 
-        # Update in database
-        await self._update_skills_in_db(user_id, skill_bank.skills)
-
-        return skill
+    async def add_skills(
+        self, user_id: str, skills: List[EnhancedSkill]
+    ) -> List[EnhancedSkill]:
+        """Add several skills to the skill bank in one write."""
+        return await self.db_manager.write_async(self._add_skills, user_id, skills)
 
     async def update_skill(
         self, user_id: str, skill_id: str, updates: Dict[str, Any]
     ) -> EnhancedSkill:
         """Update an existing skill."""
-        skill_bank = await self.get_or_create_skill_bank(user_id)
-
-        # Find skill across all categories
-        for category_name, skills in skill_bank.skills.items():
-            for i, skill in enumerate(skills):
-                if skill.id == skill_id:
-                    # Update skill fields
-                    for field, value in updates.items():
-                        if hasattr(skill, field):
-                            setattr(skill, field, value)
-
-                    # Update in database
-                    await self._update_skills_in_db(user_id, skill_bank.skills)
-
-                    return skill
-
-        raise ValueError(f"Skill with ID '{skill_id}' not found")
+        return await self.db_manager.write_async(
+            self._update_item, user_id, "skills", skill_id, updates, "Skill"
+        )
 
     async def delete_skill(self, user_id: str, skill_id: str) -> bool:
         """Delete a skill from the skill bank."""
-        skill_bank = await self.get_or_create_skill_bank(user_id)
-
-        # Find and remove skill
-        for category_name, skills in skill_bank.skills.items():
-            for i, skill in enumerate(skills):
-                if skill.id == skill_id:
-                    del skills[i]
-
-                    # Update in database
-                    await self._update_skills_in_db(user_id, skill_bank.skills)
-
-                    return True
-
-        return False
+        return await self.db_manager.write_async(
+            self._delete_item, user_id, "skills", skill_id
+        )
 
     async def get_skills(
         self, user_id: str, category: Optional[str] = None
     ) -> List[EnhancedSkill]:
         """Get all skills, optionally filtered by category."""
-        skill_bank = await self.get_or_create_skill_bank(user_id)
+        skills = await self.db_manager.run_sync(self._fetch_skills, user_id, category)
+        if skills is None:
+            await self.create_skill_bank(user_id)
+            skills = await self.db_manager.run_sync(
+                self._fetch_skills, user_id, category
+            )
 
         if category:
-            return skill_bank.skills.get(category, [])
+            return skills
 
-        # Return all skills from all categories
-        all_skills = []
-        for skills in skill_bank.skills.values():
-            all_skills.extend(skills)
+        return sorted(skills, key=lambda s: (s.category.value, s.display_order, s.name))
 
-        return sorted(
-            all_skills, key=lambda s: (s.category.value, s.display_order, s.name)
-        )
+    def _add_skills(
+        self, session: Session, user_id: str, skills: List[EnhancedSkill]
+    ) -> List[EnhancedSkill]:
+        skill_bank_id = self._skill_bank_id(session, user_id)
+
+        # Check for duplicates by name, within each category
+        taken = {
+            (group_key, name_key)
+            for group_key, name_key in session.execute(
+                select(SkillBankItemDB.group_key, SkillBankItemDB.name_key).where(
+                    SkillBankItemDB.skill_bank_id == skill_bank_id,
+                    SkillBankItemDB.section == "skills",
+                    SkillBankItemDB.group_key.in_(
+                        list({skill.category.value for skill in skills})
+                    ),
+                    SkillBankItemDB.name_key.in_(
+                        list({skill.name.lower() for skill in skills})
+                    ),
+                )
+            )
+        }
+        for skill in skills:
+            key = (skill.category.value, skill.name.lower())
+            if key in taken:
+                raise ValueError(
+                    f"Skill '{skill.name}' already exists in category '{skill.category.value}'"
+                )
+            taken.add(key)
+
+        self._insert_items(session, skill_bank_id, "skills", skills)
+        return skills
+
+    def _fetch_skills(
+        self, user_id: str, category: Optional[str]
+    ) -> Optional[List[EnhancedSkill]]:
+        with self._get_session() as session:
+            skill_bank_id = session.scalar(
+                select(EnhancedSkillBankDB.id).where(
+                    EnhancedSkillBankDB.user_id == user_id
+                )
+            )
+            if skill_bank_id is None:
+                return None
+
+            query = (
+                select(SkillBankItemDB.data)
+                .where(
+                    SkillBankItemDB.skill_bank_id == skill_bank_id,
+                    SkillBankItemDB.section == "skills",
+                )
+                .order_by(SkillBankItemDB.position)
+            )
+            if category:
+                query = query.where(SkillBankItemDB.group_key == category)
+            return [
+                EnhancedSkill.model_validate(data) for data in session.scalars(query)
+            ]
 
     # ===========================================
     # SUMMARY VARIATIONS
@@ -227,47 +332,28 @@ class SkillBankRepository:
         self, user_id: str, variation: SummaryVariation
     ) -> SummaryVariation:
         """Add a summary variation."""
-        skill_bank = await self.get_or_create_skill_bank(user_id)
-        skill_bank.summary_variations.append(variation)
-
-        await self._update_summary_variations_in_db(
-            user_id, skill_bank.summary_variations
+        return await self.db_manager.write_async(
+            self._add_item, user_id, "summary_variations", variation
         )
-        return variation
 
     async def update_summary_variation(
         self, user_id: str, variation_id: str, updates: Dict[str, Any]
     ) -> SummaryVariation:
         """Update a summary variation."""
-        skill_bank = await self.get_or_create_skill_bank(user_id)
-
-        for variation in skill_bank.summary_variations:
-            if variation.id == variation_id:
-                for field, value in updates.items():
-                    if hasattr(variation, field):
-                        setattr(variation, field, value)
-
-                await self._update_summary_variations_in_db(
-                    user_id, skill_bank.summary_variations
-                )
-                return variation
-
-        raise ValueError(f"Summary variation with ID '{variation_id}' not found")
+        return await self.db_manager.write_async(
+            self._update_item,
+            user_id,
+            "summary_variations",
+            variation_id,
+            updates,
+            "Summary variation",
+        )
 
     async def delete_summary_variation(self, user_id: str, variation_id: str) -> bool:
         """Delete a summary variation."""
-        skill_bank = await self.get_or_create_skill_bank(user_id)
-
-        for i, variation in enumerate(skill_bank.summary_variations):
-            if variation.id == variation_id:
-                del skill_bank.summary_variations[i]
-
-                await self._update_summary_variations_in_db(
-                    user_id, skill_bank.summary_variations
-                )
-                return True
-
-        return False
+        return await self.db_manager.write_async(
+            self._delete_item, user_id, "summary_variations", variation_id
+        )
 
     # ===========================================
     # EXPERIENCE MANAGEMENT
@@ -277,52 +363,32 @@ class SkillBankRepository:
         self, user_id: str, experience: ExperienceEntry
     ) -> ExperienceEntry:
         """Add a work experience entry."""
-        skill_bank = await self.get_or_create_skill_bank(user_id)
-        skill_bank.work_experiences.append(experience)
-
-        await self._update_experiences_in_db(user_id, skill_bank.work_experiences)
-        return experience
+        return await self.db_manager.write_async(
+            self._add_item, user_id, "work_experiences", experience
+        )
 
     async def update_experience(
         self, user_id: str, experience_id: str, updates: Dict[str, Any]
     ) -> ExperienceEntry:
         """Update a work experience entry."""
-        skill_bank = await self.get_or_create_skill_bank(user_id)
-
-        for experience in skill_bank.work_experiences:
-            if experience.id == experience_id:
-                for field, value in updates.items():
-                    if hasattr(experience, field):
-                        setattr(experience, field, value)
-
-                await self._update_experiences_in_db(
-                    user_id, skill_bank.work_experiences
-                )
-                return experience
-
-        raise ValueError(f"Experience with ID '{experience_id}' not found")
+        return await self.db_manager.write_async(
+            self._update_item,
+            user_id,
+            "work_experiences",
+            experience_id,
+            updates,
+            "Experience",
+        )
 
     async def delete_experience(self, user_id: str, experience_id: str) -> bool:
-        """Delete a work experience entry."""
-        skill_bank = await self.get_or_create_skill_bank(user_id)
-
-        for i, experience in enumerate(skill_bank.work_experiences):
-            if experience.id == experience_id:
-                del skill_bank.work_experiences[i]
-
-                # Also remove any content variations for this experience
-                if experience_id in skill_bank.experience_content_variations:
-                    del skill_bank.experience_content_variations[experience_id]
-
-                await self._update_experiences_in_db(
-                    user_id, skill_bank.work_experiences
-                )
-                await self._update_experience_variations_in_db(
-                    user_id, skill_bank.experience_content_variations
-                )
-                return True
-
-        return False
+        """Delete a work experience entry and its content variations."""
+        return await self.db_manager.write_async(
+            self._delete_item,
+            user_id,
+            "work_experiences",
+            experience_id,
+            "experience_content_variations",
+        )
 
     async def add_experience_content_variation(
         self, user_id: str, experience_id: str, variation: ExperienceContentVariation
@@ -334,27 +400,30 @@ class SkillBankRepository:
         self, user_id: str, variation: ExperienceContentVariation
     ) -> ExperienceContentVariation:
         """Add a variation to a work experience entry."""
-        skill_bank = await self.get_or_create_skill_bank(user_id)
+        return await self.db_manager.write_async(
+            self._add_experience_variation, user_id, variation
+        )
+
+    def _add_experience_variation(
+        self, session: Session, user_id: str, variation: ExperienceContentVariation
+    ) -> ExperienceContentVariation:
+        skill_bank_id = self._skill_bank_id(session, user_id)
 
         # Ensure the experience exists
-        experience_exists = any(
-            exp.id == variation.experience_id for exp in skill_bank.work_experiences
+        experience_exists = session.scalar(
+            select(SkillBankItemDB.id).where(
+                SkillBankItemDB.skill_bank_id == skill_bank_id,
+                SkillBankItemDB.section == "work_experiences",
+                SkillBankItemDB.id == variation.experience_id,
+            )
         )
         if not experience_exists:
             raise ValueError(
                 f"Experience with ID '{variation.experience_id}' not found"
             )
 
-        # Add variation
-        if variation.experience_id not in skill_bank.experience_content_variations:
-            skill_bank.experience_content_variations[variation.experience_id] = []
-
-        skill_bank.experience_content_variations[variation.experience_id].append(
-            variation
-        )
-
-        await self._update_experience_variations_in_db(
-            user_id, skill_bank.experience_content_variations
+        self._insert_items(
+            session, skill_bank_id, "experience_content_variations", [variation]
         )
         return variation
 
@@ -366,49 +435,32 @@ class SkillBankRepository:
         self, user_id: str, education: EducationEntry
     ) -> EducationEntry:
         """Add an education entry."""
-        skill_bank = await self.get_or_create_skill_bank(user_id)
-        skill_bank.education_entries.append(education)
-
-        await self._update_education_in_db(user_id, skill_bank.education_entries)
-        return education
+        return await self.db_manager.write_async(
+            self._add_item, user_id, "education_entries", education
+        )
 
     async def update_education(
         self, user_id: str, education_id: str, updates: Dict[str, Any]
     ) -> EducationEntry:
         """Update an education entry."""
-        skill_bank = await self.get_or_create_skill_bank(user_id)
-
-        for education in skill_bank.education_entries:
-            if education.id == education_id:
-                for field, value in updates.items():
-                    if hasattr(education, field):
-                        setattr(education, field, value)
-
-                await self._update_education_in_db(
-                    user_id, skill_bank.education_entries
-                )
-                return education
-
-        raise ValueError(f"Education with ID '{education_id}' not found")
+        return await self.db_manager.write_async(
+            self._update_item,
+            user_id,
+            "education_entries",
+            education_id,
+            updates,
+            "Education",
+        )
 
     async def delete_education(self, user_id: str, education_id: str) -> bool:
-        """Delete an education entry."""
-        skill_bank = await self.get_or_create_skill_bank(user_id)
-
-        for i, education in enumerate(skill_bank.education_entries):
-            if education.id == education_id:
-                del skill_bank.education_entries[i]
-
-                # Also remove any content variations for this education
-                if education_id in skill_bank.education_content_variations:
-                    del skill_bank.education_content_variations[education_id]
-
-                await self._update_education_in_db(
-                    user_id, skill_bank.education_entries
-                )
-                return True
-
-        return False
+        """Delete an education entry and its content variations."""
+        return await self.db_manager.write_async(
+            self._delete_item,
+            user_id,
+            "education_entries",
+            education_id,
+            "education_content_variations",
+        )
 
     # ===========================================
     # PROJECT MANAGEMENT
@@ -416,45 +468,27 @@ class SkillBankRepository:
 
     async def add_project(self, user_id: str, project: ProjectEntry) -> ProjectEntry:
         """Add a project entry."""
-        skill_bank = await self.get_or_create_skill_bank(user_id)
-        skill_bank.projects.append(project)
-
-        await self._update_projects_in_db(user_id, skill_bank.projects)
-        return project
+        return await self.db_manager.write_async(
+            self._add_item, user_id, "projects", project
+        )
 
     async def update_project(
         self, user_id: str, project_id: str, updates: Dict[str, Any]
     ) -> ProjectEntry:
         """Update a project entry."""
-        skill_bank = await self.get_or_create_skill_bank(user_id)
-
-        for project in skill_bank.projects:
-            if project.id == project_id:
-                for field, value in updates.items():
-                    if hasattr(project, field):
-                        setattr(project, field, value)
-
-                await self._update_projects_in_db(user_id, skill_bank.projects)
-                return project
-
-        raise ValueError(f"Project with ID '{project_id}' not found")
+        return await self.db_manager.write_async(
+            self._update_item, user_id, "projects", project_id, updates, "Project"
+        )
 
     async def delete_project(self, user_id: str, project_id: str) -> bool:
-        """Delete a project entry."""
-        skill_bank = await self.get_or_create_skill_bank(user_id)
-
-        for i, project in enumerate(skill_bank.projects):
-            if project.id == project_id:
-                del skill_bank.projects[i]
-
-                # Also remove any content variations for this project
-                if project_id in skill_bank.project_content_variations:
-                    del skill_bank.project_content_variations[project_id]
-
-                await self._update_projects_in_db(user_id, skill_bank.projects)
-                return True
-
-        return False
+        """Delete a project entry and its content variations."""
+        return await self.db_manager.write_async(
+            self._delete_item,
+            user_id,
+            "projects",
+            project_id,
+            "project_content_variations",
+        )
 
     # ===========================================
     # CERTIFICATION MANAGEMENT
@@ -464,45 +498,28 @@ class SkillBankRepository:
         self, user_id: str, certification: Certification
     ) -> Certification:
         """Add a certification entry."""
-        skill_bank = await self.get_or_create_skill_bank(user_id)
-        skill_bank.certifications.append(certification)
-
-        await self._update_certifications_in_db(user_id, skill_bank.certifications)
-        return certification
+        return await self.db_manager.write_async(
+            self._add_item, user_id, "certifications", certification
+        )
 
     async def update_certification(
         self, user_id: str, certification_id: str, updates: Dict[str, Any]
     ) -> Certification:
         """Update a certification entry."""
-        skill_bank = await self.get_or_create_skill_bank(user_id)
-
-        for certification in skill_bank.certifications:
-            if certification.id == certification_id:
-                for field, value in updates.items():
-                    if hasattr(certification, field):
-                        setattr(certification, field, value)
-
-                await self._update_certifications_in_db(
-                    user_id, skill_bank.certifications
-                )
-                return certification
-
-        raise ValueError(f"Certification with ID '{certification_id}' not found")
+        return await self.db_manager.write_async(
+            self._update_item,
+            user_id,
+            "certifications",
+            certification_id,
+            updates,
+            "Certification",
+        )
 
     async def delete_certification(self, user_id: str, certification_id: str) -> bool:
         """Delete a certification entry."""
-        skill_bank = await self.get_or_create_skill_bank(user_id)
-
-        for i, certification in enumerate(skill_bank.certifications):
-            if certification.id == certification_id:
-                del skill_bank.certifications[i]
-
-                await self._update_certifications_in_db(
-                    user_id, skill_bank.certifications
-                )
-                return True
-
-        return False
+        return await self.db_manager.write_async(
+            self._delete_item, user_id, "certifications", certification_id
+        )
 
     # ===========================================
     # DATA MIGRATION
@@ -510,262 +527,208 @@ class SkillBankRepository:
 
     async def migrate_from_user_profile(self, user_id: str) -> SkillBank:
         """Migrate skills data from UserProfile to SkillBank."""
+        profile_skills, bio = await self.db_manager.run_sync(
+            self._fetch_profile_seed, user_id
+        )
+        return await self.db_manager.write_async(
+            self._migrate_profile_seed, user_id, profile_skills, bio
+        )
+
+    def _fetch_profile_seed(self, user_id: str):
+        """Skills and bio of a user profile, the inputs of the migration."""
         with self._get_session() as session:
             user_profile = (
                 session.query(UserProfileDB).filter(UserProfileDB.id == user_id).first()
             )
             if not user_profile:
                 raise ValueError(f"User profile with ID '{user_id}' not found")
+            return list(user_profile.skills or []), user_profile.bio
+
+    def _migrate_profile_seed(
+        self,
+        session: Session,
+        user_id: str,
+        profile_skills: List[str],
+        bio: Optional[str],
+    ) -> SkillBank:
+        skill_bank_id = self._skill_bank_id(session, user_id)
+
+        # Migrate basic skills from user profile
+        if profile_skills:
+            # Only add skills that don't already exist
+            existing_names = set(
+                session.scalars(
+                    select(SkillBankItemDB.name_key).where(
+                        SkillBankItemDB.skill_bank_id == skill_bank_id,
+                        SkillBankItemDB.section == "skills",
+                        SkillBankItemDB.group_key == PROFILE_SKILLS_CATEGORY,
+                    )
+                )
+            )
+            new_skills = [
+                skill
+                for skill in convert_skill_list_to_enhanced(profile_skills)
+                if skill.name.lower() not in existing_names
+            ]
+            self._insert_items(
+                session,
+                skill_bank_id,
+                "skills",
+                new_skills,
+                group_key=PROFILE_SKILLS_CATEGORY,
+            )
 
-            # Get or create skill bank
-            skill_bank = await self.get_or_create_skill_bank(user_id)
-
-            # Migrate basic skills from user profile
-            if user_profile.skills:
-                # Convert simple skill names to enhanced skills
-                enhanced_skills = convert_skill_list_to_enhanced(user_profile.skills)
-
-                # Add to technical skills category
-                if "Technical Skills" not in skill_bank.skills:
-                    skill_bank.skills["Technical Skills"] = []
-
-                # Only add skills that don't already exist
-                existing_names = {
-                    skill.name.lower()
-                    for skill in skill_bank.skills["Technical Skills"]
-                }
-                new_skills = [
-                    skill
-                    for skill in enhanced_skills
-                    if skill.name.lower() not in existing_names
-                ]
-
-                skill_bank.skills["Technical Skills"].extend(new_skills)
-
-            # Migrate bio as default summary if no summary exists
-            if user_profile.bio and not skill_bank.default_summary:
-                skill_bank.default_summary = user_profile.bio
+        skill_bank_db = session.get(
+            EnhancedSkillBankDB, skill_bank_id, populate_existing=True
+        )
 
-            # Update skill bank in database
-            await self._update_full_skill_bank(user_id, skill_bank)
+        # Migrate bio as default summary if no summary exists
+        if bio and not skill_bank_db.default_summary:
+            skill_bank_db.default_summary = bio
+        skill_bank_db.updated_at = datetime.utcnow()
+        session.flush()
 
-            return skill_bank
+        return self._db_to_pydantic(session, skill_bank_db)
 
     # ===========================================
     # HELPER METHODS
     # ===========================================
 
-    def _db_to_pydantic(self, skill_bank_db: EnhancedSkillBankDB) -> SkillBank:
-        """Convert database model to Pydantic model."""
+    def _query_skill_bank(
+        self, session: Session, user_id: str
+    ) -> Optional[EnhancedSkillBankDB]:
+        return (
+            session.query(EnhancedSkillBankDB)
+            .filter(EnhancedSkillBankDB.user_id == user_id)
+            .populate_existing()
+            .first()
+        )
 
-        # Convert JSON fields back to proper types
-        skills = {}
-        if skill_bank_db.skills:
-            skills_data = (
-                skill_bank_db.skills
-                if isinstance(skill_bank_db.skills, dict)
-                else json.loads(skill_bank_db.skills)
-            )
-            for category, skill_list in skills_data.items():
-                skills[category] = [
-                    EnhancedSkill(**skill_dict) for skill_dict in skill_list
-                ]
-
-        summary_variations = []
-        if skill_bank_db.summary_variations:
-            variations_data = (
-                skill_bank_db.summary_variations
-                if isinstance(skill_bank_db.summary_variations, list)
-                else json.loads(skill_bank_db.summary_variations)
-            )
-            summary_variations = [
-                SummaryVariation(**var_dict) for var_dict in variations_data
-            ]
+    def _skill_bank_id(self, session: Session, user_id: str) -> str:
+        """Id of the user's skill bank, created with defaults if missing."""
+        skill_bank_id = session.scalar(
+            select(EnhancedSkillBankDB.id).where(EnhancedSkillBankDB.user_id == user_id)
+        )
+        if skill_bank_id is None:
+            skill_bank_id = self._create_skill_bank(session, user_id).id
+        return skill_bank_id
+
+    def _touch(self, session: Session, skill_bank_id: str, **fields) -> None:
+        """Bump the skill bank's updated_at, setting any other given fields."""
+        session.execute(
+            update(EnhancedSkillBankDB)
+            .where(EnhancedSkillBankDB.id == skill_bank_id)
+            .values(updated_at=datetime.utcnow(), **fields)
+        )
 
-        work_experiences = []
-        if skill_bank_db.work_experiences:
-            exp_data = (
-                skill_bank_db.work_experiences
-                if isinstance(skill_bank_db.work_experiences, list)
-                else json.loads(skill_bank_db.work_experiences)
-            )
-            work_experiences = [ExperienceEntry(**exp_dict) for exp_dict in exp_data]
-
-        education_entries = []
-        if skill_bank_db.education_entries:
-            edu_data = (
-                skill_bank_db.education_entries
-                if isinstance(skill_bank_db.education_entries, list)
-                else json.loads(skill_bank_db.education_entries)
-            )
-            education_entries = [EducationEntry(**edu_dict) for edu_dict in edu_data]
-
-        projects = []
-        if skill_bank_db.projects:
-            proj_data = (
-                skill_bank_db.projects
-                if isinstance(skill_bank_db.projects, list)
-                else json.loads(skill_bank_db.projects)
+    def _insert_items(
+        self,
+        session: Session,
+        skill_bank_id: str,
+        section: str,
+        items: Iterable[BaseModel],
+        group_key: Optional[str] = None,
+    ) -> None:
+        """Append items to the end of a section."""
+        items = list(items)
+        if not items:
+            return
+
+        next_position = session.scalar(
+            select(func.coalesce(func.max(SkillBankItemDB.position) + 1, 0)).where(
+                SkillBankItemDB.skill_bank_id == skill_bank_id,
+                SkillBankItemDB.section == section,
             )
-            projects = [ProjectEntry(**proj_dict) for proj_dict in proj_data]
-
-        certifications = []
-        if skill_bank_db.certifications:
-            cert_data = (
-                skill_bank_db.certifications
-                if isinstance(skill_bank_db.certifications, list)
-                else json.loads(skill_bank_db.certifications)
+        )
+        session.execute(
+            insert(SkillBankItemDB),
+            [
+                item_row(skill_bank_id, section, item, next_position + i, group_key)
+                for i, item in enumerate(items)
+            ],
+        )
+        self._touch(session, skill_bank_id)
+
+    def _add_item(
+        self, session: Session, user_id: str, section: str, item: BaseModel
+    ) -> BaseModel:
+        skill_bank_id = self._skill_bank_id(session, user_id)
+        self._insert_items(session, skill_bank_id, section, [item])
+        return item
+
+    def _update_item(
+        self,
+        session: Session,
+        user_id: str,
+        section: str,
+        item_id: str,
+        updates: Dict[str, Any],
+        label: str,
+    ) -> BaseModel:
+        skill_bank_id = self._skill_bank_id(session, user_id)
+        item_key = (
+            SkillBankItemDB.skill_bank_id == skill_bank_id,
+            SkillBankItemDB.section == section,
+            SkillBankItemDB.id == item_id,
+        )
+
+        data = session.scalar(select(SkillBankItemDB.data).where(*item_key))
+        if data is None:
+            raise ValueError(f"{label} with ID '{item_id}' not found")
+
+        item = SKILL_BANK_SECTIONS[section].model_validate(data)
+        for field, value in updates.items():
+            if hasattr(item, field):
+                setattr(item, field, value)
+
+        values = {"data": item.model_dump(mode="json")}
+        if section == "skills":
+            values["name_key"] = item.name.lower()
+        session.execute(update(SkillBankItemDB).where(*item_key).values(**values))
+        self._touch(session, skill_bank_id)
+        return item
+
+    def _delete_item(
+        self,
+        session: Session,
+        user_id: str,
+        section: str,
+        item_id: str,
+        variations_section: Optional[str] = None,
+    ) -> bool:
+        skill_bank_id = self._skill_bank_id(session, user_id)
+        deleted = session.execute(
+            delete(SkillBankItemDB).where(
+                SkillBankItemDB.skill_bank_id == skill_bank_id,
+                SkillBankItemDB.section == section,
+                SkillBankItemDB.id == item_id,
             )
-            certifications = [Certification(**cert_dict) for cert_dict in cert_data]
-
-        # Handle content variations
-        experience_content_variations = {}
-        if skill_bank_db.experience_content_variations:
-            exp_var_data = (
-                skill_bank_db.experience_content_variations
-                if isinstance(skill_bank_db.experience_content_variations, dict)
-                else json.loads(skill_bank_db.experience_content_variations)
+        ).rowcount
+        if not deleted:
+            return False
+
+        # Also remove any content variations of the deleted entry
+        if variations_section:
+            session.execute(
+                delete(SkillBankItemDB).where(
+                    SkillBankItemDB.skill_bank_id == skill_bank_id,
+                    SkillBankItemDB.section == variations_section,
+                    SkillBankItemDB.group_key == item_id,
+                )
             )
-            for exp_id, variations in exp_var_data.items():
-                experience_content_variations[exp_id] = [
-                    ExperienceContentVariation(**var_dict) for var_dict in variations
-                ]
+        self._touch(session, skill_bank_id)
+        return True
 
+    def _db_to_pydantic(
+        self, session: Session, skill_bank_db: EnhancedSkillBankDB
+    ) -> SkillBank:
+        """Convert database model and its items to Pydantic model."""
         return SkillBank(
             id=skill_bank_db.id,
             user_id=skill_bank_db.user_id,
-            skills=skills,
             skill_categories=skill_bank_db.skill_categories or [],
             default_summary=skill_bank_db.default_summary,
-            summary_variations=summary_variations,
-            work_experiences=work_experiences,
-            education_entries=education_entries,
-            projects=projects,
-            certifications=certifications,
-            experience_content_variations=experience_content_variations,
-            education_content_variations=skill_bank_db.education_content_variations
-            or {},
-            project_content_variations=skill_bank_db.project_content_variations or {},
-            # REMOVED: Legacy field references no longer exist in SkillBank Pydantic model
-            # experience_keywords, industry_keywords, technical_keywords, soft_skills,
-            # auto_extracted_skills, skill_confidence - functionality moved to enhanced skills
             created_at=skill_bank_db.created_at,
             updated_at=skill_bank_db.updated_at,
+            **load_skill_bank_sections(session, skill_bank_db.id),
         )
-
-    def _pydantic_to_db(self, skill_bank: SkillBank) -> EnhancedSkillBankDB:
-        """Convert Pydantic model to database model."""
-
-        # Convert skills to JSON serializable format
-        skills_json = {}
-        for category, skill_list in skill_bank.skills.items():
-            skills_json[category] = [skill.model_dump() for skill in skill_list]
-
-        return EnhancedSkillBankDB(
-            id=skill_bank.id,
-            user_id=skill_bank.user_id,
-            skills=json.dumps(skills_json, cls=DateTimeEncoder),
-            skill_categories=skill_bank.skill_categories,
-            default_summary=skill_bank.default_summary,
-            summary_variations=json.dumps(
-                [var.model_dump() for var in skill_bank.summary_variations],
-                cls=DateTimeEncoder,
-            ),
-            work_experiences=json.dumps(
-                [exp.model_dump() for exp in skill_bank.work_experiences],
-                cls=DateTimeEncoder,
-            ),
-            education_entries=json.dumps(
-                [edu.model_dump() for edu in skill_bank.education_entries],
-                cls=DateTimeEncoder,
-            ),
-            projects=json.dumps(
-                [proj.model_dump() for proj in skill_bank.projects], cls=DateTimeEncoder
-            ),
-            certifications=json.dumps(
-                [cert.model_dump() for cert in skill_bank.certifications],
-                cls=DateTimeEncoder,
-            ),
-            experience_content_variations=json.dumps(
-                {
-                    exp_id: [var.model_dump() for var in variations]
-                    for exp_id, variations in skill_bank.experience_content_variations.items()
-                },
-                cls=DateTimeEncoder,
-            ),
-            education_content_variations=skill_bank.education_content_variations,
-            project_content_variations=skill_bank.project_content_variations,
-            created_at=skill_bank.created_at,
-            updated_at=skill_bank.updated_at,
-        )
-
-    async def _update_skills_in_db(
-        self, user_id: str, skills: Dict[str, List[EnhancedSkill]]
-    ):
-        """Update skills in database."""
-        skills_json = {
-            category: [skill.dict() for skill in skill_list]
-            for category, skill_list in skills.items()
-        }
-        await self.update_skill_bank(user_id, {"skills": skills_json})
-
-    async def _update_summary_variations_in_db(
-        self, user_id: str, variations: List[SummaryVariation]
-    ):
-        """Update summary variations in database."""
-        variations_json = [var.dict() for var in variations]
-        await self.update_skill_bank(user_id, {"summary_variations": variations_json})
-
-    async def _update_experiences_in_db(
-        self, user_id: str, experiences: List[ExperienceEntry]
-    ):
-        """Update work experiences in database."""
-        experiences_json = [exp.dict() for exp in experiences]
-        await self.update_skill_bank(user_id, {"work_experiences": experiences_json})
-
-    async def _update_experience_variations_in_db(
-        self, user_id: str, variations: Dict[str, List[ExperienceContentVariation]]
-    ):
-        """Update experience content variations in database."""
-        variations_json = {
-            exp_id: [var.dict() for var in var_list]
-            for exp_id, var_list in variations.items()
-        }
-        await self.update_skill_bank(
-            user_id, {"experience_content_variations": variations_json}
-        )
-
-    async def _update_full_skill_bank(self, user_id: str, skill_bank: SkillBank):
-        """Update complete skill bank in database."""
-        updates = {
-            "skills": {
-                category: [skill.dict() for skill in skill_list]
-                for category, skill_list in skill_bank.skills.items()
-            },
-            "default_summary": skill_bank.default_summary,
-            "summary_variations": [var.dict() for var in skill_bank.summary_variations],
-            "work_experiences": [exp.dict() for exp in skill_bank.work_experiences],
-            "education_entries": [edu.dict() for edu in skill_bank.education_entries],
-            "projects": [proj.dict() for proj in skill_bank.projects],
-            "certifications": [cert.dict() for cert in skill_bank.certifications],
-        }
-        await self.update_skill_bank(user_id, updates)
-
-    async def _update_education_in_db(
-        self, user_id: str, education_entries: List[EducationEntry]
-    ):
-        """Update education entries in database."""
-        education_json = [edu.dict() for edu in education_entries]
-        await self.update_skill_bank(user_id, {"education_entries": education_json})
-
-    async def _update_projects_in_db(self, user_id: str, projects: List[ProjectEntry]):
-        """Update project entries in database."""
-        projects_json = [proj.dict() for proj in projects]
-        await self.update_skill_bank(user_id, {"projects": projects_json})
-
-    async def _update_certifications_in_db(
-        self, user_id: str, certifications: List[Certification]
-    ):
-        """Update certifications in database."""
-        certifications_json = [cert.dict() for cert in certifications]
-        await self.update_skill_bank(user_id, {"certifications": certifications_json})
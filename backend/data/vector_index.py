@@ -0,0 +1,661 @@
+"""
+JobPilot Vector Index
+Semantic similarity search over job embeddings.
+
+Embeddings are held in one contiguous, L2-normalised float32 matrix that is
+memory-mapped from a sidecar ``.npy`` file keyed by the embeddings' content
+hashes, so JSON vectors are only decoded when the set of embeddings changes.
+Structured filters are applied as a boolean mask before scoring, and large
+corpora use an inverted-file (IVF) index that only scores the closest
+clusters.
+"""
+
+import hashlib
+import math
+import os
+import threading
+import time
+from functools import lru_cache
+from itertools import pairwise
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from backend.data.embedding_codec import decode_embedding
+from backend.data.search_index import tokenize
+from backend.logger import logger
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+EMBEDDING_DIMENSION = 384
+HASHING_MODEL_NAME = "jobpilot/hashing-bow-384"
+
+# Rows scored per matrix multiply; bounds the temporary copy made for masks
+BLOCK_ROWS = 32768
+
+# Corpus size from which an IVF index is built instead of exact search
+IVF_THRESHOLD = 200_000
+
+
+def job_embedding_text(
+    title: Optional[str],
+    description: Optional[str] = None,
+    requirements: Optional[str] = None,
+) -> str:
+    """Text a job's embedding is computed from."""
+    return f"{title or ''} {description or ''} {requirements or ''}"
+
+
+@lru_cache(maxsize=65536)
+def _feature_slot(feature: str, dimension: int) -> Tuple[int, float]:
+    digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+    value = int.from_bytes(digest, "little")
+    return value % dimension, (1.0 if value >> 63 else -1.0)
+
+
+class HashingEmbedder:
+    """
+    Deterministic bag-of-words embedder based on feature hashing.
+
+    Words and word bigrams are hashed into a fixed number of signed buckets
+    and the result is L2-normalised. It needs no model download, produces the
+    same vector for the same text in every process, and texts that share
+    vocabulary end up close in cosine distance.
+    """
+
+    def __init__(
+        self, dimension: int = EMBEDDING_DIMENSION, model_name: str = HASHING_MODEL_NAME
+    ):
+        self.dimension = dimension
+        self.model_name = model_name
+
+    def embed(self, text: Optional[str]) -> List[float]:
+        """Embed a single text as a unit-length vector (all zeros if empty)."""
+        tokens = tokenize(text)
+        features = tokens + [f"{a} {b}" for a, b in pairwise(tokens)]
+
+        vector = [0.0] * self.dimension
+        for feature in features:
+            slot, sign = _feature_slot(feature, self.dimension)
+            vector[slot] += sign
+
+        norm = math.sqrt(sum(value * value for value in vector))
+        if norm == 0.0:
+            return vector
+        return [value / norm for value in vector]
+
+
+def _top_k(scores, k: int):
+    """Indices of the k highest scores, best first."""
+    if k <= 0 or len(scores) == 0:
+        return np.empty(0, dtype=np.int64)
+    if k < len(scores):
+        candidates = np.argpartition(-scores, k - 1)[:k]
+    else:
+        candidates = np.arange(len(scores))
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+
+class IVFIndex:
+    """
+    Inverted-file index: k-means clusters over the normalised vectors.
+
+    ``order`` is the permutation that sorts rows by cluster. Once the matrix
+    is stored in that order, cluster ``c`` is the contiguous row range
+    ``bounds[c]:bounds[c + 1]`` and probing needs no gather copies.
+    """
+
+    def __init__(self, centroids, order, bounds):
+        self.centroids = centroids
+        self.order = order
+        self.bounds = bounds
+
+    @property
+    def n_lists(self) -> int:
+        return len(self.centroids)
+
+    @classmethod
+    def build(
+        cls, matrix, n_lists: Optional[int] = None, n_iter: int = 8, seed: int = 0
+    ) -> "IVFIndex":
+        """Cluster the rows with spherical k-means trained on a sample."""
+        size = len(matrix)
+        n_lists = n_lists or max(int(math.sqrt(size)), 1)
+        n_lists = min(n_lists, size)
+        rng = np.random.default_rng(seed)
+
+        sample_size = min(size, n_lists * 64)
+        sample = np.asarray(
+            matrix[np.sort(rng.choice(size, sample_size, replace=False))]
+        )
+        centroids = sample[rng.choice(sample_size, n_lists, replace=False)].copy()
+
+        for _ in range(n_iter):
+            assignment = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignment, sample)
+            norms = np.linalg.norm(sums, axis=1)
+            populated = norms > 0
+            centroids[populated] = sums[populated] / norms[populated, None]
+
+        assignment = np.empty(size, dtype=np.int32)
+        for start in range(0, size, BLOCK_ROWS):
+            block = matrix[start : start + BLOCK_ROWS]
+            assignment[start : start + len(block)] = np.argmax(
+                block @ centroids.T, axis=1
+            )
+
+        order = np.argsort(assignment, kind="stable").astype(np.int64)
+        bounds = np.searchsorted(assignment[order], np.arange(n_lists + 1))
+        return cls(centroids, order, bounds)
+
+    def probe(self, query, n_probe: int) -> List[Tuple[int, int]]:
+        """Row ranges (in cluster order) of the n_probe closest clusters."""
+        lists = np.sort(_top_k(self.centroids @ query, n_probe))
+        return [
+            (int(self.bounds[c]), int(self.bounds[c + 1]))
+            for c in lists
+            if self.bounds[c + 1] > self.bounds[c]
+        ]
+
+    def reorder(self, matrix, path: Optional[str] = None):
+        """Copy the matrix into cluster order, to a .npy file if a path is given."""
+        if path is None:
+            return np.ascontiguousarray(matrix[self.order])
+
+        clustered = np.lib.format.open_memmap(
+            path, mode="w+", dtype=np.float32, shape=matrix.shape
+        )
+        for start in range(0, len(matrix), BLOCK_ROWS):
+            rows = self.order[start : start + BLOCK_ROWS]
+            clustered[start : start + len(rows)] = matrix[rows]
+        clustered.flush()
+        del clustered
+        return np.load(path, mmap_mode="r")
+
+    def save(self, path: str) -> None:
+        np.savez(path, centroids=self.centroids, order=self.order, bounds=self.bounds)
+
+    @classmethod
+    def load(cls, path: str) -> "IVFIndex":
+        with np.load(path) as data:
+            return cls(data["centroids"], data["order"], data["bounds"])
+
+
+class _IndexState:
+    """Immutable snapshot of the loaded index; swapped atomically on reload."""
+
+    def __init__(self, job_ids, matrix, attributes, signature, ivf=None):
+        self.job_ids = job_ids
+        self.row_of = {job_id: row for row, job_id in enumerate(job_ids)}
+        self.matrix = matrix
+        self.attributes = attributes
+        self.signature = signature
+        self.ivf = ivf
+
+    def __len__(self) -> int:
+        return len(self.job_ids)
+
+
+class JobVectorIndex:
+    """Cosine-similarity top-k search over active jobs' embeddings."""
+
+    def __init__(
+        self,
+        engine,
+        embedder: Optional[HashingEmbedder] = None,
+        cache_dir: Optional[str] = None,
+        ivf_threshold: int = IVF_THRESHOLD,
+        n_probe: Optional[int] = None,
+        refresh_interval: float = 30.0,
+    ):
+        """
+        Args:
+            engine: SQLAlchemy engine of the job database
+            embedder: Query embedder; must match the stored embedding model
+            cache_dir: Directory for the memory-mapped sidecar files. Defaults
+                to a ``vector_index`` directory next to a SQLite database file;
+                otherwise the matrix is kept in memory only.
+            ivf_threshold: Build an IVF index when the corpus has this many rows
+            n_probe: IVF clusters scored per query (default: 1/16 of clusters)
+            refresh_interval: Seconds between checks for changed embeddings
+        """
+        self.engine = engine
+        self.embedder = embedder or HashingEmbedder()
+        self.cache_dir = cache_dir or self._default_cache_dir(engine)
+        self.ivf_threshold = ivf_threshold
+        self.n_probe = n_probe
+        self.refresh_interval = refresh_interval
+        self._state: Optional[_IndexState] = None
+        self._checked_at = 0.0
+        self._load_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        state = self._state
+        return len(state) if state is not None else 0
+
+    def invalidate(self) -> None:
+        """Force a signature check before the next search."""
+        self._checked_at = 0.0
+
+    def search(
+        self,
+        query: str,
+        limit: int = 20,
+        job_types: Optional[Sequence] = None,
+        remote_types: Optional[Sequence] = None,
+        experience_levels: Optional[Sequence] = None,
+        min_salary: Optional[float] = None,
+        max_salary: Optional[float] = None,
+        job_ids: Optional[Iterable[str]] = None,
+    ) -> List[Tuple[str, float]]:
+        """Return up to ``limit`` (job_id, cosine similarity) pairs, best first."""
+        return self.search_batch(
+            [query],
+            limit=limit,
+            job_types=job_types,
+            remote_types=remote_types,
+            experience_levels=experience_levels,
+            min_salary=min_salary,
+            max_salary=max_salary,
+            job_ids=job_ids,
+        )[0]
+
+    def search_batch(
+        self,
+        queries: Sequence[str],
+        limit: int = 20,
+        job_types: Optional[Sequence] = None,
+        remote_types: Optional[Sequence] = None,
+        experience_levels: Optional[Sequence] = None,
+        min_salary: Optional[float] = None,
+        max_salary: Optional[float] = None,
+        job_ids: Optional[Iterable[str]] = None,
+    ) -> List[List[Tuple[str, float]]]:
+        """Search several queries at once, sharing one pass over the matrix."""
+        if not NUMPY_AVAILABLE:
+            raise ImportError(
+                "NumPy is required for semantic search: pip install numpy"
+            )
+
+        state = self._current_state()
+        if not queries:
+            return []
+        if state is None or len(state) == 0:
+            return [[] for _ in queries]
+
+        vectors = np.asarray(
+            [self.embedder.embed(query) for query in queries], dtype=np.float32
+        )
+        mask = self._filter_mask(
+            state,
+            job_types,
+            remote_types,
+            experience_levels,
+            min_salary,
+            max_salary,
+            job_ids,
+        )
+        results = self.search_vectors(vectors, limit, mask=mask, state=state)
+        # Queries without any known words embed to the zero vector
+        return [
+            result if vector.any() else []
+            for result, vector in zip(results, vectors, strict=True)
+        ]
+
+    def search_vectors(self, vectors, limit: int, mask=None, state=None):
+        """Top-k search for pre-computed unit query vectors of shape (b, d)."""
+        state = state or self._current_state()
+        if state is None or len(state) == 0:
+            return [[] for _ in vectors]
+
+        if state.ivf is not None:
+            return [
+                self._pairs(state, *self._search_ivf(state, vector, limit, mask))
+                for vector in vectors
+            ]
+
+        rows = None if mask is None else np.flatnonzero(mask)
+        if rows is not None and len(rows) > len(state) // 8:
+            # Dense masks: score contiguous blocks and drop masked rows instead
+            # of gathering most of the matrix
+            rows = None
+        else:
+            mask = None
+
+        best = [
+            (np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32))
+            for _ in vectors
+        ]
+        total = len(state) if rows is None else len(rows)
+        for start in range(0, total, BLOCK_ROWS):
+            if rows is None:
+                block_rows = np.arange(start, min(start + BLOCK_ROWS, total))
+                block = state.matrix[start : start + BLOCK_ROWS]
+            else:
+                block_rows = rows[start : start + BLOCK_ROWS]
+                block = state.matrix[block_rows]
+            scores = block @ vectors.T
+            if mask is not None:
+                scores[~mask[block_rows]] = -np.inf
+
+            for column, (best_rows, best_scores) in enumerate(best):
+                column_scores = scores[:, column]
+                top = _top_k(column_scores, limit)
+                merged_rows = np.concatenate([best_rows, block_rows[top]])
+                merged_scores = np.concatenate([best_scores, column_scores[top]])
+                keep = _top_k(merged_scores, limit)
+                best[column] = (merged_rows[keep], merged_scores[keep])
+
+        return [self._pairs(state, rows_, scores_) for rows_, scores_ in best]
+
+    def load(self) -> None:
+        """(Re)load the index from the database and the sidecar cache."""
+        if not NUMPY_AVAILABLE:
+            raise ImportError(
+                "NumPy is required for semantic search: pip install numpy"
+            )
+
+        with self._load_lock:
+            with Session(bind=self.engine) as session:
+                signature = self._signature(session)
+                state = self._state
+                if state is None or state.signature != signature:
+                    self._state = self._build_state(session, signature)
+            self._checked_at = time.monotonic()
+
+    def _current_state(self) -> Optional[_IndexState]:
+        if time.monotonic() - self._checked_at >= self.refresh_interval:
+            self.load()
+        return self._state
+
+    def _signature(self, session) -> Tuple:
+        """Cheap fingerprint of the embeddings and the job fields we filter on."""
+        from backend.data.models import JobEmbeddingDB, JobListingDB
+
+        row = (
+            self._embedding_query(session)
+            .with_entities(
+                func.count(JobEmbeddingDB.id),
+                func.max(JobEmbeddingDB.created_at),
+                func.max(JobListingDB.updated_at),
+            )
+            .one()
+        )
+        return tuple(row)
+
+    def _embedding_query(self, session):
+        from backend.data.models import JobEmbeddingDB, JobListingDB, JobStatus
+
+        return (
+            session.query(JobEmbeddingDB)
+            .join(JobListingDB, JobEmbeddingDB.job_id == JobListingDB.id)
+            .filter(
+                JobEmbeddingDB.embedding_model == self.embedder.model_name,
+                JobEmbeddingDB.embedding_dimension == self.embedder.dimension,
+                JobListingDB.status == JobStatus.ACTIVE,
+            )
+        )
+
+    def _build_state(self, session, signature) -> _IndexState:
+        from backend.data.models import (
+            ExperienceLevel,
+            JobEmbeddingDB,
+            JobListingDB,
+            JobType,
+            RemoteType,
+        )
+
+        started = time.perf_counter()
+        rows = (
+            self._embedding_query(session)
+            .with_entities(
+                JobEmbeddingDB.job_id,
+                JobEmbeddingDB.content_hash,
+                JobListingDB.job_type,
+                JobListingDB.remote_type,
+                JobListingDB.experience_level,
+                JobListingDB.salary_min,
+                JobListingDB.salary_max,
+            )
+            .order_by(JobEmbeddingDB.job_id, JobEmbeddingDB.created_at)
+            .all()
+        )
+        # Keep the newest embedding per job
+        latest = {row.job_id: row for row in rows}
+        rows = list(latest.values())
+
+        job_ids = [row.job_id for row in rows]
+        content_key = self._content_key((row.job_id, row.content_hash) for row in rows)
+        matrix, from_cache = self._load_matrix(session, job_ids, content_key)
+
+        def codes(enum_cls, column):
+            lookup = {member: code for code, member in enumerate(enum_cls)}
+            return np.array(
+                [lookup.get(getattr(row, column), -1) for row in rows], dtype=np.int8
+            )
+
+        def floats(column):
+            return np.array(
+                [
+                    np.nan if getattr(row, column) is None else getattr(row, column)
+                    for row in rows
+                ],
+                dtype=np.float64,
+            )
+
+        attributes = {
+            "job_type": codes(JobType, "job_type"),
+            "remote_type": codes(RemoteType, "remote_type"),
+            "experience_level": codes(ExperienceLevel, "experience_level"),
+            "salary_min": floats("salary_min"),
+            "salary_max": floats("salary_max"),
+        }
+
+        ivf = None
+        if len(job_ids) >= self.ivf_threshold:
+            ivf, matrix = self._load_ivf(matrix, content_key)
+            job_ids = [job_ids[row] for row in ivf.order]
+            attributes = {
+                name: values[ivf.order] for name, values in attributes.items()
+            }
+
+        logger.info(
+            f"Loaded {len(job_ids)} job embeddings into vector index "
+            f"({'sidecar cache' if from_cache else 'database'}, "
+            f"{'ivf' if ivf is not None else 'exact'}) "
+            f"in {time.perf_counter() - started:.2f}s"
+        )
+        return _IndexState(job_ids, matrix, attributes, signature, ivf)
+
+    def _content_key(self, pairs: Iterable[Tuple[str, str]]) -> str:
+        digest = hashlib.sha1(
+            f"{self.embedder.model_name}:{self.embedder.dimension}".encode()
+        )
+        for job_id, content_hash in pairs:
+            digest.update(f"\n{job_id}:{content_hash}".encode())
+        return digest.hexdigest()[:20]
+
+    def _sidecar_path(self, content_key: str, suffix: str) -> Optional[str]:
+        if not self.cache_dir:
+            return None
+        return os.path.join(self.cache_dir, f"embeddings-{content_key}{suffix}")
+
+    def _load_matrix(self, session, job_ids: List[str], content_key: str):
+        """Return (matrix, from_cache) for the given rows, in order."""
+        path = self._sidecar_path(content_key, ".npy")
+        if path and os.path.exists(path):
+            try:
+                matrix = np.load(path, mmap_mode="r")
+                if matrix.shape == (len(job_ids), self.embedder.dimension):
+                    return matrix, True
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable vector index cache {path}: {e}")
+
+        matrix = self._read_vectors(session, job_ids)
+        if path is None:
+            return matrix, False
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, "wb") as handle:
+                np.save(handle, matrix)
+            os.replace(temp_path, path)
+            self._remove_stale_sidecars(content_key)
+            return np.load(path, mmap_mode="r"), False
+        except OSError as e:
+            logger.warning(f"Could not write vector index cache {path}: {e}")
+            return matrix, False
+
+    def _read_vectors(self, session, job_ids: List[str]):
+        """Decode stored vectors into a normalised float32 matrix."""
+        from backend.data.models import JobEmbeddingDB
+
+        row_of = {job_id: row for row, job_id in enumerate(job_ids)}
+        matrix = np.zeros((len(job_ids), self.embedder.dimension), dtype=np.float32)
+        query = (
+            self._embedding_query(session)
+            .with_entities(
+                JobEmbeddingDB.job_id,
+                JobEmbeddingDB.embedding_data,
+                JobEmbeddingDB.embedding_dtype,
+            )
+            .order_by(JobEmbeddingDB.created_at)
+        )
+        for job_id, data, dtype in query.yield_per(1000):
+            row = row_of.get(job_id)
+            if row is not None and data:
+                # int8 scales are per vector, so normalising makes them moot
+                matrix[row] = decode_embedding(data, dtype)
+
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        np.divide(matrix, norms, out=matrix, where=norms > 0)
+        return matrix
+
+    def _load_ivf(self, matrix, content_key: str):
+        """Return the IVF index and the matrix stored in cluster order."""
+        index_path = self._sidecar_path(content_key, ".ivf.npz")
+        matrix_path = self._sidecar_path(content_key, ".ivf.npy")
+        if index_path and os.path.exists(index_path) and os.path.exists(matrix_path):
+            try:
+                clustered = np.load(matrix_path, mmap_mode="r")
+                if clustered.shape == matrix.shape:
+                    return IVFIndex.load(index_path), clustered
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Ignoring unreadable IVF cache {index_path}: {e}")
+
+        ivf = IVFIndex.build(matrix)
+        if index_path is None:
+            return ivf, ivf.reorder(matrix)
+
+        try:
+            temp_path = f"{matrix_path}.{os.getpid()}.tmp.npy"
+            clustered = ivf.reorder(matrix, temp_path)
+            os.replace(temp_path, matrix_path)
+            ivf.save(index_path)
+            return ivf, clustered
+        except OSError as e:
+            logger.warning(f"Could not write IVF cache {index_path}: {e}")
+            return ivf, ivf.reorder(matrix)
+
+    def _remove_stale_sidecars(self, content_key: str) -> None:
+        for name in os.listdir(self.cache_dir):
+            if name.startswith("embeddings-") and content_key not in name:
+                try:
+                    os.remove(os.path.join(self.cache_dir, name))
+                except OSError:
+                    # Still mapped by another process (e.g. on Windows)
+                    pass
+
+    def _search_ivf(self, state, vector, limit: int, mask):
+        n_probe = self.n_probe or max(state.ivf.n_lists // 16, 1)
+        ranges = state.ivf.probe(vector, n_probe)
+        if not ranges:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+        rows = np.concatenate([np.arange(start, stop) for start, stop in ranges])
+        scores = np.concatenate(
+            [state.matrix[start:stop] @ vector for start, stop in ranges]
+        )
+        if mask is not None:
+            scores[~mask[rows]] = -np.inf
+        top = _top_k(scores, limit)
+        return rows[top], scores[top]
+
+    @staticmethod
+    def _pairs(state, rows, scores) -> List[Tuple[str, float]]:
+        return [
+            (state.job_ids[row], float(score))
+            for row, score in zip(rows, scores, strict=True)
+            if np.isfinite(score)
+        ]
+
+    @staticmethod
+    def _filter_mask(
+        state,
+        job_types,
+        remote_types,
+        experience_levels,
+        min_salary,
+        max_salary,
+        job_ids,
+    ):
+        """Boolean row mask for the structured filters, or None if unfiltered."""
+        from backend.data.models import (
+            ExperienceLevel,
+            JobType,
+            RemoteType,
+            coerce_enum_values,
+        )
+
+        masks = []
+        for enum_cls, column, values in (
+            (JobType, "job_type", job_types),
+            (RemoteType, "remote_type", remote_types),
+            (ExperienceLevel, "experience_level", experience_levels),
+        ):
+            if values:
+                members = list(enum_cls)
+                codes = [
+                    members.index(member)
+                    for member in coerce_enum_values(enum_cls, values)
+                ]
+                masks.append(np.isin(state.attributes[column], codes))
+
+        salary_min = state.attributes["salary_min"]
+        salary_max = state.attributes["salary_max"]
+        if min_salary is not None:
+            masks.append((salary_min >= min_salary) | (salary_max >= min_salary))
+        if max_salary is not None:
+            masks.append((salary_max <= max_salary) | (salary_min <= max_salary))
+
+        if job_ids is not None:
+            allowed = np.zeros(len(state), dtype=bool)
+            allowed[
+                [state.row_of[job_id] for job_id in job_ids if job_id in state.row_of]
+            ] = True
+            masks.append(allowed)
+
+        if not masks:
+            return None
+        mask = masks[0]
+        for other in masks[1:]:
+            mask = mask & other
+        return mask
+
+    @staticmethod
+    def _default_cache_dir(engine) -> Optional[str]:
+        url = engine.url
+        if url.get_backend_name() != "sqlite" or url.database in (None, "", ":memory:"):
+            return None
+        return os.path.join(
+            os.path.dirname(os.path.abspath(url.database)), "vector_index"
+        )
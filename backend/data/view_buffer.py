@@ -0,0 +1,305 @@
+"""
+JobPilot View Counter Buffer
+Buffered job view tracking for JobUserInteractionRepository.
+
+Job views are the highest-volume write. Recording each one used to take a
+select, an insert or update, a flush and a refresh in a transaction of its
+own. Instead, views are counted in memory per ``(user_id, job_id)`` and a
+background thread periodically writes all pending counts as one upsert
+(``INSERT ... ON CONFLICT DO UPDATE SET interaction_count =
+interaction_count + n``) on the ``unique_user_job_interaction`` key.
+
+Durability is configurable:
+
+- ``buffered``: ``record`` returns at once. Views not yet flushed are lost
+  if the process dies; a failed flush keeps its counts for the next one.
+- ``sync``: ``record`` wakes the flusher and waits until its view is
+  committed. Concurrent views still share one upsert.
+
+A single bad pair (say, a job deleted since it was viewed) fails the whole
+upsert with an integrity or data error. Such a flush writes its pairs one
+at a time instead, and drops the views of pairs that fail again, so they do
+not stay in the buffer forever.
+"""
+
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+from uuid import uuid4
+
+from sqlalchemy import func
+from sqlalchemy.exc import DataError, IntegrityError
+
+from backend.data.engine import upsert_insert
+from backend.data.models import InteractionType, JobUserInteractionDB
+from backend.logger import logger
+
+DURABILITY_BUFFERED = "buffered"
+DURABILITY_SYNC = "sync"
+DURABILITY_MODES = (DURABILITY_BUFFERED, DURABILITY_SYNC)
+
+DEFAULT_FLUSH_INTERVAL_SECONDS = 1.0
+DEFAULT_MAX_PENDING = 10000
+
+ViewKey = Tuple[str, str]
+
+# Errors caused by the rows written, which retrying will not fix
+ROW_ERRORS = (IntegrityError, DataError)
+
+
+def supports_view_upsert(engine) -> bool:
+    return upsert_insert(engine) is not None
+
+
+class ViewCounterBuffer:
+    """In-memory view counts, flushed as one upsert by a background thread."""
+
+    def __init__(
+        self,
+        db_manager,
+        durability: str = DURABILITY_BUFFERED,
+        flush_interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        max_pending: int = DEFAULT_MAX_PENDING,
+    ):
+        if durability not in DURABILITY_MODES:
+            raise ValueError(f"Unknown view buffer durability: {durability}")
+        if not supports_view_upsert(db_manager.engine):
+            raise ValueError(
+                f"View upserts are not supported on {db_manager.engine.dialect.name}"
+            )
+        self.db_manager = db_manager
+        self.durability = durability
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_pending = max_pending
+
+        # (user_id, job_id) -> [count, first_seen, last_seen]
+        self._pending: Dict[ViewKey, list] = {}
+        self._pending_views = 0
+        self._generation = 0
+        self._flushed_generation = -1
+        # generation -> errors of the pairs that were not written
+        self._errors: Dict[int, Dict[ViewKey, Exception]] = {}
+        self._condition = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+        self._closed = False
+
+        self.flushes = 0
+        self.failed_flushes = 0
+        self.flushed_views = 0
+        self.dropped_views = 0
+        self.last_flush_seconds = 0.0
+
+    @classmethod
+    def from_settings(cls, db_manager, settings=None) -> Optional["ViewCounterBuffer"]:
+        """Buffer configured by the VIEW_BUFFER_* settings, or None if off."""
+        if settings is None:
+            # Import here to avoid circular imports
+            from backend.api.config import settings
+        if settings.VIEW_BUFFER_DURABILITY == "off":
+            return None
+        if not supports_view_upsert(db_manager.engine):
+            return None
+        return cls(
+            db_manager,
+            durability=settings.VIEW_BUFFER_DURABILITY,
+            flush_interval_seconds=settings.VIEW_BUFFER_FLUSH_INTERVAL_MS / 1000,
+            max_pending=settings.VIEW_BUFFER_MAX_PENDING,
+        )
+
+    def record(self, user_id: str, job_id: str) -> None:
+        """Count one view of a job by a user."""
+        now = datetime.utcnow()
+        with self._condition:
+            entry = self._pending.get((user_id, job_id))
+            if entry is None:
+                self._pending[(user_id, job_id)] = [1, now, now]
+            else:
+                entry[0] += 1
+                entry[2] = now
+            self._pending_views += 1
+            generation = self._generation
+            full = len(self._pending) >= self.max_pending
+            closed = self._closed
+        if closed:
+            # No flusher any more; write through
+            self.flush()
+            return
+        self._ensure_started()
+
+        if self.durability == DURABILITY_SYNC or full:
+            self._wake.set()
+        if self.durability == DURABILITY_SYNC:
+            self._wait_for(generation, (user_id, job_id))
+
+    def flush(self) -> int:
+        """Write all pending counts now; returns the number of views written."""
+        with self._flush_lock:
+            return self._flush()
+
+    def _flush(self) -> int:
+        with self._condition:
+            pending, self._pending = self._pending, {}
+            views, self._pending_views = self._pending_views, 0
+            generation = self._generation
+            self._generation += 1
+        if not pending:
+            self._finish(generation, {})
+            return 0
+
+        started = time.perf_counter()
+        errors: Dict[ViewKey, Exception] = {}
+        try:
+            self.db_manager.write(self._upsert, pending)
+        except ROW_ERRORS as e:
+            logger.warning(f"Flushing {views} job views failed, writing each: {e}")
+            views, errors = self._flush_each(pending)
+        except Exception as e:
+            logger.error(f"Error flushing {views} job views: {e}")
+            self.failed_flushes += 1
+            if self.durability == DURABILITY_BUFFERED:
+                self._restore(pending, views)
+            self._finish(generation, dict.fromkeys(pending, e))
+            raise
+
+        self.flushes += 1
+        self.flushed_views += views
+        self.last_flush_seconds = time.perf_counter() - started
+        self._finish(generation, errors)
+        return views
+
+    def close(self) -> None:
+        """Stop the flusher after writing what is pending."""
+        with self._condition:
+            self._closed = True
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._wake.set()
+            thread.join()
+        else:
+            self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._condition:
+            pending_keys, pending_views = len(self._pending), self._pending_views
+        return {
+            "durability": self.durability,
+            "pending_keys": pending_keys,
+            "pending_views": pending_views,
+            "max_pending": self.max_pending,
+            "flushes": self.flushes,
+            "failed_flushes": self.failed_flushes,
+            "flushed_views": self.flushed_views,
+            "dropped_views": self.dropped_views,
+            "last_flush_ms": round(self.last_flush_seconds * 1000, 2),
+        }
+
+    @staticmethod
+    def _upsert(session, pending: Dict[ViewKey, list]) -> None:
+        table = JobUserInteractionDB.__table__
+        insert = upsert_insert(session.get_bind())
+        rows = [
+            {
+                "id": str(uuid4()),
+                "user_id": user_id,
+                "job_id": job_id,
+                "interaction_type": InteractionType.VIEWED,
+                "first_interaction": first_seen,
+                "last_interaction": last_seen,
+                "interaction_count": count,
+                "interaction_data": {},
+            }
+            for (user_id, job_id), (count, first_seen, last_seen) in pending.items()
+        ]
+        statement = insert(table)
+        statement = statement.on_conflict_do_update(
+            index_elements=[table.c.user_id, table.c.job_id, table.c.interaction_type],
+            set_={
+                "interaction_count": func.coalesce(table.c.interaction_count, 0)
+                + statement.excluded.interaction_count,
+                "last_interaction": statement.excluded.last_interaction,
+            },
+        )
+        session.execute(statement, rows)
+
+    def _flush_each(
+        self, pending: Dict[ViewKey, list]
+    ) -> Tuple[int, Dict[ViewKey, Exception]]:
+        """Write pairs one upsert each; returns views written and errors."""
+        written, errors, failed = 0, {}, {}
+        for key, entry in pending.items():
+            try:
+                self.db_manager.write(self._upsert, {key: entry})
+            except ROW_ERRORS as e:
+                user_id, job_id = key
+                logger.error(
+                    f"Dropping {entry[0]} views of job {job_id} by user {user_id}: {e}"
+                )
+                self.dropped_views += entry[0]
+                errors[key] = e
+            except Exception as e:
+                logger.error(f"Error flushing views of job {key[1]}: {e}")
+                errors[key] = e
+                failed[key] = entry
+            else:
+                written += entry[0]
+        if failed and self.durability == DURABILITY_BUFFERED:
+            self._restore(failed, sum(entry[0] for entry in failed.values()))
+        return written, errors
+
+    def _restore(self, pending: Dict[ViewKey, list], views: int) -> None:
+        """Put the counts of a failed flush back for the next one."""
+        with self._condition:
+            for key, (count, first_seen, last_seen) in pending.items():
+                entry = self._pending.get(key)
+                if entry is None:
+                    self._pending[key] = [count, first_seen, last_seen]
+                else:
+                    entry[0] += count
+                    entry[1] = min(entry[1], first_seen)
+                    entry[2] = max(entry[2], last_seen)
+            self._pending_views += views
+
+    def _finish(self, generation: int, errors: Dict[ViewKey, Exception]) -> None:
+        with self._condition:
+            if errors and self.durability == DURABILITY_SYNC:
+                self._errors[generation] = errors
+                # Waiters of older generations have long been woken
+                for old in [g for g in self._errors if g < generation - 16]:
+                    del self._errors[old]
+            self._flushed_generation = generation
+            self._condition.notify_all()
+
+    def _wait_for(self, generation: int, key: ViewKey) -> None:
+        with self._condition:
+            while self._flushed_generation < generation:
+                self._condition.wait()
+            error = self._errors.get(generation, {}).get(key)
+        if error is not None:
+            raise error
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._condition:
+            if self._thread is None and not self._closed:
+                self._thread = threading.Thread(
+                    target=self._run, name="view-buffer", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self.flush_interval_seconds)
+            self._wake.clear()
+            with self._condition:
+                closed = self._closed
+            try:
+                self.flush()
+            except Exception:
+                # Logged by flush; buffered counts are retried next time
+                pass
+            if closed:
+                return
@@ -0,0 +1,213 @@
+"""
+JobPilot Write Queue
+Group commit for SQLite: one writer thread, many writes per transaction.
+
+SQLite allows a single writer at a time. Concurrent short transactions
+(job views, saves, timeline events) otherwise queue on the database lock and
+each pays for its own commit. Instead, callers submit write intents, i.e.
+callables taking a session, and get a future back. A dedicated writer
+thread collects whatever is queued (lingering up to ``max_delay_seconds``
+for more), runs the batch in one session and commits once.
+
+Futures resolve only after the commit. If an intent raises, the batch is
+rolled back, that intent's future gets the error and the rest of the batch
+is run again without it. If the commit itself fails, each intent is retried
+in a transaction of its own so errors reach the right caller.
+"""
+
+import asyncio
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List
+
+from backend.logger import logger
+
+DEFAULT_MAX_BATCH = 256
+DEFAULT_MAX_DELAY_SECONDS = 0.002
+
+# Put on the queue to stop the writer thread
+_STOP = object()
+
+
+class WriteIntent:
+    """A queued write: fn(session, *args, **kwargs) and its future."""
+
+    __slots__ = ("fn", "args", "kwargs", "future")
+
+    def __init__(self, fn: Callable, args: tuple, kwargs: Dict[str, Any]):
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.future: Future = Future()
+
+    def run(self, session):
+        return self.fn(session, *self.args, **self.kwargs)
+
+
+class WriteQueue:
+    """Single writer thread that commits queued write intents in batches."""
+
+    def __init__(
+        self,
+        session_factory: Callable,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        max_delay_seconds: float = DEFAULT_MAX_DELAY_SECONDS,
+    ):
+        self.session_factory = session_factory
+        self.max_batch = max(max_batch, 1)
+        self.max_delay_seconds = max_delay_seconds
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+        self.batches = 0
+        self.writes = 0
+        self.failed = 0
+        self.fallbacks = 0
+
+    @property
+    def in_writer_thread(self) -> bool:
+        return threading.current_thread() is self._thread
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """Queue fn(session, *args, **kwargs); the future holds its result."""
+        intent = WriteIntent(fn, args, kwargs)
+        self._ensure_started()
+        self._queue.put(intent)
+        return intent.future
+
+    def write(self, fn: Callable, *args, **kwargs):
+        """Queue a write and block until it is committed."""
+        if self.in_writer_thread:
+            # The writer would wait on itself
+            raise RuntimeError("Cannot queue a write from inside a write intent")
+        return self.submit(fn, *args, **kwargs).result()
+
+    async def write_async(self, fn: Callable, *args, **kwargs):
+        """Queue a write and await its commit without blocking the loop."""
+        return await asyncio.wrap_future(self.submit(fn, *args, **kwargs))
+
+    def close(self) -> None:
+        """Commit what is queued, then stop the writer thread."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(_STOP)
+            thread.join()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "batches": self.batches,
+            "writes": self.writes,
+            "failed": self.failed,
+            "fallbacks": self.fallbacks,
+            "queued": self._queue.qsize(),
+            "mean_batch": round(self.writes / self.batches, 1) if self.batches else 0,
+        }
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="db-writer", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            batch, stopping = self._collect()
+            if not batch:
+                continue
+            try:
+                self._commit_batch(batch)
+            except Exception as e:
+                # Keep the writer alive; fail whatever was left unresolved
+                logger.error(f"Write queue error: {e}")
+                for intent in batch:
+                    if not intent.future.done():
+                        intent.future.set_exception(e)
+
+    def _collect(self):
+        """Block for one intent, then take more until the batch is full."""
+        item = self._queue.get()
+        if item is _STOP:
+            return [], True
+        batch = [item]
+        deadline = time.monotonic() + self.max_delay_seconds
+        while len(batch) < self.max_batch:
+            try:
+                timeout = deadline - time.monotonic()
+                item = (
+                    self._queue.get(timeout=timeout)
+                    if timeout > 0
+                    else self._queue.get_nowait()
+                )
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _commit_batch(self, batch: List[WriteIntent]) -> None:
+        pending = [
+            intent for intent in batch if intent.future.set_running_or_notify_cancel()
+        ]
+        while pending:
+            session = self.session_factory()
+            try:
+                results, error = self._run_intents(session, pending)
+                if error is not None:
+                    # Drop the failing intent and run the others again
+                    session.rollback()
+                    self.failed += 1
+                    pending.pop(len(results)).future.set_exception(error)
+                    continue
+                session.commit()
+            except Exception as e:
+                session.rollback()
+                logger.error(f"Group commit of {len(pending)} writes failed: {e}")
+                self.fallbacks += 1
+                for intent in pending:
+                    self._commit_alone(intent)
+                return
+            finally:
+                session.close()
+
+            self.batches += 1
+            self.writes += len(pending)
+            for intent, result in zip(pending, results, strict=True):
+                intent.future.set_result(result)
+            return
+
+    @staticmethod
+    def _run_intents(session, intents: List[WriteIntent]):
+        """Run intents in order; stop at the first error."""
+        results = []
+        for intent in intents:
+            try:
+                results.append(intent.run(session))
+            except Exception as e:
+                return results, e
+        return results, None
+
+    def _commit_alone(self, intent: WriteIntent) -> None:
+        session = self.session_factory()
+        try:
+            result = intent.run(session)
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            self.failed += 1
+            intent.future.set_exception(e)
+            return
+        finally:
+            session.close()
+        self.batches += 1
+        self.writes += 1
+        intent.future.set_result(result)
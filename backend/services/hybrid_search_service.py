@@ -0,0 +1,242 @@
+"""
+Hybrid Search Service
+
+Combines BM25 keyword ranking and semantic vector ranking for /search/hybrid:
+- Both retrieval stages run concurrently and return (job_id, score) pairs only
+- Scores are fused per job with min-max normalization or reciprocal rank fusion
+- Only the final page of jobs is loaded from the database, in one query
+"""
+
+import asyncio
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from backend.data.models import (
+    ExperienceLevel,
+    JobListing,
+    JobType,
+    RemoteType,
+    coerce_enum_values,
+)
+from backend.logger import logger
+
+MINMAX = "minmax"
+RRF = "rrf"
+FUSION_MODES = (MINMAX, RRF)
+
+# Rank offset from the original RRF paper; damps the weight of the top ranks
+RRF_K = 60
+
+# Candidates retrieved from each stage before fusion
+DEFAULT_CANDIDATE_POOL = 200
+
+
+def min_max_normalize(hits: Sequence[Tuple[str, float]]) -> Dict[str, float]:
+    """Scale scores to [0, 1]; a stage whose scores are all equal maps to 1."""
+    if not hits:
+        return {}
+    scores = [score for _, score in hits]
+    low, high = min(scores), max(scores)
+    if high == low:
+        return {job_id: 1.0 for job_id, _ in hits}
+    return {job_id: (score - low) / (high - low) for job_id, score in hits}
+
+
+def reciprocal_rank_scores(
+    hits: Sequence[Tuple[str, float]], k: int = RRF_K
+) -> Dict[str, float]:
+    """
+    Reciprocal rank of each hit, scaled so the best hit scores 1.
+
+    ``(k + 1) / (k + rank)`` orders results exactly like plain RRF while
+    keeping per-stage scores comparable with min-max normalized ones.
+    """
+    return {job_id: (k + 1) / (k + rank) for rank, (job_id, _) in enumerate(hits, 1)}
+
+
+def fuse_scores(
+    keyword_hits: Sequence[Tuple[str, float]],
+    semantic_hits: Sequence[Tuple[str, float]],
+    keyword_weight: float = 0.5,
+    semantic_weight: float = 0.5,
+    fusion: str = MINMAX,
+) -> List[Tuple[str, float, float, float]]:
+    """
+    Merge two rankings by job ID.
+
+    Returns (job_id, combined, keyword, semantic) tuples, best first. A job
+    missing from one ranking scores 0 for that stage. Weights are normalized
+    to sum to 1.
+    """
+    if fusion not in FUSION_MODES:
+        raise ValueError(
+            f"Unknown fusion mode {fusion!r}; expected one of {FUSION_MODES}"
+        )
+
+    normalize = min_max_normalize if fusion == MINMAX else reciprocal_rank_scores
+    keyword_scores = normalize(keyword_hits)
+    semantic_scores = normalize(semantic_hits)
+
+    total_weight = keyword_weight + semantic_weight
+    if total_weight <= 0:
+        keyword_weight, semantic_weight, total_weight = 1.0, 1.0, 2.0
+    keyword_weight /= total_weight
+    semantic_weight /= total_weight
+
+    fused = []
+    for job_id in {**keyword_scores, **semantic_scores}:
+        keyword = keyword_scores.get(job_id, 0.0)
+        semantic = semantic_scores.get(job_id, 0.0)
+        combined = keyword_weight * keyword + semantic_weight * semantic
+        fused.append((job_id, combined, keyword, semantic))
+
+    fused.sort(key=lambda item: item[1], reverse=True)
+    return fused
+
+
+class HybridSearchHit:
+    """A hydrated job with its per-stage and combined scores."""
+
+    def __init__(
+        self,
+        job: JobListing,
+        keyword_score: float,
+        semantic_score: float,
+        combined_score: float,
+    ):
+        self.job = job
+        self.keyword_score = keyword_score
+        self.semantic_score = semantic_score
+        self.combined_score = combined_score
+
+
+class HybridSearchOutcome:
+    """Final page of hits, size of the fused candidate set and stage timings."""
+
+    def __init__(
+        self, hits: List[HybridSearchHit], total: int, timings: Dict[str, float]
+    ):
+        self.hits = hits
+        self.total = total
+        self.timings = timings
+
+
+class HybridSearchService:
+    """Service for keyword + semantic job search with score fusion."""
+
+    def __init__(
+        self,
+        job_repository,
+        vector_index,
+        candidate_pool: int = DEFAULT_CANDIDATE_POOL,
+    ):
+        self.job_repository = job_repository
+        self.vector_index = vector_index
+        self.candidate_pool = candidate_pool
+
+    async def search(
+        self,
+        query: str,
+        limit: int = 20,
+        job_types: Optional[List[str]] = None,
+        remote_types: Optional[List[str]] = None,
+        experience_levels: Optional[List[str]] = None,
+        min_salary: Optional[float] = None,
+        max_salary: Optional[float] = None,
+        location: Optional[str] = None,
+        company: Optional[str] = None,
+        keyword_weight: float = 0.5,
+        semantic_weight: float = 0.5,
+        fusion: str = MINMAX,
+    ) -> HybridSearchOutcome:
+        """Run both retrieval stages concurrently, fuse, then load the top jobs."""
+        started = time.perf_counter()
+        timings = {}
+
+        filters = {
+            "job_types": coerce_enum_values(JobType, job_types),
+            "remote_types": coerce_enum_values(RemoteType, remote_types),
+            "experience_levels": coerce_enum_values(ExperienceLevel, experience_levels),
+            "min_salary": min_salary,
+            "max_salary": max_salary,
+        }
+        # Filter values that match no enum member can only match no jobs
+        if any(
+            values and not filters[name]
+            for name, values in (
+                ("job_types", job_types),
+                ("remote_types", remote_types),
+                ("experience_levels", experience_levels),
+            )
+        ):
+            return HybridSearchOutcome([], 0, {"total_ms": 0.0})
+
+        pool = max(self.candidate_pool, limit)
+
+        def keyword_stage():
+            if keyword_weight <= 0 and semantic_weight > 0:
+                return []
+            stage_start = time.perf_counter()
+            hits = self.job_repository.rank_jobs_by_text(
+                query, limit=pool, location=location, company=company, **filters
+            )
+            timings["keyword_ms"] = _elapsed_ms(stage_start)
+            return hits
+
+        def semantic_stage():
+            if semantic_weight <= 0 and keyword_weight > 0:
+                return []
+            stage_start = time.perf_counter()
+            try:
+                allowed_job_ids = None
+                if location or company:
+                    allowed_job_ids = self.job_repository.find_job_ids(
+                        location=location, company=company
+                    )
+                hits = self.vector_index.search(
+                    query, limit=pool, job_ids=allowed_job_ids, **filters
+                )
+            except ImportError as e:
+                # NumPy is optional; degrade to keyword-only ranking
+                logger.warning(f"Semantic stage unavailable for hybrid search: {e}")
+                hits = []
+            timings["semantic_ms"] = _elapsed_ms(stage_start)
+            return hits
+
+        retrieval_start = time.perf_counter()
+        keyword_hits, semantic_hits = await asyncio.gather(
+            asyncio.to_thread(keyword_stage), asyncio.to_thread(semantic_stage)
+        )
+        timings["retrieval_ms"] = _elapsed_ms(retrieval_start)
+
+        fusion_start = time.perf_counter()
+        fused = fuse_scores(
+            keyword_hits, semantic_hits, keyword_weight, semantic_weight, fusion
+        )
+        timings["fusion_ms"] = _elapsed_ms(fusion_start)
+
+        hydration_start = time.perf_counter()
+        page = fused[:limit]
+        jobs = await asyncio.to_thread(
+            self.job_repository.get_jobs, [job_id for job_id, *_ in page]
+        )
+        timings["hydration_ms"] = _elapsed_ms(hydration_start)
+
+        jobs_by_id = {str(job.id): job for job in jobs}
+        hits = [
+            HybridSearchHit(jobs_by_id[job_id], keyword, semantic, combined)
+            for job_id, combined, keyword, semantic in page
+            if job_id in jobs_by_id
+        ]
+        timings["total_ms"] = _elapsed_ms(started)
+
+        logger.info(
+            f"Hybrid search '{query}': {len(keyword_hits)} keyword + "
+            f"{len(semantic_hits)} semantic candidates, {len(fused)} fused "
+            f"in {timings['total_ms']:.1f} ms"
+        )
+        return HybridSearchOutcome(hits, len(fused), timings)
+
+
+def _elapsed_ms(start: float) -> float:
+    return round((time.perf_counter() - start) * 1000, 3)
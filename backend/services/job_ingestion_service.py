@@ -0,0 +1,725 @@
+"""
+Job Ingestion Service
+
+Streams raw postings from job boards into the database:
+- Each source delivers postings as an async iterator, pulled no faster than
+  the source's ``rate_limit_config`` allows
+- Postings flow through change detection, normalize, company resolve, dedup
+  check and bulk write stages that run concurrently, connected by bounded
+  queues: a slow stage pauses the stages feeding it instead of buffering the
+  whole feed
+- Change detection hashes each raw posting and compares it in bulk with the
+  hash stored on its listing; unchanged postings only get ``last_verified``
+  touched on their job and skip the remaining stages
+- Each written batch records the postings in job_source_listings (keyed by
+  the board's ``source_job_id``) and advances the source's ``last_scraped``
+- ``file_postings`` reads a JSON Lines (or JSON array) file and stands in
+  for real boards in tests and local runs
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+from uuid import uuid4
+
+from sqlalchemy import bindparam, insert, update
+
+from backend.data.bulk_insert import execute_grouped
+from backend.data.database import DatabaseManager, JobRepository
+from backend.data.models import (
+    ExperienceLevel,
+    JobListingDB,
+    JobSourceDB,
+    JobSourceListingDB,
+    JobType,
+    RemoteType,
+    coerce_enum_values,
+)
+from backend.logger import logger
+
+DEFAULT_BATCH_SIZE = 500
+# Batches buffered between consecutive stages
+DEFAULT_QUEUE_SIZE = 2
+# A partial batch is passed on once its oldest posting waited this long
+DEFAULT_FLUSH_INTERVAL = 1.0
+
+_DONE = object()
+
+# Raw posting fields, by the name used after applying the source's field map
+_TEXT_FIELDS = (
+    "title",
+    "location",
+    "description",
+    "requirements",
+    "responsibilities",
+    "education_required",
+    "application_url",
+)
+_LIST_FIELDS = {
+    "skills": "skills_required",
+    "preferred_skills": "skills_preferred",
+    "benefits": "benefits",
+}
+_ENUM_FIELDS = {
+    "job_type": JobType,
+    "remote_type": RemoteType,
+    "experience_level": ExperienceLevel,
+}
+_KNOWN_FIELDS = (
+    set(_TEXT_FIELDS)
+    | set(_LIST_FIELDS)
+    | set(_ENUM_FIELDS)
+    | {
+        "id",
+        "source_job_id",
+        "company",
+        "company_domain",
+        "company_website",
+        "url",
+        "salary_min",
+        "salary_max",
+        "salary_currency",
+        "posted_date",
+        "application_deadline",
+    }
+)
+
+
+class RateLimiter:
+    """Token bucket limiting how fast postings are pulled from a source."""
+
+    def __init__(
+        self,
+        requests_per_second: float,
+        burst: int = 1,
+        postings_per_request: int = 1,
+        clock=time.monotonic,
+        sleep=asyncio.sleep,
+    ):
+        if requests_per_second <= 0:
+            raise ValueError("requests_per_second must be positive")
+        self.rate = requests_per_second
+        self.burst = max(burst, 1)
+        self.cost = 1.0 / max(postings_per_request, 1)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(self.burst)
+        self._updated = clock()
+
+    @classmethod
+    def from_config(
+        cls, config: Optional[Mapping[str, Any]]
+    ) -> Optional["RateLimiter"]:
+        """
+        Build a limiter from a source's ``rate_limit_config``.
+
+        Understands ``requests_per_second`` or ``requests_per_minute``,
+        ``burst`` and ``postings_per_request`` (page size, so one request
+        covers that many postings). Returns None when no rate is configured.
+        """
+        if not config:
+            return None
+        rate = config.get("requests_per_second")
+        if rate is None and config.get("requests_per_minute") is not None:
+            rate = config["requests_per_minute"] / 60.0
+        if not rate:
+            return None
+        return cls(
+            float(rate),
+            burst=int(config.get("burst", 1)),
+            postings_per_request=int(config.get("postings_per_request", 1)),
+        )
+
+    async def acquire(self) -> None:
+        """Wait until the next posting may be pulled."""
+        while True:
+            now = self._clock()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            if self._tokens >= self.cost - 1e-9:
+                self._tokens -= self.cost
+                return
+            await self._sleep((self.cost - self._tokens) / self.rate)
+
+
+class NormalizedPosting:
+    """A raw posting mapped onto job columns plus its source identity."""
+
+    __slots__ = (
+        "source_job_id",
+        "source_url",
+        "company_name",
+        "company_domain",
+        "job",
+        "metadata",
+        "content_hash",
+        "company_id",
+        "job_id",
+        "listing_id",
+        "is_new",
+    )
+
+    def __init__(
+        self,
+        source_job_id: str,
+        source_url: str,
+        company_name: str,
+        company_domain: Optional[str],
+        job: Dict[str, Any],
+        metadata: Dict[str, Any],
+    ):
+        self.source_job_id = source_job_id
+        self.source_url = source_url
+        self.company_name = company_name
+        self.company_domain = company_domain
+        self.job = job
+        self.metadata = metadata
+        self.content_hash = None
+        # Filled in by the change detection, resolve and dedup stages
+        self.company_id = None
+        self.job_id = None
+        self.listing_id = None
+        self.is_new = True
+
+
+class IngestionReport:
+    """Counts and timings of one ingestion run."""
+
+    def __init__(self, source_name: str):
+        self.source_name = source_name
+        self.received = 0
+        self.rejected = 0
+        self.duplicates = 0
+        self.unchanged = 0
+        self.inserted = 0
+        self.updated = 0
+        self.batches = 0
+        self.elapsed_seconds = 0.0
+        self.stage_seconds = {
+            "detect": 0.0,
+            "normalize": 0.0,
+            "resolve": 0.0,
+            "dedup": 0.0,
+            "write": 0.0,
+        }
+
+    @property
+    def postings_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.received / self.elapsed_seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "source": self.source_name,
+            "received": self.received,
+            "rejected": self.rejected,
+            "duplicates": self.duplicates,
+            "unchanged": self.unchanged,
+            "inserted": self.inserted,
+            "updated": self.updated,
+            "batches": self.batches,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "postings_per_second": round(self.postings_per_second, 1),
+            "stage_seconds": {
+                stage: round(seconds, 3)
+                for stage, seconds in self.stage_seconds.items()
+            },
+        }
+
+
+def _parse_datetime(value) -> Optional[datetime]:
+    """Parse ISO timestamps into naive UTC, the way job dates are stored."""
+    if isinstance(value, str) and value:
+        try:
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _parse_salary(value) -> Optional[float]:
+    try:
+        salary = float(value)
+    except (TypeError, ValueError):
+        return None
+    return salary if salary >= 0 else None
+
+
+def _http_url(value) -> Optional[str]:
+    if isinstance(value, str) and value.startswith("http") and "://" in value:
+        return value
+    return None
+
+
+def _text(value) -> Optional[str]:
+    if value is None:
+        return None
+    text_value = str(value).strip()
+    return text_value or None
+
+
+def apply_field_map(
+    raw: Mapping[str, Any], field_map: Optional[Mapping[str, str]]
+) -> Mapping[str, Any]:
+    """Rename board fields to the names used here, e.g. ``{"title": "position"}``."""
+    if not field_map:
+        return raw
+    raw = dict(raw)
+    for field, board_field in field_map.items():
+        if board_field in raw:
+            raw[field] = raw.pop(board_field)
+    return raw
+
+
+def posting_source_job_id(raw: Mapping[str, Any]) -> Optional[str]:
+    """The board's identifier of a posting, falling back to its URL."""
+    return _text(raw.get("source_job_id") or raw.get("id")) or _http_url(raw.get("url"))
+
+
+def posting_content_hash(raw: Mapping[str, Any], ignore: Iterable[str] = ()) -> str:
+    """
+    Hash the content of a raw posting, independent of key order.
+
+    ``ignore`` names fields that change on every scrape without the posting
+    changing (view counts, fetch timestamps) and must not count as edits.
+    """
+    ignored = set(ignore)
+    content = {key: value for key, value in raw.items() if key not in ignored}
+    canonical = json.dumps(
+        content, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def normalize_posting(
+    raw: Mapping[str, Any],
+    base_url: str = "",
+    field_map: Optional[Mapping[str, str]] = None,
+) -> Optional[NormalizedPosting]:
+    """
+    Map a raw posting onto job columns.
+
+    ``field_map`` (from the source's ``scraping_rules``) is applied with
+    ``apply_field_map``. Fields this function does not know are kept as
+    listing metadata. Returns None for postings without a title, company or
+    identifier.
+    """
+    raw = apply_field_map(raw, field_map)
+
+    title = _text(raw.get("title"))
+    company = _text(raw.get("company"))
+    url = _http_url(raw.get("url"))
+    source_job_id = posting_source_job_id(raw)
+    if not title or not company or not source_job_id:
+        return None
+
+    job = {field: _text(raw.get(field)) for field in _TEXT_FIELDS}
+    job["application_url"] = _http_url(job["application_url"])
+    job["job_url"] = url
+    for field, column in _LIST_FIELDS.items():
+        values = raw.get(field)
+        job[column] = [str(value) for value in values] if values else None
+    for field, enum_cls in _ENUM_FIELDS.items():
+        members = coerce_enum_values(enum_cls, [raw[field]]) if raw.get(field) else []
+        job[field] = members[0] if members else None
+
+    salary_min = _parse_salary(raw.get("salary_min"))
+    salary_max = _parse_salary(raw.get("salary_max"))
+    if salary_min is not None and salary_max is not None and salary_max < salary_min:
+        salary_min, salary_max = salary_max, salary_min
+    job["salary_min"] = salary_min
+    job["salary_max"] = salary_max
+    job["salary_currency"] = _text(raw.get("salary_currency")) or "USD"
+    job["posted_date"] = _parse_datetime(raw.get("posted_date"))
+    job["application_deadline"] = _parse_datetime(raw.get("application_deadline"))
+
+    metadata = {key: value for key, value in raw.items() if key not in _KNOWN_FIELDS}
+    return NormalizedPosting(
+        source_job_id=source_job_id,
+        source_url=url or base_url,
+        company_name=company,
+        company_domain=_text(raw.get("company_domain") or raw.get("company_website")),
+        job=job,
+        metadata=metadata,
+    )
+
+
+async def file_postings(
+    path: Union[str, Path], since: Optional[datetime] = None
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Yield postings from a JSON Lines file or a file holding a JSON array.
+
+    With ``since``, postings whose ``posted_date`` is not after it are
+    skipped, mirroring an incremental scrape from ``last_scraped``.
+    """
+    content = await asyncio.to_thread(Path(path).read_text, encoding="utf-8")
+    stripped = content.lstrip()
+    if stripped.startswith("["):
+        postings = json.loads(stripped)
+    else:
+        postings = (json.loads(line) for line in content.splitlines() if line.strip())
+
+    for count, posting in enumerate(postings, 1):
+        if since is not None:
+            posted = _parse_datetime(posting.get("posted_date"))
+            if posted is not None and posted <= since:
+                continue
+        yield posting
+        if count % 1000 == 0:
+            # Let the other stages run while a large file is parsed
+            await asyncio.sleep(0)
+
+
+class JobIngestionPipeline:
+    """Concurrent detect -> normalize -> resolve -> dedup -> write pipeline."""
+
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ):
+        self.db_manager = db_manager
+        self.job_repository = JobRepository(db_manager)
+        self.batch_size = batch_size
+        self.queue_size = queue_size
+        self.flush_interval = flush_interval
+
+    async def ingest(
+        self, source: str, postings: AsyncIterable[Mapping[str, Any]]
+    ) -> IngestionReport:
+        """
+        Ingest postings from one source, identified by its name or ID.
+
+        Raises ValueError for unknown or inactive sources. If a stage fails
+        the others are cancelled; batches written before that stay committed.
+        """
+        source_row = await asyncio.to_thread(self._load_source, source)
+        report = IngestionReport(source_row["name"])
+        limiter = RateLimiter.from_config(source_row["rate_limit_config"])
+        start = time.perf_counter()
+
+        raw_queue = asyncio.Queue(maxsize=self.batch_size)
+        collected = asyncio.Queue(maxsize=self.queue_size)
+        normalized = asyncio.Queue(maxsize=self.queue_size)
+        resolved = asyncio.Queue(maxsize=self.queue_size)
+        deduplicated = asyncio.Queue(maxsize=self.queue_size)
+
+        tasks = [
+            asyncio.create_task(self._read(postings, limiter, raw_queue, report)),
+            asyncio.create_task(
+                self._collect(source_row, raw_queue, collected, report)
+            ),
+            asyncio.create_task(
+                self._detect_changes(source_row, collected, normalized, report)
+            ),
+            asyncio.create_task(self._resolve(normalized, resolved, report)),
+            asyncio.create_task(self._deduplicate(resolved, deduplicated, report)),
+            asyncio.create_task(self._write(source_row, deduplicated, report)),
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException as e:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            logger.error(f"Ingestion from {report.source_name} failed: {e}")
+            raise
+
+        report.elapsed_seconds = time.perf_counter() - start
+        logger.info(f"Ingested from {report.source_name}: {report.to_dict()}")
+        return report
+
+    def _load_source(self, source: str) -> Dict[str, Any]:
+        with self.db_manager.get_session() as session:
+            source_db = (
+                session.query(JobSourceDB)
+                .filter((JobSourceDB.id == source) | (JobSourceDB.name == source))
+                .first()
+            )
+            if source_db is None:
+                raise ValueError(f"Unknown job source: {source}")
+            if not source_db.is_active:
+                raise ValueError(f"Job source is inactive: {source_db.name}")
+            return {
+                "id": source_db.id,
+                "name": source_db.name,
+                "base_url": source_db.base_url,
+                "scraping_rules": source_db.scraping_rules or {},
+                "rate_limit_config": source_db.rate_limit_config,
+            }
+
+    async def _read(self, postings, limiter, raw_queue, report) -> None:
+        iterator = postings.__aiter__()
+        while True:
+            if limiter is not None:
+                await limiter.acquire()
+            try:
+                posting = await iterator.__anext__()
+            except StopAsyncIteration:
+                break
+            report.received += 1
+            await raw_queue.put(posting)
+        await raw_queue.put(_DONE)
+
+    async def _collect(self, source_row, raw_queue, collected, report) -> None:
+        """Batch raw postings, keyed by source_job_id with their content hash."""
+        field_map = source_row["scraping_rules"].get("field_map")
+        volatile_fields = source_row["scraping_rules"].get("volatile_fields", ())
+        done = False
+        while not done:
+            batch = []
+            deadline = None
+            while len(batch) < self.batch_size:
+                timeout = None
+                if deadline is not None:
+                    timeout = max(deadline - time.monotonic(), 0)
+                try:
+                    raw = await asyncio.wait_for(raw_queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if raw is _DONE:
+                    done = True
+                    break
+
+                started = time.perf_counter()
+                raw = apply_field_map(raw, field_map)
+                source_job_id = posting_source_job_id(raw)
+                if source_job_id is not None:
+                    content_hash = posting_content_hash(raw, volatile_fields)
+                report.stage_seconds["detect"] += time.perf_counter() - started
+                if source_job_id is None:
+                    report.rejected += 1
+                    continue
+                batch.append((source_job_id, content_hash, raw))
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+            if batch:
+                await collected.put(batch)
+        await collected.put(_DONE)
+
+    async def _detect_changes(self, source_row, collected, normalized, report) -> None:
+        """
+        Drop postings whose stored hash matches and normalize the rest.
+
+        Unchanged postings only get ``last_verified`` touched on their job.
+        """
+        # Hash of the version of each posting handled earlier in this run
+        seen: Dict[str, str] = {}
+        while (batch := await collected.get()) is not _DONE:
+            started = time.perf_counter()
+            latest = {}
+            for source_job_id, content_hash, raw in batch:
+                if source_job_id in latest:
+                    report.duplicates += 1
+                latest[source_job_id] = (content_hash, raw)
+            for source_job_id in list(latest):
+                if seen.get(source_job_id) == latest[source_job_id][0]:
+                    report.duplicates += 1
+                    del latest[source_job_id]
+
+            stored = await asyncio.to_thread(
+                self._stored_listings, source_row["id"], list(latest)
+            )
+            unchanged, changed = [], []
+            for source_job_id, (content_hash, raw) in latest.items():
+                known = stored.get(source_job_id)
+                if (
+                    source_job_id not in seen
+                    and known is not None
+                    and known[2] == content_hash
+                ):
+                    unchanged.append(known[0])
+                else:
+                    changed.append((content_hash, raw, known))
+                seen[source_job_id] = content_hash
+            if unchanged:
+                await asyncio.to_thread(self._touch_unchanged, unchanged)
+                report.unchanged += len(unchanged)
+            report.stage_seconds["detect"] += time.perf_counter() - started
+
+            started = time.perf_counter()
+            postings = []
+            for content_hash, raw, known in changed:
+                # The field map was applied while collecting
+                posting = normalize_posting(raw, source_row["base_url"])
+                if posting is None:
+                    report.rejected += 1
+                    continue
+                posting.content_hash = content_hash
+                if known is not None:
+                    posting.job_id, posting.listing_id = known[0], known[1]
+                    posting.is_new = False
+                postings.append(posting)
+            report.stage_seconds["normalize"] += time.perf_counter() - started
+            if postings:
+                await normalized.put(postings)
+        await normalized.put(_DONE)
+
+    def _stored_listings(
+        self, source_id: str, source_job_ids: List[str]
+    ) -> Dict[str, Tuple[str, str, Optional[str]]]:
+        """Map source_job_id -> (job_id, listing_id, content_hash)."""
+        if not source_job_ids:
+            return {}
+        with self.db_manager.get_session() as session:
+            rows = session.query(
+                JobSourceListingDB.source_job_id,
+                JobSourceListingDB.job_id,
+                JobSourceListingDB.id,
+                JobSourceListingDB.content_hash,
+            ).filter(
+                JobSourceListingDB.source_id == source_id,
+                JobSourceListingDB.source_job_id.in_(source_job_ids),
+            )
+            return {row[0]: tuple(row[1:]) for row in rows}
+
+    def _touch_unchanged(self, job_ids: List[str]) -> None:
+        with self.db_manager.get_session() as session:
+            session.execute(
+                update(JobListingDB).where(JobListingDB.id.in_(job_ids))
+                # Keep updated_at: the job's content did not change
+                .values(
+                    last_verified=datetime.utcnow(),
+                    updated_at=JobListingDB.updated_at,
+                )
+            )
+
+    async def _resolve(self, normalized, resolved, report) -> None:
+        while (batch := await normalized.get()) is not _DONE:
+            started = time.perf_counter()
+            company_ids = await asyncio.to_thread(
+                self.job_repository.resolve_companies,
+                {(posting.company_name, posting.company_domain) for posting in batch},
+            )
+            kept = []
+            for posting in batch:
+                posting.company_id = company_ids.get(
+                    (posting.company_name, posting.company_domain)
+                )
+                if posting.company_id is None:
+                    report.rejected += 1
+                else:
+                    kept.append(posting)
+            report.stage_seconds["resolve"] += time.perf_counter() - started
+            if kept:
+                await resolved.put(kept)
+        await resolved.put(_DONE)
+
+    async def _deduplicate(self, resolved, deduplicated, report) -> None:
+        # Stored listings were matched while detecting changes. This covers
+        # postings assigned to jobs earlier in this run, which may not be
+        # written yet when a later batch repeats them.
+        assigned: Dict[str, tuple] = {}
+        while (batch := await resolved.get()) is not _DONE:
+            started = time.perf_counter()
+            for posting in batch:
+                if posting.source_job_id in assigned:
+                    report.duplicates += 1
+                    posting.job_id, posting.listing_id = assigned[posting.source_job_id]
+                    posting.is_new = False
+                elif posting.job_id is None:
+                    posting.job_id, posting.listing_id = str(uuid4()), str(uuid4())
+                assigned[posting.source_job_id] = (posting.job_id, posting.listing_id)
+            report.stage_seconds["dedup"] += time.perf_counter() - started
+            await deduplicated.put(batch)
+        await deduplicated.put(_DONE)
+
+    async def _write(self, source_row, deduplicated, report) -> None:
+        while (batch := await deduplicated.get()) is not _DONE:
+            started = time.perf_counter()
+            await asyncio.to_thread(self._write_batch, source_row, batch)
+            report.stage_seconds["write"] += time.perf_counter() - started
+            report.inserted += sum(1 for posting in batch if posting.is_new)
+            report.updated += sum(1 for posting in batch if not posting.is_new)
+            report.batches += 1
+
+        # A run without new postings still counts as a scrape
+        await asyncio.to_thread(self._touch_source, source_row["id"])
+
+    def _write_batch(self, source_row, batch: List[NormalizedPosting]) -> None:
+        """Write one batch of jobs and source listings in a single transaction."""
+        now = datetime.utcnow()
+        new_jobs, job_updates, new_listings, listing_updates = [], [], [], []
+        for posting in batch:
+            job = {
+                **posting.job,
+                "company_id": posting.company_id,
+                "source": source_row["name"],
+                "scraped_at": now,
+                "last_verified": now,
+            }
+            listing = {
+                "source_url": posting.source_url,
+                "source_metadata": posting.metadata or None,
+                "content_hash": posting.content_hash,
+                "last_updated": now,
+            }
+            if posting.is_new:
+                new_jobs.append({**job, "id": posting.job_id})
+                new_listings.append(
+                    {
+                        **listing,
+                        "id": posting.listing_id,
+                        "job_id": posting.job_id,
+                        "source_id": source_row["id"],
+                        "source_job_id": posting.source_job_id,
+                        "scraped_at": now,
+                    }
+                )
+            else:
+                job_updates.append(
+                    {**job, "updated_at": now, "existing_id": posting.job_id}
+                )
+                listing_updates.append({**listing, "existing_id": posting.listing_id})
+
+        listings = JobSourceListingDB.__table__
+        with self.db_manager.get_session() as session:
+            with self.db_manager.search_index.deferred_indexing(session):
+                self.job_repository.insert_job_rows(session, new_jobs)
+                self.job_repository.update_job_rows(session, job_updates)
+            if new_listings:
+                execute_grouped(session, insert(listings), new_listings)
+            if listing_updates:
+                execute_grouped(
+                    session,
+                    update(listings).where(listings.c.id == bindparam("existing_id")),
+                    listing_updates,
+                )
+            session.execute(self._last_scraped_update(source_row["id"], now))
+
+    def _touch_source(self, source_id: str) -> None:
+        with self.db_manager.get_session() as session:
+            session.execute(self._last_scraped_update(source_id, datetime.utcnow()))
+
+    @staticmethod
+    def _last_scraped_update(source_id: str, now: datetime):
+        return (
+            update(JobSourceDB)
+            .where(JobSourceDB.id == source_id)
+            .values(last_scraped=now)
+        )
@@ -18,18 +18,38 @@ from backend.data.models import (
     TimelineEvent,
     TimelineEventDB,
     TimelineEventType,
-    pydantic_to_sqlalchemy,
     sqlalchemy_to_pydantic,
 )
+from backend.data.pagination import keyset_order
 
 logger = logging.getLogger(__name__)
 
 
+def _to_event(event_db: TimelineEventDB) -> TimelineEvent:
+    """Pydantic event for a row, with interaction_id as application_id."""
+    event = sqlalchemy_to_pydantic(event_db, TimelineEvent)
+    event.application_id = event_db.interaction_id
+    return event
+
+
 class TimelineService:
     """Service for managing timeline events in job applications."""
 
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: Session, autocommit: bool = True):
+        # With autocommit=False writes are only flushed; the caller owns the
+        # transaction (e.g. a write intent on the database write queue)
         self.db = db_session
+        self.autocommit = autocommit
+
+    def _commit(self):
+        if self.autocommit:
+            self.db.commit()
+        else:
+            self.db.flush()
+
+    def _rollback(self):
+        if self.autocommit:
+            self.db.rollback()
 
     def create_event(
         self,
@@ -60,17 +80,22 @@ class TimelineService:
             )
 
             # Convert to SQLAlchemy and save
-            event_db = pydantic_to_sqlalchemy(event, TimelineEventDB)
+            # The table links events to the job interaction that holds the
+            # application, so application_id is stored as interaction_id
+            event_db = TimelineEventDB(
+                **event.model_dump(exclude={"application_id"}),
+                interaction_id=application_id,
+            )
             self.db.add(event_db)
-            self.db.commit()
+            self._commit()
             self.db.refresh(event_db)
 
             # Convert back to Pydantic
-            return sqlalchemy_to_pydantic(event_db, TimelineEvent)
+            return _to_event(event_db)
 
         except Exception as e:
             logger.error(f"Error creating timeline event: {e}")
-            self.db.rollback()
+            self._rollback()
             raise
 
     def get_user_timeline(
@@ -81,8 +106,13 @@ class TimelineService:
         job_id: Optional[str] = None,
         event_types: Optional[List[TimelineEventType]] = None,
         days_back: Optional[int] = None,
+        after: Optional[str] = None,
     ) -> List[TimelineEvent]:
-        """Get timeline events for a user, with optional filtering."""
+        """Get timeline events for a user, with optional filtering.
+
+        Pages by offset, or by keyset when ``after`` is the cursor of the
+        previous page.
+        """
 
         try:
             query = self.db.query(TimelineEventDB).filter(
@@ -103,16 +133,15 @@ class TimelineService:
                 query = query.filter(TimelineEventDB.event_date >= cutoff_date)
 
             # Order by event date (most recent first)
-            query = query.order_by(desc(TimelineEventDB.event_date))
+            query = keyset_order(
+                query, TimelineEventDB.event_date, TimelineEventDB.id, after
+            )
 
             # Apply pagination
             events_db = query.offset(offset).limit(limit).all()
 
             # Convert to Pydantic models
-            return [
-                sqlalchemy_to_pydantic(event_db, TimelineEvent)
-                for event_db in events_db
-            ]
+            return [_to_event(event_db) for event_db in events_db]
 
         except Exception as e:
             logger.error(f"Error retrieving user timeline: {e}")
@@ -138,10 +167,7 @@ class TimelineService:
             )
 
             # Convert to Pydantic models
-            return [
-                sqlalchemy_to_pydantic(event_db, TimelineEvent)
-                for event_db in events_db
-            ]
+            return [_to_event(event_db) for event_db in events_db]
 
         except Exception as e:
             logger.error(f"Error retrieving job timeline: {e}")
@@ -153,22 +179,19 @@ class TimelineService:
         """Get timeline events for a specific application ID.
 
         Note: With the new job_user_interactions structure, this method
-        now simply filters timeline events by the application_id field.
+        now simply filters timeline events by the interaction they link to.
         """
 
         try:
             query = self.db.query(TimelineEventDB).filter(
-                TimelineEventDB.application_id == application_id
+                TimelineEventDB.interaction_id == application_id
             )
 
             # Order by event date (chronological order for application timeline)
             events_db = query.order_by(TimelineEventDB.event_date).limit(limit).all()
 
             # Convert to Pydantic models
-            return [
-                sqlalchemy_to_pydantic(event_db, TimelineEvent)
-                for event_db in events_db
-            ]
+            return [_to_event(event_db) for event_db in events_db]
 
         except Exception as e:
             logger.error(f"Error retrieving application timeline: {e}")
@@ -210,15 +233,15 @@ class TimelineService:
             # Update timestamp
             event_db.updated_at = datetime.utcnow()
 
-            self.db.commit()
+            self._commit()
             self.db.refresh(event_db)
 
             # Convert back to Pydantic
-            return sqlalchemy_to_pydantic(event_db, TimelineEvent)
+            return _to_event(event_db)
 
         except Exception as e:
             logger.error(f"Error updating timeline event: {e}")
-            self.db.rollback()
+            self._rollback()
             raise
 
     def delete_event(self, event_id: str) -> bool:
@@ -235,12 +258,12 @@ class TimelineService:
                 return False
 
             self.db.delete(event_db)
-            self.db.commit()
+            self._commit()
             return True
 
         except Exception as e:
             logger.error(f"Error deleting timeline event: {e}")
-            self.db.rollback()
+            self._rollback()
             raise
 
     # Convenience methods for creating specific types of events
@@ -425,10 +448,7 @@ class TimelineService:
                 .all()
             )
 
-            return [
-                sqlalchemy_to_pydantic(event_db, TimelineEvent)
-                for event_db in events_db
-            ]
+            return [_to_event(event_db) for event_db in events_db]
 
         except Exception as e:
             logger.error(f"Error retrieving upcoming events: {e}")
@@ -1,11 +1,24 @@
 """
 Retry utilities for handling transient failures in database operations.
+
+Coroutine functions are retried with ``asyncio.sleep`` so backoff never
+blocks the event loop. Plain functions sleep with ``time.sleep``, which is
+only safe off the loop (e.g. on the database executor); a plain function
+that fails on the event loop thread is not retried.
+
+Retries are capped process-wide by a retry budget, so that a struggling
+database is not hit with a storm of retries, and every call site keeps
+metrics (attempts, retries, backoff time) that ``retry_metrics`` exports.
 """
 
+import asyncio
 import random
+import threading
 import time
+from collections import deque
 from functools import wraps
-from typing import Any, Callable, Tuple, Type
+from inspect import iscoroutinefunction
+from typing import Any, Callable, Dict, Optional, Tuple, Type
 
 from sqlalchemy.exc import DisconnectionError, OperationalError, StatementError
 from sqlalchemy.exc import TimeoutError as SQLTimeoutError
@@ -20,6 +33,125 @@ RETRYABLE_DB_EXCEPTIONS = (
     StatementError,  # Statement execution issues (some cases)
 )
 
+# Retries allowed across the process per window before failing fast
+DEFAULT_RETRY_BUDGET = 100
+DEFAULT_RETRY_BUDGET_WINDOW_SECONDS = 60.0
+
+
+class RetryBudget:
+    """Thread-safe cap on the number of retries per sliding time window."""
+
+    def __init__(
+        self,
+        max_retries: int = DEFAULT_RETRY_BUDGET,
+        window_seconds: float = DEFAULT_RETRY_BUDGET_WINDOW_SECONDS,
+        clock=time.monotonic,
+    ):
+        self.max_retries = max_retries
+        self.window_seconds = window_seconds
+        self._clock = clock
+        self._spent: deque = deque()
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> bool:
+        """Spend one retry if the budget allows it."""
+        with self._lock:
+            now = self._clock()
+            while self._spent and self._spent[0] <= now - self.window_seconds:
+                self._spent.popleft()
+            if len(self._spent) >= self.max_retries:
+                return False
+            self._spent.append(now)
+            return True
+
+    def remaining(self) -> int:
+        with self._lock:
+            cutoff = self._clock() - self.window_seconds
+            return self.max_retries - sum(1 for spent in self._spent if spent > cutoff)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._spent.clear()
+
+
+class CallSiteMetrics:
+    """Retry counters for one decorated function."""
+
+    __slots__ = (
+        "calls",
+        "attempts",
+        "retries",
+        "failures",
+        "budget_exhausted",
+        "backoff_seconds",
+    )
+
+    def __init__(self):
+        self.calls = 0
+        self.attempts = 0
+        self.retries = 0
+        self.failures = 0
+        self.budget_exhausted = 0
+        self.backoff_seconds = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "attempts": self.attempts,
+            "retries": self.retries,
+            "failures": self.failures,
+            "budget_exhausted": self.budget_exhausted,
+            "backoff_seconds": round(self.backoff_seconds, 3),
+        }
+
+
+class RetryMetrics:
+    """Registry of per-call-site retry metrics."""
+
+    def __init__(self):
+        self._sites: Dict[str, CallSiteMetrics] = {}
+        self._lock = threading.Lock()
+
+    def site(self, name: str) -> CallSiteMetrics:
+        with self._lock:
+            metrics = self._sites.get(name)
+            if metrics is None:
+                metrics = self._sites[name] = CallSiteMetrics()
+            return metrics
+
+    def record(self, metrics: CallSiteMetrics, **increments) -> None:
+        with self._lock:
+            for field, amount in increments.items():
+                setattr(metrics, field, getattr(metrics, field) + amount)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Metrics of every call site that has been called."""
+        with self._lock:
+            return {
+                name: metrics.to_dict()
+                for name, metrics in sorted(self._sites.items())
+                if metrics.calls
+            }
+
+    def reset(self) -> None:
+        """Zero every counter; decorated functions keep their entries."""
+        with self._lock:
+            for metrics in self._sites.values():
+                metrics.__init__()
+
+
+# Process-wide budget and metrics shared by every decorated function
+retry_budget = RetryBudget()
+retry_metrics = RetryMetrics()
+
+
+def _on_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
 
 def with_retry(
     max_retries: int = 3,
@@ -28,10 +160,14 @@ def with_retry(
     exponential_base: float = 2.0,
     jitter: bool = True,
     retryable_exceptions: Tuple[Type[Exception], ...] = RETRYABLE_DB_EXCEPTIONS,
+    budget: Optional[RetryBudget] = None,
 ) -> Callable:
     """
     Decorator that adds retry logic with exponential backoff to functions.
 
+    Works on plain and coroutine functions; coroutine functions back off
+    with ``asyncio.sleep``.
+
     Args:
         max_retries: Maximum number of retry attempts (default: 3)
         base_delay: Initial delay between retries in seconds (default: 1.0)
@@ -39,50 +175,95 @@ def with_retry(
         exponential_base: Base for exponential backoff (default: 2.0)
         jitter: Add random jitter to delay (default: True)
         retryable_exceptions: Tuple of exceptions that should trigger retry
+        budget: Retry budget to spend from (default: the process-wide one)
     """
 
     def decorator(func: Callable) -> Callable:
+        name = f"{func.__module__}.{func.__qualname__}"
+        metrics = retry_metrics.site(name)
+
+        def backoff(attempt: int, error: Exception, on_loop: bool = False):
+            """Delay before the next attempt, or None to give up and re-raise."""
+            if attempt == max_retries:
+                logger.error(
+                    f"Function {func.__name__} failed after {max_retries + 1} attempts. "
+                    f"Final error: {error}"
+                )
+                return None
+            if on_loop:
+                logger.error(
+                    f"Function {func.__name__} failed on the event loop; not "
+                    f"retrying to avoid blocking it. Error: {error}"
+                )
+                return None
+            if not (budget or retry_budget).try_acquire():
+                retry_metrics.record(metrics, budget_exhausted=1)
+                logger.error(
+                    f"Function {func.__name__} failed and the retry budget is "
+                    f"exhausted; not retrying. Error: {error}"
+                )
+                return None
+
+            # Calculate delay with exponential backoff
+            delay = min(base_delay * (exponential_base**attempt), max_delay)
+
+            # Add jitter to prevent thundering herd
+            if jitter:
+                delay = delay * (0.5 + random.random() * 0.5)
+
+            retry_metrics.record(metrics, retries=1, backoff_seconds=delay)
+            logger.warning(
+                f"Function {func.__name__} failed on attempt {attempt + 1}/{max_retries + 1}. "
+                f"Error: {error}. Retrying in {delay:.2f} seconds..."
+            )
+            return delay
+
+        def non_retryable(error: Exception) -> None:
+            retry_metrics.record(metrics, failures=1)
+            logger.error(
+                f"Function {func.__name__} failed with non-retryable error: {error}"
+            )
+
+        if iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs) -> Any:
+                retry_metrics.record(metrics, calls=1)
+                for attempt in range(max_retries + 1):
+                    retry_metrics.record(metrics, attempts=1)
+                    try:
+                        return await func(*args, **kwargs)
+                    except retryable_exceptions as e:
+                        delay = backoff(attempt, e)
+                        if delay is None:
+                            retry_metrics.record(metrics, failures=1)
+                            raise
+                        await asyncio.sleep(delay)
+                    except Exception as e:
+                        non_retryable(e)
+                        raise
+
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            last_exception = None
-
-            for attempt in range(max_retries + 1):  # +1 to include initial attempt
+            retry_metrics.record(metrics, calls=1)
+            for attempt in range(max_retries + 1):
+                retry_metrics.record(metrics, attempts=1)
                 try:
                     return func(*args, **kwargs)
                 except retryable_exceptions as e:
-                    last_exception = e
-
-                    # Don't retry on the last attempt
-                    if attempt == max_retries:
-                        logger.error(
-                            f"Function {func.__name__} failed after {max_retries + 1} attempts. "
-                            f"Final error: {e}"
-                        )
+                    # time.sleep on the event loop thread would stall every
+                    # request; fail fast there instead
+                    delay = backoff(attempt, e, on_loop=_on_event_loop())
+                    if delay is None:
+                        retry_metrics.record(metrics, failures=1)
                         raise
-
-                    # Calculate delay with exponential backoff
-                    delay = min(base_delay * (exponential_base**attempt), max_delay)
-
-                    # Add jitter to prevent thundering herd
-                    if jitter:
-                        delay = delay * (0.5 + random.random() * 0.5)
-
-                    logger.warning(
-                        f"Function {func.__name__} failed on attempt {attempt + 1}/{max_retries + 1}. "
-                        f"Error: {e}. Retrying in {delay:.2f} seconds..."
-                    )
-
                     time.sleep(delay)
                 except Exception as e:
-                    # Non-retryable exception
-                    logger.error(
-                        f"Function {func.__name__} failed with non-retryable error: {e}"
-                    )
+                    non_retryable(e)
                     raise
 
-            # This should never be reached, but just in case
-            raise last_exception
-
         return wrapper
 
     return decorator
@@ -95,7 +276,8 @@ def retry_database_operation(
     Retry a database operation with exponential backoff.
 
     This is a functional approach for one-off operations where you don't want
-    to use the decorator.
+    to use the decorator. If ``operation`` is a coroutine function, an
+    awaitable is returned instead.
 
     Args:
         operation: The function to retry
@@ -110,37 +292,8 @@ def retry_database_operation(
     Raises:
         The last exception if all retries fail
     """
-    last_exception = None
-
-    for attempt in range(max_retries + 1):
-        try:
-            return operation(*args, **kwargs)
-        except RETRYABLE_DB_EXCEPTIONS as e:
-            last_exception = e
-
-            if attempt == max_retries:
-                logger.error(
-                    f"Database operation {operation.__name__} failed after {max_retries + 1} attempts. "
-                    f"Final error: {e}"
-                )
-                raise
-
-            delay = min(base_delay * (2**attempt), 60.0)
-            delay = delay * (0.5 + random.random() * 0.5)  # Add jitter
-
-            logger.warning(
-                f"Database operation {operation.__name__} failed on attempt {attempt + 1}/{max_retries + 1}. "
-                f"Error: {e}. Retrying in {delay:.2f} seconds..."
-            )
-
-            time.sleep(delay)
-        except Exception as e:
-            logger.error(
-                f"Database operation {operation.__name__} failed with non-retryable error: {e}"
-            )
-            raise
-
-    raise last_exception
+    retrying = with_retry(max_retries=max_retries, base_delay=base_delay)(operation)
+    return retrying(*args, **kwargs)
 
 
 class RetryableError(Exception):
@@ -0,0 +1,142 @@
+"""
+Benchmark async route handlers under concurrent load: skill bank reads run
+either directly on the event loop (the previous behaviour) or on the
+database executor through DatabaseManager.run_sync.
+
+Each of --clients concurrent clients repeatedly requests a skill bank. A
+heartbeat task records how long the event loop went without running other
+tasks; with blocking handlers every in-flight request waits out each query.
+--latency-ms adds a simulated round trip to every query, as against a
+database server instead of a local SQLite file.
+
+Usage:
+    python benchmarks/bench_async_db.py --clients 200 --requests 10
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+
+from backend.data.database import DatabaseManager  # noqa: E402
+from backend.data.skill_bank_models import EnhancedSkill  # noqa: E402
+from backend.data.skill_bank_repository import SkillBankRepository  # noqa: E402
+
+
+def add_latency(repository: SkillBankRepository, seconds: float) -> None:
+    fetch = repository._fetch_skill_bank
+
+    def fetch_with_latency(user_id):
+        time.sleep(seconds)
+        return fetch(user_id)
+
+    repository._fetch_skill_bank = fetch_with_latency
+
+
+def build_app(repository: SkillBankRepository) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/blocking/{user_id}")
+    async def blocking(user_id: str):
+        skill_bank = repository._fetch_skill_bank(user_id)
+        return {"skills": sum(len(s) for s in skill_bank.skills.values())}
+
+    @app.get("/executor/{user_id}")
+    async def executor(user_id: str):
+        skill_bank = await repository.get_skill_bank(user_id)
+        return {"skills": sum(len(s) for s in skill_bank.skills.values())}
+
+    return app
+
+
+async def seed(repository: SkillBankRepository, users: int, skills: int) -> None:
+    for user in range(users):
+        user_id = f"user-{user}"
+        await repository.update_skill_bank(
+            user_id,
+            {
+                "skills": {
+                    "Technical Skills": [
+                        EnhancedSkill(name=f"Skill {i}") for i in range(skills)
+                    ]
+                }
+            },
+        )
+
+
+async def run_load(app, mode, clients, requests, users):
+    transport = httpx.ASGITransport(app=app)
+    latencies = []
+    stalls = []
+    done = asyncio.Event()
+
+    async def heartbeat():
+        # Gap between wakeups of a 5ms sleep: how long the loop was stalled
+        last = time.perf_counter()
+        while not done.is_set():
+            await asyncio.sleep(0.005)
+            now = time.perf_counter()
+            stalls.append(now - last - 0.005)
+            last = now
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as http:
+
+        async def client(index):
+            for i in range(requests):
+                started = time.perf_counter()
+                response = await http.get(f"/{mode}/user-{(index + i) % users}")
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - started)
+
+        ticker = asyncio.create_task(heartbeat())
+        started = time.perf_counter()
+        await asyncio.gather(*(client(index) for index in range(clients)))
+        elapsed = time.perf_counter() - started
+        done.set()
+        await ticker
+
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(
+        f"{mode:<9} {clients * requests / elapsed:>8,.0f} req/s  "
+        f"p50 {statistics.median(latencies) * 1000:7.1f}ms  "
+        f"p95 {p95 * 1000:7.1f}ms  "
+        f"longest loop stall {max(stalls) * 1000:7.1f}ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=10)
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--skills", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_manager = DatabaseManager(
+            f"sqlite:///{tmp}/bench.db", executor_workers=args.workers
+        )
+        repository = SkillBankRepository(db_manager)
+        asyncio.run(seed(repository, args.users, args.skills))
+        if args.latency_ms:
+            add_latency(repository, args.latency_ms / 1000)
+        app = build_app(repository)
+
+        for mode in ("blocking", "executor"):
+            asyncio.run(run_load(app, mode, args.clients, args.requests, args.users))
+        db_manager.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Load test /auth/login bursts against a cheap endpoint: bcrypt verification
+either runs inline on the event loop (the previous behaviour) or on the
+password pool.
+
+While --logins concurrent logins are processed, a probe requests an
+endpoint that does no password work every 10ms and records how late each
+response was.
+
+Usage:
+    python benchmarks/bench_auth_login.py --logins 16 --rounds 12
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+
+import backend.api.auth as auth  # noqa: E402
+from backend.api.config import settings  # noqa: E402
+from backend.api.routers import auth as auth_router  # noqa: E402
+from backend.data.database import DatabaseManager, UserRepository  # noqa: E402
+from backend.data.models import UserProfileDB  # noqa: E402
+
+PASSWORD = "benchmark-password"
+
+
+async def inline_verify(plain_password, hashed_password):
+    return auth.verify_password(plain_password, hashed_password)
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(auth_router.router)
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    return app
+
+
+async def run_burst(app, label, logins):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as http:
+        probe_latencies = []
+        done = asyncio.Event()
+
+        async def probe():
+            # Pings are due every 10ms; latency counts from when a ping was
+            # due, so time spent waiting for a blocked loop is included
+            due = time.perf_counter()
+            while not done.is_set():
+                await asyncio.sleep(max(due - time.perf_counter(), 0))
+                await http.get("/ping")
+                now = time.perf_counter()
+                probe_latencies.append(now - due)
+                due = max(due + 0.01, now)
+
+        async def login():
+            response = await http.post(
+                "/auth/login", json={"email": "bench@example.com", "password": PASSWORD}
+            )
+            response.raise_for_status()
+
+        prober = asyncio.create_task(probe())
+        await asyncio.sleep(0.05)
+        started = time.perf_counter()
+        await asyncio.gather(*(login() for _ in range(logins)))
+        elapsed = time.perf_counter() - started
+        done.set()
+        await prober
+
+    probe_latencies.sort()
+    p95 = probe_latencies[max(int(len(probe_latencies) * 0.95) - 1, 0)]
+    print(
+        f"{label:<13} {logins / elapsed:6.1f} logins/s  "
+        f"ping p50 {statistics.median(probe_latencies) * 1000:7.1f}ms  "
+        f"p95 {p95 * 1000:7.1f}ms  max {probe_latencies[-1] * 1000:7.1f}ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--logins", type=int, default=16)
+    parser.add_argument("--rounds", type=int, default=12)
+    args = parser.parse_args()
+
+    settings.BCRYPT_ROUNDS = args.rounds
+    settings.PASSWORD_HASH_MAX_PENDING = max(args.logins, 1)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_manager = DatabaseManager(f"sqlite:///{tmp}/auth.db")
+        repository = UserRepository(db_manager)
+        with db_manager.get_session() as session:
+            session.add(
+                UserProfileDB(
+                    id=str(uuid.uuid4()),
+                    email="bench@example.com",
+                    hashed_password=auth.get_password_hash(PASSWORD),
+                    is_active=True,
+                )
+            )
+        auth_router.get_user_repository = lambda: repository
+        app = build_app()
+
+        offloaded = auth_router.verify_password_async
+        auth_router.verify_password_async = inline_verify
+        asyncio.run(run_burst(app, "inline bcrypt", args.logins))
+        auth_router.verify_password_async = offloaded
+        asyncio.run(run_burst(app, "password pool", args.logins))
+        db_manager.close()
+
+
+if __name__ == "__main__":
+    main()
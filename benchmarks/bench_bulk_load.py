@@ -0,0 +1,109 @@
+"""
+Benchmark bulk job loading into SQLite: the ORM add_all path vs chunked Core
+inserts, from plain dicts and from JobListing models, plus an upsert pass
+over the same feed.
+
+Usage:
+    python benchmarks/bench_bulk_load.py --jobs 100000
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backend.data.database import DatabaseManager, JobRepository  # noqa: E402
+from backend.data.models import (  # noqa: E402
+    CompanyInfoDB,
+    JobListing,
+    JobListingDB,
+    JobType,
+    RemoteType,
+    pydantic_to_sqlalchemy,
+)
+
+TITLES = ["Python Engineer", "Data Analyst", "DevOps Engineer", "Product Manager"]
+CITIES = ["Berlin", "Austin", "London", "Remote", "Toronto"]
+
+
+def feed(count, company_ids, source, seed=0):
+    rng = random.Random(seed)
+    for i in range(count):
+        salary = rng.randrange(50, 200) * 1000
+        yield {
+            "company_id": rng.choice(company_ids),
+            "title": f"{rng.choice(TITLES)} {i}",
+            "location": rng.choice(CITIES),
+            "description": "Build and run data pipelines for our platform. " * 4,
+            "job_type": JobType.FULL_TIME,
+            "remote_type": rng.choice(list(RemoteType)),
+            "salary_min": salary,
+            "salary_max": salary + 20000,
+            "skills_required": ["python", "sql"],
+            "source": source,
+            "job_url": f"https://jobs.example.com/{source}/{i}",
+        }
+
+
+def orm_load(db_manager, rows):
+    """The previous bulk_create_jobs path, kept here as the baseline."""
+    with db_manager.get_session() as session:
+        session.add_all(
+            pydantic_to_sqlalchemy(JobListing(**row), JobListingDB) for row in rows
+        )
+
+
+def report_line(label, count, seconds):
+    print(
+        f"{label:<22} {count:>8} rows {seconds:7.2f}s {count / seconds:>10,.0f} rows/s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=100000)
+    parser.add_argument("--chunk-size", type=int, default=2000)
+    parser.add_argument("--orm-jobs", type=int, default=20000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_manager = DatabaseManager(f"sqlite:///{tmp}/bulk.db")
+        repository = JobRepository(db_manager)
+        company_ids = [str(uuid.uuid4()) for _ in range(500)]
+        with db_manager.get_session() as session:
+            session.add_all(
+                CompanyInfoDB(id=company_id, name=f"Co {i}", normalized_name=f"co {i}")
+                for i, company_id in enumerate(company_ids)
+            )
+
+        start = time.perf_counter()
+        orm_load(db_manager, feed(args.orm_jobs, company_ids, "orm"))
+        report_line("ORM add_all", args.orm_jobs, time.perf_counter() - start)
+
+        report = repository.bulk_load_jobs(
+            feed(args.jobs, company_ids, "core"), chunk_size=args.chunk_size
+        )
+        report_line("Core (dicts)", report.inserted, report.elapsed_seconds)
+
+        report = repository.bulk_load_jobs(
+            (JobListing(**row) for row in feed(args.jobs, company_ids, "models")),
+            chunk_size=args.chunk_size,
+        )
+        report_line("Core (JobListing)", report.inserted, report.elapsed_seconds)
+
+        report = repository.bulk_load_jobs(
+            feed(args.jobs, company_ids, "core", seed=1),
+            upsert=True,
+            chunk_size=args.chunk_size,
+        )
+        report_line("Core upsert (updates)", report.updated, report.elapsed_seconds)
+        db_manager.engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
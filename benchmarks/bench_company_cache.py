@@ -0,0 +1,79 @@
+"""
+Benchmark company resolution during job ingestion with and without the
+resolution cache.
+
+A feed of postings draws its employers from a fixed pool, so most lookups
+repeat. Each posting resolves its company through
+``JobRepository.get_or_create_company``; the bulk path resolves the distinct
+names of a whole batch with ``JobRepository.resolve_companies``.
+
+Usage:
+    python benchmarks/bench_company_cache.py --employers 2000 --postings 20000
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backend.data.company_cache import CompanyResolutionCache  # noqa: E402
+from backend.data.database import DatabaseManager, JobRepository  # noqa: E402
+
+SUFFIXES = ["Inc.", "LLC", "Ltd", ""]
+
+
+def run(label, db_manager, names, fn):
+    start = time.perf_counter()
+    fn(names)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{label:<18} {elapsed:7.2f}s   {len(names) / elapsed:10,.0f} postings/s   "
+        f"cache {db_manager.company_cache.stats()}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--employers", type=int, default=2000)
+    parser.add_argument("--postings", type=int, default=20000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    employers = [f"Employer {i}" for i in range(args.employers)]
+    names = [
+        f"{rng.choice(employers)} {rng.choice(SUFFIXES)}".strip()
+        for _ in range(args.postings)
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_manager = DatabaseManager(f"sqlite:///{tmp}/companies.db")
+        repository = JobRepository(db_manager)
+        # Create the employers up front so every run only resolves
+        repository.resolve_companies((name, None) for name in employers)
+
+        def per_posting(batch):
+            for name in batch:
+                repository.get_or_create_company(name)
+
+        db_manager.company_cache = CompanyResolutionCache(max_size=0)
+        run("uncached", db_manager, names, per_posting)
+
+        db_manager.company_cache = CompanyResolutionCache()
+        run("cached", db_manager, names, per_posting)
+
+        db_manager.company_cache = CompanyResolutionCache()
+        run(
+            "bulk (one pass)",
+            db_manager,
+            names,
+            lambda batch: repository.resolve_companies((name, None) for name in batch),
+        )
+        db_manager.engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+Benchmark fuzzy company name matching: full SequenceMatcher scan vs the
+trigram index.
+
+Queries are misspelled or re-suffixed variants of existing companies plus
+names that match nothing (the common case when ingesting new employers).
+
+Usage:
+    python benchmarks/bench_company_matching.py --companies 50000 --queries 200
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import insert  # noqa: E402
+
+from backend.data.company_matcher import (  # noqa: E402
+    company_name_index,
+    find_existing_company_by_name,
+    normalize_company_name,
+    similarity_score,
+)
+from backend.data.database import DatabaseManager  # noqa: E402
+from backend.data.models import CompanyInfoDB  # noqa: E402
+
+SYLLABLES = (
+    "ac ab al an ar bel bio cor dat del en fin gen glo hel in ka lo lu "
+    "ma mer nex no on or pa pro qua ra ri sol sys ta tek tri ux ver vi zen"
+).split()
+WORDS = "labs data cloud health energy logistics media capital robotics foods".split()
+SUFFIXES = ["Inc.", "LLC", "Ltd", "Corporation", "GmbH", ""]
+
+
+def company_name(rng: random.Random) -> str:
+    stem = "".join(rng.choices(SYLLABLES, k=rng.randint(2, 4))).capitalize()
+    if rng.random() < 0.5:
+        stem += " " + rng.choice(WORDS).capitalize()
+    return f"{stem} {rng.choice(SUFFIXES)}".strip()
+
+
+def misspell(name: str, rng: random.Random) -> str:
+    position = rng.randrange(len(name))
+    return name[:position] + rng.choice("aeiou") + name[position + 1 :]
+
+
+def legacy_find(session, name: str, threshold: float = 0.85):
+    """The pre-index fuzzy path, kept here as the baseline."""
+    normalized = normalize_company_name(name)
+    exact = (
+        session.query(CompanyInfoDB.id)
+        .filter(CompanyInfoDB.normalized_name == normalized)
+        .first()
+    )
+    if exact:
+        return exact.id
+    best, best_score = None, 0.0
+    for company_id, candidate in session.query(
+        CompanyInfoDB.id, CompanyInfoDB.normalized_name
+    ):
+        score = similarity_score(normalized, candidate)
+        if score > best_score and score >= threshold:
+            best, best_score = company_id, score
+    return best
+
+
+def timed(label, fn, queries):
+    samples, results = [], []
+    for query in queries:
+        start = time.perf_counter()
+        results.append(fn(query))
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    p95 = samples[max(int(len(samples) * 0.95) - 1, 0)]
+    print(
+        f"{label:<10} mean {statistics.mean(samples):8.2f} ms   "
+        f"p50 {statistics.median(samples):8.2f} ms   p95 {p95:8.2f} ms"
+    )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--companies", type=int, default=50000)
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        db_manager = DatabaseManager(f"sqlite:///{tmp}/companies.db")
+        names = {}
+        while len(names) < args.companies:
+            name = company_name(rng)
+            names.setdefault(normalize_company_name(name), name)
+        rows = [
+            {"id": str(uuid.uuid4()), "name": name, "normalized_name": normalized}
+            for normalized, name in names.items()
+        ]
+        with db_manager.engine.begin() as conn:
+            for start in range(0, len(rows), 5000):
+                conn.execute(insert(CompanyInfoDB), rows[start : start + 5000])
+
+        existing = [row["name"] for row in rng.sample(rows, args.queries // 2)]
+        queries = [misspell(name, rng) for name in existing] + [
+            company_name(rng) + " Partners" for _ in range(args.queries // 2)
+        ]
+
+        with db_manager.get_session() as session:
+            legacy = timed("scan", lambda q: legacy_find(session, q), queries)
+
+            start = time.perf_counter()
+            company_name_index(session).ensure_loaded(session)
+            print(
+                f"Loaded trigram index over {args.companies} companies "
+                f"in {time.perf_counter() - start:.2f}s"
+            )
+            indexed = timed(
+                "trigram",
+                lambda q: find_existing_company_by_name(session, q),
+                queries,
+            )
+
+        normalized_by_id = {row["id"]: row["normalized_name"] for row in rows}
+
+        def match_score(query, company_id):
+            if company_id is None:
+                return None
+            return similarity_score(
+                normalize_company_name(query), normalized_by_id[company_id]
+            )
+
+        # Equally similar companies are interchangeable; only ties may differ
+        agreement = sum(
+            match_score(query, a) == match_score(query, b)
+            for query, a, b in zip(queries, legacy, indexed, strict=True)
+        ) / len(queries)
+        print(f"Match as good as full scan: {agreement:.1%} of queries")
+        db_manager.engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+Benchmark job keyword search: legacy ILIKE scan vs FTS5 vs in-memory index.
+
+Usage:
+    python benchmarks/bench_job_search.py --jobs 50000 --queries 200
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import insert, or_  # noqa: E402
+
+from backend.data.database import DatabaseManager, JobRepository  # noqa: E402
+from backend.data.models import CompanyInfoDB, JobListingDB  # noqa: E402
+
+TITLES = [
+    "Python Engineer",
+    "Data Analyst",
+    "Frontend Developer",
+    "DevOps Engineer",
+    "Machine Learning Engineer",
+    "Product Manager",
+    "QA Automation Engineer",
+    "Site Reliability Engineer",
+]
+SENIORITY = ["Junior", "Mid-level", "Senior", "Staff", "Principal"]
+WORDS = (
+    "python sql react typescript kubernetes docker aws terraform spark "
+    "airflow pandas django fastapi golang rust java kotlin swift graphql "
+    "postgres redis kafka grafana linux security testing design mentoring"
+).split()
+# Filler vocabulary so keyword selectivity resembles real postings
+FILLER = [f"lorem{i}" for i in range(5000)]
+QUERIES = ["python", "senior engineer", "kubernetes", "react typescript", "data"]
+
+
+def seed(db_manager: DatabaseManager, jobs: int, rng: random.Random) -> None:
+    companies = [
+        {
+            "id": str(uuid.uuid4()),
+            "name": f"Company {i}",
+            "normalized_name": f"company {i}",
+        }
+        for i in range(max(jobs // 50, 1))
+    ]
+    rows = []
+    for i in range(jobs):
+        rows.append(
+            {
+                "id": str(uuid.uuid4()),
+                "title": f"{rng.choice(SENIORITY)} {rng.choice(TITLES)}",
+                "company_id": rng.choice(companies)["id"],
+                "description": " ".join(
+                    rng.sample(WORDS, 4) + rng.choices(FILLER, k=56)
+                ),
+                "requirements": " ".join(rng.sample(WORDS, 3)),
+                "status": "active",
+            }
+        )
+    with db_manager.engine.begin() as conn:
+        conn.execute(insert(CompanyInfoDB), companies)
+        for start in range(0, len(rows), 5000):
+            conn.execute(insert(JobListingDB), rows[start : start + 5000])
+
+
+def ilike_search(db_manager: DatabaseManager, query: str, limit: int) -> int:
+    """The pre-index search path, kept here as the baseline."""
+    pattern = f"%{query}%"
+    with db_manager.get_session() as session:
+        q = (
+            session.query(JobListingDB)
+            .join(CompanyInfoDB, JobListingDB.company_id == CompanyInfoDB.id)
+            .filter(
+                or_(
+                    JobListingDB.title.ilike(pattern),
+                    JobListingDB.description.ilike(pattern),
+                    JobListingDB.requirements.ilike(pattern),
+                    CompanyInfoDB.name.ilike(pattern),
+                )
+            )
+        )
+        total = q.count()
+        q.order_by(JobListingDB.created_at.desc()).limit(limit).all()
+        return total
+
+
+def timed(label, fn, queries, rounds):
+    samples = []
+    for _ in range(rounds):
+        for query in queries:
+            start = time.perf_counter()
+            fn(query)
+            samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    p95 = samples[int(len(samples) * 0.95) - 1]
+    print(
+        f"{label:<18} mean {statistics.mean(samples):8.2f} ms   "
+        f"p50 {statistics.median(samples):8.2f} ms   p95 {p95:8.2f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=20000)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    rounds = max(args.queries // len(QUERIES), 1)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_manager = DatabaseManager(f"sqlite:///{tmp}/bench.db")
+        start = time.perf_counter()
+        seed(db_manager, args.jobs, rng)
+        db_manager.search_index.rebuild()
+        print(
+            f"Seeded and indexed {args.jobs} jobs in {time.perf_counter() - start:.1f}s"
+        )
+
+        repo = JobRepository(db_manager)
+        index = db_manager.search_index
+
+        for query in QUERIES:
+            hits = ilike_search(db_manager, query, args.limit)
+            print(f"  {query!r}: {hits} matches")
+
+        timed(
+            "ilike",
+            lambda q: ilike_search(db_manager, q, args.limit),
+            QUERIES,
+            rounds,
+        )
+        if index.uses_fts5:
+            timed(
+                "fts5 (bm25)",
+                lambda q: repo.search_jobs(query=q, limit=args.limit),
+                QUERIES,
+                rounds,
+            )
+
+        index.uses_fts5 = False
+        start = time.perf_counter()
+        index.search("warmup")
+        print(f"In-memory index loaded in {time.perf_counter() - start:.1f}s")
+        timed(
+            "inverted index",
+            lambda q: repo.search_jobs(query=q, limit=args.limit),
+            QUERIES,
+            rounds,
+        )
+        db_manager.engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
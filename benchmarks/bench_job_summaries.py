@@ -0,0 +1,115 @@
+"""
+Benchmark summary projections against full rows for job list and search pages.
+
+Seeds --jobs postings with multi-KB descriptions, requirements and
+responsibilities plus JSON skill and benefit columns, then times pages of
+--limit jobs from JobRepository.search_jobs, as summaries and as full rows.
+Each result also reports the JSON response size of one page.
+
+Usage:
+    python benchmarks/bench_job_summaries.py --jobs 20000 --limit 50
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pydantic import TypeAdapter  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+
+from backend.data.database import DatabaseManager, JobRepository  # noqa: E402
+from backend.data.models import CompanyInfoDB, JobListingDB  # noqa: E402
+
+WORDS = ["python", "kubernetes", "react", "typescript", "data", "platform"]
+FILLER = [f"lorem{i}" for i in range(2000)]
+
+
+def paragraph(rng: random.Random, words: int) -> str:
+    return " ".join(rng.sample(WORDS, 2) + rng.choices(FILLER, k=words))
+
+
+def seed(db_manager: DatabaseManager, jobs: int, rng: random.Random) -> None:
+    companies = [
+        {"id": str(uuid.uuid4()), "name": f"Company {i}", "normalized_name": f"c{i}"}
+        for i in range(max(jobs // 50, 1))
+    ]
+    rows = [
+        {
+            "id": str(uuid.uuid4()),
+            "title": f"Engineer {i}",
+            "company_id": rng.choice(companies)["id"],
+            "location": "Remote",
+            "salary_min": 90000.0,
+            "salary_max": 150000.0,
+            "description": paragraph(rng, 400),
+            "requirements": paragraph(rng, 120),
+            "responsibilities": paragraph(rng, 120),
+            "skills_required": rng.sample(FILLER, 12),
+            "skills_preferred": rng.sample(FILLER, 8),
+            "benefits": rng.sample(FILLER, 10),
+            "tech_stack": rng.sample(FILLER, 10),
+            "benefits_parsed": {"health": True, "pto_days": 25, "equity": "0.1%"},
+            "status": "active",
+        }
+        for i in range(jobs)
+    ]
+    with db_manager.engine.begin() as conn:
+        conn.execute(insert(CompanyInfoDB), companies)
+        for start in range(0, len(rows), 2000):
+            conn.execute(insert(JobListingDB), rows[start : start + 2000])
+
+
+def timed(fn, rounds: int):
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=20000)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_manager = DatabaseManager(f"sqlite:///{tmp}/summaries.db")
+        seed(db_manager, args.jobs, random.Random(42))
+        db_manager.search_index.rebuild()
+        repo = JobRepository(db_manager)
+
+        pages = {
+            "listing": dict(limit=args.limit, include_total=False),
+            "text search": dict(query="python", limit=args.limit, include_total=False),
+        }
+        print(f"{args.jobs} jobs, pages of {args.limit}, best of {args.rounds}:")
+        for label, kwargs in pages.items():
+            for summary in (False, True):
+                ms, (jobs, _) = timed(
+                    lambda summary=summary, kwargs=kwargs: repo.search_jobs(
+                        summary=summary, **kwargs
+                    ),
+                    args.rounds,
+                )
+                response = TypeAdapter(List[type(jobs[0])]).dump_json(jobs)
+                kind = "summary" if summary else "full"
+                print(
+                    f"  {label:12} {kind:8} {ms:7.2f} ms/page  "
+                    f"{len(response) / 1024:8.1f} KiB JSON"
+                )
+
+        db_manager.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Benchmark converting job rows into JobListing models.
+
+Seeds --rows jobs, then times loading and converting all of them:
+
+- legacy: ORM objects, the old column walk, then ``.dict()`` and a second
+  JobListing build to attach the company name (what search used to do)
+- plan, ORM objects: conversion plan over ORM objects, validated
+- plan, Core rows: plan columns plus the company name as Core rows,
+  validated in bulk and then built with ``model_construct``
+
+Usage:
+    python benchmarks/bench_model_conversion.py --rows 10000
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bench_job_search import seed  # noqa: E402
+
+from backend.data.conversion import (  # noqa: E402
+    DEFAULTED_COLUMNS,
+    EMPTY_DICT_COLUMNS,
+    EMPTY_LIST_COLUMNS,
+    conversion_plan,
+)
+from backend.data.database import DatabaseManager  # noqa: E402
+from backend.data.models import CompanyInfoDB, JobListing, JobListingDB  # noqa: E402
+
+
+def legacy_to_pydantic(sqlalchemy_obj, pydantic_class):
+    """The per-row column walk that conversion plans replaced."""
+    data = {}
+    for column in sqlalchemy_obj.__table__.columns:
+        value = getattr(sqlalchemy_obj, column.name)
+        if value is None and column.name in EMPTY_LIST_COLUMNS:
+            value = []
+        elif value is None and column.name in EMPTY_DICT_COLUMNS:
+            value = {}
+        elif value is None and column.name in DEFAULTED_COLUMNS:
+            continue
+        data[column.name] = value
+    return pydantic_class(**data)
+
+
+def legacy(session):
+    jobs = []
+    for job_db in session.query(JobListingDB).join(CompanyInfoDB).all():
+        job_dict = legacy_to_pydantic(job_db, JobListing).dict()
+        job_dict["company_name"] = job_db.company.name
+        jobs.append(JobListing(**job_dict))
+    return jobs
+
+
+def plan_objects(session):
+    plan = conversion_plan(JobListingDB, JobListing)
+    return plan.from_objects(session.query(JobListingDB).all())
+
+
+def plan_rows(session, validate):
+    plan = conversion_plan(JobListingDB, JobListing)
+    rows = (
+        session.query(*plan.columns, CompanyInfoDB.name.label("company_name"))
+        .join(CompanyInfoDB)
+        .all()
+    )
+    return plan.from_rows(rows, validate=validate)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_manager = DatabaseManager(f"sqlite:///{tmp}/conversion.db")
+        seed(db_manager, args.rows, random.Random(42))
+
+        cases = {
+            "legacy (double build)": legacy,
+            "plan, ORM objects": plan_objects,
+            "plan, Core rows, validated": lambda s: plan_rows(s, True),
+            "plan, Core rows, constructed": lambda s: plan_rows(s, False),
+        }
+        print(f"{args.rows} jobs, best of {args.rounds} rounds (load + convert):")
+        for label, convert in cases.items():
+            best = float("inf")
+            for _ in range(args.rounds):
+                # Fresh session per round so nothing comes from the identity map
+                with db_manager.get_session() as session:
+                    started = time.perf_counter()
+                    jobs = convert(session)
+                    best = min(best, time.perf_counter() - started)
+            per_row = best / len(jobs) * 1e6
+            print(f"  {label:30} {best * 1000:8.1f} ms  {per_row:6.1f} us/row")
+
+        db_manager.close()
+
+
+if __name__ == "__main__":
+    main()
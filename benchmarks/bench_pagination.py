@@ -0,0 +1,89 @@
+"""
+Benchmark offset against keyset (cursor) pagination of UserRepository.list_users.
+
+Fills --rows user profiles, then times fetching page 1 and page --page of
+--limit rows both ways. Offset pages also count the total, as before; cursor
+pages skip the count.
+
+Usage:
+    python benchmarks/bench_pagination.py --rows 100000 --page 500
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from uuid import uuid4
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import insert  # noqa: E402
+
+from backend.data.database import DatabaseManager, UserRepository  # noqa: E402
+from backend.data.models import UserProfileDB  # noqa: E402
+from backend.data.pagination import next_cursor  # noqa: E402
+
+
+def timed(fn, repeat=20):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return (time.perf_counter() - started) / repeat * 1000, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--page", type=int, default=500)
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_manager = DatabaseManager(f"sqlite:///{tmp}/pages.db")
+        base = datetime(2024, 1, 1)
+        with db_manager.get_session() as session:
+            session.execute(
+                insert(UserProfileDB),
+                [
+                    {
+                        "id": str(uuid4()),
+                        "email": f"user{n}@example.com",
+                        "created_at": base + timedelta(seconds=n),
+                    }
+                    for n in range(args.rows)
+                ],
+            )
+        users = UserRepository(db_manager)
+        limit = args.limit
+        deep_offset = (args.page - 1) * limit
+
+        # Walk to the deep page once to get its cursor
+        cursor = None
+        for _ in range(args.page - 1):
+            page, _ = users.list_users(limit=limit, after=cursor, include_total=False)
+            cursor = next_cursor(page, limit, "created_at")
+
+        results = {
+            "offset page 1": lambda: users.list_users(limit=limit),
+            f"offset page {args.page}": lambda: users.list_users(
+                limit=limit, offset=deep_offset
+            ),
+            "cursor page 1": lambda: users.list_users(limit=limit, include_total=False),
+            f"cursor page {args.page}": lambda: users.list_users(
+                limit=limit, after=cursor, include_total=False
+            ),
+        }
+        pages = {}
+        for label, fn in results.items():
+            ms, (page, _) = timed(fn)
+            pages[label] = [user.id for user in page]
+            print(f"{label:<18} {ms:8.2f}ms")
+
+        assert pages[f"offset page {args.page}"] == pages[f"cursor page {args.page}"]
+        db_manager.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Benchmark re-ingesting a job feed where only a few postings changed: the
+first run writes every posting, the re-scrape only rewrites changed ones and
+touches ``last_verified`` on the rest.
+
+Usage:
+    python benchmarks/bench_reingest.py --postings 20000 --changed 0.05
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import tempfile
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backend.data.database import DatabaseManager  # noqa: E402
+from backend.data.models import JobSourceDB  # noqa: E402
+from backend.services.job_ingestion_service import JobIngestionPipeline  # noqa: E402
+
+TITLES = ["Python Engineer", "Data Analyst", "DevOps Engineer", "Product Manager"]
+
+
+def make_feed(count, seed=0):
+    rng = random.Random(seed)
+    return [
+        {
+            "id": f"p-{i}",
+            "title": f"{rng.choice(TITLES)} {i}",
+            "company": f"Company {rng.randrange(500)}",
+            "url": f"https://board.example.com/jobs/{i}",
+            "description": "Build and run data pipelines for our platform. " * 4,
+            "salary_min": rng.randrange(50, 200) * 1000,
+            "skills": ["python", "sql"],
+        }
+        for i in range(count)
+    ]
+
+
+async def stream(postings):
+    for posting in postings:
+        yield posting
+
+
+def report_line(label, report):
+    print(
+        f"{label:<12} {report.elapsed_seconds:7.2f}s "
+        f"{report.postings_per_second:>9,.0f} postings/s  "
+        f"inserted={report.inserted} updated={report.updated} "
+        f"unchanged={report.unchanged}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--postings", type=int, default=20000)
+    parser.add_argument("--changed", type=float, default=0.05)
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    feed = make_feed(args.postings)
+    rng = random.Random(1)
+    rescrape = [
+        (
+            {**posting, "title": posting["title"] + " (updated)"}
+            if rng.random() < args.changed
+            else posting
+        )
+        for posting in feed
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_manager = DatabaseManager(f"sqlite:///{tmp}/reingest.db")
+        with db_manager.get_session() as session:
+            session.add(
+                JobSourceDB(
+                    id=str(uuid.uuid4()),
+                    name="board",
+                    display_name="Board",
+                    base_url="https://board.example.com",
+                )
+            )
+        pipeline = JobIngestionPipeline(db_manager, batch_size=args.batch_size)
+
+        report_line("initial", asyncio.run(pipeline.ingest("board", stream(feed))))
+        report_line(
+            "re-scrape", asyncio.run(pipeline.ingest("board", stream(rescrape)))
+        )
+        db_manager.engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmark JobRepository.search_jobs with each count strategy.
+
+Seeds --jobs listings like bench_job_search.py and runs its queries
+(FTS5 ranked) plus an unfiltered listing, counting totals exactly, capped at
+--cap, and cached (repeated searches hit the cache).
+
+Usage:
+    python benchmarks/bench_search_count.py --jobs 50000 --queries 100
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bench_job_search import QUERIES, seed, timed  # noqa: E402
+
+from backend.data.count_cache import COUNT_STRATEGIES  # noqa: E402
+from backend.data.database import DatabaseManager, JobRepository  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=20000)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--cap", type=int, default=1000)
+    args = parser.parse_args()
+
+    rounds = max(args.queries // len(QUERIES), 1)
+    with tempfile.TemporaryDirectory() as tmp:
+        db_manager = DatabaseManager(f"sqlite:///{tmp}/bench.db")
+        seed(db_manager, args.jobs, random.Random(42))
+        db_manager.search_index.rebuild()
+        db_manager.count_cache.cap = args.cap
+        repo = JobRepository(db_manager)
+
+        for label, queries in (("text", QUERIES), ("listing", [None])):
+            print(f"{label} searches:")
+            for strategy in COUNT_STRATEGIES:
+                timed(
+                    f"  {strategy}",
+                    lambda q, strategy=strategy: repo.search_jobs(
+                        query=q, limit=args.limit, count_strategy=strategy
+                    ),
+                    queries,
+                    rounds,
+                )
+            totals = {
+                strategy: repo.search_jobs(
+                    query=queries[0], limit=args.limit, count_strategy=strategy
+                )[1].display
+                for strategy in COUNT_STRATEGIES
+            }
+            print(f"  totals for {queries[0]!r}: {totals}")
+
+        print(f"cache: {db_manager.count_cache.stats()}")
+        db_manager.close()
+
+
+if __name__ == "__main__":
+    main()
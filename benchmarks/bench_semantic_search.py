@@ -0,0 +1,159 @@
+"""
+Benchmark semantic top-k search over a synthetic embedding matrix.
+
+Compares exact blocked cosine search, filtered search (pre-filter mask) and
+the IVF index. The matrix is memory-mapped from a temporary .npy file, as the
+sidecar cache is in production.
+
+Usage:
+    python benchmarks/bench_semantic_search.py --vectors 1000000 --queries 50
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import create_engine  # noqa: E402
+
+from backend.data.vector_index import (  # noqa: E402
+    BLOCK_ROWS,
+    EMBEDDING_DIMENSION,
+    IVFIndex,
+    JobVectorIndex,
+    _IndexState,
+)
+
+
+def synthetic_matrix(path: str, size: int, clusters: int, rng) -> np.ndarray:
+    """Clustered unit vectors, written block by block to a .npy file."""
+    centers = rng.standard_normal((clusters, EMBEDDING_DIMENSION)).astype(np.float32)
+    matrix = np.lib.format.open_memmap(
+        path, mode="w+", dtype=np.float32, shape=(size, EMBEDDING_DIMENSION)
+    )
+    for start in range(0, size, BLOCK_ROWS):
+        stop = min(start + BLOCK_ROWS, size)
+        block = centers[rng.integers(0, clusters, stop - start)]
+        block += 0.6 * rng.standard_normal(block.shape).astype(np.float32)
+        block /= np.linalg.norm(block, axis=1, keepdims=True)
+        matrix[start:stop] = block
+    matrix.flush()
+    del matrix
+    return np.load(path, mmap_mode="r")
+
+
+def timed(label, fn, queries):
+    fn(queries[0])  # warm the page cache
+    samples = []
+    for query in queries:
+        start = time.perf_counter()
+        fn(query)
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    p95 = samples[max(int(len(samples) * 0.95) - 1, 0)]
+    print(
+        f"{label:<22} mean {statistics.mean(samples):8.2f} ms   "
+        f"p50 {statistics.median(samples):8.2f} ms   p95 {p95:8.2f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--vectors", type=int, default=200000)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    engine = create_engine("sqlite://")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        matrix = synthetic_matrix(
+            os.path.join(tmp, "embeddings.npy"), args.vectors, 1000, rng
+        )
+        print(f"Generated {args.vectors} vectors in {time.perf_counter() - start:.1f}s")
+
+        job_ids = [f"job-{row}" for row in range(args.vectors)]
+        attributes = {
+            "job_type": rng.integers(0, 6, args.vectors).astype(np.int8),
+            "remote_type": rng.integers(0, 3, args.vectors).astype(np.int8),
+            "experience_level": rng.integers(0, 6, args.vectors).astype(np.int8),
+            "salary_min": rng.uniform(40000, 200000, args.vectors),
+            "salary_max": rng.uniform(40000, 200000, args.vectors),
+        }
+        queries = np.asarray(matrix[rng.choice(args.vectors, args.queries)])
+        queries = queries + 0.1 * rng.standard_normal(queries.shape).astype(np.float32)
+        queries /= np.linalg.norm(queries, axis=1, keepdims=True)
+
+        # States are passed explicitly, so the index never touches the database
+        index = JobVectorIndex(engine)
+        state = _IndexState(job_ids, matrix, attributes, signature=None)
+
+        query_list = list(queries)
+        exact_hits = []
+        timed(
+            "exact",
+            lambda q: exact_hits.append(
+                index.search_vectors(q[None, :], args.limit, state=state)[0]
+            ),
+            query_list,
+        )
+
+        mask = JobVectorIndex._filter_mask(
+            state, None, ["Remote"], None, 120000, None, None
+        )
+        print(f"  filter keeps {int(mask.sum())} of {args.vectors} rows")
+        timed(
+            "exact + filter",
+            lambda q: index.search_vectors(q[None, :], args.limit, mask, state),
+            query_list,
+        )
+
+        start = time.perf_counter()
+        ivf = IVFIndex.build(matrix)
+        clustered = ivf.reorder(matrix, os.path.join(tmp, "clustered.npy"))
+        print(
+            f"Built IVF with {ivf.n_lists} lists in "
+            f"{time.perf_counter() - start:.1f}s"
+        )
+        ivf_state = _IndexState(
+            [job_ids[row] for row in ivf.order],
+            clustered,
+            {name: values[ivf.order] for name, values in attributes.items()},
+            signature=None,
+            ivf=ivf,
+        )
+        ivf_mask = mask[ivf.order]
+
+        ivf_hits = []
+        timed(
+            "ivf",
+            lambda q: ivf_hits.append(
+                index.search_vectors(q[None, :], args.limit, state=ivf_state)[0]
+            ),
+            query_list,
+        )
+        timed(
+            "ivf + filter",
+            lambda q: index.search_vectors(q[None, :], args.limit, ivf_mask, ivf_state),
+            query_list,
+        )
+
+        # Both lists start with the warm-up query, so they line up
+        recall = [
+            len({j for j, _ in approx} & {j for j, _ in exact}) / args.limit
+            for approx, exact in zip(ivf_hits, exact_hits, strict=True)
+        ]
+        print(f"IVF recall@{args.limit}: {statistics.mean(recall):.3f}")
+
+
+if __name__ == "__main__":
+    main()
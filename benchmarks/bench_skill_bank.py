@@ -0,0 +1,208 @@
+"""
+Benchmark single-skill writes on large skill banks: whole-document JSON
+rewrites (the previous storage) against one row per skill.
+
+Seeds a skill bank of --skills skills both ways, then times adding, updating
+and deleting one skill. The whole-document path does what the repository
+used to do: load the skills JSON, build every EnhancedSkill, change one and
+serialize the full category map back. It stores the skills section only; the
+old code also parsed and rewrote every other section, so its real cost was
+higher. Row writes go through the repository, so their times include the
+write queue round trip. Each result also reports the bytes written per
+operation.
+
+Usage:
+    python benchmarks/bench_skill_bank.py --skills 500 --rounds 50
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import (  # noqa: E402
+    JSON,
+    Column,
+    MetaData,
+    String,
+    Table,
+    event,
+    select,
+    update,
+)
+
+from backend.data.database import DatabaseManager  # noqa: E402
+from backend.data.skill_bank_models import EnhancedSkill  # noqa: E402
+from backend.data.skill_bank_repository import SkillBankRepository  # noqa: E402
+
+CATEGORIES = ["technical", "soft", "language", "tool", "domain"]
+
+metadata = MetaData()
+legacy_banks = Table(
+    "legacy_skill_banks",
+    metadata,
+    Column("user_id", String, primary_key=True),
+    Column("skills", JSON),
+)
+
+
+def make_skills(count: int):
+    return [
+        EnhancedSkill(
+            name=f"Skill {i}",
+            category=CATEGORIES[i % len(CATEGORIES)],
+            description=f"Used skill {i} across several production systems",
+            keywords=[f"keyword-{i}-{k}" for k in range(5)],
+        )
+        for i in range(count)
+    ]
+
+
+class LegacyStore:
+    """The skills section stored as one JSON document per skill bank."""
+
+    def __init__(self, engine):
+        self.engine = engine
+        metadata.create_all(engine)
+
+    def seed(self, user_id, skills):
+        document = {}
+        for skill in skills:
+            document.setdefault(skill.category.value, []).append(
+                skill.model_dump(mode="json")
+            )
+        with self.engine.begin() as conn:
+            conn.execute(
+                legacy_banks.insert().values(
+                    user_id=user_id, skills=json.dumps(document)
+                )
+            )
+
+    def _rewrite(self, user_id, change):
+        with self.engine.begin() as conn:
+            stored = conn.execute(
+                select(legacy_banks.c.skills).where(legacy_banks.c.user_id == user_id)
+            ).scalar_one()
+            skills = {
+                category: [EnhancedSkill(**data) for data in items]
+                for category, items in json.loads(stored).items()
+            }
+            change(skills)
+            document = {
+                category: [skill.model_dump(mode="json") for skill in items]
+                for category, items in skills.items()
+            }
+            conn.execute(
+                update(legacy_banks)
+                .where(legacy_banks.c.user_id == user_id)
+                .values(skills=json.dumps(document))
+            )
+
+    def add(self, user_id, skill):
+        self._rewrite(
+            user_id,
+            lambda skills: skills.setdefault(skill.category.value, []).append(skill),
+        )
+
+    def update(self, user_id, skill_id, updates):
+        def change(skills):
+            for items in skills.values():
+                for skill in items:
+                    if skill.id == skill_id:
+                        for field, value in updates.items():
+                            setattr(skill, field, value)
+
+        self._rewrite(user_id, change)
+
+    def delete(self, user_id, skill_id):
+        def change(skills):
+            for items in skills.values():
+                items[:] = [skill for skill in items if skill.id != skill_id]
+
+        self._rewrite(user_id, change)
+
+
+class BytesWritten:
+    """Sum of the parameter sizes of INSERT/UPDATE statements."""
+
+    def __init__(self, engine):
+        self.total = 0
+        event.listen(engine, "before_cursor_execute", self._record)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(("INSERT", "UPDATE")):
+            self.total += len(str(parameters))
+
+
+def timed(operation, rounds, written):
+    best = float("inf")
+    written.total = 0
+    for i in range(rounds):
+        started = time.perf_counter()
+        operation(i)
+        best = min(best, time.perf_counter() - started)
+    return best * 1000, written.total / rounds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--skills", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_manager = DatabaseManager(f"sqlite:///{tmp}/skill_bank.db")
+        written = BytesWritten(db_manager.engine)
+        repository = SkillBankRepository(db_manager)
+        legacy = LegacyStore(db_manager.engine)
+
+        asyncio.run(repository.update_skill_bank("rows", {"skills": {}}))
+        asyncio.run(repository.add_skills("rows", make_skills(args.skills)))
+        legacy.seed("document", make_skills(args.skills))
+
+        extra = {
+            "document": [EnhancedSkill(name=f"New {i}") for i in range(args.rounds)],
+            "rows": [EnhancedSkill(name=f"New {i}") for i in range(args.rounds)],
+        }
+        ops = {
+            "document": {
+                "add": lambda i: legacy.add("document", extra["document"][i]),
+                "update": lambda i: legacy.update(
+                    "document", extra["document"][i].id, {"usage_count": 1}
+                ),
+                "delete": lambda i: legacy.delete("document", extra["document"][i].id),
+            },
+            "rows": {
+                "add": lambda i: asyncio.run(
+                    repository.add_skill("rows", extra["rows"][i])
+                ),
+                "update": lambda i: asyncio.run(
+                    repository.update_skill(
+                        "rows", extra["rows"][i].id, {"usage_count": 1}
+                    )
+                ),
+                "delete": lambda i: asyncio.run(
+                    repository.delete_skill("rows", extra["rows"][i].id)
+                ),
+            },
+        }
+
+        print(f"Skill bank of {args.skills} skills, best of {args.rounds}:")
+        for operation in ("add", "update", "delete"):
+            for storage in ("document", "rows"):
+                ms, size = timed(ops[storage][operation], args.rounds, written)
+                print(
+                    f"  {operation:7} {storage:9} {ms:8.2f} ms  "
+                    f"{size / 1024:8.1f} KiB written"
+                )
+
+        db_manager.close()
+
+
+if __name__ == "__main__":
+    main()
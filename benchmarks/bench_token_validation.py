@@ -0,0 +1,71 @@
+"""
+Microbenchmark the per-request cost of authenticating with a bearer token.
+
+Compares validate_token with the token cache disabled (JWT decode, signature
+check and token version lookup on every request) against the cached path,
+for --tokens distinct clients each making --requests requests. The previous
+decode-only validation is shown for reference.
+
+Usage:
+    python benchmarks/bench_token_validation.py --tokens 100 --requests 200
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import jwt  # noqa: E402
+
+import backend.api.auth as auth  # noqa: E402
+from backend.api.token_cache import TokenValidationCache  # noqa: E402
+from backend.data.database import DatabaseManager, UserRepository  # noqa: E402
+from backend.data.models import UserProfileDB  # noqa: E402
+
+
+def decode_only(token):
+    return jwt.decode(token, auth.SECRET_KEY, algorithms=[auth.ALGORITHM])["sub"]
+
+
+def measure(label, validate, tokens, requests):
+    started = time.perf_counter()
+    for _ in range(requests):
+        for token in tokens:
+            validate(token)
+    elapsed = time.perf_counter() - started
+    calls = requests * len(tokens)
+    print(f"{label:<22} {elapsed / calls * 1e6:8.1f} us/request")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tokens", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_manager = DatabaseManager(f"sqlite:///{tmp}/tokens.db")
+        repository = UserRepository(db_manager)
+        tokens = []
+        with db_manager.get_session() as session:
+            for _ in range(args.tokens):
+                user_id = str(uuid.uuid4())
+                session.add(UserProfileDB(id=user_id, is_active=True))
+                tokens.append(auth.create_access_token({"sub": user_id, "ver": 0}))
+        auth.get_user_repository = lambda: repository
+
+        measure("decode only (before)", decode_only, tokens, args.requests)
+        auth.token_cache = TokenValidationCache(max_size=0)
+        measure("uncached", auth.validate_token, tokens, args.requests)
+        auth.token_cache = TokenValidationCache()
+        measure("cached", auth.validate_token, tokens, args.requests)
+        print(f"cache stats: {auth.token_cache.stats()}")
+        db_manager.close()
+
+
+if __name__ == "__main__":
+    main()
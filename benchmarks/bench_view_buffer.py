@@ -0,0 +1,98 @@
+"""
+Benchmark recording job views on SQLite one write per view (through the
+write queue) and through the view counter buffer, which flushes all pending
+counts as one upsert.
+
+--threads workers, like the database executor under load, each record
+--views views spread over --jobs jobs for their own user.
+
+Usage:
+    python benchmarks/bench_view_buffer.py --threads 15 --views 200
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backend.data.database import DatabaseManager  # noqa: E402
+from backend.data.interaction_repository import (  # noqa: E402
+    JobUserInteractionRepository,
+)
+from backend.data.view_buffer import ViewCounterBuffer  # noqa: E402
+
+
+def run(label, database_url, durability, threads, views, jobs):
+    db_manager = DatabaseManager(database_url)
+    view_buffer = None
+    if durability is not None:
+        view_buffer = ViewCounterBuffer(
+            db_manager, durability=durability, flush_interval_seconds=0.05
+        )
+    repository = JobUserInteractionRepository(db_manager, view_buffer=view_buffer)
+    latencies = []
+    lock = threading.Lock()
+
+    def worker(index):
+        user_id = f"user-{index}"
+        for i in range(views):
+            started = time.perf_counter()
+            repository.record_job_view(user_id, f"job-{i % jobs}")
+            with lock:
+                latencies.append(time.perf_counter() - started)
+
+    workers = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    started = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    if view_buffer is not None:
+        view_buffer.close()
+    elapsed = time.perf_counter() - started
+
+    total = sum(
+        view.interaction_count
+        for n in range(threads)
+        for view in repository.get_user_interactions(f"user-{n}")
+    )
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(
+        f"{label:<10} {len(latencies) / elapsed:10,.0f} views/s  "
+        f"p50 {statistics.median(latencies) * 1000:7.3f}ms  "
+        f"p95 {p95 * 1000:7.3f}ms  stored {total}"
+    )
+    db_manager.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--threads", type=int, default=15)
+    parser.add_argument("--views", type=int, default=200)
+    parser.add_argument("--jobs", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, durability in (
+            ("per-view", None),
+            ("sync", "sync"),
+            ("buffered", "buffered"),
+        ):
+            run(
+                label,
+                f"sqlite:///{tmp}/{label}.db",
+                durability,
+                args.threads,
+                args.views,
+                args.jobs,
+            )
+
+
+if __name__ == "__main__":
+    main()
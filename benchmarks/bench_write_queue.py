@@ -0,0 +1,100 @@
+"""
+Benchmark concurrent interaction writes on SQLite with one transaction per
+write (write_batch_size=0, the previous behaviour) and with the group-commit
+write queue.
+
+--threads workers, like the database executor under load, each record
+--writes job views and saves for their own user.
+
+Usage:
+    python benchmarks/bench_write_queue.py --threads 15 --writes 200
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backend.data.database import DatabaseManager  # noqa: E402
+from backend.data.engine import EngineProfile  # noqa: E402
+from backend.data.interaction_repository import (  # noqa: E402
+    JobUserInteractionRepository,
+)
+
+
+def run(label, database_url, profile, threads, writes):
+    db_manager = DatabaseManager(database_url, engine_profile=profile)
+    repository = JobUserInteractionRepository(db_manager)
+    latencies = []
+    errors = []
+    lock = threading.Lock()
+
+    def worker(index):
+        user_id = f"user-{index}"
+        for i in range(writes):
+            started = time.perf_counter()
+            try:
+                if i % 4 == 3:
+                    repository.save_job(user_id, f"job-{i % 50}")
+                else:
+                    repository.record_job_view(user_id, f"job-{i % 50}")
+            except Exception as e:
+                with lock:
+                    errors.append(e)
+                continue
+            with lock:
+                latencies.append(time.perf_counter() - started)
+
+    workers = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    started = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    batches = ""
+    if db_manager.write_queue is not None:
+        batches = f"  mean batch {db_manager.write_queue.stats()['mean_batch']}"
+    print(
+        f"{label:<12} {len(latencies) / elapsed:8,.0f} writes/s  "
+        f"p50 {statistics.median(latencies) * 1000:6.1f}ms  "
+        f"p95 {p95 * 1000:6.1f}ms  errors {len(errors)}{batches}"
+    )
+    db_manager.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--threads", type=int, default=15)
+    parser.add_argument("--writes", type=int, default=200)
+    parser.add_argument(
+        "--synchronous",
+        default="NORMAL",
+        help="SQLite synchronous pragma (FULL makes every commit fsync)",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, batch_size in (("per-write", 0), ("group commit", 256)):
+            profile = EngineProfile(
+                sqlite_synchronous=args.synchronous, write_batch_size=batch_size
+            )
+            run(
+                label,
+                f"sqlite:///{tmp}/{batch_size}.db",
+                profile,
+                args.threads,
+                args.writes,
+            )
+
+
+if __name__ == "__main__":
+    main()
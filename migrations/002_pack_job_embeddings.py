@@ -0,0 +1,172 @@
+"""
+Migration script to store job embeddings as packed binary vectors.
+
+Replaces the JSON ``embedding_vector`` column of job_embeddings with
+``embedding_data`` (little-endian float32/float16/int8 bytes),
+``embedding_dtype`` and ``embedding_scale``. Existing rows are converted in
+batches. On SQLite the database is vacuumed afterwards to reclaim the space
+and the job search index is rebuilt, since VACUUM may renumber rowids.
+"""
+
+import json
+
+from sqlalchemy import inspect, text
+
+from backend.data.embedding_codec import (
+    EMBEDDING_DTYPES,
+    FLOAT32,
+    embedding_to_list,
+    encode_embedding,
+)
+
+BATCH_SIZE = 1000
+
+
+def _columns(engine):
+    return {column["name"] for column in inspect(engine).get_columns("job_embeddings")}
+
+
+def _vacuum(engine):
+    """Reclaim freed pages on SQLite and resync rowid-keyed search index."""
+    if engine.dialect.name != "sqlite":
+        return
+
+    from backend.data.search_index import JobSearchIndex
+
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("VACUUM"))
+
+    search_index = JobSearchIndex(engine)
+    search_index.ensure_schema()
+    search_index.rebuild()
+
+
+def upgrade(engine, dtype=FLOAT32):
+    """Convert JSON embedding vectors to packed binary vectors."""
+    if dtype not in EMBEDDING_DTYPES:
+        raise ValueError(f"Unsupported embedding dtype: {dtype}")
+
+    columns = _columns(engine)
+    if "embedding_vector" not in columns:
+        print("job_embeddings already uses packed binary vectors")
+        return
+
+    try:
+        with engine.begin() as conn:
+            if "embedding_data" not in columns:
+                conn.execute(
+                    text("ALTER TABLE job_embeddings ADD COLUMN embedding_data BLOB")
+                )
+                conn.execute(
+                    text(
+                        "ALTER TABLE job_embeddings ADD COLUMN embedding_dtype "
+                        "VARCHAR NOT NULL DEFAULT 'float32'"
+                    )
+                )
+                conn.execute(
+                    text("ALTER TABLE job_embeddings ADD COLUMN embedding_scale FLOAT")
+                )
+
+            converted = 0
+            while True:
+                rows = conn.execute(
+                    text(
+                        "SELECT id, embedding_vector FROM job_embeddings "
+                        "WHERE embedding_data IS NULL LIMIT :limit"
+                    ),
+                    {"limit": BATCH_SIZE},
+                ).all()
+                if not rows:
+                    break
+
+                updates = []
+                for embedding_id, vector in rows:
+                    if isinstance(vector, str):
+                        vector = json.loads(vector)
+                    data, scale = encode_embedding(vector or [], dtype)
+                    updates.append(
+                        {
+                            "id": embedding_id,
+                            "data": data,
+                            "dtype": dtype,
+                            "scale": scale,
+                        }
+                    )
+                conn.execute(
+                    text(
+                        "UPDATE job_embeddings SET embedding_data = :data, "
+                        "embedding_dtype = :dtype, embedding_scale = :scale "
+                        "WHERE id = :id"
+                    ),
+                    updates,
+                )
+                converted += len(updates)
+
+            conn.execute(text("ALTER TABLE job_embeddings DROP COLUMN embedding_vector"))
+
+        print(f"Successfully packed {converted} job embeddings as {dtype}")
+
+    except Exception as e:
+        print(f"Error during migration: {e}")
+        raise
+
+    _vacuum(engine)
+
+
+def downgrade(engine):
+    """Restore JSON embedding vectors from the packed binary vectors."""
+    columns = _columns(engine)
+    if "embedding_data" not in columns:
+        print("job_embeddings already uses JSON vectors")
+        return
+
+    try:
+        with engine.begin() as conn:
+            if "embedding_vector" not in columns:
+                conn.execute(
+                    text("ALTER TABLE job_embeddings ADD COLUMN embedding_vector JSON")
+                )
+
+            rows = conn.execute(
+                text(
+                    "SELECT id, embedding_data, embedding_dtype, embedding_scale "
+                    "FROM job_embeddings"
+                )
+            ).all()
+            for start in range(0, len(rows), BATCH_SIZE):
+                conn.execute(
+                    text(
+                        "UPDATE job_embeddings SET embedding_vector = :vector "
+                        "WHERE id = :id"
+                    ),
+                    [
+                        {
+                            "id": embedding_id,
+                            "vector": json.dumps(
+                                embedding_to_list(data, dtype or FLOAT32, scale)
+                            ),
+                        }
+                        for embedding_id, data, dtype, scale in rows[
+                            start : start + BATCH_SIZE
+                        ]
+                    ],
+                )
+
+            for column in ("embedding_data", "embedding_dtype", "embedding_scale"):
+                conn.execute(text(f"ALTER TABLE job_embeddings DROP COLUMN {column}"))
+
+        print(f"Successfully restored {len(rows)} job embeddings to JSON")
+
+    except Exception as e:
+        print(f"Error during downgrade: {e}")
+        raise
+
+    _vacuum(engine)
+
+
+if __name__ == "__main__":
+    from backend.data.models import create_database_engine
+
+    # Run upgrade migration
+    engine = create_database_engine()
+    upgrade(engine)
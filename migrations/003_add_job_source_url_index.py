@@ -0,0 +1,56 @@
+"""
+Migration script to index job listings by (source, job_url).
+
+Bulk loads that upsert on ``(source, job_url)`` look up existing listings a
+chunk at a time; without this index every chunk scans job_listings.
+"""
+
+from sqlalchemy import inspect, text
+
+INDEX_NAME = "idx_job_source_url"
+
+
+def _indexes(engine):
+    return {index["name"] for index in inspect(engine).get_indexes("job_listings")}
+
+
+def upgrade(engine):
+    """Create the (source, job_url) index on job_listings."""
+    if INDEX_NAME in _indexes(engine):
+        print(f"{INDEX_NAME} already exists")
+        return
+
+    try:
+        with engine.begin() as conn:
+            conn.execute(
+                text(f"CREATE INDEX {INDEX_NAME} ON job_listings (source, job_url)")
+            )
+        print(f"Successfully created {INDEX_NAME}")
+
+    except Exception as e:
+        print(f"Error during migration: {e}")
+        raise
+
+
+def downgrade(engine):
+    """Drop the (source, job_url) index."""
+    if INDEX_NAME not in _indexes(engine):
+        print(f"{INDEX_NAME} does not exist")
+        return
+
+    try:
+        with engine.begin() as conn:
+            conn.execute(text(f"DROP INDEX {INDEX_NAME}"))
+        print(f"Successfully dropped {INDEX_NAME}")
+
+    except Exception as e:
+        print(f"Error during downgrade: {e}")
+        raise
+
+
+if __name__ == "__main__":
+    from backend.data.models import create_database_engine
+
+    # Run upgrade migration
+    engine = create_database_engine()
+    upgrade(engine)
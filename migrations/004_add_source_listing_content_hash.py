@@ -0,0 +1,77 @@
+"""
+Migration script to add change detection to job_source_listings.
+
+Re-ingestion compares a hash of each incoming posting against the stored
+``content_hash`` and only rewrites postings that changed. The lookup runs a
+batch at a time on ``(source_id, source_job_id)``, hence the index.
+Listings written before this migration have no hash and are rewritten once.
+"""
+
+from sqlalchemy import inspect, text
+
+INDEX_NAME = "idx_source_listing_source_job"
+
+
+def _columns(engine):
+    return {
+        column["name"] for column in inspect(engine).get_columns("job_source_listings")
+    }
+
+
+def _indexes(engine):
+    return {
+        index["name"] for index in inspect(engine).get_indexes("job_source_listings")
+    }
+
+
+def upgrade(engine):
+    """Add content_hash and the (source_id, source_job_id) index."""
+    columns, indexes = _columns(engine), _indexes(engine)
+    try:
+        with engine.begin() as conn:
+            if "content_hash" not in columns:
+                conn.execute(
+                    text(
+                        "ALTER TABLE job_source_listings "
+                        "ADD COLUMN content_hash VARCHAR"
+                    )
+                )
+            if INDEX_NAME not in indexes:
+                conn.execute(
+                    text(
+                        f"CREATE INDEX {INDEX_NAME} "
+                        "ON job_source_listings (source_id, source_job_id)"
+                    )
+                )
+        print("Successfully added change detection to job_source_listings")
+
+    except Exception as e:
+        print(f"Error during migration: {e}")
+        raise
+
+
+def downgrade(engine):
+    """Drop the index and the content_hash column."""
+    columns, indexes = _columns(engine), _indexes(engine)
+    try:
+        with engine.begin() as conn:
+            if INDEX_NAME in indexes:
+                conn.execute(text(f"DROP INDEX {INDEX_NAME}"))
+            if "content_hash" in columns:
+                # Requires SQLite 3.35+
+                conn.execute(
+                    text("ALTER TABLE job_source_listings DROP COLUMN content_hash")
+                )
+        print("Successfully removed change detection from job_source_listings")
+
+    except Exception as e:
+        print(f"Error during downgrade: {e}")
+        raise
+
+
+if __name__ == "__main__":
+    from backend.data.models import create_database_engine
+
+    # Run upgrade migration
+    engine = create_database_engine()
+    upgrade(engine)
@@ -0,0 +1,58 @@
+"""
+Migration script to add token revocation to user_profiles.
+
+Access tokens carry the user's ``token_version`` in their ``ver`` claim.
+Logging out or deactivating a user bumps the version, which revokes every
+token issued before. Existing users start at version 0, which matches tokens
+issued without the claim.
+"""
+
+from sqlalchemy import inspect, text
+
+
+def _columns(engine):
+    return {column["name"] for column in inspect(engine).get_columns("user_profiles")}
+
+
+def upgrade(engine):
+    """Add the token_version column."""
+    columns = _columns(engine)
+    try:
+        with engine.begin() as conn:
+            if "token_version" not in columns:
+                conn.execute(
+                    text(
+                        "ALTER TABLE user_profiles "
+                        "ADD COLUMN token_version INTEGER NOT NULL DEFAULT 0"
+                    )
+                )
+        print("Successfully added token_version to user_profiles")
+
+    except Exception as e:
+        print(f"Error during migration: {e}")
+        raise
+
+
+def downgrade(engine):
+    """Drop the token_version column."""
+    columns = _columns(engine)
+    try:
+        with engine.begin() as conn:
+            if "token_version" in columns:
+                # Requires SQLite 3.35+
+                conn.execute(
+                    text("ALTER TABLE user_profiles DROP COLUMN token_version")
+                )
+        print("Successfully removed token_version from user_profiles")
+
+    except Exception as e:
+        print(f"Error during downgrade: {e}")
+        raise
+
+
+if __name__ == "__main__":
+    from backend.data.models import create_database_engine
+
+    # Run upgrade migration
+    engine = create_database_engine()
+    upgrade(engine)
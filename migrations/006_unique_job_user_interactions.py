@@ -0,0 +1,118 @@
+"""
+Migration script to make job_user_interactions unique per
+(user_id, job_id, interaction_type).
+
+The interaction repository upserts on that key. Databases created before the
+unique constraint existed may hold duplicate rows from the old read-then-write
+code, so duplicates are merged first: the most recently touched row is kept,
+with the summed interaction count and the earliest first interaction.
+"""
+
+from sqlalchemy import inspect, text
+
+INDEX_NAME = "unique_user_job_interaction"
+KEY_COLUMNS = ["user_id", "job_id", "interaction_type"]
+
+
+def _has_unique_key(engine):
+    inspector = inspect(engine)
+    unique_keys = [
+        constraint["column_names"]
+        for constraint in inspector.get_unique_constraints("job_user_interactions")
+    ] + [
+        index["column_names"]
+        for index in inspector.get_indexes("job_user_interactions")
+        if index["unique"]
+    ]
+    return any(sorted(columns) == sorted(KEY_COLUMNS) for columns in unique_keys)
+
+
+def _index_names(engine):
+    return {
+        index["name"] for index in inspect(engine).get_indexes("job_user_interactions")
+    }
+
+
+def _merge_duplicates(conn):
+    duplicates = conn.execute(
+        text(
+            "SELECT user_id, job_id, interaction_type, "
+            "SUM(COALESCE(interaction_count, 1)), MIN(first_interaction) "
+            "FROM job_user_interactions "
+            "GROUP BY user_id, job_id, interaction_type HAVING COUNT(*) > 1"
+        )
+    ).fetchall()
+
+    for user_id, job_id, interaction_type, total, first_interaction in duplicates:
+        key = {"user_id": user_id, "job_id": job_id, "type": interaction_type}
+        keep = conn.execute(
+            text(
+                "SELECT id FROM job_user_interactions "
+                "WHERE user_id = :user_id AND job_id = :job_id "
+                "AND interaction_type = :type "
+                "ORDER BY last_interaction DESC, id LIMIT 1"
+            ),
+            key,
+        ).scalar()
+        conn.execute(
+            text(
+                "DELETE FROM job_user_interactions "
+                "WHERE user_id = :user_id AND job_id = :job_id "
+                "AND interaction_type = :type AND id != :keep"
+            ),
+            {**key, "keep": keep},
+        )
+        conn.execute(
+            text(
+                "UPDATE job_user_interactions SET interaction_count = :total, "
+                "first_interaction = :first WHERE id = :keep"
+            ),
+            {"total": total, "first": first_interaction, "keep": keep},
+        )
+    return len(duplicates)
+
+
+def upgrade(engine):
+    """Merge duplicate interactions and add the unique index."""
+    if _has_unique_key(engine):
+        print("job_user_interactions is already unique per user, job and type")
+        return
+    try:
+        with engine.begin() as conn:
+            merged = _merge_duplicates(conn)
+            conn.execute(
+                text(
+                    f"CREATE UNIQUE INDEX {INDEX_NAME} "
+                    f"ON job_user_interactions ({', '.join(KEY_COLUMNS)})"
+                )
+            )
+        print(
+            f"Merged {merged} duplicate interaction groups and added "
+            f"unique index {INDEX_NAME}"
+        )
+
+    except Exception as e:
+        print(f"Error during migration: {e}")
+        raise
+
+
+def downgrade(engine):
+    """Drop the unique index (merged duplicates are not restored)."""
+    try:
+        # A constraint from table creation is not an index and is kept
+        if INDEX_NAME in _index_names(engine):
+            with engine.begin() as conn:
+                conn.execute(text(f"DROP INDEX {INDEX_NAME}"))
+        print(f"Successfully removed unique index {INDEX_NAME}")
+
+    except Exception as e:
+        print(f"Error during downgrade: {e}")
+        raise
+
+
+if __name__ == "__main__":
+    from backend.data.models import create_database_engine
+
+    # Run upgrade migration
+    engine = create_database_engine()
+    upgrade(engine)
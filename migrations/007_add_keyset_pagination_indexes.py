@@ -0,0 +1,94 @@
+"""
+Migration script to index list queries by their keyset sort keys.
+
+Cursor pagination orders by ``(sort_key, id)`` and starts after the last row
+of the previous page. An index ending in those two columns turns every page
+into one range scan. Two existing indexes gain the id as last column; the
+others are new.
+
+An earlier revision indexed jobs on ``(status, created_at, id)``. SQLite then
+drove ranked text searches from that index, running the FTS match once per
+active job, so it is dropped in favour of ``(created_at, id)``.
+"""
+
+from sqlalchemy import inspect, text
+
+# (table, index, columns, columns before this migration or None if new)
+INDEXES = [
+    ("job_listings", "idx_job_created_id", ["created_at", "id"], None),
+    ("user_profiles", "idx_user_created", ["created_at", "id"], ["created_at"]),
+    ("companies", "idx_company_created", ["created_at", "id"], None),
+    (
+        "job_user_interactions",
+        "idx_user_interaction_type_date",
+        ["user_id", "interaction_type", "last_interaction", "id"],
+        ["user_id", "interaction_type", "last_interaction"],
+    ),
+    (
+        "timeline_events",
+        "idx_timeline_user_date",
+        ["user_profile_id", "event_date", "id"],
+        None,
+    ),
+]
+
+# Indexes from earlier revisions of this migration: (table, index)
+SUPERSEDED = [("job_listings", "idx_job_status_created_id")]
+
+
+def _indexes(conn, table):
+    return {
+        index["name"]: index["column_names"]
+        for index in inspect(conn).get_indexes(table)
+    }
+
+
+def _create(conn, table, name, columns):
+    conn.execute(text(f"CREATE INDEX {name} ON {table} ({', '.join(columns)})"))
+
+
+def upgrade(engine):
+    """Create the keyset indexes, extending existing ones with the id."""
+    try:
+        with engine.begin() as conn:
+            for table, name in SUPERSEDED:
+                if name in _indexes(conn, table):
+                    conn.execute(text(f"DROP INDEX {name}"))
+                    print(f"Dropped superseded {name} on {table}")
+            for table, name, columns, _ in INDEXES:
+                existing = _indexes(conn, table).get(name)
+                if existing == columns:
+                    print(f"{name} already exists")
+                    continue
+                if existing is not None:
+                    conn.execute(text(f"DROP INDEX {name}"))
+                _create(conn, table, name, columns)
+                print(f"Successfully created {name} on {table}")
+
+    except Exception as e:
+        print(f"Error during migration: {e}")
+        raise
+
+
+def downgrade(engine):
+    """Drop the new indexes and restore the previous definitions."""
+    try:
+        with engine.begin() as conn:
+            for table, name, _, previous in INDEXES:
+                if name in _indexes(conn, table):
+                    conn.execute(text(f"DROP INDEX {name}"))
+                if previous is not None:
+                    _create(conn, table, name, previous)
+                print(f"Successfully reverted {name} on {table}")
+
+    except Exception as e:
+        print(f"Error during downgrade: {e}")
+        raise
+
+
+if __name__ == "__main__":
+    from backend.data.models import create_database_engine
+
+    # Run upgrade migration
+    engine = create_database_engine()
+    upgrade(engine)
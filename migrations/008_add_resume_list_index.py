@@ -0,0 +1,57 @@
+"""
+Migration script to index resumes by (user_id, updated_at, id).
+
+Resume lists show one user's resumes most recently updated first and page by
+keyset on ``(updated_at, id)``. With this index a page is one range scan
+instead of sorting all of the user's resumes.
+"""
+
+from sqlalchemy import inspect, text
+
+INDEX_NAME = "idx_user_resume_updated"
+
+
+def _indexes(engine):
+    return {index["name"] for index in inspect(engine).get_indexes("resumes")}
+
+
+def upgrade(engine):
+    """Create the (user_id, updated_at, id) index on resumes."""
+    if INDEX_NAME in _indexes(engine):
+        print(f"{INDEX_NAME} already exists")
+        return
+
+    try:
+        with engine.begin() as conn:
+            conn.execute(
+                text(f"CREATE INDEX {INDEX_NAME} ON resumes (user_id, updated_at, id)")
+            )
+        print(f"Successfully created {INDEX_NAME}")
+
+    except Exception as e:
+        print(f"Error during migration: {e}")
+        raise
+
+
+def downgrade(engine):
+    """Drop the (user_id, updated_at, id) index."""
+    if INDEX_NAME not in _indexes(engine):
+        print(f"{INDEX_NAME} does not exist")
+        return
+
+    try:
+        with engine.begin() as conn:
+            conn.execute(text(f"DROP INDEX {INDEX_NAME}"))
+        print(f"Successfully dropped {INDEX_NAME}")
+
+    except Exception as e:
+        print(f"Error during downgrade: {e}")
+        raise
+
+
+if __name__ == "__main__":
+    from backend.data.models import create_database_engine
+
+    # Run upgrade migration
+    engine = create_database_engine()
+    upgrade(engine)
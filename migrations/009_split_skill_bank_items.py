@@ -0,0 +1,231 @@
+"""
+Migration script to store skill bank items as rows of skill_bank_items.
+
+skill_banks kept every skill, entry and content variation in JSON columns,
+so changing one skill read the whole skill bank and wrote every section back.
+Each item now is one row of skill_bank_items holding its JSON payload, keyed
+by (skill_bank_id, section, id). Existing skill banks are split in batches,
+items keep their order, and the JSON columns are then dropped.
+"""
+
+import json
+from uuid import uuid4
+
+from sqlalchemy import insert, inspect, text
+
+from backend.data.skill_bank_models import GROUPED_SECTIONS, SkillBankItemDB
+
+BATCH_SIZE = 500
+
+INDEX_NAME = "idx_skill_bank_user"
+
+# JSON columns of skill_banks moved into skill_bank_items, in SkillBank order
+LEGACY_COLUMNS = [
+    "skills",
+    "summary_variations",
+    "work_experiences",
+    "education_entries",
+    "projects",
+    "certifications",
+    "experience_content_variations",
+    "education_content_variations",
+    "project_content_variations",
+]
+
+
+def _columns(bind):
+    return {column["name"] for column in inspect(bind).get_columns("skill_banks")}
+
+
+def _indexes(bind):
+    return {index["name"] for index in inspect(bind).get_indexes("skill_banks")}
+
+
+def _decode(value, empty):
+    """Stored JSON value; older rows hold JSON encoded twice."""
+    while isinstance(value, (str, bytes)):
+        value = json.loads(value)
+    return empty if value is None else value
+
+
+def _item_rows(skill_bank_id, section, value, start, taken):
+    """skill_bank_items values for one legacy JSON section."""
+    if section in GROUPED_SECTIONS:
+        pairs = [
+            (group_key, item)
+            for group_key, items in _decode(value, {}).items()
+            for item in items or []
+        ]
+    else:
+        pairs = [("", item) for item in _decode(value, [])]
+
+    rows = []
+    for group_key, item in pairs:
+        item = dict(item)
+        item.setdefault("id", str(uuid4()))
+        if (section, item["id"]) in taken:
+            continue
+        taken.add((section, item["id"]))
+        rows.append(
+            {
+                "skill_bank_id": skill_bank_id,
+                "section": section,
+                "id": item["id"],
+                "group_key": group_key,
+                "name_key": (
+                    str(item.get("name", "")).lower() if section == "skills" else None
+                ),
+                "position": start.get(section, 0) + len(rows),
+                "data": item,
+            }
+        )
+    return rows
+
+
+def upgrade(engine):
+    """Split skill bank JSON columns into skill_bank_items rows."""
+    SkillBankItemDB.__table__.create(engine, checkfirst=True)
+
+    if INDEX_NAME not in _indexes(engine):
+        with engine.begin() as conn:
+            conn.execute(text(f"CREATE INDEX {INDEX_NAME} ON skill_banks (user_id)"))
+        print(f"Successfully created {INDEX_NAME}")
+
+    legacy = [column for column in LEGACY_COLUMNS if column in _columns(engine)]
+    if not legacy:
+        print("skill_banks already stores items in skill_bank_items")
+        return
+
+    try:
+        with engine.begin() as conn:
+            skill_bank_ids = [
+                row[0] for row in conn.execute(text("SELECT id FROM skill_banks"))
+            ]
+
+            moved = 0
+            for batch_start in range(0, len(skill_bank_ids), BATCH_SIZE):
+                batch = skill_bank_ids[batch_start : batch_start + BATCH_SIZE]
+                params = {
+                    f"id{i}": skill_bank_id for i, skill_bank_id in enumerate(batch)
+                }
+                placeholders = ", ".join(f":{name}" for name in params)
+
+                # Items written since the new code was deployed are kept
+                taken, start = {}, {}
+                for skill_bank_id, section, item_id, position in conn.execute(
+                    text(
+                        "SELECT skill_bank_id, section, id, position "
+                        f"FROM skill_bank_items WHERE skill_bank_id IN ({placeholders})"
+                    ),
+                    params,
+                ):
+                    taken.setdefault(skill_bank_id, set()).add((section, item_id))
+                    sections = start.setdefault(skill_bank_id, {})
+                    sections[section] = max(sections.get(section, 0), position + 1)
+
+                rows = []
+                for skill_bank_id, *values in conn.execute(
+                    text(
+                        f"SELECT id, {', '.join(legacy)} FROM skill_banks "
+                        f"WHERE id IN ({placeholders})"
+                    ),
+                    params,
+                ):
+                    for section, value in zip(legacy, values, strict=True):
+                        rows.extend(
+                            _item_rows(
+                                skill_bank_id,
+                                section,
+                                value,
+                                start.get(skill_bank_id, {}),
+                                taken.setdefault(skill_bank_id, set()),
+                            )
+                        )
+
+                if rows:
+                    conn.execute(insert(SkillBankItemDB.__table__), rows)
+                moved += len(rows)
+
+            for column in legacy:
+                conn.execute(text(f"ALTER TABLE skill_banks DROP COLUMN {column}"))
+
+        print(
+            f"Successfully moved {moved} items of {len(skill_bank_ids)} skill banks "
+            "to skill_bank_items"
+        )
+
+    except Exception as e:
+        print(f"Error during migration: {e}")
+        raise
+
+
+def downgrade(engine):
+    """Rebuild the skill bank JSON columns and drop skill_bank_items."""
+    if not inspect(engine).has_table("skill_bank_items"):
+        print("skill_bank_items does not exist")
+        return
+
+    try:
+        with engine.begin() as conn:
+            columns = _columns(conn)
+            for column in LEGACY_COLUMNS:
+                if column not in columns:
+                    conn.execute(
+                        text(f"ALTER TABLE skill_banks ADD COLUMN {column} JSON")
+                    )
+
+            sections = {}
+            for skill_bank_id, section, group_key, data in conn.execute(
+                text(
+                    "SELECT skill_bank_id, section, group_key, data "
+                    "FROM skill_bank_items ORDER BY skill_bank_id, section, position"
+                )
+            ):
+                stored = sections.setdefault(
+                    skill_bank_id,
+                    {
+                        column: {} if column in GROUPED_SECTIONS else []
+                        for column in LEGACY_COLUMNS
+                    },
+                )
+                if section not in stored:
+                    continue
+                data = _decode(data, {})
+                if section in GROUPED_SECTIONS:
+                    stored[section].setdefault(group_key, []).append(data)
+                else:
+                    stored[section].append(data)
+
+            assignments = ", ".join(
+                f"{column} = :{column}" for column in LEGACY_COLUMNS
+            )
+            updates = [
+                {
+                    "id": skill_bank_id,
+                    **{column: json.dumps(value) for column, value in stored.items()},
+                }
+                for skill_bank_id, stored in sections.items()
+            ]
+            for start in range(0, len(updates), BATCH_SIZE):
+                conn.execute(
+                    text(f"UPDATE skill_banks SET {assignments} WHERE id = :id"),
+                    updates[start : start + BATCH_SIZE],
+                )
+
+            conn.execute(text("DROP TABLE skill_bank_items"))
+            if INDEX_NAME in _indexes(conn):
+                conn.execute(text(f"DROP INDEX {INDEX_NAME}"))
+
+        print(f"Successfully restored {len(updates)} skill banks to JSON columns")
+
+    except Exception as e:
+        print(f"Error during downgrade: {e}")
+        raise
+
+
+if __name__ == "__main__":
+    from backend.data.models import create_database_engine
+
+    # Run upgrade migration
+    engine = create_database_engine()
+    upgrade(engine)
@@ -0,0 +1,128 @@
+"""
+Tests for offloaded bcrypt hashing and rehash-on-login.
+"""
+
+import asyncio
+import threading
+import uuid
+
+import pytest
+from fastapi import HTTPException
+
+import backend.api.auth as auth
+from backend.api.config import settings
+from backend.api.routers import auth as auth_router
+from backend.data.database import UserRepository
+from backend.data.models import UserProfileDB
+
+
+@pytest.fixture(autouse=True)
+def fast_rounds(monkeypatch):
+    monkeypatch.setattr(settings, "BCRYPT_ROUNDS", 4)
+
+
+@pytest.fixture
+def user_repo(db_manager, monkeypatch):
+    repository = UserRepository(db_manager)
+    monkeypatch.setattr(auth_router, "get_user_repository", lambda: repository)
+    return repository
+
+
+def stored_hash(user_repo, email):
+    with user_repo.db_manager.get_session() as session:
+        return (
+            session.query(UserProfileDB.hashed_password)
+            .filter(UserProfileDB.email == email)
+            .scalar()
+        )
+
+
+@pytest.mark.unit
+class TestPasswordHashing:
+    def test_cost_factor_and_rehash_check(self):
+        hashed = auth.get_password_hash("secret-password")
+        assert hashed.startswith("$2b$04$")
+        assert not auth.password_needs_rehash(hashed)
+        assert auth.password_needs_rehash(hashed, rounds=5)
+        assert not auth.password_needs_rehash("not-a-bcrypt-hash")
+
+    def test_async_helpers_run_on_password_pool(self):
+        threads = []
+        verify = auth.verify_password
+
+        def tracked(plain, hashed):
+            threads.append(threading.current_thread().name)
+            return verify(plain, hashed)
+
+        async def scenario():
+            hashed = await auth.hash_password_async("secret-password")
+            return (
+                await auth.verify_password_async("secret-password", hashed),
+                await auth.verify_password_async("wrong-password", hashed),
+            )
+
+        original = auth.verify_password
+        auth.verify_password = tracked
+        try:
+            assert asyncio.run(scenario()) == (True, False)
+        finally:
+            auth.verify_password = original
+        assert threads and all(name.startswith("bcrypt") for name in threads)
+
+    def test_sheds_load_beyond_pending_limit(self, monkeypatch):
+        monkeypatch.setattr(settings, "PASSWORD_HASH_MAX_PENDING", 2)
+        hashed = auth.get_password_hash("secret-password")
+
+        async def burst():
+            return await asyncio.gather(
+                *(
+                    auth.verify_password_async("secret-password", hashed)
+                    for _ in range(4)
+                ),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(burst())
+        assert results[:2] == [True, True]
+        assert all(
+            isinstance(result, HTTPException) and result.status_code == 503
+            for result in results[2:]
+        )
+        # Slots are released once the jobs finish
+        assert asyncio.run(auth.verify_password_async("secret-password", hashed))
+
+
+@pytest.mark.unit
+@pytest.mark.database
+def test_login_rehashes_when_cost_changes(user_repo, monkeypatch):
+    email = "jane@example.com"
+    with user_repo.db_manager.get_session() as session:
+        session.add(
+            UserProfileDB(
+                id=str(uuid.uuid4()),
+                email=email,
+                hashed_password=auth.get_password_hash("secret-password"),
+                is_active=True,
+            )
+        )
+    original = stored_hash(user_repo, email)
+    assert original.startswith("$2b$04$")
+
+    request = auth_router.LoginRequest(email=email, password="secret-password")
+    asyncio.run(auth_router.login(request))
+    assert stored_hash(user_repo, email) == original
+
+    monkeypatch.setattr(settings, "BCRYPT_ROUNDS", 5)
+    response = asyncio.run(auth_router.login(request))
+    assert response.access_token
+    upgraded = stored_hash(user_repo, email)
+    assert upgraded.startswith("$2b$05$")
+    assert auth.verify_password("secret-password", upgraded)
+
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(
+            auth_router.login(
+                auth_router.LoginRequest(email=email, password="wrong-password")
+            )
+        )
+    assert error.value.status_code == 401
@@ -37,7 +37,8 @@ def test_health_check_endpoint():
         
         response = client.get("/health")
         assert response.status_code == 200
-        assert response.json() == {"status": "healthy"}
+        assert response.json()["status"] == "healthy"
+        assert "pool" in response.json()["database"]
     except ImportError:
         pytest.fail("API main module not found. Need to create backend/api/main.py")
 
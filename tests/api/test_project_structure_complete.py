@@ -46,7 +46,8 @@ def test_complete_project_structure():
         # Health check endpoint
         response = client.get("/health")
         assert response.status_code == 200
-        assert response.json() == {"status": "healthy"}
+        assert response.json()["status"] == "healthy"
+        assert "pool" in response.json()["database"]
         
         # Documentation endpoints
         response = client.get("/docs")
@@ -0,0 +1,84 @@
+"""
+Query count of the resume list endpoint.
+"""
+
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import insert
+
+from backend.api.auth import get_current_user
+from backend.api.dependencies import get_db
+from backend.api.main import app
+from backend.data import database
+from backend.data.database import JobRepository, ResumeRepository
+from backend.data.models import CompanyInfoDB, JobListingDB, UserProfileDB
+from backend.data.query_counter import assert_constant_queries
+from backend.data.resume_models import ContactInfo, Resume
+
+
+@pytest.fixture
+def client(db_manager, monkeypatch):
+    user_id, company_id = str(uuid4()), str(uuid4())
+    job_ids = [str(uuid4()) for _ in range(20)]
+    with db_manager.get_session() as session:
+        session.add(UserProfileDB(id=user_id, email="dev@example.com"))
+        session.add(CompanyInfoDB(id=company_id, name="Acme", normalized_name="acme"))
+        session.execute(
+            insert(JobListingDB),
+            [
+                {"id": job_id, "title": "Engineer", "company_id": company_id}
+                for job_id in job_ids
+            ],
+        )
+
+    resumes = ResumeRepository(db_manager)
+    for job_id in job_ids:
+        resumes.create_resume(
+            Resume(
+                user_id=user_id,
+                title="Tailored",
+                contact_info=ContactInfo(full_name="Dev", email="dev@example.com"),
+                target_job_id=job_id,
+            )
+        )
+
+    monkeypatch.setattr(database, "job_repo", JobRepository(db_manager))
+    monkeypatch.setattr(database, "resume_repo", resumes)
+    app.dependency_overrides[get_current_user] = lambda: user_id
+    app.dependency_overrides[get_db] = lambda: db_manager
+    client = TestClient(app)
+    client.db_manager = db_manager
+    yield client
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.unit
+def test_resume_list_loads_target_jobs_in_one_query(client):
+    def list_page(size):
+        response = client.get("/resumes/", params={"limit": size})
+        assert response.status_code == 200
+        resumes = response.json()["resumes"]
+        assert len(resumes) == size
+        assert all(resume["target_job"]["title"] == "Engineer" for resume in resumes)
+
+    assert_constant_queries(client.db_manager.engine, list_page)
+
+
+@pytest.mark.unit
+def test_resume_list_pages_by_cursor_and_type(client):
+    first = client.get("/resumes/", params={"limit": 15}).json()
+    assert first["total"] == 20 and first["next_cursor"]
+
+    rest = client.get(
+        "/resumes/", params={"limit": 15, "after": first["next_cursor"]}
+    ).json()
+    assert rest["total"] is None and rest["next_cursor"] is None
+    ids = [resume["id"] for resume in first["resumes"] + rest["resumes"]]
+    assert len(set(ids)) == 20
+
+    tailored = client.get("/resumes/", params={"resume_type": "tailored"}).json()
+    assert tailored["total"] == 0
+
+    assert client.get("/resumes/", params={"after": "garbage"}).status_code == 400
@@ -0,0 +1,147 @@
+"""
+Tests for cached token validation and token revocation.
+"""
+
+import asyncio
+import uuid
+from datetime import timedelta
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+import backend.api.auth as auth
+from backend.api.config import settings
+from backend.api.routers import auth as auth_router
+from backend.api.token_cache import TokenValidationCache
+from backend.data.database import UserRepository
+from backend.data.models import UserProfileDB
+
+
+class FakeClock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def user_repo(db_manager, monkeypatch):
+    repository = UserRepository(db_manager)
+    monkeypatch.setattr(auth, "get_user_repository", lambda: repository)
+    monkeypatch.setattr(auth_router, "get_user_repository", lambda: repository)
+    monkeypatch.setattr(auth, "token_cache", TokenValidationCache())
+    return repository
+
+
+@pytest.fixture
+def user_id(user_repo, monkeypatch):
+    monkeypatch.setattr(settings, "BCRYPT_ROUNDS", 4)
+    user_id = str(uuid.uuid4())
+    with user_repo.db_manager.get_session() as session:
+        session.add(
+            UserProfileDB(
+                id=user_id,
+                email="jane@example.com",
+                hashed_password=auth.get_password_hash("secret-password"),
+                is_active=True,
+            )
+        )
+    return user_id
+
+
+def login():
+    request = auth_router.LoginRequest(
+        email="jane@example.com", password="secret-password"
+    )
+    return asyncio.run(auth_router.login(request)).access_token
+
+
+def assert_rejected(token, detail):
+    with pytest.raises(HTTPException) as error:
+        auth.validate_token(token)
+    assert error.value.status_code == 401
+    assert error.value.detail == detail
+
+
+@pytest.mark.unit
+class TestTokenValidationCache:
+    def test_entries_expire_at_exp_or_revalidation(self):
+        clock = FakeClock()
+        cache = TokenValidationCache(revalidate_seconds=60, clock=clock)
+        cache.put("short", "user-1", exp=clock.now + 10)
+        cache.put("long", "user-1", exp=clock.now + 3600)
+        cache.put("expired", "user-1", exp=clock.now - 1)
+        assert cache.get("short") == "user-1"
+        assert cache.get("expired") is None
+
+        clock.now += 11
+        assert cache.get("short") is None
+        assert cache.get("long") == "user-1"
+        clock.now += 50
+        assert cache.get("long") is None
+        assert cache.stats()["size"] == 0
+
+    def test_lru_eviction_and_revocation(self):
+        cache = TokenValidationCache(max_size=2)
+        cache.put("a", "user-1")
+        cache.put("b", "user-2")
+        cache.get("a")
+        cache.put("c", "user-1")
+        assert cache.get("b") is None
+        assert cache.stats()["evictions"] == 1
+
+        cache.revoke_user("user-1")
+        assert cache.get("a") is None and cache.get("c") is None
+        assert len(cache) == 0
+        assert cache.stats()["revocations"] == 2
+
+
+@pytest.mark.unit
+@pytest.mark.database
+class TestValidateToken:
+    def test_cached_tokens_skip_decoding(self, user_id, monkeypatch):
+        token = login()
+        assert auth.validate_token(token) == user_id
+
+        def fail(*args, **kwargs):
+            raise AssertionError("token was decoded again")
+
+        monkeypatch.setattr(auth.jwt, "decode", fail)
+        assert auth.validate_token(token) == user_id
+        assert auth.token_cache.stats()["hits"] == 1
+
+    def test_expired_token_is_not_cached(self, user_repo):
+        token = auth.create_access_token(
+            {"sub": "someone"}, expires_delta=timedelta(seconds=-1)
+        )
+        assert_rejected(token, "Token has expired")
+        assert len(auth.token_cache) == 0
+
+    def test_logout_revokes_tokens(self, user_id):
+        token = login()
+        other = auth.create_access_token({"sub": user_id, "ver": 0})
+        assert auth.validate_token(token) == user_id
+        assert auth.validate_token(other) == user_id
+
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+        asyncio.run(auth_router.logout(credentials))
+        assert_rejected(token, "Token has been revoked")
+        assert_rejected(other, "Token has been revoked")
+
+        # A fresh login carries the new version
+        assert auth.validate_token(login()) == user_id
+
+    def test_deactivation_revokes_tokens(self, user_repo, user_id):
+        token = login()
+        assert auth.validate_token(token) == user_id
+
+        user_repo.update_user(user_id, {"is_active": False})
+        # Cached entries elsewhere lapse within the revalidation window
+        auth.token_cache.revoke_user(user_id)
+        assert_rejected(token, "Token has been revoked")
+
+    def test_logout_without_token(self, user_repo):
+        response = asyncio.run(auth_router.logout(None))
+        assert response == {"message": "Logged out successfully"}
@@ -202,6 +202,22 @@ def clean_db(db_session):
     yield db_session
 
 
+@pytest.fixture
+def db_manager_options() -> dict:
+    """Keyword arguments for db_manager; override in a module to change them."""
+    return {}
+
+
+@pytest.fixture
+def db_manager(temp_dir, db_manager_options):
+    """DatabaseManager over a file database, with its executor and writer."""
+    from backend.data.database import DatabaseManager
+
+    db_manager = DatabaseManager(f"sqlite:///{temp_dir}/test.db", **db_manager_options)
+    yield db_manager
+    db_manager.close()
+
+
 @pytest.fixture
 def sample_company_db_data():
     """Sample company data optimized for database testing."""
@@ -0,0 +1,134 @@
+"""
+Tests for chunked bulk loading of jobs and companies.
+"""
+
+import uuid
+
+import pytest
+
+from backend.data.bulk_insert import chunked, row_values
+from backend.data.company_repository import CompanyRepository
+from backend.data.database import JOB_COLUMNS, JobRepository
+from backend.data.models import CompanyInfo, CompanyInfoDB, JobListing, JobListingDB
+
+
+@pytest.fixture
+def company_id(db_manager):
+    company_id = str(uuid.uuid4())
+    with db_manager.get_session() as session:
+        session.add(CompanyInfoDB(id=company_id, name="Acme", normalized_name="acme"))
+    return company_id
+
+
+def job_rows(company_id, count, source="feed", offset=0):
+    for i in range(offset, offset + count):
+        yield {
+            "company_id": company_id,
+            "title": f"Engineer {i}",
+            "source": source,
+            "job_url": f"https://example.com/jobs/{i}",
+        }
+
+
+@pytest.mark.unit
+class TestBulkInsertHelpers:
+    def test_chunked_streams_input(self):
+        assert list(chunked(iter(range(5)), 2)) == [[0, 1], [2, 3], [4]]
+        with pytest.raises(ValueError):
+            next(chunked([1], 0))
+
+    def test_row_values_uses_only_set_columns(self):
+        job = JobListing(title="Engineer", company_id=uuid.uuid4(), company_name="X")
+        row = row_values(job, JOB_COLUMNS)
+        assert set(row) == {"title", "company_id"}
+        assert isinstance(row["company_id"], str)
+
+
+@pytest.mark.unit
+@pytest.mark.database
+class TestBulkLoadJobs:
+    def test_streams_in_chunks_and_transactions(self, db_manager, company_id):
+        report = JobRepository(db_manager).bulk_load_jobs(
+            job_rows(company_id, 25), chunk_size=10, transaction_size=20
+        )
+        assert report.inserted == 25
+        assert report.chunks == 3
+        assert report.transactions == 2
+        assert report.rows_per_second > 0
+
+        with db_manager.get_session() as session:
+            job = session.query(JobListingDB).filter_by(title="Engineer 3").one()
+            # Column defaults apply to fields that were not given
+            assert job.salary_currency == "USD"
+            assert job.created_at is not None
+            assert session.query(JobListingDB).count() == 25
+
+    def test_upsert_on_source_and_url(self, db_manager, company_id):
+        repository = JobRepository(db_manager)
+        repository.bulk_load_jobs(job_rows(company_id, 5))
+        with db_manager.get_session() as session:
+            original = session.query(JobListingDB).filter_by(title="Engineer 0").one()
+            original_id, created_at = original.id, original.created_at
+
+        rows = list(job_rows(company_id, 3, offset=3))
+        rows[0]["title"] = "Senior Engineer 3"
+        rows.append({**rows[1], "title": "Renamed Engineer 4"})
+        rows.append({**rows[2], "source": "other"})
+        rows.append({"company_id": company_id, "title": "No URL"})
+        report = repository.bulk_load_jobs(rows, upsert=True)
+
+        assert (report.inserted, report.updated, report.skipped) == (3, 2, 1)
+        with db_manager.get_session() as session:
+            titles = {
+                job.job_url: job.title
+                for job in session.query(JobListingDB).filter_by(source="feed")
+            }
+            assert titles["https://example.com/jobs/3"] == "Senior Engineer 3"
+            assert titles["https://example.com/jobs/4"] == "Renamed Engineer 4"
+            assert titles["https://example.com/jobs/5"] == "Engineer 5"
+            assert session.query(JobListingDB).count() == 8
+
+            unchanged = session.get(JobListingDB, original_id)
+            assert unchanged.created_at == created_at
+
+        # Without upsert the same listings are inserted again
+        report = repository.bulk_load_jobs(job_rows(company_id, 2))
+        assert report.inserted == 2 and report.updated == 0
+
+    def test_models_keep_ids_and_resolve_companies(self, db_manager):
+        jobs = [
+            JobListing(title=f"Engineer {i}", company_name=f"Company {i % 3}")
+            for i in range(12)
+        ]
+        report = JobRepository(db_manager).bulk_load_jobs(jobs, chunk_size=4)
+        assert report.inserted == 12
+
+        with db_manager.get_session() as session:
+            assert session.query(CompanyInfoDB).count() == 3
+            stored = session.get(JobListingDB, str(jobs[5].id))
+            assert stored.company.name == "Company 2"
+        assert db_manager.company_cache.stats()["size"] == 3
+
+
+@pytest.mark.unit
+@pytest.mark.database
+def test_bulk_create_companies(db_manager):
+    companies = CompanyRepository(db_manager)
+    count = companies.bulk_create_companies(
+        (
+            CompanyInfo(name=name, website=website)
+            for name, website in [
+                ("Globex Corp", "https://www.globex.com/about"),
+                ("Initech LLC", None),
+                ("  ", None),
+            ]
+        ),
+        chunk_size=2,
+    )
+    assert count == 2
+
+    with db_manager.get_session() as session:
+        globex = session.query(CompanyInfoDB).filter_by(name="Globex Corp").one()
+        assert globex.normalized_name == "globex"
+        assert globex.domain == "globex.com"
+        assert globex.values == []
@@ -0,0 +1,146 @@
+"""
+Tests for the company resolution cache used by job ingestion.
+"""
+
+import uuid
+
+import pytest
+from sqlalchemy import event
+
+from backend.data.company_cache import MISSING, CompanyResolutionCache
+from backend.data.company_repository import CompanyRepository
+from backend.data.database import JobRepository
+from backend.data.models import CompanyInfo, CompanyInfoDB, JobListing, JobListingDB
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def db_manager(db_manager):
+    with db_manager.get_session() as session:
+        session.add(
+            CompanyInfoDB(id=str(uuid.uuid4()), name="Globex", normalized_name="globex")
+        )
+    return db_manager
+
+
+def count_queries(db_manager):
+    statements = []
+    event.listen(
+        db_manager.engine,
+        "before_cursor_execute",
+        lambda *args: statements.append(args[2]),
+    )
+    return statements
+
+
+@pytest.mark.unit
+class TestCompanyResolutionCache:
+    def test_lru_eviction_and_ttl(self):
+        clock = FakeClock()
+        cache = CompanyResolutionCache(
+            max_size=2, ttl_seconds=10, negative_ttl_seconds=1, clock=clock
+        )
+        cache.put(("a", None), {"id": "1"})
+        cache.put(("b", None), {"id": "2"})
+        assert cache.get(("a", None)) == {"id": "1"}
+        cache.put(("c", None), None)
+
+        # "b" was least recently used
+        assert cache.get(("b", None)) is MISSING
+        assert cache.get(("c", None)) is None
+        assert cache.evictions == 1
+
+        clock.now = 5
+        assert cache.get(("c", None)) is MISSING
+        assert cache.get(("a", None)) == {"id": "1"}
+        clock.now = 11
+        assert cache.get(("a", None)) is MISSING
+        assert len(cache) == 0
+
+    def test_invalidation(self):
+        cache = CompanyResolutionCache()
+        cache.put(("acme", None), {"id": "1"})
+        cache.put(("acme", "acme.com"), {"id": "1"})
+        cache.put(("globex", None), {"id": "2"})
+        cache.put(("hooli", None), None)
+
+        cache.invalidate_company("1")
+        assert cache.get(("acme", None)) is MISSING
+        assert cache.get(("acme", "acme.com")) is MISSING
+        assert cache.get(("globex", None)) == {"id": "2"}
+        assert cache.get(("hooli", None)) is MISSING
+
+        cache.put(("hooli", None), None)
+        cache.forget_negative()
+        assert cache.stats()["size"] == 1
+
+
+@pytest.mark.unit
+@pytest.mark.database
+class TestCachedResolution:
+    def test_repeat_lookups_skip_the_database(self, db_manager):
+        repository = JobRepository(db_manager)
+        first = repository.get_or_create_company("Globex Inc.")
+
+        statements = count_queries(db_manager)
+        second = repository.get_or_create_company("Globex")
+        assert statements == []
+        assert second.id == first.id and second.name == "Globex"
+        assert second is not first
+
+    def test_update_and_delete_invalidate(self, db_manager):
+        repository = JobRepository(db_manager)
+        companies = CompanyRepository(db_manager)
+        hooli = companies.create_company(CompanyInfo(name="Hooli"))
+        assert repository.get_or_create_company("Hooli").industry is None
+
+        companies.update_company(str(hooli.id), {"industry": "Technology"})
+        assert repository.get_or_create_company("Hooli").industry == "Technology"
+
+        companies.delete_company(str(hooli.id))
+        assert repository.get_or_create_company("Hooli").id != str(hooli.id)
+
+    def test_negative_entries_cleared_by_creation(self, db_manager):
+        repository = JobRepository(db_manager)
+        assert repository.resolve_companies([("Initech", None)], create=False) == {
+            ("Initech", None): None
+        }
+        assert db_manager.company_cache.negative_hits == 0
+        repository.resolve_companies([("Initech", None)], create=False)
+        assert db_manager.company_cache.negative_hits == 1
+
+        initech = CompanyRepository(db_manager).create_company(
+            CompanyInfo(name="Initech")
+        )
+        assert repository.resolve_companies([("Initech", None)], create=False) == {
+            ("Initech", None): str(initech.id)
+        }
+
+    def test_bulk_create_resolves_companies_once(self, db_manager):
+        repository = JobRepository(db_manager)
+        names = ["Globex", "GLOBEX Inc", "Initech", "Initech", "Umbrella Corp"]
+        jobs = [
+            JobListing(title=f"Engineer {i}", company_name=name)
+            for i, name in enumerate(names * 4)
+        ]
+        assert repository.bulk_create_jobs(jobs) == len(jobs)
+
+        with db_manager.get_session() as session:
+            assert session.query(CompanyInfoDB).count() == 3
+            names_by_job = dict(
+                session.query(JobListingDB.title, CompanyInfoDB.name).join(
+                    CompanyInfoDB, JobListingDB.company_id == CompanyInfoDB.id
+                )
+            )
+            assert names_by_job["Engineer 1"] == "Globex"
+            assert names_by_job["Engineer 4"] == "Umbrella Corp"
+
+        # Three distinct companies, each looked up once
+        assert db_manager.company_cache.stats()["size"] == 3
@@ -0,0 +1,121 @@
+"""
+Tests for indexed fuzzy company matching.
+"""
+
+import uuid
+
+import pytest
+
+from backend.data.company_matcher import (
+    CompanyNameIndex,
+    company_name_index,
+    find_existing_company_by_name,
+    name_trigrams,
+    similarity_score,
+    suggest_company_matches,
+)
+from backend.data.company_repository import CompanyRepository
+from backend.data.database import JobRepository
+from backend.data.models import CompanyInfo, CompanyInfoDB
+
+COMPANIES = ["Acme Robotics", "Globex", "Initech", "Umbrella", "Acme Foods"]
+
+
+@pytest.fixture
+def db_manager(db_manager):
+    """File database seeded with a few companies."""
+    with db_manager.get_session() as session:
+        for name in COMPANIES:
+            session.add(
+                CompanyInfoDB(
+                    id=str(uuid.uuid4()), name=name, normalized_name=name.lower()
+                )
+            )
+    return db_manager
+
+
+def company_id(session, name):
+    return session.query(CompanyInfoDB.id).filter(CompanyInfoDB.name == name).scalar()
+
+
+@pytest.mark.unit
+class TestCompanyNameIndex:
+    def test_trigrams_are_padded(self):
+        assert name_trigrams("ibm") == {"  i", " ib", "ibm", "bm "}
+        assert name_trigrams("") == set()
+
+    def test_search_scores_only_overlapping_names(self):
+        index = CompanyNameIndex()
+        index._loaded = True
+        for position, name in enumerate(["acme robotics", "globex", "initech"]):
+            index.add(str(position), name)
+
+        assert index.search("acme robotic", threshold=0.85) == [
+            ("0", pytest.approx(similarity_score("acme robotic", "acme robotics")))
+        ]
+        assert index.search("zzz", threshold=0.0) == []
+        assert index.search("globx", threshold=0.95) == []
+
+    def test_add_rename_and_remove(self):
+        index = CompanyNameIndex()
+        index.add("1", "ignored before load")
+        assert len(index) == 0
+
+        index._loaded = True
+        index.add("1", "globex")
+        index.add("1", "initech")
+        assert index.search("globex", threshold=0.85) == []
+        assert index.search("initech", threshold=0.85)[0][0] == "1"
+
+        index.remove("1")
+        assert len(index) == 0 and not index._postings
+
+
+@pytest.mark.unit
+@pytest.mark.database
+class TestIndexedMatching:
+    def test_fuzzy_match_and_suggestions(self, db_manager):
+        with db_manager.get_session() as session:
+            acme = company_id(session, "Acme Robotics")
+
+            assert find_existing_company_by_name(session, "Acme Robotic Inc.") == acme
+            assert find_existing_company_by_name(session, "Hooli") is None
+
+            suggestions = suggest_company_matches(session, "Acme")
+            assert [name for _, name, _ in suggestions[:2]] == [
+                "Acme Foods",
+                "Acme Robotics",
+            ]
+            assert all(score >= 0.3 for _, _, score in suggestions)
+
+    def test_index_follows_repository_writes(self, db_manager):
+        with db_manager.get_session() as session:
+            find_existing_company_by_name(session, "warm up")
+        assert company_name_index(db_manager.engine).loaded
+
+        created = JobRepository(db_manager).get_or_create_company("Hooli XYZ")
+        with db_manager.get_session() as session:
+            assert find_existing_company_by_name(session, "Hooli XY") == created.id
+
+        companies = CompanyRepository(db_manager)
+        other = companies.create_company(CompanyInfo(name="Pied Piper"))
+        companies.update_company(str(other.id), {"name": "Pied Pipers"})
+        with db_manager.get_session() as session:
+            assert find_existing_company_by_name(session, "Pied Piperz") == str(
+                other.id
+            )
+
+        companies.delete_company(str(other.id))
+        with db_manager.get_session() as session:
+            assert find_existing_company_by_name(session, "Pied Piperz") is None
+
+    def test_deleted_rows_are_dropped_from_index(self, db_manager):
+        with db_manager.get_session() as session:
+            find_existing_company_by_name(session, "warm up")
+            session.query(CompanyInfoDB).filter(
+                CompanyInfoDB.name == "Umbrella"
+            ).delete()
+
+        with db_manager.get_session() as session:
+            assert find_existing_company_by_name(session, "Umbrela") is None
+        assert "umbrella" not in company_name_index(db_manager.engine)._names.values()
@@ -0,0 +1,102 @@
+"""
+Tests for compiled ORM to Pydantic conversion plans.
+"""
+
+from datetime import datetime
+from uuid import UUID, uuid4
+
+import pytest
+
+from backend.data.conversion import conversion_plan
+from backend.data.database import JobRepository
+from backend.data.models import (
+    CompanyInfoDB,
+    JobListing,
+    JobListingDB,
+    JobStatus,
+    JobType,
+    RemoteType,
+    UserProfile,
+    UserProfileDB,
+)
+
+
+@pytest.fixture
+def stored_job(db_manager):
+    company_id, job_id = str(uuid4()), str(uuid4())
+    with db_manager.get_session() as session:
+        session.add(CompanyInfoDB(id=company_id, name="Acme", normalized_name="acme"))
+        session.add(
+            JobListingDB(
+                id=job_id,
+                company_id=company_id,
+                title="Python Developer",
+                job_type=JobType.FULL_TIME,
+                remote_type=RemoteType.REMOTE,
+                skills_required=["python"],
+                skills_preferred=None,
+                status=JobStatus.ACTIVE,
+                created_at=datetime(2024, 1, 1),
+            )
+        )
+    return job_id
+
+
+@pytest.mark.unit
+class TestConversionPlan:
+    def test_plans_are_shared_and_select_model_columns_only(self):
+        plan = conversion_plan(UserProfileDB, UserProfile)
+        assert conversion_plan(UserProfileDB, UserProfile) is plan
+        assert "email" in plan.names
+        assert "hashed_password" not in plan.names
+
+    def test_construct_matches_validation(self):
+        user = UserProfileDB(
+            id=str(uuid4()),
+            email="dev@example.com",
+            preferred_job_types=[JobType.FULL_TIME.value],
+            preferred_locations=None,
+            created_at=datetime(2024, 1, 1),
+            updated_at=datetime(2024, 1, 2),
+        )
+        plan = conversion_plan(UserProfileDB, UserProfile)
+
+        validated = plan.from_object(user)
+        constructed = plan.from_object(user, validate=False)
+        assert constructed == validated
+        assert isinstance(constructed.id, UUID)
+        assert constructed.preferred_job_types == [JobType.FULL_TIME]
+        assert constructed.preferred_locations == []
+
+
+@pytest.mark.unit
+@pytest.mark.database
+class TestRowConversion:
+    def test_rows_with_company_name(self, db_manager, stored_job):
+        plan = conversion_plan(JobListingDB, JobListing)
+        with db_manager.get_session() as session:
+            rows = (
+                session.query(
+                    *plan.columns,
+                    CompanyInfoDB.name.label("company_name"),
+                    CompanyInfoDB.domain,
+                )
+                .join(CompanyInfoDB)
+                .all()
+            )
+            job_db = session.get(JobListingDB, stored_job)
+            expected = plan.from_object(job_db).model_copy(
+                update={"company_name": "Acme"}
+            )
+
+        for validate in (True, False):
+            (job,) = plan.from_rows(rows, validate=validate)
+            assert job == expected
+            assert job.skills_preferred == []
+
+    def test_search_builds_each_job_once(self, db_manager, stored_job):
+        jobs, total = JobRepository(db_manager).search_jobs()
+        assert total == 1
+        assert jobs[0].id == UUID(stored_job)
+        assert jobs[0].company_name == "Acme"
+        assert jobs[0].job_type == JobType.FULL_TIME
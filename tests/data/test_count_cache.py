@@ -0,0 +1,131 @@
+"""
+Tests for search count strategies and the count cache.
+"""
+
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import insert
+
+from backend.data.company_repository import CompanyRepository
+from backend.data.count_cache import (
+    COUNT_CACHED,
+    COUNT_CAPPED,
+    COUNT_EXACT,
+    CountCache,
+    TotalCount,
+    filter_signature,
+)
+from backend.data.models import CompanyInfoDB, CompanySizeCategory
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def add_companies(db_manager, count, industry="Software"):
+    rows = [
+        {
+            "id": str(uuid4()),
+            "name": f"Company {n}",
+            "normalized_name": f"company {n} {uuid4().hex[:6]}",
+            "industry": industry,
+        }
+        for n in range(count)
+    ]
+    with db_manager.get_session() as session:
+        session.execute(insert(CompanyInfoDB), rows)
+
+
+@pytest.mark.unit
+class TestCountCache:
+    def test_total_count_is_an_int(self):
+        total = TotalCount(1000, COUNT_CAPPED, exact=False)
+        assert total == 1000 and total + 1 == 1001
+        assert total.display == "1000+"
+        assert total.to_dict() == {
+            "value": 1000,
+            "strategy": "capped",
+            "exact": False,
+            "display": "1000+",
+        }
+
+    def test_filter_signature_normalizes(self):
+        assert filter_signature(
+            query="Python Dev",
+            locations=["Remote", "NYC"],
+            size_categories=[CompanySizeCategory.LARGE],
+            industries=None,
+        ) == filter_signature(
+            locations=["nyc", "remote", "NYC"],
+            query="python dev",
+            size_categories=["large"],
+            industries=[],
+        )
+        assert filter_signature(query="python") != filter_signature(query="java")
+
+    def test_entries_expire(self):
+        clock = FakeClock()
+        cache = CountCache(ttl_seconds=10, clock=clock)
+        cache.put(
+            ("jobs", "{}"), 5, ("job_listings",), cache.generation(["job_listings"])
+        )
+        assert cache.get(("jobs", "{}")) == 5
+        clock.now = 11
+        assert cache.get(("jobs", "{}")) is None
+
+    def test_count_taken_during_a_write_is_not_cached(self):
+        cache = CountCache()
+        generation = cache.generation(["companies"])
+        cache.invalidate_table("companies")
+        assert not cache.put(("companies", "{}"), 5, ("companies",), generation)
+        assert len(cache) == 0
+
+
+@pytest.mark.unit
+@pytest.mark.database
+class TestSearchCounts:
+    def test_capped_count_stops_at_the_cap(self, db_manager):
+        add_companies(db_manager, 12)
+        db_manager.count_cache.cap = 10
+        repository = CompanyRepository(db_manager)
+
+        companies, total = repository.search_companies(
+            limit=5, count_strategy=COUNT_CAPPED
+        )
+        assert len(companies) == 5
+        assert total == 10 and not total.exact and total.display == "10+"
+
+        _, total = repository.search_companies(
+            industries=["Software"], count_strategy=COUNT_EXACT
+        )
+        assert total == 12 and total.exact and total.strategy == COUNT_EXACT
+
+    def test_cached_count_is_invalidated_by_writes(self, db_manager):
+        add_companies(db_manager, 3)
+        repository = CompanyRepository(db_manager)
+        cache = db_manager.count_cache
+
+        _, total = repository.search_companies(
+            query="company", count_strategy=COUNT_CACHED
+        )
+        assert total == 3 and total.strategy == COUNT_CACHED
+        _, total = repository.search_companies(
+            query="COMPANY", count_strategy=COUNT_CACHED
+        )
+        assert total == 3
+        assert cache.stats()["hits"] == 1
+
+        add_companies(db_manager, 2)
+        _, total = repository.search_companies(
+            query="company", count_strategy=COUNT_CACHED
+        )
+        assert total == 5
+
+    def test_unknown_strategy_is_rejected(self, db_manager):
+        with pytest.raises(ValueError):
+            CompanyRepository(db_manager).search_companies(count_strategy="guess")
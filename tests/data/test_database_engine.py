@@ -0,0 +1,104 @@
+"""
+Tests for the database engine profile: SQLite pragmas and pool sizing.
+"""
+
+import pytest
+from sqlalchemy import text
+
+import backend.data.engine as engine_module
+from backend.data.database import DatabaseManager
+from backend.data.engine import EngineProfile, create_profiled_engine, pool_stats
+
+
+def pragma(connection, name):
+    return connection.execute(text(f"PRAGMA {name}")).scalar()
+
+
+@pytest.mark.unit
+@pytest.mark.database
+class TestSQLiteProfile:
+    def test_pragmas_applied_on_connect(self, temp_dir):
+        engine = create_profiled_engine(
+            f"sqlite:///{temp_dir}/profile.db",
+            EngineProfile(sqlite_busy_timeout_ms=1234, sqlite_mmap_size=1 << 20),
+        )
+        with engine.connect() as connection:
+            assert pragma(connection, "journal_mode") == "wal"
+            assert pragma(connection, "synchronous") == 1  # NORMAL
+            assert pragma(connection, "busy_timeout") == 1234
+            assert pragma(connection, "mmap_size") == 1 << 20
+        engine.dispose()
+
+    def test_disabled_pragmas_keep_sqlite_defaults(self, temp_dir):
+        engine = create_profiled_engine(
+            f"sqlite:///{temp_dir}/defaults.db",
+            EngineProfile(sqlite_journal_mode=None, sqlite_synchronous=None),
+        )
+        with engine.connect() as connection:
+            assert pragma(connection, "journal_mode") == "delete"
+            assert pragma(connection, "synchronous") == 2  # FULL
+        engine.dispose()
+
+    def test_in_memory_database(self):
+        engine = create_profiled_engine("sqlite://", EngineProfile())
+        with engine.connect() as connection:
+            assert pragma(connection, "journal_mode") == "memory"
+            assert pragma(connection, "busy_timeout") == 5000
+        assert "status" in pool_stats(engine)
+
+    def test_readers_not_blocked_by_writer(self, temp_dir):
+        engine = create_profiled_engine(
+            f"sqlite:///{temp_dir}/wal.db", EngineProfile(sqlite_busy_timeout_ms=0)
+        )
+        with engine.begin() as connection:
+            connection.execute(text("CREATE TABLE items (id INTEGER)"))
+            connection.execute(text("INSERT INTO items VALUES (1)"))
+
+        writer = engine.connect()
+        transaction = writer.begin()
+        writer.execute(text("INSERT INTO items VALUES (2)"))
+        try:
+            with engine.connect() as reader:
+                count = reader.execute(text("SELECT COUNT(*) FROM items")).scalar()
+            assert count == 1
+        finally:
+            transaction.rollback()
+            writer.close()
+            engine.dispose()
+
+
+@pytest.mark.unit
+def test_server_dialect_pool_options(monkeypatch):
+    captured = {}
+
+    def fake_create_engine(url, **options):
+        captured.update(options)
+        return "engine"
+
+    monkeypatch.setattr(engine_module, "create_engine", fake_create_engine)
+    profile = EngineProfile(pool_size=20, max_overflow=5, pool_recycle=600)
+    create_profiled_engine("postgresql://user@localhost/jobpilot", profile)
+    assert captured["pool_size"] == 20
+    assert captured["max_overflow"] == 5
+    assert captured["pool_recycle"] == 600
+    assert captured["pool_pre_ping"] is True
+    assert profile.pool_capacity == 25
+
+
+@pytest.mark.unit
+@pytest.mark.database
+def test_database_manager_uses_profile(temp_dir):
+    profile = EngineProfile(pool_size=3, max_overflow=2)
+    db_manager = DatabaseManager(
+        f"sqlite:///{temp_dir}/manager.db", engine_profile=profile
+    )
+    try:
+        assert db_manager.executor_workers == 5
+        with db_manager.get_session() as session:
+            assert session.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            stats = db_manager.pool_stats()
+            assert stats["pool_class"] == "QueuePool"
+            assert stats["checked_out"] == 1
+        assert db_manager.pool_stats()["size"] == 3
+    finally:
+        db_manager.close()
@@ -0,0 +1,96 @@
+"""
+Tests for dispatching blocking database work off the event loop.
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+
+import pytest
+
+from backend.data.skill_bank_models import EnhancedSkill
+from backend.data.skill_bank_repository import SkillBankRepository
+
+request_id = contextvars.ContextVar("request_id", default=None)
+
+
+@pytest.fixture
+def db_manager_options():
+    return {"executor_workers": 4}
+
+
+@pytest.mark.unit
+class TestRunSync:
+    def test_runs_on_executor_with_context(self, db_manager):
+        def work(value):
+            return value * 2, threading.current_thread().name, request_id.get()
+
+        async def call():
+            request_id.set("req-1")
+            return await db_manager.run_sync(work, 21)
+
+        result, thread_name, seen_request = asyncio.run(call())
+        assert result == 42
+        assert thread_name.startswith("db")
+        assert seen_request == "req-1"
+
+    def test_propagates_errors(self, db_manager):
+        def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            asyncio.run(db_manager.run_sync(fail))
+
+    def test_bounded_and_keeps_loop_responsive(self, db_manager):
+        lock = threading.Lock()
+        running = [0, 0]  # current, peak
+
+        def slow_query():
+            with lock:
+                running[0] += 1
+                running[1] = max(running[1], running[0])
+            time.sleep(0.05)
+            with lock:
+                running[0] -= 1
+
+        async def scenario():
+            ticks = 0
+
+            async def heartbeat():
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0.005)
+
+            ticker = asyncio.create_task(heartbeat())
+            await asyncio.gather(*(db_manager.run_sync(slow_query) for _ in range(12)))
+            ticker.cancel()
+            return ticks
+
+        ticks = asyncio.run(scenario())
+        assert running[1] == db_manager.executor_workers
+        # Three rounds of 50ms queries; the loop kept ticking throughout
+        assert ticks >= 10
+
+
+@pytest.mark.unit
+@pytest.mark.database
+def test_skill_bank_repository_runs_on_executor(db_manager, monkeypatch):
+    repository = SkillBankRepository(db_manager)
+    threads = set()
+    fetch = repository._fetch_skills
+
+    def tracked_fetch(user_id, category):
+        threads.add(threading.current_thread().name)
+        return fetch(user_id, category)
+
+    monkeypatch.setattr(repository, "_fetch_skills", tracked_fetch)
+
+    async def scenario():
+        await repository.add_skill("user-1", EnhancedSkill(name="Python"))
+        return await repository.get_skills("user-1")
+
+    skills = asyncio.run(scenario())
+    assert "Python" in [skill.name for skill in skills]
+    assert threads and all(name.startswith("db") for name in threads)
@@ -0,0 +1,108 @@
+"""
+Tests for the packed embedding storage format.
+"""
+
+import numpy as np
+import pytest
+
+from backend.data import embedding_codec
+from backend.data.embedding_codec import (
+    FLOAT16,
+    FLOAT32,
+    INT8,
+    decode_embedding,
+    embedding_to_array,
+    embedding_to_list,
+    encode_embedding,
+)
+from backend.data.models import CompanyInfoDB, JobEmbeddingDB, JobListingDB
+
+VECTOR = [0.5, -0.25, 0.125, -1.0, 0.0, 0.333]
+
+
+@pytest.mark.unit
+class TestEmbeddingCodec:
+    @pytest.mark.parametrize(
+        "dtype, size, tolerance",
+        [(FLOAT32, 4, 1e-7), (FLOAT16, 2, 1e-3), (INT8, 1, 1.0 / 127)],
+    )
+    def test_round_trip(self, dtype, size, tolerance):
+        data, scale = encode_embedding(VECTOR, dtype)
+
+        assert len(data) == len(VECTOR) * size
+        assert (scale is not None) == (dtype == INT8)
+        assert embedding_to_array(data, dtype, scale) == pytest.approx(
+            VECTOR, abs=tolerance
+        )
+
+    def test_float32_decoding_is_zero_copy(self):
+        data, _ = encode_embedding(VECTOR)
+        view = decode_embedding(data)
+
+        assert view.dtype == np.dtype("<f4")
+        assert not view.flags.owndata
+        assert embedding_to_array(data).base is not None
+
+    def test_int8_keeps_direction(self):
+        data, scale = encode_embedding(VECTOR, INT8)
+        codes = decode_embedding(data, INT8).astype(np.float32)
+        original = np.asarray(VECTOR, dtype=np.float32)
+
+        cosine = codes @ original / np.linalg.norm(codes) / np.linalg.norm(original)
+        assert cosine > 0.999
+        assert scale == pytest.approx(1.0 / 127)
+
+    @pytest.mark.parametrize("dtype", [FLOAT32, FLOAT16, INT8])
+    def test_pure_python_fallback_matches_numpy(self, dtype, monkeypatch):
+        expected = encode_embedding(VECTOR, dtype)
+
+        monkeypatch.setattr(embedding_codec, "NUMPY_AVAILABLE", False)
+        data, scale = encode_embedding(VECTOR, dtype)
+
+        assert data == expected[0]
+        assert scale == pytest.approx(expected[1])
+        assert embedding_to_list(data, dtype, scale) == pytest.approx(
+            VECTOR, abs=1.0 / 127
+        )
+
+    def test_unknown_dtype_is_rejected(self):
+        with pytest.raises(ValueError):
+            encode_embedding(VECTOR, "float64")
+
+
+@pytest.mark.unit
+@pytest.mark.models
+class TestJobEmbeddingStorage:
+    def test_model_accessors(
+        self, clean_db, sample_company_db_data, sample_job_db_data
+    ):
+        company = CompanyInfoDB(**sample_company_db_data)
+        clean_db.add(company)
+        clean_db.flush()
+        job = JobListingDB(company_id=company.id, **sample_job_db_data)
+        clean_db.add(job)
+        clean_db.flush()
+
+        embedding = JobEmbeddingDB(
+            job_id=job.id, embedding_model="test-model", content_hash="abc"
+        )
+        embedding.set_vector(VECTOR, FLOAT16)
+        clean_db.add(embedding)
+        clean_db.commit()
+        clean_db.expire_all()
+
+        stored = clean_db.get(JobEmbeddingDB, embedding.id)
+        assert stored.embedding_dtype == FLOAT16
+        assert stored.embedding_dimension == len(VECTOR)
+        assert isinstance(stored.embedding_data, bytes)
+        assert stored.as_array() == pytest.approx(VECTOR, abs=1e-3)
+        assert stored.embedding_vector == pytest.approx(VECTOR, abs=1e-3)
+
+    def test_legacy_vector_keyword_packs_float32(self):
+        embedding = JobEmbeddingDB(
+            job_id="job", embedding_model="m", content_hash="h", embedding_vector=VECTOR
+        )
+
+        assert embedding.embedding_dtype == FLOAT32
+        assert len(embedding.embedding_data) == len(VECTOR) * 4
+        assert embedding.embedding_vector == pytest.approx(VECTOR)
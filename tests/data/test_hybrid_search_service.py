@@ -0,0 +1,159 @@
+"""
+Tests for hybrid keyword + semantic search score fusion.
+"""
+
+import asyncio
+import hashlib
+import uuid
+
+import pytest
+
+from backend.data.database import JobRepository
+from backend.data.models import CompanyInfoDB, JobEmbeddingDB, JobListingDB, JobStatus
+from backend.data.vector_index import HashingEmbedder, job_embedding_text
+from backend.services.hybrid_search_service import (
+    RRF,
+    HybridSearchService,
+    fuse_scores,
+    min_max_normalize,
+    reciprocal_rank_scores,
+)
+
+JOBS = [
+    ("Python Backend Engineer", "Django and FastAPI services", "Remote", "Acme"),
+    ("Data Scientist", "Machine learning models in Python", "Berlin", "Acme"),
+    ("Frontend Developer", "React and TypeScript user interfaces", "Remote", "Globex"),
+    ("Warehouse Associate", "Forklift operation and inventory", "Austin", "Globex"),
+]
+
+
+@pytest.fixture
+def hybrid_db(db_manager):
+    """File database with jobs from two companies and their embeddings."""
+    embedder = HashingEmbedder()
+    job_ids = {}
+
+    with db_manager.get_session() as session:
+        companies = {}
+        for name in ("Acme", "Globex"):
+            companies[name] = CompanyInfoDB(
+                id=str(uuid.uuid4()), name=name, normalized_name=name.lower()
+            )
+            session.add(companies[name])
+        for title, description, location, company in JOBS:
+            job = JobListingDB(
+                id=str(uuid.uuid4()),
+                company_id=companies[company].id,
+                title=title,
+                description=description,
+                location=location,
+                status=JobStatus.ACTIVE,
+            )
+            session.add(job)
+            text = job_embedding_text(title, description)
+            session.add(
+                JobEmbeddingDB(
+                    job_id=job.id,
+                    embedding_model=embedder.model_name,
+                    content_hash=hashlib.md5(text.encode()).hexdigest(),
+                    embedding_vector=embedder.embed(text),
+                    embedding_dimension=embedder.dimension,
+                )
+            )
+            job_ids[job.id] = title
+
+    service = HybridSearchService(JobRepository(db_manager), db_manager.vector_index)
+    return service, job_ids
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+@pytest.mark.unit
+class TestScoreFusion:
+    def test_min_max_normalize(self):
+        scores = min_max_normalize([("a", 8.0), ("b", 5.0), ("c", 2.0)])
+        assert scores == {"a": 1.0, "b": 0.5, "c": 0.0}
+        assert min_max_normalize([("a", 3.0), ("b", 3.0)]) == {"a": 1.0, "b": 1.0}
+        assert min_max_normalize([]) == {}
+
+    def test_reciprocal_rank_scores_follow_rank_only(self):
+        scores = reciprocal_rank_scores([("a", 100.0), ("b", 0.1)], k=60)
+        assert scores["a"] == 1.0
+        assert scores["b"] == pytest.approx(61 / 62)
+
+    def test_fusion_merges_candidates_by_id(self):
+        fused = fuse_scores(
+            [("a", 10.0), ("b", 4.0), ("c", 1.0)],
+            [("c", 0.9), ("d", 0.3)],
+            keyword_weight=0.25,
+            semantic_weight=0.75,
+        )
+        by_id = {job_id: (combined, kw, sem) for job_id, combined, kw, sem in fused}
+
+        assert [job_id for job_id, *_ in fused] == ["c", "a", "b", "d"]
+        assert by_id["c"] == pytest.approx((0.75, 0.0, 1.0))
+        assert by_id["d"] == pytest.approx((0.0, 0.0, 0.0))
+
+    def test_rrf_rewards_agreement(self):
+        fused = fuse_scores(
+            [("a", 9.0), ("b", 8.0), ("c", 7.0)],
+            [("d", 0.9), ("b", 0.8), ("e", 0.7)],
+            fusion=RRF,
+        )
+        assert fused[0][0] == "b"
+
+    def test_weights_are_normalized(self):
+        fused = fuse_scores([("a", 1.0)], [("b", 1.0)], 0.0, 0.0)
+        assert {combined for _, combined, _, _ in fused} == {0.5}
+
+        with pytest.raises(ValueError):
+            fuse_scores([], [], fusion="borda")
+
+
+@pytest.mark.unit
+@pytest.mark.database
+class TestHybridSearchService:
+    def test_results_combine_both_stages(self, hybrid_db):
+        service, job_ids = hybrid_db
+        outcome = run(service.search("python engineer", limit=2))
+
+        assert [job_ids[str(hit.job.id)] for hit in outcome.hits][0] == (
+            "Python Backend Engineer"
+        )
+        assert len(outcome.hits) == 2
+        assert outcome.total >= 2
+        top = outcome.hits[0]
+        assert top.keyword_score == 1.0 and top.semantic_score == 1.0
+        assert top.job.company_name == "Acme"
+        assert {
+            "keyword_ms",
+            "semantic_ms",
+            "retrieval_ms",
+            "fusion_ms",
+            "hydration_ms",
+            "total_ms",
+        } <= set(outcome.timings)
+
+    def test_filters_apply_to_both_stages(self, hybrid_db):
+        service, job_ids = hybrid_db
+
+        outcome = run(service.search("python", limit=10, location="Berlin"))
+        assert [job_ids[str(hit.job.id)] for hit in outcome.hits] == ["Data Scientist"]
+
+        outcome = run(service.search("developer", limit=10, company="Globex"))
+        assert "Python Backend Engineer" not in {
+            job_ids[str(hit.job.id)] for hit in outcome.hits
+        }
+
+        outcome = run(service.search("python", limit=10, job_types=["Gig"]))
+        assert outcome.hits == [] and outcome.total == 0
+
+    def test_zero_weight_skips_stage(self, hybrid_db):
+        service, _ = hybrid_db
+        outcome = run(service.search("forklift", limit=5, semantic_weight=0.0))
+
+        assert "semantic_ms" not in outcome.timings
+        assert len(outcome.hits) == 1
+        assert outcome.hits[0].semantic_score == 0.0
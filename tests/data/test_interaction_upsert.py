@@ -0,0 +1,82 @@
+"""
+Tests for upserted job user interactions.
+"""
+
+import threading
+
+import pytest
+
+import backend.data.interaction_repository as interaction_repository
+from backend.data.engine import EngineProfile
+from backend.data.interaction_repository import JobUserInteractionRepository
+from backend.data.models import InteractionType
+
+
+@pytest.fixture(params=[0, 256], ids=["inline", "write-queue"])
+def db_manager_options(request):
+    # Inline writes race in separate transactions; queued writes share one
+    return {"engine_profile": EngineProfile(write_batch_size=request.param)}
+
+
+@pytest.fixture
+def repository(db_manager):
+    return JobUserInteractionRepository(db_manager)
+
+
+def run_in_parallel(target, threads=20):
+    workers = [threading.Thread(target=target) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+
+@pytest.mark.unit
+@pytest.mark.database
+class TestInteractionUpserts:
+    def test_parallel_saves_create_one_row(self, repository):
+        errors = []
+
+        def saver():
+            for i in range(10):
+                try:
+                    repository.save_job("user-1", "job-1", notes=f"note {i}")
+                except Exception as e:
+                    errors.append(e)
+
+        run_in_parallel(saver)
+
+        assert errors == []
+        saved = repository.get_user_interactions("user-1", InteractionType.SAVED)
+        assert len(saved) == 1
+        assert saved[0].interaction_count == 200
+        assert saved[0].saved_date is not None
+
+    def test_upsert_returns_stored_row(self, repository):
+        first = repository.apply_to_job("user-1", "job-1", resume_version="v1")
+        second = repository.apply_to_job("user-1", "job-1", resume_version="v2")
+
+        assert second.id == first.id
+        assert second.resume_version == "v2"
+        assert second.interaction_count == 2
+        assert second.applied_date == first.applied_date
+        assert second.first_interaction == first.first_interaction
+
+    def test_hide_does_not_count(self, repository):
+        repository.hide_job("user-1", "job-1", reason="too far")
+        hidden = repository.hide_job("user-1", "job-1", reason="not remote")
+        assert hidden.notes == "not remote"
+        assert hidden.interaction_count == 1
+
+    def test_view_data_is_merged(self, repository):
+        repository.record_job_view("user-1", "job-1", {"source": "email"})
+        viewed = repository.record_job_view("user-1", "job-1", {"page": 2})
+        assert viewed.interaction_count == 2
+        assert viewed.interaction_data == {"source": "email", "page": 2}
+
+    def test_dialects_without_upsert_fall_back(self, repository, monkeypatch):
+        monkeypatch.setattr(interaction_repository, "upsert_insert", lambda bind: None)
+        repository.save_job("user-1", "job-1", tags=["a"])
+        saved = repository.save_job("user-1", "job-1", tags=["b"])
+        assert saved.tags == ["b"]
+        assert saved.interaction_count == 2
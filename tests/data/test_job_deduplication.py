@@ -0,0 +1,218 @@
+"""
+Tests for blocking + MinHash/LSH job deduplication.
+"""
+
+import os
+import random
+import subprocess
+import sys
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from backend.data import job_deduplication
+from backend.data.job_deduplication import DedupRecord, JobDeduplicator, MinHasher
+from backend.data.models import CompanyInfoDB, JobDeduplicationDB, JobListingDB
+
+WORDS = [f"word{i}" for i in range(2000)]
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Signs a 5000-word description, more shingles than MAX_SHINGLES
+SIGNATURE_SCRIPT = """
+import random
+from backend.data.job_deduplication import MinHasher, _shingle_hashes
+rng = random.Random(7)
+text = " ".join(rng.choice([f"word{i}" for i in range(2000)]) for _ in range(5000))
+print(MinHasher().signatures([_shingle_hashes(text)])[0])
+"""
+
+
+def description(rng, length=120):
+    return " ".join(rng.choices(WORDS, k=length))
+
+
+def reworded(text, rng, changes=3):
+    words = text.split()
+    for _ in range(changes):
+        words[rng.randrange(len(words))] = rng.choice(WORDS)
+    return " ".join(words)
+
+
+@pytest.fixture
+def records():
+    """Distinct listings plus re-posts of the first two with light edits."""
+    rng = random.Random(3)
+    posted = datetime(2024, 1, 1)
+    listings = [
+        DedupRecord(
+            f"job-{i}",
+            f"Company {i % 5} Inc.",
+            f"Engineer {i}",
+            description(rng),
+            "Berlin",
+            posted + timedelta(days=i),
+        )
+        for i in range(40)
+    ]
+    listings.append(
+        DedupRecord(
+            "repost-0",
+            "Company 0",
+            "Engineer 0",
+            reworded(listings[0].description, rng),
+            "Berlin",
+            posted - timedelta(days=1),
+        )
+    )
+    listings.append(
+        DedupRecord(
+            "repost-1",
+            "COMPANY 1 inc",
+            "Engineer 1",
+            reworded(listings[1].description, rng),
+            None,
+            posted + timedelta(days=90),
+        )
+    )
+    # Same description at another company is not a duplicate
+    listings.append(
+        DedupRecord(
+            "other-company",
+            "Globex",
+            "Engineer 0",
+            listings[0].description,
+            "Berlin",
+        )
+    )
+    return listings
+
+
+def pair_ids(report):
+    return {
+        (pair.canonical_job_id, pair.duplicate_job_id) for pair in report.duplicates
+    }
+
+
+@pytest.mark.unit
+class TestJobDeduplicator:
+    def test_finds_reposts_within_company_blocks(self, records):
+        report = JobDeduplicator().find_duplicates(records, 0.8)
+
+        # The earliest posting is canonical
+        assert pair_ids(report) == {("repost-0", "job-0"), ("job-1", "repost-1")}
+        assert report.blocks == 6
+        assert report.jobs_processed == len(records)
+        assert report.candidate_pairs < len(records) * (len(records) - 1) // 20
+
+        by_duplicate = {pair.duplicate_job_id: pair for pair in report.duplicates}
+        assert by_duplicate["job-0"].matching_fields == [
+            "company",
+            "title",
+            "description",
+            "location",
+        ]
+        assert "location" not in by_duplicate["repost-1"].matching_fields
+        assert 0.8 <= by_duplicate["job-0"].confidence_score <= 1.0
+
+    def test_title_only_listings_pair_on_identical_titles(self):
+        listings = [
+            DedupRecord("a", "Acme", "Senior Python Engineer"),
+            DedupRecord("b", "Acme", "senior python engineer"),
+            DedupRecord("c", "Acme", "Data Analyst"),
+        ]
+        report = JobDeduplicator().find_duplicates(listings, 0.9)
+        assert pair_ids(report) == {("a", "b")}
+        assert report.duplicates[0].matching_fields == ["company", "title"]
+
+    def test_oversized_buckets_are_paired_star_wise(self):
+        listings = [
+            DedupRecord(f"job-{i}", "Acme", "Warehouse Associate") for i in range(30)
+        ]
+        report = JobDeduplicator(max_bucket_size=10).find_duplicates(listings, 0.9)
+        assert report.candidate_pairs == 29
+
+    def test_pure_python_fallback_matches_numpy(self, records, monkeypatch):
+        expected = JobDeduplicator().find_duplicates(records, 0.5)
+
+        monkeypatch.setattr(job_deduplication, "NUMPY_AVAILABLE", False)
+        report = JobDeduplicator().find_duplicates(records, 0.5)
+
+        assert pair_ids(report) == pair_ids(expected)
+        assert report.candidate_pairs == expected.candidate_pairs
+
+    def test_minhash_estimates_jaccard(self):
+        hasher = MinHasher(num_perm=256)
+        left = list(range(0, 300))
+        right = list(range(100, 400))  # Jaccard 200 / 400
+        signatures = hasher.signatures([left, right, []])
+
+        agreement = sum(
+            1 for a, b in zip(signatures[0], signatures[1], strict=True) if a == b
+        ) / len(signatures[0])
+        assert agreement == pytest.approx(0.5, abs=0.1)
+        assert not any(signatures[2])
+
+    def test_long_text_signatures_do_not_depend_on_hash_seed(self):
+        def signature(seed):
+            return subprocess.run(
+                [sys.executable, "-c", SIGNATURE_SCRIPT],
+                cwd=PROJECT_ROOT,
+                env={**os.environ, "PYTHONHASHSEED": seed},
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+
+        assert signature("1") == signature("2")
+
+
+@pytest.mark.unit
+@pytest.mark.database
+class TestDeduplicationRun:
+    def test_run_records_new_pairs_once(self, db_manager, records):
+        companies = {}
+        with db_manager.get_session() as session:
+            for record in records:
+                if record.company not in companies:
+                    companies[record.company] = str(uuid.uuid4())
+                    session.add(
+                        CompanyInfoDB(
+                            id=companies[record.company],
+                            name=record.company,
+                            normalized_name=record.company.lower(),
+                        )
+                    )
+                session.add(
+                    JobListingDB(
+                        id=record.job_id,
+                        company_id=companies[record.company],
+                        title=record.title,
+                        description=record.description,
+                        location=record.location,
+                        posted_date=record.posted,
+                    )
+                )
+
+        deduplicator = JobDeduplicator()
+        with db_manager.get_session() as session:
+            report = deduplicator.run(session, confidence_threshold=0.8)
+        assert report.records_written == 2
+        assert report.jobs_per_second > 0
+
+        with db_manager.get_session() as session:
+            report = deduplicator.run(
+                session, ["job-0", "repost-0", "job-1"], confidence_threshold=0.8
+            )
+            assert report.jobs_processed == 3
+            assert pair_ids(report) == {("repost-0", "job-0")}
+            assert report.records_written == 0
+
+            stored = session.query(JobDeduplicationDB).all()
+            assert {(row.canonical_job_id, row.duplicate_job_id) for row in stored} == {
+                ("repost-0", "job-0"),
+                ("job-1", "repost-1"),
+            }
+            assert all(row.merge_strategy == "keep_canonical" for row in stored)
@@ -0,0 +1,320 @@
+"""
+Tests for the streaming job feed ingestion pipeline.
+"""
+
+import asyncio
+import json
+import threading
+import uuid
+from datetime import datetime
+
+import pytest
+
+from backend.data.models import (
+    CompanyInfoDB,
+    JobListingDB,
+    JobSourceDB,
+    JobSourceListingDB,
+    JobType,
+    RemoteType,
+)
+from backend.services.job_ingestion_service import (
+    JobIngestionPipeline,
+    RateLimiter,
+    file_postings,
+    normalize_posting,
+    posting_content_hash,
+)
+
+POSTINGS = [
+    {
+        "id": "b-1",
+        "position": "Python Engineer",
+        "company": "Acme Inc.",
+        "url": "https://board.example.com/jobs/1",
+        "job_type": "full-time",
+        "remote_type": "Remote",
+        "salary_min": 120000,
+        "salary_max": 100000,
+        "posted_date": "2024-03-01T09:00:00Z",
+        "team": "platform",
+    },
+    {
+        "id": "b-2",
+        "position": "Data Analyst",
+        "company": "Globex",
+        "url": "https://board.example.com/jobs/2",
+        "posted_date": "2024-03-02T09:00:00",
+    },
+    {"id": "b-3", "position": "Designer", "company": "ACME"},
+    {"id": "b-4", "company": "Globex"},
+]
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+@pytest.fixture
+def db_manager(db_manager):
+    with db_manager.get_session() as session:
+        session.add(
+            JobSourceDB(
+                id=str(uuid.uuid4()),
+                name="board",
+                display_name="Board",
+                base_url="https://board.example.com",
+                scraping_rules={"field_map": {"title": "position"}},
+            )
+        )
+    return db_manager
+
+
+@pytest.fixture
+def feed_file(temp_dir):
+    path = temp_dir / "postings.jsonl"
+    path.write_text(
+        "".join(json.dumps(posting) + "\n" for posting in POSTINGS), encoding="utf-8"
+    )
+    return path
+
+
+async def generated(postings, pulled=None):
+    for posting in postings:
+        if pulled is not None:
+            pulled.append(posting)
+        yield posting
+
+
+@pytest.mark.unit
+class TestNormalizePosting:
+    def test_maps_fields_and_cleans_values(self):
+        posting = normalize_posting(
+            POSTINGS[0], "https://board.example.com", {"title": "position"}
+        )
+        assert posting.source_job_id == "b-1"
+        assert posting.company_name == "Acme Inc."
+        assert posting.job["title"] == "Python Engineer"
+        assert posting.job["job_type"] == JobType.FULL_TIME
+        assert posting.job["remote_type"] == RemoteType.REMOTE
+        assert (posting.job["salary_min"], posting.job["salary_max"]) == (
+            100000,
+            120000,
+        )
+        assert posting.job["posted_date"] == datetime(2024, 3, 1, 9)
+        assert posting.metadata == {"team": "platform"}
+
+    def test_rejects_incomplete_postings(self):
+        assert normalize_posting({"company": "Acme", "id": "1"}) is None
+        assert normalize_posting({"title": "Engineer", "id": "1"}) is None
+        assert normalize_posting({"title": "Engineer", "company": "Acme"}) is None
+
+    def test_falls_back_to_url_and_base_url(self):
+        posting = normalize_posting(
+            {"title": "Engineer", "company": "Acme", "url": "not-a-url"},
+            "https://board.example.com",
+        )
+        assert posting is None
+
+        posting = normalize_posting(
+            {"title": "Engineer", "company": "Acme", "source_job_id": 7},
+            "https://board.example.com",
+        )
+        assert posting.source_url == "https://board.example.com"
+        assert posting.job["job_url"] is None
+
+    def test_content_hash_ignores_key_order_and_volatile_fields(self):
+        posting = {"id": "1", "title": "Engineer", "views": 10}
+        reordered = {"views": 10, "title": "Engineer", "id": "1"}
+        assert posting_content_hash(posting) == posting_content_hash(reordered)
+        assert posting_content_hash(posting) != posting_content_hash(
+            {**posting, "views": 11}
+        )
+        assert posting_content_hash(posting, ["views"]) == posting_content_hash(
+            {**posting, "views": 11}, ["views"]
+        )
+
+
+@pytest.mark.unit
+class TestRateLimiter:
+    def test_from_config(self):
+        assert RateLimiter.from_config(None) is None
+        assert RateLimiter.from_config({"burst": 3}) is None
+        limiter = RateLimiter.from_config(
+            {"requests_per_minute": 30, "postings_per_request": 10}
+        )
+        assert limiter.rate == pytest.approx(0.5)
+        assert limiter.cost == pytest.approx(0.1)
+
+    def test_acquire_waits_for_tokens(self):
+        now = [0.0]
+        sleeps = []
+
+        async def sleep(seconds):
+            sleeps.append(seconds)
+            now[0] += seconds
+
+        limiter = RateLimiter(2.0, burst=2, clock=lambda: now[0], sleep=sleep)
+
+        async def pull(count):
+            for _ in range(count):
+                await limiter.acquire()
+
+        run(pull(5))
+        # Two from the burst, then one every half second
+        assert sum(sleeps) == pytest.approx(1.5)
+
+
+@pytest.mark.unit
+@pytest.mark.database
+class TestJobIngestionPipeline:
+    def test_ingests_file_feed(self, db_manager, feed_file):
+        pipeline = JobIngestionPipeline(db_manager, batch_size=2)
+        report = run(pipeline.ingest("board", file_postings(feed_file)))
+
+        assert report.received == 4
+        assert report.rejected == 1
+        assert report.inserted == 3 and report.updated == 0
+        assert report.batches == 2
+
+        with db_manager.get_session() as session:
+            source = session.query(JobSourceDB).one()
+            assert source.last_scraped is not None
+            listings = {
+                listing.source_job_id: listing
+                for listing in session.query(JobSourceListingDB)
+            }
+            assert set(listings) == {"b-1", "b-2", "b-3"}
+            assert listings["b-1"].source_metadata == {"team": "platform"}
+            assert listings["b-3"].source_url == "https://board.example.com"
+
+            job = listings["b-1"].job
+            assert job.title == "Python Engineer"
+            assert job.source == "board"
+            assert job.company.name == "Acme Inc."
+            # "ACME" resolves to the company created for "Acme Inc."
+            assert listings["b-3"].job.company_id == job.company_id
+            assert session.query(CompanyInfoDB).count() == 2
+
+        jobs, _ = pipeline.job_repository.search_jobs(query="analyst")
+        assert [job.title for job in jobs] == ["Data Analyst"]
+
+    def test_reingest_updates_instead_of_duplicating(self, db_manager, feed_file):
+        pipeline = JobIngestionPipeline(db_manager, batch_size=10)
+        run(pipeline.ingest("board", file_postings(feed_file)))
+
+        changed = [
+            {**POSTINGS[1], "position": "Senior Data Analyst"},
+            {**POSTINGS[1], "position": "Lead Data Analyst"},
+            {"id": "b-5", "position": "SRE", "company": "Initech"},
+        ]
+        report = run(pipeline.ingest("board", generated(changed)))
+        assert (report.inserted, report.updated, report.duplicates) == (1, 1, 1)
+
+        with db_manager.get_session() as session:
+            assert session.query(JobListingDB).count() == 4
+            assert session.query(JobSourceListingDB).count() == 4
+            listing = (
+                session.query(JobSourceListingDB).filter_by(source_job_id="b-2").one()
+            )
+            assert listing.job.title == "Lead Data Analyst"
+
+    def test_reingest_only_touches_unchanged_postings(self, db_manager, feed_file):
+        pipeline = JobIngestionPipeline(db_manager, batch_size=10)
+        run(pipeline.ingest("board", file_postings(feed_file)))
+        with db_manager.get_session() as session:
+            before = {
+                job.title: (job.updated_at, job.last_verified)
+                for job in session.query(JobListingDB)
+            }
+            assert all(
+                listing.content_hash for listing in session.query(JobSourceListingDB)
+            )
+
+        feed = [*POSTINGS[:2], {**POSTINGS[2], "position": "Senior Designer"}]
+        report = run(pipeline.ingest("board", generated(feed)))
+        assert (report.unchanged, report.updated, report.inserted) == (2, 1, 0)
+
+        with db_manager.get_session() as session:
+            jobs = {job.title: job for job in session.query(JobListingDB)}
+            assert set(jobs) == {"Python Engineer", "Data Analyst", "Senior Designer"}
+            for title in ("Python Engineer", "Data Analyst"):
+                updated_at, last_verified = before[title]
+                assert jobs[title].updated_at == updated_at
+                assert jobs[title].last_verified > last_verified
+
+        # A posting repeated in one run with its stored content is only touched
+        report = run(pipeline.ingest("board", generated([POSTINGS[1], POSTINGS[1]])))
+        assert (report.unchanged, report.duplicates, report.batches) == (1, 1, 0)
+
+    def test_volatile_fields_do_not_count_as_changes(self, db_manager):
+        with db_manager.get_session() as session:
+            session.query(JobSourceDB).update(
+                {"scraping_rules": {"volatile_fields": ["views"]}}
+            )
+        pipeline = JobIngestionPipeline(db_manager)
+        posting = {"id": "v-1", "title": "Engineer", "company": "Acme", "views": 1}
+        run(pipeline.ingest("board", generated([posting])))
+
+        report = run(pipeline.ingest("board", generated([{**posting, "views": 9}])))
+        assert report.unchanged == 1 and report.updated == 0
+
+    def test_file_feed_skips_postings_before_since(self, feed_file):
+        async def collect():
+            return [
+                posting["id"]
+                async for posting in file_postings(
+                    feed_file, since=datetime(2024, 3, 1, 12)
+                )
+            ]
+
+        # Postings without a date are always kept
+        assert run(collect()) == ["b-2", "b-3", "b-4"]
+
+    def test_bounded_queues_apply_backpressure(self, db_manager, monkeypatch):
+        pipeline = JobIngestionPipeline(db_manager, batch_size=5, queue_size=1)
+        release = threading.Event()
+        pulled = []
+        total = 500
+
+        write_batch = pipeline._write_batch
+
+        async def observe():
+            task = asyncio.create_task(
+                pipeline.ingest(
+                    "board",
+                    generated(
+                        (
+                            {"id": str(i), "title": f"Job {i}", "company": "Acme"}
+                            for i in range(total)
+                        ),
+                        pulled,
+                    ),
+                )
+            )
+            await asyncio.sleep(0.3)
+            stalled_at = len(pulled)
+            release.set()
+            report = await task
+            return stalled_at, report
+
+        def blocked_write(source_row, batch):
+            release.wait(5)
+            write_batch(source_row, batch)
+
+        monkeypatch.setattr(pipeline, "_write_batch", blocked_write)
+        stalled_at, report = run(observe())
+
+        # Raw queue, one batch per stage and per queue, nowhere near the feed
+        assert stalled_at <= 5 * 12
+        assert report.inserted == total
+
+    def test_unknown_and_inactive_sources(self, db_manager):
+        pipeline = JobIngestionPipeline(db_manager)
+        with pytest.raises(ValueError):
+            run(pipeline.ingest("missing", generated([])))
+
+        with db_manager.get_session() as session:
+            session.query(JobSourceDB).update({"is_active": False})
+        with pytest.raises(ValueError):
+            run(pipeline.ingest("board", generated([])))
@@ -0,0 +1,105 @@
+"""
+Tests for keyset (cursor) pagination.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import insert, text
+
+from backend.data.database import UserRepository
+from backend.data.interaction_repository import JobUserInteractionRepository
+from backend.data.models import UserProfileDB
+from backend.data.pagination import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    next_cursor,
+)
+
+
+def add_users(db_manager, count):
+    # Three users share each timestamp, so the id has to break ties
+    base = datetime(2024, 1, 1)
+    rows = [
+        {
+            "id": f"00000000-0000-0000-0000-{n:012d}",
+            "email": f"user{n}@example.com",
+            "created_at": base + timedelta(minutes=n // 3),
+        }
+        for n in range(count)
+    ]
+    with db_manager.get_session() as session:
+        session.execute(insert(UserProfileDB), rows)
+
+
+@pytest.mark.unit
+class TestCursors:
+    def test_round_trip(self):
+        created = datetime(2024, 5, 6, 7, 8, 9, 123456)
+        cursor = encode_cursor(created, "user-1")
+        assert "=" not in cursor
+        assert decode_cursor(cursor) == (created, "user-1")
+
+    @pytest.mark.parametrize("cursor", ["", "not-a-cursor", "WzFd", "eyJhIjogMX0"])
+    def test_invalid_cursors_are_rejected(self, cursor):
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor)
+
+    def test_no_cursor_after_a_short_page(self):
+        class Row:
+            id = "a"
+            created_at = datetime(2024, 1, 1)
+
+        assert next_cursor([Row(), Row()], 3, "created_at") is None
+        assert next_cursor([Row(), Row()], 2, "created_at") is not None
+
+
+@pytest.mark.unit
+@pytest.mark.database
+class TestKeysetPagination:
+    def test_cursor_pages_match_offset_pages(self, db_manager):
+        add_users(db_manager, 25)
+        users = UserRepository(db_manager)
+
+        everyone, total = users.list_users(limit=100)
+        assert total == 25
+
+        seen, cursor = [], None
+        while True:
+            page, page_total = users.list_users(
+                limit=4, after=cursor, include_total=False
+            )
+            assert page_total is None
+            seen.extend(page)
+            cursor = next_cursor(page, 4, "created_at")
+            if cursor is None:
+                break
+
+        assert [user.id for user in seen] == [user.id for user in everyone]
+        assert len({user.id for user in seen}) == 25
+
+    def test_invalid_cursor_is_raised_not_swallowed(self, db_manager):
+        with pytest.raises(InvalidCursorError):
+            UserRepository(db_manager).list_users(after="garbage")
+        with pytest.raises(InvalidCursorError):
+            JobUserInteractionRepository(db_manager).get_applications(
+                "user-1", after="garbage"
+            )
+
+    def test_deep_pages_use_an_index_range_scan(self, db_manager):
+        add_users(db_manager, 3)
+        with db_manager.get_session() as session:
+            plan = " ".join(
+                row[-1]
+                for row in session.execute(
+                    text(
+                        "EXPLAIN QUERY PLAN SELECT id FROM user_profiles "
+                        "WHERE (created_at, id) < (:created_at, :id) "
+                        "ORDER BY created_at DESC, id DESC LIMIT 10"
+                    ),
+                    {"created_at": "2024-01-01 00:00:00.000000", "id": "x"},
+                )
+            )
+        assert "idx_user_created" in plan
+        assert "TEMP B-TREE" not in plan
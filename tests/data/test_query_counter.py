@@ -0,0 +1,103 @@
+"""
+Tests for the query counter and N+1 checks on job reads.
+"""
+
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import insert
+
+from backend.data.database import JobRepository
+from backend.data.mock_data_generator import MockDataGenerator
+from backend.data.models import (
+    CompanyInfoDB,
+    JobListingDB,
+    TimelineEventDB,
+    UserProfileDB,
+)
+from backend.data.query_counter import (
+    QueryCountGrowthError,
+    assert_constant_queries,
+    count_queries,
+)
+
+
+@pytest.fixture
+def repo(db_manager):
+    companies = [
+        {"id": str(uuid4()), "name": f"Company {n}", "normalized_name": f"c{n}"}
+        for n in range(20)
+    ]
+    jobs = [
+        {
+            "id": str(uuid4()),
+            "title": f"Engineer {n}",
+            "company_id": companies[n]["id"],
+            "status": "active",
+        }
+        for n in range(20)
+    ]
+    with db_manager.get_session() as session:
+        session.execute(insert(CompanyInfoDB), companies)
+        session.execute(insert(JobListingDB), jobs)
+    repo = JobRepository(db_manager)
+    repo.job_ids = [job["id"] for job in jobs]
+    return repo
+
+
+@pytest.mark.unit
+@pytest.mark.database
+class TestQueryCounter:
+    def test_counts_statements(self, repo):
+        counter = count_queries(repo.db_manager.engine, lambda: repo.get_job("x"))
+        assert counter.count == 1
+        assert counter.statements[0].startswith("SELECT")
+
+    def test_per_row_loads_are_caught(self, repo):
+        with pytest.raises(QueryCountGrowthError):
+            assert_constant_queries(
+                repo.db_manager.engine,
+                lambda size: [repo.get_job(job_id) for job_id in repo.job_ids[:size]],
+            )
+
+    @pytest.mark.parametrize(
+        "read",
+        [
+            lambda repo, size: repo.search_jobs(limit=size),
+            lambda repo, size: repo.search_jobs(limit=size, summary=False),
+            lambda repo, size: repo.get_jobs_by_company("Company", limit=size),
+            lambda repo, size: repo.get_recent_jobs(limit=size),
+            lambda repo, size: repo.get_jobs(repo.job_ids[:size]),
+        ],
+        ids=["search", "search_full", "by_company", "recent", "get_jobs"],
+    )
+    def test_job_reads_do_not_grow_with_page_size(self, repo, read):
+        count = assert_constant_queries(
+            repo.db_manager.engine, lambda size: read(repo, size)
+        )
+        assert count <= 2
+
+
+@pytest.mark.unit
+@pytest.mark.database
+def test_mock_interactions_use_batched_job_details(repo):
+    user_ids = [str(uuid4()) for _ in range(2)]
+    with repo.db_manager.get_session() as session:
+        session.add_all(
+            UserProfileDB(id=user_id, email=f"{user_id}@example.com")
+            for user_id in user_ids
+        )
+
+    generator = MockDataGenerator(repo.db_manager)
+    results = generator.create_job_interactions(user_ids, repo.job_ids)
+    assert results["interactions"] == results["timeline_events"] > 0
+
+    with repo.db_manager.get_session() as session:
+        descriptions = [
+            event.description for event in session.query(TimelineEventDB).all()
+        ]
+    assert len(descriptions) == results["timeline_events"]
+    assert all(
+        description.startswith(("Applied to Engineer ", "Saved Engineer "))
+        for description in descriptions
+    )
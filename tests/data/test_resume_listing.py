@@ -0,0 +1,134 @@
+"""
+Tests for listing a user's resumes with SQL filtering and pagination.
+"""
+
+from datetime import date, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import insert
+
+from backend.api.models.resumes.models import ResumeResponse
+from backend.data import resume_repository
+from backend.data.database import ResumeRepository
+from backend.data.models import UserProfileDB
+from backend.data.pagination import next_cursor
+from backend.data.resume_models import (
+    ContactInfo,
+    ResumeDB,
+    ResumeType,
+    WorkExperience,
+)
+
+USER_ID = str(uuid4())
+
+
+@pytest.fixture
+def db_manager(db_manager):
+    base = datetime(2024, 1, 1)
+    base_id = str(uuid4())
+    rows = [
+        {
+            "id": base_id,
+            "user_id": USER_ID,
+            "title": "Base",
+            "resume_type": "base",
+            "contact_info": {"full_name": "Dev", "email": "dev@example.com"},
+            "work_experience": [
+                {
+                    "company": "Acme",
+                    "position": "Engineer",
+                    "start_date": "2020-01-01",
+                }
+            ],
+            "updated_at": base,
+        }
+    ] + [
+        {
+            "id": str(uuid4()),
+            "user_id": USER_ID,
+            "title": f"Tailored {n}",
+            "resume_type": "tailored",
+            "parent_resume_id": base_id,
+            "contact_info": {"full_name": "Dev", "email": "dev@example.com"},
+            # Pairs of resumes share a timestamp, so the id has to break ties
+            "updated_at": base + timedelta(minutes=1 + n // 2),
+        }
+        for n in range(9)
+    ]
+    with db_manager.get_session() as session:
+        session.add(UserProfileDB(id=USER_ID, email="dev@example.com"))
+        session.flush()
+        session.execute(insert(ResumeDB), rows)
+    return db_manager
+
+
+@pytest.mark.unit
+@pytest.mark.database
+class TestUserResumeListing:
+    def test_filters_and_counts_in_sql(self, db_manager):
+        resumes = ResumeRepository(db_manager)
+
+        page, total = resumes.get_user_resumes(
+            USER_ID, resume_type=ResumeType.TAILORED, limit=4
+        )
+        assert total == 9
+        assert len(page) == 4
+        assert all(resume.resume_type == ResumeType.TAILORED for resume in page)
+
+        page, total = resumes.get_user_resumes(USER_ID, include_total=False)
+        assert total is None and len(page) == 10
+
+    def test_cursor_pages_match_offset_pages(self, db_manager):
+        resumes = ResumeRepository(db_manager)
+        everyone, _ = resumes.get_user_resumes(USER_ID, limit=100)
+
+        seen, cursor = [], None
+        while True:
+            page, _ = resumes.get_user_resumes(
+                USER_ID, limit=3, after=cursor, include_total=False
+            )
+            seen.extend(page)
+            cursor = next_cursor(page, 3, "updated_at")
+            if cursor is None:
+                break
+
+        assert [resume.id for resume in seen] == [resume.id for resume in everyone]
+        assert everyone[-1].title == "Base"
+
+    def test_content_sections_are_validated_once(self, db_manager):
+        page, _ = ResumeRepository(db_manager).get_user_resumes(
+            USER_ID, resume_type=ResumeType.BASE
+        )
+        (resume,) = page
+        assert isinstance(resume.contact_info, ContactInfo)
+        assert isinstance(resume.work_experience[0], WorkExperience)
+        assert resume.work_experience[0].start_date == date(2020, 1, 1)
+
+        response = ResumeResponse(
+            id=resume.id,
+            user_id=resume.user_id,
+            title=resume.title,
+            resume_type=resume.resume_type,
+            status=resume.status,
+            contact_info=resume.contact_info,
+            work_experience=resume.work_experience,
+            created_at=resume.created_at,
+            updated_at=resume.updated_at,
+        )
+        # The response reuses the validated sections instead of parsing again
+        assert response.contact_info is resume.contact_info
+        assert response.work_experience[0] is resume.work_experience[0]
+
+    @pytest.mark.asyncio
+    async def test_session_repository_pages_in_sql(self, db_manager):
+        with db_manager.get_session() as session:
+            repository = resume_repository.ResumeRepository(session)
+            everyone = await repository.get_user_resumes(
+                USER_ID, resume_type=ResumeType.TAILORED
+            )
+            page = await repository.get_user_resumes(
+                USER_ID, resume_type=ResumeType.TAILORED, limit=2, offset=2
+            )
+        assert len(everyone) == 9
+        assert [resume.id for resume in page] == [resume.id for resume in everyone[2:4]]
@@ -0,0 +1,152 @@
+"""
+Tests for async-aware retries, the retry budget and retry metrics.
+"""
+
+import asyncio
+import time
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+import backend.utils.retry as retry
+from backend.utils.retry import RetryBudget, retry_database_operation, with_retry
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def locked():
+    return OperationalError("UPDATE", {}, Exception("database is locked"))
+
+
+@pytest.fixture(autouse=True)
+def fresh_budget_and_metrics(monkeypatch):
+    monkeypatch.setattr(retry, "retry_budget", RetryBudget())
+    retry.retry_metrics.reset()
+    yield
+    retry.retry_metrics.reset()
+
+
+def flaky(failures):
+    """A function failing with a retryable error the first N calls."""
+    calls = []
+
+    def operation():
+        calls.append(1)
+        if len(calls) <= failures:
+            raise locked()
+        return len(calls)
+
+    return operation, calls
+
+
+@pytest.mark.unit
+class TestWithRetry:
+    def test_coroutines_back_off_without_blocking_the_loop(self):
+        attempts = []
+
+        @with_retry(max_retries=3, base_delay=0.05, jitter=False)
+        async def query():
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise locked()
+            return "done"
+
+        async def scenario():
+            ticks = 0
+
+            async def heartbeat():
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0.005)
+
+            ticker = asyncio.create_task(heartbeat())
+            result = await query()
+            ticker.cancel()
+            return result, ticks
+
+        result, ticks = asyncio.run(scenario())
+        assert result == "done"
+        # 0.05s + 0.10s of backoff; the loop kept running throughout
+        assert ticks >= 10
+
+        metrics = retry.retry_metrics.snapshot()
+        site = next(v for k, v in metrics.items() if k.endswith("query"))
+        assert site["calls"] == 1
+        assert site["attempts"] == 3
+        assert site["retries"] == 2
+        assert site["backoff_seconds"] == pytest.approx(0.15)
+
+    def test_sync_function_on_event_loop_fails_fast(self, monkeypatch):
+        sleeps = []
+        monkeypatch.setattr(retry.time, "sleep", sleeps.append)
+        operation, calls = flaky(2)
+        retrying = with_retry(max_retries=3, base_delay=5.0)(operation)
+
+        async def call_on_loop():
+            return retrying()
+
+        with pytest.raises(OperationalError):
+            asyncio.run(call_on_loop())
+        assert len(calls) == 1 and sleeps == []
+
+        # Off the loop the same call is retried
+        assert retrying() == 3
+        assert len(sleeps) == 1
+
+    def test_non_retryable_errors_are_not_retried(self):
+        @with_retry(max_retries=3, base_delay=0)
+        def broken():
+            raise ValueError("bad input")
+
+        with pytest.raises(ValueError):
+            broken()
+        site = next(iter(retry.retry_metrics.snapshot().values()))
+        assert site["attempts"] == 1
+        assert site["failures"] == 1
+
+    def test_retry_database_operation_supports_coroutines(self):
+        attempts = []
+
+        async def operation(value):
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise locked()
+            return value
+
+        result = asyncio.run(retry_database_operation(operation, 7, base_delay=0.01))
+        assert result == 7 and len(attempts) == 2
+
+
+@pytest.mark.unit
+class TestRetryBudget:
+    def test_budget_window(self):
+        clock = FakeClock()
+        budget = RetryBudget(max_retries=2, window_seconds=10, clock=clock)
+        assert budget.try_acquire() and budget.try_acquire()
+        assert not budget.try_acquire()
+        assert budget.remaining() == 0
+        clock.now = 10.5
+        assert budget.remaining() == 2
+        assert budget.try_acquire()
+
+    def test_exhausted_budget_fails_fast(self, monkeypatch):
+        monkeypatch.setattr(retry, "retry_budget", RetryBudget(max_retries=1))
+        operation, calls = flaky(5)
+        retrying = with_retry(max_retries=5, base_delay=0.01)(operation)
+
+        started = time.perf_counter()
+        with pytest.raises(OperationalError):
+            retrying()
+        assert time.perf_counter() - started < 1
+        # One budgeted retry, then the second failure is final
+        assert len(calls) == 2
+        site = next(iter(retry.retry_metrics.snapshot().values()))
+        assert site["budget_exhausted"] == 1
+        assert site["failures"] == 1
@@ -0,0 +1,226 @@
+"""
+Tests for the job full-text search index (FTS5 and in-memory fallback).
+"""
+
+import uuid
+
+import pytest
+
+from backend.data.database import DatabaseManager, JobRepository
+from backend.data.models import CompanyInfoDB, JobListing, JobListingSummary
+from backend.data.search_index import (
+    InvertedIndex,
+    build_match_expression,
+    tokenize,
+)
+
+
+@pytest.fixture(params=[True, False], ids=["fts5", "inverted_index"])
+def search_repo(request, db_manager):
+    """Job repository over a file database, with and without FTS5."""
+    if not request.param:
+        db_manager.search_index._use_fts5 = False
+        db_manager.search_index.uses_fts5 = False
+
+    acme_id, globex_id = str(uuid.uuid4()), str(uuid.uuid4())
+    with db_manager.get_session() as session:
+        session.add_all(
+            [
+                CompanyInfoDB(
+                    id=acme_id, name="Acme Robotics", normalized_name="acme robotics"
+                ),
+                CompanyInfoDB(id=globex_id, name="Globex", normalized_name="globex"),
+            ]
+        )
+
+    repo = JobRepository(db_manager)
+    repo.acme_id = acme_id
+    repo.create_job(
+        JobListing(
+            title="Senior Python Engineer",
+            company_id=acme_id,
+            description="Build robot control software in Python.",
+        )
+    )
+    repo.create_job(
+        JobListing(
+            title="Data Analyst",
+            company_id=globex_id,
+            description="SQL dashboards. Some Python scripting is a plus.",
+        )
+    )
+    repo.create_job(
+        JobListing(
+            title="Frontend Developer",
+            company_id=globex_id,
+            description="React and TypeScript.",
+            requirements="3 years of frontend engineering",
+        )
+    )
+    return repo
+
+
+@pytest.mark.unit
+class TestTokenizer:
+    def test_tokenize_splits_on_punctuation(self):
+        assert tokenize("Senior Python/Django_Engineer!") == [
+            "senior",
+            "python",
+            "django",
+            "engineer",
+        ]
+
+    def test_match_expression_uses_prefix_terms(self):
+        assert build_match_expression("python dev") == '"python"* "dev"*'
+        assert build_match_expression("?!") is None
+
+
+@pytest.mark.unit
+class TestInvertedIndex:
+    def test_bm25_prefers_title_matches(self):
+        index = InvertedIndex()
+        index.add("a", ["Python Engineer", "Acme", "Backend work", None])
+        index.add("b", ["Engineer", "Globex", "Some Python scripting", None])
+
+        results = index.search("python")
+        assert [doc_id for doc_id, _ in results] == ["a", "b"]
+        assert results[0][1] > results[1][1] > 0
+
+    def test_all_tokens_required_with_prefix_matching(self):
+        index = InvertedIndex()
+        index.add("a", ["Python Engineer", None, None, None])
+        index.add("b", ["Python Analyst", None, None, None])
+
+        assert [doc_id for doc_id, _ in index.search("pyth eng")] == ["a"]
+
+    def test_reindex_and_remove(self):
+        index = InvertedIndex()
+        index.add("a", ["Python Engineer", None, None, None])
+        index.add("a", ["Rust Engineer", None, None, None])
+        assert index.search("python") == []
+        assert len(index.search("rust")) == 1
+
+        index.remove("a")
+        assert len(index) == 0
+        assert index.search("engineer") == []
+
+
+@pytest.mark.unit
+@pytest.mark.database
+class TestJobRepositorySearch:
+    def test_search_ranks_by_relevance(self, search_repo):
+        jobs, total = search_repo.search_jobs(query="python")
+
+        assert total == 2
+        assert [job.title for job in jobs] == ["Senior Python Engineer", "Data Analyst"]
+        assert jobs[0].company_name == "Acme Robotics"
+
+    def test_search_matches_company_and_requirements(self, search_repo):
+        jobs, total = search_repo.search_jobs(query="acme")
+        assert total == 1 and jobs[0].title == "Senior Python Engineer"
+
+        jobs, total = search_repo.search_jobs(query="frontend engineering")
+        assert total == 1 and jobs[0].title == "Frontend Developer"
+
+    def test_search_combines_with_filters_and_pagination(self, search_repo):
+        jobs, total = search_repo.search_jobs(query="python", companies=["Globex"])
+        assert total == 1 and jobs[0].title == "Data Analyst"
+
+        jobs, total = search_repo.search_jobs(query="python", limit=1, offset=1)
+        assert total == 2
+        assert [job.title for job in jobs] == ["Data Analyst"]
+
+    def test_search_returns_summaries_and_get_job_the_full_row(self, search_repo):
+        jobs, _ = search_repo.search_jobs(query="frontend")
+        assert isinstance(jobs[0], JobListingSummary)
+        assert jobs[0].company_name == "Globex"
+        assert "description" not in jobs[0].model_dump()
+
+        job = search_repo.get_job(str(jobs[0].id))
+        assert job.requirements == "3 years of frontend engineering"
+        assert job.company_name == "Globex"
+
+        jobs, _ = search_repo.search_jobs(query="frontend", summary=False)
+        assert jobs[0].description == "React and TypeScript."
+
+    def test_rank_jobs_by_text_returns_scored_ids(self, search_repo):
+        hits = search_repo.rank_jobs_by_text("python")
+        jobs = search_repo.get_jobs([job_id for job_id, _ in hits])
+
+        assert [job.title for job in jobs] == ["Senior Python Engineer", "Data Analyst"]
+        assert hits[0][1] > hits[1][1] > 0
+
+        hits = search_repo.rank_jobs_by_text("python", company="globex", limit=5)
+        assert len(hits) == 1
+        assert search_repo.rank_jobs_by_text("python", location="Mars") == []
+
+    def test_index_follows_updates_deletes_and_renames(self, search_repo):
+        jobs, _ = search_repo.search_jobs(query="frontend")
+        job_id = str(jobs[0].id)
+
+        search_repo.update_job(job_id, {"title": "Rust Developer"})
+        assert search_repo.search_jobs(query="rust")[1] == 1
+
+        with search_repo.db_manager.get_session() as session:
+            session.query(CompanyInfoDB).filter(
+                CompanyInfoDB.id == search_repo.acme_id
+            ).update({"name": "Initech"})
+            search_repo.db_manager.search_index.refresh_company(
+                session, search_repo.acme_id
+            )
+        assert search_repo.search_jobs(query="initech")[1] == 1
+
+        assert search_repo.delete_job(job_id)
+        assert search_repo.search_jobs(query="rust")[1] == 0
+
+    def test_bulk_loaded_jobs_are_indexed(self, search_repo):
+        report = search_repo.bulk_load_jobs(
+            (
+                {"title": f"Kotlin Developer {i}", "company_id": search_repo.acme_id}
+                for i in range(5)
+            ),
+            chunk_size=2,
+        )
+        assert report.inserted == 5
+        assert search_repo.search_jobs(query="kotlin")[1] == 5
+        assert search_repo.search_jobs(query="acme kotlin")[1] == 5
+
+        # Single inserts are indexed again once the bulk load committed
+        search_repo.create_job(
+            JobListing(title="Elixir Developer", company_id=search_repo.acme_id)
+        )
+        assert search_repo.search_jobs(query="elixir")[1] == 1
+
+    def test_legacy_insert_trigger_is_replaced(self, db_manager):
+        with db_manager.engine.begin() as conn:
+            conn.exec_driver_sql("DROP TRIGGER job_listings_fts_insert")
+            conn.exec_driver_sql(
+                "CREATE TRIGGER job_listings_fts_insert AFTER INSERT ON job_listings "
+                "BEGIN INSERT INTO job_listings_fts (rowid, title) "
+                "VALUES (NEW.rowid, NEW.title); END"
+            )
+        db_manager.search_index.ensure_schema()
+        with db_manager.engine.connect() as conn:
+            trigger = conn.exec_driver_sql(
+                "SELECT sql FROM sqlite_master WHERE name = 'job_listings_fts_insert'"
+            ).scalar()
+        assert "job_listings_fts_deferred" in trigger
+
+    def test_existing_rows_are_backfilled(self, temp_dir):
+        url = f"sqlite:///{temp_dir}/backfill.db"
+        db_manager = DatabaseManager(url)
+        company_id = str(uuid.uuid4())
+        with db_manager.get_session() as session:
+            session.add(
+                CompanyInfoDB(id=company_id, name="Acme", normalized_name="acme")
+            )
+        JobRepository(db_manager).create_job(
+            JobListing(title="Python Engineer", company_id=company_id)
+        )
+        with db_manager.engine.begin() as conn:
+            conn.exec_driver_sql("DELETE FROM job_listings_fts")
+        db_manager.engine.dispose()
+
+        reopened = DatabaseManager(url)
+        assert reopened.search_index.search("python")[0][1] > 0
+        reopened.engine.dispose()
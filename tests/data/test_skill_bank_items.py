@@ -0,0 +1,149 @@
+"""
+Tests for skill bank items stored one row each in skill_bank_items.
+"""
+
+import asyncio
+from datetime import date
+
+import pytest
+
+from backend.data.query_counter import count_queries
+from backend.data.skill_bank_models import (
+    EnhancedSkill,
+    ExperienceContentVariation,
+    ExperienceEntry,
+    SkillCategory,
+)
+from backend.data.skill_bank_repository import SkillBankRepository
+
+
+@pytest.fixture
+def repository(db_manager):
+    return SkillBankRepository(db_manager)
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def skill_names(skill_bank, category):
+    return [skill.name for skill in skill_bank.skills.get(category, [])]
+
+
+@pytest.mark.unit
+@pytest.mark.database
+class TestSkillItems:
+    def test_add_update_delete_keep_order(self, repository):
+        technical = SkillCategory.TECHNICAL.value
+        skills = [EnhancedSkill(name=f"Skill {i}") for i in range(3)]
+        for skill in skills:
+            run(repository.add_skill("user-1", skill))
+
+        updated = run(
+            repository.update_skill("user-1", skills[1].id, {"name": "Renamed"})
+        )
+        assert updated.name == "Renamed"
+        assert run(repository.delete_skill("user-1", skills[0].id))
+        assert not run(repository.delete_skill("user-1", skills[0].id))
+
+        skill_bank = run(repository.get_skill_bank("user-1"))
+        assert skill_names(skill_bank, technical) == ["Renamed", "Skill 2"]
+        assert [s.name for s in run(repository.get_skills("user-1", technical))] == [
+            "Renamed",
+            "Skill 2",
+        ]
+
+    def test_duplicate_names_rejected_per_category(self, repository):
+        run(repository.add_skill("user-1", EnhancedSkill(name="Python")))
+        with pytest.raises(ValueError, match="already exists"):
+            run(repository.add_skill("user-1", EnhancedSkill(name="python")))
+
+        soft = EnhancedSkill(name="Python", category=SkillCategory.SOFT)
+        assert run(repository.add_skill("user-1", soft)) == soft
+
+    def test_missing_skill_raises(self, repository):
+        with pytest.raises(ValueError, match="Skill with ID 'missing' not found"):
+            run(repository.update_skill("user-1", "missing", {"name": "Go"}))
+
+    def test_single_skill_writes_do_not_grow_with_bank(self, db_manager, repository):
+        def statements(user_id, bank_size):
+            run(
+                repository.add_skills(
+                    user_id,
+                    [EnhancedSkill(name=f"Skill {i}") for i in range(bank_size)],
+                )
+            )
+            skill = EnhancedSkill(name="Rust")
+            add = count_queries(
+                db_manager.engine, lambda: run(repository.add_skill(user_id, skill))
+            )
+            edit = count_queries(
+                db_manager.engine,
+                lambda: run(
+                    repository.update_skill(user_id, skill.id, {"level": "expert"})
+                ),
+            )
+            return add.statements + edit.statements
+
+        small, large = statements("user-1", 5), statements("user-2", 500)
+        assert len(small) == len(large)
+        assert not any("UPDATE skill_banks SET skills" in s for s in large)
+
+
+@pytest.mark.unit
+@pytest.mark.database
+class TestEntriesAndVariations:
+    def test_delete_experience_removes_its_variations(self, repository):
+        experience = ExperienceEntry(
+            company="Acme", position="Engineer", start_date=date(2020, 1, 1)
+        )
+        run(repository.add_experience("user-1", experience))
+        variation = ExperienceContentVariation(
+            title="Technical", content="Built things", experience_id=experience.id
+        )
+        run(repository.add_experience_variation("user-1", variation))
+
+        skill_bank = run(repository.get_skill_bank("user-1"))
+        assert skill_bank.experience_content_variations[experience.id] == [variation]
+
+        assert run(repository.delete_experience("user-1", experience.id))
+        skill_bank = run(repository.get_skill_bank("user-1"))
+        assert experience.id not in skill_bank.experience_content_variations
+
+    def test_variation_needs_experience(self, repository):
+        variation = ExperienceContentVariation(
+            title="Technical", content="Built things", experience_id="missing"
+        )
+        with pytest.raises(ValueError, match="Experience with ID 'missing' not found"):
+            run(repository.add_experience_variation("user-1", variation))
+
+    def test_update_skill_bank_replaces_sections(self, repository):
+        run(repository.add_skill("user-1", EnhancedSkill(name="Python")))
+        skill_bank = run(
+            repository.update_skill_bank(
+                "user-1",
+                {
+                    "default_summary": "Backend engineer",
+                    "skills": {"Languages": [{"name": "Go"}]},
+                },
+            )
+        )
+        assert skill_bank.default_summary == "Backend engineer"
+        assert list(skill_bank.skills) == ["Languages"]
+        assert skill_names(skill_bank, "Languages") == ["Go"]
+
+    def test_migrate_from_user_profile_skips_existing(self, repository, monkeypatch):
+        monkeypatch.setattr(
+            repository,
+            "_fetch_profile_seed",
+            lambda user_id: (["Python", "Go"], "Engineer"),
+        )
+        run(repository.update_skill_bank("user-1", {"default_summary": None}))
+
+        first = run(repository.migrate_from_user_profile("user-1"))
+        second = run(repository.migrate_from_user_profile("user-1"))
+        assert second.skills["Technical Skills"] == first.skills["Technical Skills"]
+        assert {"python", "go"} <= {
+            name.lower() for name in skill_names(second, "Technical Skills")
+        }
+        assert second.default_summary == "Engineer"
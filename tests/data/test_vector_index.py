@@ -0,0 +1,199 @@
+"""
+Tests for the semantic vector index over job embeddings.
+"""
+
+import hashlib
+import uuid
+
+import numpy as np
+import pytest
+
+from backend.data.models import (
+    CompanyInfoDB,
+    JobEmbeddingDB,
+    JobListingDB,
+    JobStatus,
+    JobType,
+    RemoteType,
+)
+from backend.data.vector_index import (
+    HashingEmbedder,
+    IVFIndex,
+    JobVectorIndex,
+    job_embedding_text,
+)
+
+JOBS = [
+    ("Python Backend Engineer", "Django and FastAPI services", JobType.FULL_TIME,
+     RemoteType.REMOTE, 150000),
+    ("Data Scientist", "Machine learning models in Python", JobType.FULL_TIME,
+     RemoteType.HYBRID, 130000),
+    ("Frontend Developer", "React and TypeScript user interfaces", JobType.CONTRACT,
+     RemoteType.REMOTE, 90000),
+    ("Warehouse Associate", "Forklift operation and inventory", JobType.PART_TIME,
+     RemoteType.ON_SITE, None),
+]  # fmt: skip
+
+
+@pytest.fixture
+def populated_db(db_manager):
+    """File database with jobs and hashing-embedder embeddings."""
+    embedder = HashingEmbedder()
+    job_ids = {}
+
+    with db_manager.get_session() as session:
+        company = CompanyInfoDB(
+            id=str(uuid.uuid4()), name="Acme", normalized_name="acme"
+        )
+        session.add(company)
+        for title, description, job_type, remote_type, salary in JOBS:
+            job = JobListingDB(
+                id=str(uuid.uuid4()),
+                company_id=company.id,
+                title=title,
+                description=description,
+                job_type=job_type,
+                remote_type=remote_type,
+                salary_min=salary,
+                salary_max=salary,
+                status=JobStatus.ACTIVE,
+            )
+            session.add(job)
+            text = job_embedding_text(title, description)
+            session.add(
+                JobEmbeddingDB(
+                    job_id=job.id,
+                    embedding_model=embedder.model_name,
+                    content_hash=hashlib.md5(text.encode()).hexdigest(),
+                    embedding_vector=embedder.embed(text),
+                    embedding_dimension=embedder.dimension,
+                )
+            )
+            job_ids[title] = job.id
+
+    return db_manager, job_ids
+
+
+def titles(hits, job_ids):
+    by_id = {job_id: title for title, job_id in job_ids.items()}
+    return [by_id[job_id] for job_id, _ in hits]
+
+
+@pytest.mark.unit
+class TestHashingEmbedder:
+    def test_embeddings_are_deterministic_unit_vectors(self):
+        embedder = HashingEmbedder()
+        vector = embedder.embed("Senior Python engineer")
+
+        assert vector == HashingEmbedder().embed("Senior Python engineer")
+        assert len(vector) == 384
+        assert np.linalg.norm(vector) == pytest.approx(1.0)
+        assert not any(HashingEmbedder().embed("?!"))
+
+    def test_shared_vocabulary_is_closer(self):
+        embedder = HashingEmbedder()
+        query = np.array(embedder.embed("python engineer"))
+        related = np.array(embedder.embed("senior python engineer"))
+        unrelated = np.array(embedder.embed("forklift operator"))
+
+        assert query @ related > query @ unrelated
+
+
+@pytest.mark.unit
+@pytest.mark.database
+class TestJobVectorIndex:
+    def test_search_ranks_by_similarity(self, populated_db):
+        db_manager, job_ids = populated_db
+        hits = db_manager.vector_index.search("python backend engineer", limit=2)
+
+        assert titles(hits, job_ids)[0] == "Python Backend Engineer"
+        assert len(hits) == 2
+        assert hits[0][1] >= hits[1][1]
+
+    def test_filters_are_applied_before_top_k(self, populated_db):
+        db_manager, job_ids = populated_db
+        index = db_manager.vector_index
+
+        hits = index.search("python", limit=1, remote_types=["Hybrid"])
+        assert titles(hits, job_ids) == ["Data Scientist"]
+
+        hits = index.search("python", limit=10, job_types=["full-time"])
+        assert set(titles(hits, job_ids)) == {
+            "Python Backend Engineer",
+            "Data Scientist",
+        }
+
+        hits = index.search("developer", limit=10, min_salary=100000)
+        assert "Frontend Developer" not in titles(hits, job_ids)
+        assert "Warehouse Associate" not in titles(hits, job_ids)
+
+        only = [job_ids["Warehouse Associate"]]
+        hits = index.search("python", limit=10, job_ids=only)
+        assert [job_id for job_id, _ in hits] == only
+
+    def test_query_without_known_words_returns_nothing(self, populated_db):
+        db_manager, _ = populated_db
+        assert db_manager.vector_index.search("?!", limit=5) == []
+
+    def test_matrix_is_memory_mapped_from_sidecar(self, populated_db):
+        db_manager, job_ids = populated_db
+        db_manager.vector_index.load()
+
+        # Corrupt the stored vectors without changing their content hashes: a
+        # fresh index must still be served from the sidecar file
+        with db_manager.get_session() as session:
+            for embedding in session.query(JobEmbeddingDB):
+                embedding.embedding_vector = [0.0] * 384
+
+        reloaded = JobVectorIndex(db_manager.engine)
+        reloaded.load()
+        assert isinstance(reloaded._state.matrix, np.memmap)
+        hits = reloaded.search("python backend engineer", limit=1)
+        assert titles(hits, job_ids) == ["Python Backend Engineer"]
+
+    def test_index_picks_up_new_embeddings(self, populated_db):
+        db_manager, job_ids = populated_db
+        index = db_manager.vector_index
+        assert len(index.search("forklift", limit=10)) == 4
+
+        with db_manager.get_session() as session:
+            session.query(JobListingDB).filter(
+                JobListingDB.id == job_ids["Warehouse Associate"]
+            ).update({"status": JobStatus.EXPIRED})
+        index.invalidate()
+
+        assert len(index.search("forklift", limit=10)) == 3
+
+    def test_ivf_index_matches_exact_search(self, populated_db):
+        db_manager, _ = populated_db
+        exact = db_manager.vector_index
+        ivf = JobVectorIndex(db_manager.engine, ivf_threshold=1, n_probe=2)
+
+        for query in ("python engineer", "react developer", "inventory"):
+            ivf_hits = ivf.search(query, limit=4)
+            exact_hits = exact.search(query, limit=4)
+            # Equal scores may come back in a different order
+            assert ivf_hits[0] == exact_hits[0]
+            assert [score for _, score in ivf_hits] == pytest.approx(
+                [score for _, score in exact_hits]
+            )
+        assert ivf._state.ivf is not None and exact._state.ivf is None
+
+
+@pytest.mark.unit
+class TestIVFIndex:
+    def test_probe_finds_nearest_clusters(self):
+        rng = np.random.default_rng(7)
+        matrix = rng.standard_normal((2000, 64)).astype(np.float32)
+        matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+
+        ivf = IVFIndex.build(matrix, n_lists=20)
+        assert sorted(ivf.order.tolist()) == list(range(2000))
+        assert sum(stop - start for start, stop in ivf.probe(matrix[0], 20)) == 2000
+
+        clustered = ivf.reorder(matrix)
+        position = np.argsort(ivf.order)
+        for row in range(50):
+            ranges = ivf.probe(matrix[row], 2)
+            assert any(start <= position[row] < stop for start, stop in ranges)
+            assert np.array_equal(clustered[position[row]], matrix[row])
@@ -0,0 +1,170 @@
+"""
+Tests for buffered job view counting.
+"""
+
+import threading
+
+import pytest
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+from backend.data.engine import EngineProfile
+from backend.data.interaction_repository import JobUserInteractionRepository
+from backend.data.view_buffer import ViewCounterBuffer
+
+
+@pytest.fixture
+def db_manager_options():
+    return {"engine_profile": EngineProfile(write_max_delay_ms=1)}
+
+
+def make_repository(db_manager, **options):
+    # A long interval so that only explicit flushes write
+    options.setdefault("flush_interval_seconds", 60)
+    view_buffer = ViewCounterBuffer(db_manager, **options)
+    return JobUserInteractionRepository(db_manager, view_buffer=view_buffer)
+
+
+def reject_job(view_buffer, monkeypatch, bad_job_id):
+    """Make upserts fail as a foreign key violation would for one job."""
+    upsert = view_buffer._upsert
+
+    def checked(session, pending):
+        if any(job_id == bad_job_id for _, job_id in pending):
+            raise IntegrityError("INSERT", {}, Exception("FOREIGN KEY failed"))
+        upsert(session, pending)
+
+    monkeypatch.setattr(view_buffer, "_upsert", checked)
+
+
+def view_counts(repository, user_id):
+    return {
+        view.job_id: view.interaction_count
+        for view in repository.get_user_interactions(user_id)
+    }
+
+
+@pytest.mark.unit
+@pytest.mark.database
+class TestViewCounterBuffer:
+    def test_views_are_aggregated_into_one_flush(self, db_manager):
+        repository = make_repository(db_manager)
+        view_buffer = repository.view_buffer
+        try:
+
+            def viewer():
+                for i in range(20):
+                    repository.record_job_view("user-1", f"job-{i % 2}")
+
+            threads = [threading.Thread(target=viewer) for _ in range(5)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            stats = view_buffer.stats()
+            assert stats["pending_keys"] == 2
+            assert stats["pending_views"] == 100
+            assert view_counts(repository, "user-1") == {}
+
+            assert view_buffer.flush() == 100
+            assert view_counts(repository, "user-1") == {"job-0": 50, "job-1": 50}
+            assert view_buffer.stats()["flushes"] == 1
+        finally:
+            view_buffer.close()
+
+    def test_flush_increments_existing_rows(self, db_manager):
+        repository = make_repository(db_manager)
+        view_buffer = repository.view_buffer
+        try:
+            # A view recorded with data is written straight away
+            repository.record_job_view("user-1", "job-1", {"source": "email"})
+            repository.record_job_view("user-1", "job-1")
+            repository.record_job_view("user-1", "job-1")
+            view_buffer.flush()
+            repository.record_job_view("user-1", "job-1")
+            view_buffer.flush()
+
+            views = repository.get_user_interactions("user-1")
+            assert len(views) == 1
+            assert views[0].interaction_count == 4
+            assert views[0].interaction_data == {"source": "email"}
+        finally:
+            view_buffer.close()
+
+    def test_sync_durability_waits_for_commit(self, db_manager):
+        repository = make_repository(db_manager, durability="sync")
+        view_buffer = repository.view_buffer
+        try:
+            repository.record_job_view("user-1", "job-1")
+            assert view_counts(repository, "user-1") == {"job-1": 1}
+            assert view_buffer.stats()["pending_views"] == 0
+        finally:
+            view_buffer.close()
+
+    def test_failed_flush_keeps_counts(self, db_manager, monkeypatch):
+        repository = make_repository(db_manager)
+        view_buffer = repository.view_buffer
+        try:
+            repository.record_job_view("user-1", "job-1")
+
+            def fail(*args, **kwargs):
+                raise OperationalError("INSERT", {}, Exception("database is locked"))
+
+            monkeypatch.setattr(db_manager, "write", fail)
+            with pytest.raises(OperationalError):
+                view_buffer.flush()
+            repository.record_job_view("user-1", "job-1")
+            assert view_buffer.stats()["pending_views"] == 2
+            assert view_buffer.stats()["failed_flushes"] == 1
+
+            monkeypatch.undo()
+            assert view_buffer.flush() == 2
+            assert view_counts(repository, "user-1") == {"job-1": 2}
+        finally:
+            view_buffer.close()
+
+    def test_failed_pair_is_dropped_and_others_written(self, db_manager, monkeypatch):
+        repository = make_repository(db_manager)
+        view_buffer = repository.view_buffer
+        try:
+            reject_job(view_buffer, monkeypatch, "deleted-job")
+            repository.record_job_view("user-1", "job-1")
+            repository.record_job_view("user-1", "job-1")
+            repository.record_job_view("user-1", "deleted-job")
+
+            assert view_buffer.flush() == 2
+            assert view_counts(repository, "user-1") == {"job-1": 2}
+            stats = view_buffer.stats()
+            assert stats["pending_views"] == 0
+            assert stats["dropped_views"] == 1
+            assert stats["failed_flushes"] == 0
+            assert view_buffer.flush() == 0
+        finally:
+            view_buffer.close()
+
+    def test_sync_failed_pair_raises_for_its_viewer(self, db_manager, monkeypatch):
+        repository = make_repository(db_manager, durability="sync")
+        view_buffer = repository.view_buffer
+        try:
+            reject_job(view_buffer, monkeypatch, "deleted-job")
+            with pytest.raises(IntegrityError):
+                repository.record_job_view("user-1", "deleted-job")
+            repository.record_job_view("user-1", "job-1")
+            assert view_counts(repository, "user-1") == {"job-1": 1}
+        finally:
+            view_buffer.close()
+
+    def test_close_flushes_and_later_views_write_through(self, db_manager):
+        repository = make_repository(db_manager)
+        view_buffer = repository.view_buffer
+        repository.record_job_view("user-1", "job-1")
+        view_buffer.close()
+        assert view_counts(repository, "user-1") == {"job-1": 1}
+
+        repository.record_job_view("user-1", "job-1")
+        assert view_counts(repository, "user-1") == {"job-1": 2}
+        assert view_buffer.stats()["pending_views"] == 0
+
+    def test_unknown_durability_is_rejected(self, db_manager):
+        with pytest.raises(ValueError):
+            ViewCounterBuffer(db_manager, durability="eventually")
@@ -0,0 +1,188 @@
+"""
+Tests for group-committed SQLite writes through the write queue.
+"""
+
+import asyncio
+import threading
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+from backend.data.database import DatabaseManager
+from backend.data.engine import EngineProfile
+from backend.data.interaction_repository import JobUserInteractionRepository
+from backend.data.models import TimelineEventType
+from backend.data.write_queue import WriteQueue
+from backend.services.timeline_service import TimelineService
+
+
+@pytest.fixture
+def db_manager_options():
+    return {"engine_profile": EngineProfile(write_max_delay_ms=20)}
+
+
+@pytest.fixture
+def db_manager(db_manager):
+    with db_manager.get_session() as session:
+        session.execute(text("CREATE TABLE notes (id INTEGER PRIMARY KEY, body TEXT)"))
+    return db_manager
+
+
+def add_note(session, note_id, body="note"):
+    session.execute(
+        text("INSERT INTO notes (id, body) VALUES (:id, :body)"),
+        {"id": note_id, "body": body},
+    )
+    return note_id
+
+
+def note_ids(db_manager):
+    with db_manager.get_session() as session:
+        return [row[0] for row in session.execute(text("SELECT id FROM notes"))]
+
+
+def submit_together(write_queue, calls):
+    """Submit calls so they land in a single batch."""
+    write_queue.max_delay_seconds = 0.2
+    return [write_queue.submit(*call) for call in calls]
+
+
+@pytest.mark.unit
+@pytest.mark.database
+class TestWriteQueue:
+    def test_concurrent_writes_share_commits(self, db_manager):
+        def worker(offset):
+            for i in range(10):
+                db_manager.write(add_note, offset + i)
+
+        threads = [threading.Thread(target=worker, args=(n * 100,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(note_ids(db_manager)) == 80
+        stats = db_manager.write_queue.stats()
+        assert stats["writes"] == 80
+        assert stats["batches"] < 80
+
+    def test_failing_intent_does_not_fail_batch(self, db_manager):
+        futures = submit_together(
+            db_manager.write_queue,
+            [(add_note, 1), (add_note, 1), (add_note, 2)],
+        )
+        assert futures[0].result() == 1
+        with pytest.raises(IntegrityError):
+            futures[1].result()
+        assert futures[2].result() == 2
+        assert sorted(note_ids(db_manager)) == [1, 2]
+        assert db_manager.write_queue.stats()["failed"] == 1
+
+    def test_commit_failure_falls_back_to_single_writes(self, db_manager):
+        sessions = []
+
+        def session_factory():
+            session = db_manager.SessionFactory()
+            if not sessions:
+                # The first (batch) commit fails
+                def fail_commit():
+                    raise OperationalError("COMMIT", {}, Exception("disk I/O error"))
+
+                session.commit = fail_commit
+            sessions.append(session)
+            return session
+
+        write_queue = WriteQueue(session_factory)
+        try:
+            futures = submit_together(write_queue, [(add_note, 1), (add_note, 2)])
+            assert [future.result() for future in futures] == [1, 2]
+        finally:
+            write_queue.close()
+        assert write_queue.stats()["fallbacks"] == 1
+        assert sorted(note_ids(db_manager)) == [1, 2]
+
+    def test_write_async_and_nested_write(self, db_manager):
+        def nested(session):
+            return db_manager.write(add_note, 5)
+
+        async def scenario():
+            first = await db_manager.write_async(add_note, 4)
+            with pytest.raises(RuntimeError):
+                await db_manager.write_async(nested)
+            return first
+
+        assert asyncio.run(scenario()) == 4
+        assert note_ids(db_manager) == [4]
+
+    def test_in_memory_database_writes_inline(self):
+        db_manager = DatabaseManager("sqlite:///:memory:")
+        try:
+            assert db_manager.write_queue is None
+            result = db_manager.write(
+                lambda session: session.execute(text("SELECT 1")).scalar()
+            )
+            assert result == 1
+        finally:
+            db_manager.close()
+
+
+@pytest.mark.unit
+@pytest.mark.database
+def test_concurrent_job_views_are_serialized(db_manager):
+    repository = JobUserInteractionRepository(db_manager)
+
+    def viewer():
+        for _ in range(5):
+            repository.record_job_view("user-1", "job-1")
+
+    threads = [threading.Thread(target=viewer) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    views = repository.get_user_interactions("user-1")
+    assert len(views) == 1
+    assert views[0].interaction_count == 30
+
+
+@pytest.mark.unit
+@pytest.mark.database
+def test_timeline_service_commits_by_default(db_manager):
+    with db_manager.get_session() as session:
+        service = TimelineService(session)
+        event = service.create_event(
+            "user-1", TimelineEventType.CUSTOM_EVENT, "Created"
+        )
+        service.update_event(str(event.id), title="Updated")
+
+    with db_manager.get_session() as session:
+        service = TimelineService(session)
+        (stored,) = service.get_user_timeline("user-1")
+        assert stored.title == "Updated"
+        assert service.delete_event(str(event.id))
+
+    with db_manager.get_session() as session:
+        assert TimelineService(session).get_user_timeline("user-1") == []
+
+
+@pytest.mark.unit
+@pytest.mark.database
+def test_timeline_service_rolls_back_failed_commit(db_manager, monkeypatch):
+    session = db_manager.SessionFactory()
+    rollbacks = []
+    monkeypatch.setattr(session, "rollback", lambda: rollbacks.append(True))
+
+    def fail():
+        raise OperationalError("COMMIT", {}, Exception("disk I/O error"))
+
+    monkeypatch.setattr(session, "commit", fail)
+    try:
+        with pytest.raises(OperationalError):
+            TimelineService(session).create_event(
+                "user-1", TimelineEventType.CUSTOM_EVENT, "Created"
+            )
+        assert rollbacks
+    finally:
+        session.close()